@@ -9,7 +9,12 @@ Exporta:
 """
 from .service import BoundaryElementService
 from .displacement import check_displacement_method, check_drift_capacity
-from .stress import check_stress_method, calculate_boundary_stress
+from .stress import (
+    check_stress_method,
+    calculate_boundary_stress,
+    edge_stresses,
+    scan_boundary_stress,
+)
 from .dimensions import calculate_dimensions
 from .confinement import (
     calculate_transverse_reinforcement,
@@ -22,6 +27,7 @@ from ..results import (
     DisplacementCheckResult,
     StressCheckResult,
     BoundaryStressAnalysis,
+    BoundaryStressScan,
     BoundaryElementDimensions,
     BoundaryTransverseReinforcement,
     BoundaryElementResult,
@@ -35,6 +41,8 @@ __all__ = [
     "check_drift_capacity",
     "check_stress_method",
     "calculate_boundary_stress",
+    "edge_stresses",
+    "scan_boundary_stress",
     "calculate_dimensions",
     "calculate_transverse_reinforcement",
     "max_tie_spacing",
@@ -44,6 +52,7 @@ __all__ = [
     "DisplacementCheckResult",
     "StressCheckResult",
     "BoundaryStressAnalysis",
+    "BoundaryStressScan",
     "BoundaryElementDimensions",
     "BoundaryTransverseReinforcement",
     "BoundaryElementResult",
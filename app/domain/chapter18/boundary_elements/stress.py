@@ -5,8 +5,38 @@ Verificación por método de esfuerzos ACI 318-25 §18.10.6.3.
 Según 18.10.6.3:
 - Requiere elemento de borde si sigma_max >= 0.2 * f'c
 - Puede discontinuar si sigma < 0.15 * f'c
+
+Todas las funciones usan la misma fórmula (edge_stresses), que acepta
+escalares o arrays: scan_boundary_stress la evalúa de una vez sobre todas
+las combinaciones de un elemento.
 """
-from ..results import StressCheckResult, BoundaryStressAnalysis
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..results import StressCheckResult, BoundaryStressAnalysis, BoundaryStressScan
+
+
+def edge_stresses(width, thickness, P_N, M_Nmm) -> Tuple:
+    """
+    Esfuerzos en los bordes: σ = P/A ± |M|*y/I.
+
+    Args:
+        width: Ancho del muro (mm)
+        thickness: Espesor del muro (mm)
+        P_N: Carga axial en N (positivo = compresión), escalar o array
+        M_Nmm: Momento en N-mm, escalar o array
+
+    Returns:
+        Tuple (sigma_left, sigma_right) en MPa, con la forma de P_N/M_Nmm
+    """
+    Ag = width * thickness
+    Ig = thickness * (width ** 3) / 12
+    y = width / 2
+
+    sigma_axial = P_N / Ag if Ag > 0 else P_N * 0.0
+    sigma_moment = abs(M_Nmm) * y / Ig if Ig > 0 else abs(M_Nmm) * 0.0
+    return sigma_axial + sigma_moment, sigma_axial - sigma_moment
 
 
 def calculate_boundary_stress(
@@ -39,11 +69,8 @@ def calculate_boundary_stress(
     # Límite de esfuerzo según ACI 318-25 §18.10.6.3
     sigma_limit = 0.2 * fc  # MPa
 
-    # Calcular esfuerzos en bordes (MPa)
     # Borde izquierdo: compresión cuando M positivo
-    sigma_left = P_N / Ag + abs(M_Nmm) * y / Ig
-    # Borde derecho
-    sigma_right = P_N / Ag - abs(M_Nmm) * y / Ig
+    sigma_left, sigma_right = edge_stresses(width, thickness, P_N, M_Nmm)
 
     return BoundaryStressAnalysis(
         sigma_left=sigma_left,
@@ -55,6 +82,58 @@ def calculate_boundary_stress(
     )
 
 
+def scan_boundary_stress(
+    width: float,
+    thickness: float,
+    fc: float,
+    P_N: np.ndarray,
+    M_Nmm: np.ndarray
+) -> BoundaryStressScan:
+    """
+    Máximo esfuerzo de compresión en cada borde sobre todas las combinaciones.
+
+    Equivale a recorrer las combinaciones con calculate_boundary_stress y
+    quedarse con la primera que supera el máximo anterior (partiendo de 0),
+    pero en una sola pasada sobre arrays.
+
+    Args:
+        width: Ancho del muro (mm)
+        thickness: Espesor del muro (mm)
+        fc: Resistencia del hormigón f'c (MPa)
+        P_N: Cargas axiales en N por combinación (positivo = compresión)
+        M_Nmm: Momentos en N-mm por combinación
+
+    Returns:
+        BoundaryStressScan con máximos e índices de la combinación crítica
+    """
+    sigma_left, sigma_right = edge_stresses(
+        width, thickness,
+        np.asarray(P_N, dtype=float),
+        np.asarray(M_Nmm, dtype=float)
+    )
+    max_left, index_left = _positive_max(sigma_left)
+    max_right, index_right = _positive_max(sigma_right)
+
+    return BoundaryStressScan(
+        sigma_left=max_left,
+        sigma_right=max_right,
+        index_left=index_left,
+        index_right=index_right,
+        sigma_limit=0.2 * fc
+    )
+
+
+def _positive_max(sigma: np.ndarray) -> Tuple[float, Optional[int]]:
+    """Primer máximo estrictamente positivo (NaN no cuenta); (0, None) si no hay."""
+    if sigma.size == 0:
+        return 0.0, None
+    positive = np.where(sigma > 0, sigma, 0.0)
+    i = int(np.argmax(positive))
+    if positive[i] <= 0:
+        return 0.0, None
+    return float(positive[i]), i
+
+
 def check_stress_method(
     sigma_max: float,
     fc: float
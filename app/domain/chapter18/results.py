@@ -249,6 +249,35 @@ class BoundaryStressAnalysis:
         return self.sigma_right >= self.sigma_limit
 
 
+@dataclass
+class BoundaryStressScan:
+    """
+    Maximos de esfuerzo en cada borde sobre todas las combinaciones.
+
+    Args:
+        sigma_left: Maximo esfuerzo borde izquierdo (MPa, 0 si ninguno > 0)
+        sigma_right: Maximo esfuerzo borde derecho (MPa, 0 si ninguno > 0)
+        index_left: Combinacion del maximo izquierdo (None si ninguno > 0)
+        index_right: Combinacion del maximo derecho (None si ninguno > 0)
+        sigma_limit: Limite 0.2*f'c (MPa)
+    """
+    sigma_left: float
+    sigma_right: float
+    index_left: Optional[int]
+    index_right: Optional[int]
+    sigma_limit: float
+
+    @property
+    def required_left(self) -> bool:
+        """True si se requiere elemento de borde en el lado izquierdo."""
+        return self.sigma_left >= self.sigma_limit
+
+    @property
+    def required_right(self) -> bool:
+        """True si se requiere elemento de borde en el lado derecho."""
+        return self.sigma_right >= self.sigma_limit
+
+
 @dataclass
 class BoundaryElementDimensions:
     """Dimensiones requeridas del elemento de borde."""
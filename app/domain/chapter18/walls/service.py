@@ -16,7 +16,7 @@ import math
 from typing import Optional, List, Tuple, TYPE_CHECKING
 
 from ..common import SeismicCategory
-from ..boundary_elements import BoundaryElementService
+from ..boundary_elements import BoundaryElementService, edge_stresses
 from ..wall_piers import WallPierService, classify_wall_pier
 from ..reinforcement import SeismicReinforcementService
 from ..design_forces import ShearAmplificationService
@@ -343,18 +343,9 @@ class SeismicWallService:
         Returns:
             Esfuerzo máximo de compresión (MPa)
         """
-        Ag = lw * tw
-        Ig = tw * (lw ** 3) / 12
-        y = lw / 2
-
         # Convertir a unidades consistentes (N, N-mm)
-        Pu_N = abs(Pu) * TONF_TO_N
-        Mu_Nmm = abs(Mu) * TONFM_TO_NMM
-
-        sigma_axial = Pu_N / Ag if Ag > 0 else 0
-        sigma_moment = (Mu_Nmm * y / Ig) if Ig > 0 else 0
-
-        return sigma_axial + sigma_moment  # MPa (N/mm² = MPa)
+        sigma_max, _ = edge_stresses(lw, tw, abs(Pu) * TONF_TO_N, abs(Mu) * TONFM_TO_NMM)
+        return sigma_max  # MPa (N/mm² = MPa)
 
     def _check_wall_pier(
         self,
@@ -644,17 +635,12 @@ class SeismicWallService:
 
         # Calcular esfuerzo máximo por método de esfuerzos
         Ag = lw * tw
-        Ig = tw * (lw ** 3) / 12
-        y = lw / 2
 
-        # P en N, M en N-mm
+        # P en N
         Pu_N = abs(Pu) * TONF_TO_N
-        Mu_Nmm = abs(Mu) * TONFM_TO_NMM
 
-        # sigma = P/A + M×y/I
-        sigma_axial = Pu_N / Ag if Ag > 0 else 0
-        sigma_moment = (Mu_Nmm * y / Ig) if Ig > 0 else 0
-        sigma_max = (sigma_axial + sigma_moment)  # MPa (ya en N/mm² = MPa)
+        # sigma = P/A + M×y/I (MPa, ya en N/mm² = MPa)
+        sigma_max = self._calculate_sigma_max(lw, tw, Pu, Mu)
 
         # Verificar por método de esfuerzos
         stress_result = self._boundary_service.check_stress_method(sigma_max, fc)
@@ -27,6 +27,7 @@ from .phi_chapter21 import (
     EPSILON_TY,
     EPSILON_T_LIMIT,
     calculate_phi_flexure,
+    calculate_phi_flexure_array,
     # Umbrales DCR
     DCR_OK,
     DCR_WARN,
@@ -26,6 +26,7 @@ TABLA 21.2.1 - Factores de reducción phi:
 - §21.2.4.1: phi = 0.60 para miembros controlados por cortante
 - §21.2.4.4: phi = 0.85 para vigas de acople con refuerzo diagonal
 """
+import numpy as np
 
 # =============================================================================
 # FACTORES PHI PARA FLEXIÓN Y CARGA AXIAL (§21.2.2)
@@ -97,21 +98,24 @@ WHITNEY_STRESS_FACTOR = 0.85   # 0.85×f'c para bloque rectangular equivalente
 # FUNCIONES DE CÁLCULO DE PHI
 # =============================================================================
 
-def calculate_phi_flexure(
-    epsilon_t: float,
+def calculate_phi_flexure_array(
+    epsilon_t: np.ndarray,
     is_spiral: bool = False,
     is_unconfined: bool = False
-) -> float:
+) -> np.ndarray:
     """
-    Calcula el factor de reducción φ según la deformación del acero (§21.2.2).
+    Calcula φ según la deformación del acero (§21.2.2), para un arreglo.
+
+    Es la única implementación de la Tabla 21.2.2: calculate_phi_flexure()
+    la usa para un solo valor.
 
     Args:
-        epsilon_t: Deformación neta del acero en tracción (valor absoluto)
+        epsilon_t: Deformaciones netas del acero en tracción
         is_spiral: True si el elemento tiene refuerzo en espiral
         is_unconfined: True si es hormigón no confinado (Cap. 14, pedestales con 1 barra)
 
     Returns:
-        φ: Factor de reducción de resistencia
+        Arreglo de φ con la forma de epsilon_t
 
     Tabla 21.2.2:
     - epsilon_t <= epsilon_ty: Compresión controlada (0.65 o 0.75)
@@ -121,24 +125,42 @@ def calculate_phi_flexure(
     Capítulo 14 (hormigón no confinado):
     - φ = 0.60 constante para todos los estados de deformación
     """
+    eps = np.abs(np.asarray(epsilon_t, dtype=float))
+
     # Caso especial: hormigón no confinado (Cap. 14)
     # Para pedestales/pilares con 1 barra centrada, φ = 0.60 siempre
     if is_unconfined:
-        return PHI_COMPRESSION_UNCONFINED
+        return np.full_like(eps, PHI_COMPRESSION_UNCONFINED)
 
-    epsilon_t = abs(epsilon_t)
     phi_c = PHI_COMPRESSION_SPIRAL if is_spiral else PHI_COMPRESSION
+    # Zona de transición - interpolación lineal
+    transition = phi_c + (PHI_TENSION - phi_c) * \
+        (eps - EPSILON_TY) / (EPSILON_T_LIMIT - EPSILON_TY)
+    return np.where(
+        eps >= EPSILON_T_LIMIT, PHI_TENSION,        # Controlada por tracción
+        np.where(eps <= EPSILON_TY, phi_c, transition)  # Controlada por compresión
+    )
+
+
+def calculate_phi_flexure(
+    epsilon_t: float,
+    is_spiral: bool = False,
+    is_unconfined: bool = False
+) -> float:
+    """
+    Calcula el factor de reducción φ según la deformación del acero (§21.2.2).
 
-    if epsilon_t >= EPSILON_T_LIMIT:
-        # Sección controlada por tracción
-        return PHI_TENSION
-    elif epsilon_t <= EPSILON_TY:
-        # Sección controlada por compresión
-        return phi_c
-    else:
-        # Zona de transición - interpolación lineal
-        return phi_c + (PHI_TENSION - phi_c) * \
-               (epsilon_t - EPSILON_TY) / (EPSILON_T_LIMIT - EPSILON_TY)
+    Delega a calculate_phi_flexure_array() con un solo valor.
+
+    Args:
+        epsilon_t: Deformación neta del acero en tracción (valor absoluto)
+        is_spiral: True si el elemento tiene refuerzo en espiral
+        is_unconfined: True si es hormigón no confinado (Cap. 14, pedestales con 1 barra)
+
+    Returns:
+        φ: Factor de reducción de resistencia
+    """
+    return float(calculate_phi_flexure_array(epsilon_t, is_spiral, is_unconfined))
 
 
 # =============================================================================
@@ -24,6 +24,7 @@ from .horizontal_element import (
     HorizontalDiscreteReinforcement,
 )
 from .load_combination import LoadCombination
+from .force_store import ForceStore
 from .element_forces import ElementForces, ElementForceType
 from .parsed_data import ParsedData
 from .design_proposal import (
@@ -59,6 +60,7 @@ __all__ = [
     # Fuerzas
     'ElementForces',
     'ElementForceType',
+    'ForceStore',
     # Comunes
     'LoadCombination',
     'ParsedData',
@@ -7,10 +7,13 @@ Esta estructura permite calcular propiedades de sección (Ag, centroide, Ixx, Iy
 para geometrías no rectangulares según ACI 318-25.
 """
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, TYPE_CHECKING
 from enum import Enum
 import math
 
+if TYPE_CHECKING:
+    from ..flexure.fiber_section import FiberMesh
+
 
 class SectionShapeType(Enum):
     """Tipo de forma de la sección compuesta."""
@@ -156,6 +159,7 @@ class CompositeSection:
     _centroid: Optional[Tuple[float, float]] = field(default=None, repr=False)
     _Ixx: Optional[float] = field(default=None, repr=False)
     _Iyy: Optional[float] = field(default=None, repr=False)
+    _fiber_mesh: Optional['FiberMesh'] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         """Detecta automáticamente el tipo de forma si no se especificó."""
@@ -333,6 +337,19 @@ class CompositeSection:
 
         return (min(xs), min(ys), max(xs), max(ys))
 
+    def get_fiber_mesh(self) -> 'FiberMesh':
+        """
+        Malla de fibras de hormigón de la sección (para la curva P-M).
+
+        Unión de los rectángulos de los segmentos: el solape en las
+        intersecciones se cuenta una sola vez (a diferencia de Ag). Se
+        calcula una vez y se cachea.
+        """
+        if self._fiber_mesh is None:
+            from ..flexure.fiber_section import mesh_polygons
+            self._fiber_mesh = mesh_polygons([s.get_corners() for s in self.segments])
+        return self._fiber_mesh
+
     def calculate_Acv(self, direction: str = 'primary') -> float:
         """
         Área de cortante efectiva según ACI 318-25 para muros flanged.
@@ -471,6 +488,7 @@ class CompositeSection:
         self._centroid = None
         self._Ixx = None
         self._Iyy = None
+        self._fiber_mesh = None
 
     def to_dict(self) -> dict:
         """Convierte la sección a diccionario para serialización."""
@@ -491,7 +509,22 @@ class CompositeSection:
                     'thickness': s.thickness,
                     'length': s.length,
                     'orientation': s.orientation,
+                    'wall_id': s.wall_id,
                 }
                 for s in self.segments
             ]
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CompositeSection':
+        """Reconstruye la sección desde to_dict() (las propiedades se recalculan)."""
+        return cls(
+            segments=[
+                WallSegment(
+                    x1=s['x1'], y1=s['y1'], x2=s['x2'], y2=s['y2'],
+                    thickness=s['thickness'], wall_id=s.get('wall_id'),
+                )
+                for s in data.get('segments', [])
+            ],
+            shape_type=SectionShapeType(data.get('shape_type', SectionShapeType.CUSTOM.value)),
+        )
@@ -2,15 +2,18 @@
 """
 Entidad unificada para fuerzas de cualquier elemento estructural.
 
-OPTIMIZADO: Almacena combinaciones como DataFrame en lugar de lista de objetos
-para evitar crear 240k+ objetos Python durante el parsing.
+OPTIMIZADO: Las combinaciones viven en un ForceStore columnar compartido por
+toda la tabla de fuerzas; cada ElementForces es una vista [start, stop) sin
+copia, en lugar de un DataFrame o una lista de objetos por elemento.
 """
 import math
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional, TYPE_CHECKING, Any
+from typing import List, Dict, Iterator, Optional, Tuple, TYPE_CHECKING, Any
 import numpy as np
 
+from .force_store import ForceStore, FORCE_COLUMNS, LABEL_COLUMNS
+
 if TYPE_CHECKING:
     from .load_combination import LoadCombination
     from .section_cut import SectionCutInfo
@@ -36,9 +39,10 @@ class ElementForces:
     """
     Colección de combinaciones de carga para cualquier elemento estructural.
 
-    OPTIMIZADO: Usa DataFrame interno para almacenar combinaciones en lugar
-    de lista de objetos LoadCombination. Esto elimina la creación de 240k+
-    objetos Python y permite operaciones vectorizadas.
+    OPTIMIZADO: Es una vista sobre un ForceStore columnar (arreglos NumPy
+    contiguos compartidos por todos los elementos de la tabla). Las columnas
+    se leen sin copia con values()/labels(); los objetos LoadCombination
+    solo se crean bajo demanda (iter_combinations() o combinations).
 
     Campos obligatorios:
         label: Identificador del elemento
@@ -60,16 +64,132 @@ class ElementForces:
     length: float = 0.0  # mm - Vigas
     section_cut: Optional['SectionCutInfo'] = None  # Drop beams
 
-    # DataFrame interno para combinaciones (OPTIMIZADO)
-    _combinations_df: Optional[pd.DataFrame] = field(default=None, repr=False)
+    # Almacén columnar y rango de filas de este elemento (OPTIMIZADO)
+    _store: Optional[ForceStore] = field(default=None, repr=False)
+    _start: int = field(default=0, repr=False)
+    _stop: int = field(default=0, repr=False)
 
     # Cache para lista de objetos (lazy loading)
     _combinations_list: Optional[List['LoadCombination']] = field(default=None, repr=False)
 
     def __post_init__(self):
-        """Inicializa DataFrame vacío si no se proporciona."""
-        if self._combinations_df is None:
-            self._combinations_df = pd.DataFrame(columns=COMBO_COLUMNS)
+        """Inicializa almacén vacío si no se proporciona."""
+        if self._store is None:
+            self._store = ForceStore.empty()
+            self._start = self._stop = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Estado para pickle (envío a procesos worker).
+
+        Omite el cache de objetos LoadCombination y, si el almacén es
+        compartido, viaja solo una copia compacta de las filas del elemento.
+        """
+        state = self.__dict__.copy()
+        state['_combinations_list'] = None
+        if self._start != 0 or self._stop != len(self._store):
+            state['_store'] = self._store.subset(self._start, self._stop)
+            state['_start'], state['_stop'] = 0, self._stop - self._start
+        return state
+
+    @classmethod
+    def views(
+        cls,
+        store: ForceStore,
+        ranges: Dict[str, Tuple[int, int]],
+        element_type: ElementForceType
+    ) -> Dict[str, 'ElementForces']:
+        """
+        Crea en bloque las vistas de todos los elementos de un almacén.
+
+        Args:
+            store: Almacén de la tabla completa (ForceStore.from_frame)
+            ranges: {"Story_Label": (start, stop)}
+            element_type: Tipo de elemento
+
+        Returns:
+            {clave: ElementForces}. Se omiten claves sin '_'.
+        """
+        views: Dict[str, 'ElementForces'] = {}
+        for key, (start, stop) in ranges.items():
+            story, separator, label = key.partition('_')
+            if not separator:
+                continue
+            views[key] = cls(
+                label=label, story=story, element_type=element_type,
+                _store=store, _start=start, _stop=stop
+            )
+        return views
+
+    @staticmethod
+    def share_store(forces: Dict[str, 'ElementForces']) -> None:
+        """
+        Reasocia los elementos a un único almacén compacto.
+
+        Las vistas que vuelven de otro proceso traen cada una su propia copia
+        de filas (ver __getstate__); unirlas restituye un almacén por tabla.
+
+        Args:
+            forces: {clave: ElementForces} (se modifican en el lugar)
+        """
+        if not forces:
+            return
+        store, ranges = ForceStore.concat({key: f.store_range for key, f in forces.items()})
+        for key, force in forces.items():
+            force.bind(store, *ranges[key])
+
+    def bind(self, store: ForceStore, start: int, stop: int) -> None:
+        """Asocia el elemento a las filas [start, stop) de un almacén."""
+        self._store = store
+        self._start = start
+        self._stop = stop
+        self._combinations_list = None  # Invalidar cache
+
+    # =========================================================================
+    # Acceso columnar (sin crear objetos)
+    # =========================================================================
+
+    @property
+    def store_range(self) -> Tuple[ForceStore, int, int]:
+        """(almacén, start, stop) de las filas de este elemento."""
+        return self._store, self._start, self._stop
+
+    def values(self, column: str) -> np.ndarray:
+        """Vista de solo lectura de una columna numérica (P, V2, V3, T, M2, M3)."""
+        return self._store.column(column, self._start, self._stop)
+
+    def labels(self, column: str) -> np.ndarray:
+        """Textos de una columna categórica (name, location, step_type)."""
+        return self._store.labels(column, self._start, self._stop)
+
+    def iter_combinations(self) -> Iterator['LoadCombination']:
+        """
+        Itera las combinaciones creando un LoadCombination a la vez.
+
+        No guarda los objetos (a diferencia de combinations), por lo que la
+        memoria no crece al recorrer elementos con muchas combinaciones.
+        """
+        if self._combinations_list is not None:
+            yield from self._combinations_list
+            return
+
+        from .load_combination import LoadCombination
+        columns = [self.labels(col) for col in LABEL_COLUMNS]
+        columns += [self.values(col).tolist() for col in FORCE_COLUMNS]
+        for name, location, step_type, P, V2, V3, T, M2, M3 in zip(*columns):
+            yield LoadCombination(
+                name=name, location=location, step_type=step_type,
+                P=P, V2=V2, V3=V3, T=T, M2=M2, M3=M3
+            )
+
+    def get_combination(self, i: int) -> 'LoadCombination':
+        """Crea solo el LoadCombination de la combinación i (sin materializar la lista)."""
+        from .load_combination import LoadCombination
+        row = self._start + int(i)
+        return LoadCombination(
+            **{col: str(self._store.labels(col, row, row + 1)[0]) for col in LABEL_COLUMNS},
+            **{col: float(self._store.column(col)[row]) for col in FORCE_COLUMNS}
+        )
 
     # =========================================================================
     # Propiedades para acceso a combinaciones
@@ -84,70 +204,49 @@ class ElementForces:
         if self._combinations_list is not None:
             return self._combinations_list
 
-        # Crear lista desde DataFrame solo si se necesita
-        if self._combinations_df is None or len(self._combinations_df) == 0:
+        if self.n_combinations == 0:
             return []
 
-        from .load_combination import LoadCombination
-        # Convertir tipos numpy a Python nativos para evitar errores de serialización JSON
-        self._combinations_list = [
-            LoadCombination(
-                name=str(row['name']) if row['name'] is not None else '',
-                location=str(row['location']) if row['location'] is not None else '',
-                step_type=str(row['step_type']) if row['step_type'] is not None else '',
-                P=float(row['P']),
-                V2=float(row['V2']),
-                V3=float(row['V3']),
-                T=float(row['T']),
-                M2=float(row['M2']),
-                M3=float(row['M3'])
-            )
-            for row in self._combinations_df.to_dict('records')
-        ]
+        self._combinations_list = list(self.iter_combinations())
         return self._combinations_list
 
     @combinations.setter
     def combinations(self, value: List['LoadCombination']):
         """Permite asignar lista de combinaciones (compatibilidad)."""
         if not value:
-            self._combinations_df = pd.DataFrame(columns=COMBO_COLUMNS)
+            self.bind(ForceStore.empty(), 0, 0)
             self._combinations_list = []
             return
 
-        # Convertir lista a DataFrame
-        self._combinations_df = pd.DataFrame([
-            {
-                'name': c.name,
-                'location': c.location,
-                'step_type': c.step_type,
-                'P': c.P,
-                'V2': c.V2,
-                'V3': c.V3,
-                'T': c.T,
-                'M2': c.M2,
-                'M3': c.M3
-            }
-            for c in value
-        ])
+        df = pd.DataFrame(
+            [[getattr(c, col) for col in COMBO_COLUMNS] for c in value],
+            columns=COMBO_COLUMNS
+        )
+        store, ranges = ForceStore.from_frame(df)
+        self.bind(store, *ranges[''])
         self._combinations_list = value
 
     def set_combinations_from_df(self, df: pd.DataFrame):
         """
         Asigna combinaciones directamente desde DataFrame (RÁPIDO).
-        Evita crear objetos LoadCombination.
+        Evita crear objetos LoadCombination. Para tablas completas conviene
+        ForceStore.from_frame() + bind(), que comparte un único almacén.
         """
-        self._combinations_df = df[COMBO_COLUMNS].copy() if len(df) > 0 else pd.DataFrame(columns=COMBO_COLUMNS)
-        self._combinations_list = None  # Invalidar cache
+        if len(df) == 0:
+            self.bind(ForceStore.empty(), 0, 0)
+            return
+        store, ranges = ForceStore.from_frame(df[COMBO_COLUMNS])
+        self.bind(store, *ranges[''])
 
     @property
     def combinations_df(self) -> pd.DataFrame:
-        """Acceso directo al DataFrame de combinaciones."""
-        return self._combinations_df
+        """DataFrame de combinaciones (se construye en cada acceso)."""
+        return self._store.to_frame(self._start, self._stop)
 
     @property
     def n_combinations(self) -> int:
         """Número de combinaciones (sin crear objetos)."""
-        return len(self._combinations_df) if self._combinations_df is not None else 0
+        return self._stop - self._start
 
     # =========================================================================
     # Métodos VECTORIZADOS (no crean objetos LoadCombination)
@@ -156,19 +255,19 @@ class ElementForces:
     def get_envelope(self) -> Dict[str, float]:
         """
         Obtiene la envolvente de todas las combinaciones.
-        VECTORIZADO: Opera sobre DataFrame directamente.
+        VECTORIZADO: Opera sobre las columnas del almacén.
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             return {}
 
+        P = self.values('P')
         return {
-            'P_max': float(df['P'].max()),
-            'P_min': float(df['P'].min()),
-            'V2_max': float(df['V2'].abs().max()),
-            'V3_max': float(df['V3'].abs().max()),
-            'M2_max': float(df['M2'].abs().max()),
-            'M3_max': float(df['M3'].abs().max()),
+            'P_max': float(P.max()),
+            'P_min': float(P.min()),
+            'V2_max': float(np.abs(self.values('V2')).max()),
+            'V3_max': float(np.abs(self.values('V3')).max()),
+            'M2_max': float(np.abs(self.values('M2')).max()),
+            'M3_max': float(np.abs(self.values('M3')).max()),
         }
 
     def get_critical_pm_points(
@@ -178,46 +277,61 @@ class ElementForces:
     ) -> List[tuple]:
         """
         Obtiene todos los puntos (P, M) para graficar en diagrama de interacción.
-        VECTORIZADO: Opera sobre DataFrame.
+        VECTORIZADO: Opera sobre las columnas del almacén.
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             return []
 
+        P, M, names = self.get_pm_arrays(moment_axis, angle_deg)
+        return [(p, m, n) for p, m, n in zip(P.tolist(), M.tolist(), names)]
+
+    def get_pm_arrays(
+        self,
+        moment_axis: str = 'M3',
+        angle_deg: float = 0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Puntos (P, M) de todas las combinaciones como arreglos.
+
+        Mismos valores que get_critical_pm_points() sin armar tuplas.
+
+        Returns:
+            (P, M, nombres "name (location)"); P positivo = compresión
+        """
         # P con convención positivo = compresión
-        P = -df['P'].values
+        P = -self.values('P')
+        M2 = self.values('M2')
+        M3 = self.values('M3')
 
         # Calcular momento según eje
         if moment_axis == 'M2':
-            M = np.abs(df['M2'].values)
+            M = np.abs(M2)
         elif moment_axis == 'M3':
-            M = np.abs(df['M3'].values)
+            M = np.abs(M3)
         elif moment_axis == 'combined':
             rad = math.radians(angle_deg)
-            M = np.abs(df['M3'].values * math.cos(rad) + df['M2'].values * math.sin(rad))
+            M = np.abs(M3 * math.cos(rad) + M2 * math.sin(rad))
         elif moment_axis == 'SRSS':
-            M = np.sqrt(df['M2'].values**2 + df['M3'].values**2)
+            M = np.sqrt(M2**2 + M3**2)
         else:
-            M = np.abs(df['M3'].values)
-
-        # Crear nombres de combinación y convertir a tipos Python nativos
-        names = df['name'].values + ' (' + df['location'].values + ')'
+            M = np.abs(M3)
 
-        return [(float(p), float(m), str(n)) for p, m, n in zip(P, M, names)]
+        # Nombres de combinación con ubicación
+        names = self.labels('name') + ' (' + self.labels('location') + ')'
+        return P, M, names
 
     def get_combinations_with_angles(self) -> List[dict]:
         """
         Obtiene todas las combinaciones con información de ángulo.
-        VECTORIZADO: Opera sobre DataFrame.
+        VECTORIZADO: Opera sobre las columnas del almacén.
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             return []
 
         # Calcular valores vectorizados
-        M2 = df['M2'].values
-        M3 = df['M3'].values
-        P_compression = -df['P'].values
+        M2 = self.values('M2')
+        M3 = self.values('M3')
+        P_compression = -self.values('P')
 
         M_resultant = np.sqrt(M2**2 + M3**2)
 
@@ -226,20 +340,24 @@ class ElementForces:
             angle_deg = np.degrees(np.arctan2(np.abs(M2), np.abs(M3)))
             angle_deg = np.nan_to_num(angle_deg, nan=0.0)
 
+        names = self.labels('name')
+        locations = self.labels('location')
+        step_types = self.labels('step_type')
+
         # Crear lista de dicts (convertir tipos numpy a Python nativos)
         combos_info = []
-        for i in range(len(df)):
+        for i in range(self.n_combinations):
             combos_info.append({
                 'index': int(i),
-                'name': str(df['name'].iloc[i]),
-                'location': str(df['location'].iloc[i]),
-                'step_type': str(df['step_type'].iloc[i]),
+                'name': str(names[i]),
+                'location': str(locations[i]),
+                'step_type': str(step_types[i]),
                 'P': float(P_compression[i]),
                 'M2': float(M2[i]),
                 'M3': float(M3[i]),
                 'M_resultant': float(M_resultant[i]),
                 'angle_deg': float(angle_deg[i]),
-                'full_name': f"{df['name'].iloc[i]} ({df['location'].iloc[i]})"
+                'full_name': f"{names[i]} ({locations[i]})"
             })
 
         # Ordenar por momento resultante
@@ -251,14 +369,13 @@ class ElementForces:
         Obtiene los cortantes máximos en cada dirección.
         VECTORIZADO.
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             if self.element_type == ElementForceType.DROP_BEAM:
                 return {'V_max': 0, 'V2_max': 0, 'V3_max': 0}
             return {'V2_max': 0, 'V3_max': 0}
 
-        V2_max = float(df['V2'].abs().max())
-        V3_max = float(df['V3'].abs().max())
+        V2_max = float(np.abs(self.values('V2')).max())
+        V3_max = float(np.abs(self.values('V3')).max())
 
         result = {
             'V2_max': V2_max,
@@ -274,13 +391,12 @@ class ElementForces:
         """
         Obtiene el momento máximo. VECTORIZADO.
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             return {'M2_max': 0, 'M3_max': 0}
 
         return {
-            'M2_max': float(df['M2'].abs().max()),
-            'M3_max': float(df['M3'].abs().max())
+            'M2_max': float(np.abs(self.values('M2')).max()),
+            'M3_max': float(np.abs(self.values('M3')).max())
         }
 
     # =========================================================================
@@ -291,106 +407,47 @@ class ElementForces:
         """
         Obtiene la combinación con máxima demanda (P + M combinado).
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             return None
 
         # Calcular demanda vectorizada
-        demand = df['P'].abs() + np.sqrt(df['M2']**2 + df['M3']**2)
-        idx = demand.idxmax()
+        demand = np.abs(self.values('P')) + np.sqrt(self.values('M2')**2 + self.values('M3')**2)
 
         # Crear solo el objeto necesario
-        from .load_combination import LoadCombination
-        row = df.loc[idx]
-        return LoadCombination(
-            name=row['name'],
-            location=row['location'],
-            step_type=row['step_type'],
-            P=row['P'],
-            V2=row['V2'],
-            V3=row['V3'],
-            T=row['T'],
-            M2=row['M2'],
-            M3=row['M3']
-        )
+        return self.get_combination(np.argmax(demand))
 
     def get_critical_shear_combo(self) -> Optional['LoadCombination']:
         """
         Obtiene la combinación con el cortante máximo.
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             return None
 
         if self.element_type == ElementForceType.DROP_BEAM:
-            shear = np.maximum(df['V2'].abs(), df['V3'].abs())
+            shear = np.maximum(np.abs(self.values('V2')), np.abs(self.values('V3')))
         else:
-            shear = df['V2'].abs()
+            shear = np.abs(self.values('V2'))
 
-        idx = shear.idxmax()
-
-        from .load_combination import LoadCombination
-        row = df.loc[idx]
-        return LoadCombination(
-            name=row['name'],
-            location=row['location'],
-            step_type=row['step_type'],
-            P=row['P'],
-            V2=row['V2'],
-            V3=row['V3'],
-            T=row['T'],
-            M2=row['M2'],
-            M3=row['M3']
-        )
+        return self.get_combination(np.argmax(shear))
 
     def get_critical_moment_combo(self) -> Optional['LoadCombination']:
         """
         Obtiene la combinación con el momento M3 máximo.
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             return None
 
-        idx = df['M3'].abs().idxmax()
-
-        from .load_combination import LoadCombination
-        row = df.loc[idx]
-        return LoadCombination(
-            name=row['name'],
-            location=row['location'],
-            step_type=row['step_type'],
-            P=row['P'],
-            V2=row['V2'],
-            V3=row['V3'],
-            T=row['T'],
-            M2=row['M2'],
-            M3=row['M3']
-        )
+        return self.get_combination(np.argmax(np.abs(self.values('M3'))))
 
     def get_critical_flexure_combo(self) -> Optional['LoadCombination']:
         """
         Obtiene la combinación crítica para flexocompresión.
         """
-        df = self._combinations_df
-        if df is None or len(df) == 0:
+        if self.n_combinations == 0:
             return None
 
-        M_max = np.maximum(df['M2'].abs(), df['M3'].abs())
-        idx = M_max.idxmax()
-
-        from .load_combination import LoadCombination
-        row = df.loc[idx]
-        return LoadCombination(
-            name=row['name'],
-            location=row['location'],
-            step_type=row['step_type'],
-            P=row['P'],
-            V2=row['V2'],
-            V3=row['V3'],
-            T=row['T'],
-            M2=row['M2'],
-            M3=row['M3']
-        )
+        M_max = np.maximum(np.abs(self.values('M2')), np.abs(self.values('M3')))
+        return self.get_combination(np.argmax(M_max))
 
     # =========================================================================
     # Métodos específicos de PierForces
@@ -0,0 +1,220 @@
+# app/domain/entities/force_store.py
+"""
+Almacén columnar de combinaciones de carga.
+
+Una tabla de fuerzas de ETABS (piers, columnas, vigas, section cuts) se
+guarda UNA vez como arreglos NumPy contiguos: P/V2/V3/T/M2/M3 en float64 y
+name/location/step_type como códigos categóricos (int32 + categorías).
+Las filas de cada elemento quedan consecutivas, de modo que ElementForces
+es solo un rango [start, stop) sobre el almacén: sin DataFrame por elemento
+y con acceso a columnas sin copia.
+"""
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Columnas numéricas (fuerzas en tonf, momentos en tonf-m)
+FORCE_COLUMNS = ('P', 'V2', 'V3', 'T', 'M2', 'M3')
+
+# Columnas de texto (codificadas como categorías)
+LABEL_COLUMNS = ('name', 'location', 'step_type')
+
+
+def _encode_labels(values: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+    """Codifica textos como (códigos int32, categorías). None/NaN -> ''."""
+    series = pd.Series(values, dtype=object)
+    series = series.where(series.notna(), '').astype(str)
+    codes, categories = pd.factorize(series, sort=False)
+    return codes.astype(np.int32), np.asarray(categories, dtype=object)
+
+
+class ForceStore:
+    """
+    Combinaciones de carga de muchos elementos en arreglos columnares.
+
+    Se construye desde un DataFrame con COMBO_COLUMNS (from_frame). Los
+    arreglos son de solo lectura: las vistas que entrega column() no se
+    pueden modificar por accidente desde un elemento.
+
+    Con lazy() los arreglos se cargan recién en el primer acceso (ej:
+    proyecto abierto desde disco cuyas fuerzas aún no se consultan).
+    """
+
+    def __init__(
+        self,
+        numeric: Dict[str, np.ndarray],
+        codes: Dict[str, np.ndarray],
+        categories: Dict[str, np.ndarray]
+    ):
+        self._loader = None
+        self._set_arrays(numeric, codes, categories)
+
+    def _set_arrays(self, numeric, codes, categories) -> None:
+        for arr in (*numeric.values(), *codes.values()):
+            arr.flags.writeable = False
+        self._n_rows = len(numeric['P'])
+        self._numeric = numeric
+        self._codes = codes
+        self._categories = categories
+
+    def __getattr__(self, name: str):
+        # Solo se invoca si el atributo no existe: arreglos de un almacén lazy
+        loader = self.__dict__.get('_loader')
+        if loader is None or name not in ('_numeric', '_codes', '_categories'):
+            raise AttributeError(name)
+        self._set_arrays(*loader())
+        self._loader = None
+        return self.__dict__[name]
+
+    # =========================================================================
+    # Construcción
+    # =========================================================================
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        key_column: Optional[str] = None
+    ) -> Tuple['ForceStore', Dict[str, Tuple[int, int]]]:
+        """
+        Crea el almacén desde un DataFrame de combinaciones.
+
+        Args:
+            df: DataFrame con COMBO_COLUMNS (y opcionalmente key_column)
+            key_column: Columna con la clave del elemento. Las filas se
+                agrupan por clave (orden estable dentro de cada elemento)
+
+        Returns:
+            (store, {clave: (start, stop)}). Sin key_column el rango único
+            se entrega bajo la clave ''.
+        """
+        if key_column is not None and len(df) > 0:
+            # Códigos enteros en orden alfabético de clave: el argsort estable
+            # se hace sobre enteros y los rangos salen de los conteos
+            codes, keys = pd.factorize(df[key_column].astype(str), sort=True)
+            order = np.argsort(codes, kind='stable')
+            df = df.iloc[order]
+            counts = np.bincount(codes, minlength=len(keys))
+            stops = np.cumsum(counts)
+            starts = stops - counts
+            ranges = {
+                key: (int(start), int(stop))
+                for key, start, stop in zip(keys, starts, stops)
+            }
+        else:
+            ranges = {'': (0, len(df))}
+
+        numeric = {
+            col: np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+            for col in FORCE_COLUMNS
+        }
+        codes, categories = {}, {}
+        for col in LABEL_COLUMNS:
+            codes[col], categories[col] = _encode_labels(df[col].to_numpy())
+
+        return cls(numeric, codes, categories), ranges
+
+    @classmethod
+    def concat(
+        cls,
+        parts: Dict[str, Tuple['ForceStore', int, int]]
+    ) -> Tuple['ForceStore', Dict[str, Tuple[int, int]]]:
+        """
+        Une rangos de uno o más almacenes en un almacén compacto.
+
+        Args:
+            parts: {clave: (store, start, stop)}
+
+        Returns:
+            (store, {clave: (start, stop)}) en el orden de parts
+        """
+        ranges, offset = {}, 0
+        for key, (_, start, stop) in parts.items():
+            ranges[key] = (offset, offset + stop - start)
+            offset += stop - start
+        if not parts:
+            return cls.empty(), ranges
+
+        numeric = {
+            col: np.concatenate([s.column(col, a, b) for s, a, b in parts.values()])
+            for col in FORCE_COLUMNS
+        }
+        codes, categories = {}, {}
+        for col in LABEL_COLUMNS:
+            codes[col], categories[col] = _encode_labels(
+                np.concatenate([s.labels(col, a, b) for s, a, b in parts.values()])
+            )
+        return cls(numeric, codes, categories), ranges
+
+    @classmethod
+    def empty(cls) -> 'ForceStore':
+        """Almacén sin combinaciones."""
+        return cls(
+            {col: np.empty(0, dtype=np.float64) for col in FORCE_COLUMNS},
+            {col: np.empty(0, dtype=np.int32) for col in LABEL_COLUMNS},
+            {col: np.empty(0, dtype=object) for col in LABEL_COLUMNS},
+        )
+
+    @classmethod
+    def lazy(
+        cls,
+        n_rows: int,
+        loader: Callable[[], Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray], Dict[str, np.ndarray]]]
+    ) -> 'ForceStore':
+        """
+        Almacén cuyos arreglos se cargan en el primer acceso.
+
+        Args:
+            n_rows: Número de filas (len() no dispara la carga)
+            loader: Función que retorna (numeric, codes, categories)
+        """
+        store = cls.__new__(cls)
+        store._loader = loader
+        store._n_rows = n_rows
+        return store
+
+    @property
+    def is_loaded(self) -> bool:
+        """True si los arreglos ya están en memoria."""
+        return self._loader is None
+
+    def subset(self, start: int, stop: int) -> 'ForceStore':
+        """Copia compacta de un rango (ej: para enviar un elemento a otro proceso)."""
+        numeric = {col: arr[start:stop].copy() for col, arr in self._numeric.items()}
+        codes, categories = {}, {}
+        for col in LABEL_COLUMNS:
+            used, remapped = np.unique(self._codes[col][start:stop], return_inverse=True)
+            codes[col] = remapped.astype(np.int32)
+            categories[col] = self._categories[col][used]
+        return ForceStore(numeric, codes, categories)
+
+    # =========================================================================
+    # Acceso
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes de los arreglos (sin contar categorías compartidas)."""
+        return sum(arr.nbytes for arr in (*self._numeric.values(), *self._codes.values()))
+
+    def arrays(self) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """(numeric, codes, categories) completos, para persistir el almacén."""
+        return self._numeric, self._codes, self._categories
+
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Vista (sin copia) de una columna numérica en [start, stop)."""
+        return self._numeric[name][start:stop]
+
+    def labels(self, name: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Textos de una columna categórica en [start, stop)."""
+        return self._categories[name][self._codes[name][start:stop]]
+
+    def to_frame(self, start: int = 0, stop: Optional[int] = None) -> pd.DataFrame:
+        """DataFrame con COMBO_COLUMNS para un rango (compatibilidad)."""
+        data = {col: self.labels(col, start, stop) for col in LABEL_COLUMNS}
+        data.update({col: self.column(col, start, stop) for col in FORCE_COLUMNS})
+        return pd.DataFrame(data)
@@ -57,11 +57,16 @@ class ParsedData:
     # Cache de resultados de analisis
     analysis_cache: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
+    # Huella de las entradas con que se calculó cada resultado del cache
+    # Estructura: {element_key: hash}. Si la huella no cambia, el resultado
+    # cacheado sigue siendo válido (análisis incremental)
+    analysis_fingerprints: Dict[str, str] = field(default_factory=dict)
+
     # Cache de curvas de interacción P-M por elemento
-    # Estructura: {element_key: {'primary': [InteractionPoint, ...], 'secondary': [...]}}
+    # Estructura: {element_key: {'primary': InteractionCurve, 'secondary': InteractionCurve}}
     # La curva P-M es determinística para un elemento dado (depende solo de geometría y armadura)
     # Se invalida automáticamente si cambia la armadura del elemento
-    interaction_curves: Dict[str, Dict[str, List[Any]]] = field(default_factory=dict)
+    interaction_curves: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     @property
     def has_vertical_elements(self) -> bool:
@@ -1003,6 +1003,8 @@ class VerticalElement:
             pm_v3=data.get('pm_v3', 1.0),
             pm_torsion=data.get('pm_torsion', 1.0),
             pm_weight=data.get('pm_weight', 1.0),
+            composite_section=(CompositeSection.from_dict(data['composite_section'])
+                               if data.get('composite_section') else None),
         )
 
     # =========================================================================
@@ -3,21 +3,33 @@
 Verificación de flexión según ACI 318-25.
 
 Módulos:
+- interaction_curve: Curva P-M compacta (InteractionCurve)
 - interaction_diagram: Diagramas de interacción P-M
 - slenderness: Efectos de esbeltez
 - checker: Verificación de capacidad a flexión
+- biaxial_surface: Superficie de interacción biaxial P-M2-M3
+- fiber_section: Sección de fibras para secciones compuestas (L, T, C)
 """
-from .interaction_diagram import InteractionDiagramService, InteractionPoint
+from .interaction_curve import InteractionCurve, InteractionPoint
+from .interaction_diagram import InteractionDiagramService
 from .slenderness import SlendernessService, SlendernessResult
 from .checker import FlexureChecker, FlexureCheckResult
+from .fiber_section import FiberMesh, FiberSection
+from .biaxial_surface import BiaxialSection, BiaxialSurface, generate_biaxial_surface
 from ..calculations.steel_layer_calculator import SteelLayer
 
 __all__ = [
     'InteractionDiagramService',
     'InteractionPoint',
+    'InteractionCurve',
     'SlendernessService',
     'SlendernessResult',
     'FlexureChecker',
     'FlexureCheckResult',
+    'BiaxialSection',
+    'BiaxialSurface',
+    'generate_biaxial_surface',
+    'FiberMesh',
+    'FiberSection',
     'SteelLayer',
 ]
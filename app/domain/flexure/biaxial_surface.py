@@ -0,0 +1,501 @@
+# app/domain/flexure/biaxial_surface.py
+"""
+Superficie de interacción biaxial P-M2-M3 por compatibilidad de deformaciones.
+
+Reemplaza la aproximación Mn(θ) = Mn3·cos(θ) + Mn2·sin(θ) por el equilibrio
+de la sección con el eje neutro inclinado (ACI 318-25 §22.2 y §22.4):
+
+1. Se evalúa una grilla (ángulo del eje neutro × profundidad c) en una sola
+   operación NumPy. El bloque de Whitney se integra en forma exacta
+   recortando cada polígono de hormigón (rectángulo o segmento de una
+   sección compuesta) con el semiplano comprimido; las barras se toman
+   con su posición 2D del RebarLayout.
+2. Para cada profundidad, la grilla se interpola a ángulos de momento fijos
+   (meridianos): cada meridiano es una curva P-M en el plano de un ángulo
+   de momento, con el mismo formato (n, 7) de InteractionCurve.
+3. Por meridiano se tabula el inverso del radio de la curva de diseño
+   según la dirección del rayo en el plano P-M (normalizado). El DCR de una
+   demanda (Pu, M2, M3) es una interpolación bilineal en esa tabla: O(1)
+   por combinación.
+
+Los ángulos (del eje neutro, de los meridianos y de los rayos) se reparten
+en coordenadas normalizadas por las dimensiones/capacidades de la sección,
+de modo que los muros delgados (M3 >> M2) quedan bien muestreados.
+
+Convención de ejes: x a lo largo del largo del muro (M3, dirección
+'primary'), y a lo largo del espesor (M2, 'secondary').
+
+Uso:
+    section = BiaxialSection.from_element(pier)
+    surface = generate_biaxial_surface(section)
+    surface.safety_factors(Pu, M2, M3)     # arreglos por combinación
+    surface.curve_at(M2, M3)               # InteractionCurve para graficar
+"""
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Tuple
+
+import numpy as np
+
+from ..constants.materials import EPSILON_CU, ES_MPA, calculate_beta1
+from ..constants.phi_chapter21 import (
+    PHI_COMPRESSION,
+    PHI_COMPRESSION_UNCONFINED,
+    PHI_TENSION,
+)
+from ..constants.units import N_TO_TONF, NMM_TO_TONFM
+from .checker import FlexureChecker
+from .fiber_section import corner_bars
+from .interaction_curve import CURVE_COLUMNS, InteractionCurve, ArrayLike
+from .interaction_diagram import calculate_phi_array, generate_c_values
+
+if TYPE_CHECKING:
+    from ..entities.vertical_element import VerticalElement
+
+# Resolución por defecto de la superficie
+N_NEUTRAL_AXIS_ANGLES = 144   # Ángulos del eje neutro (vuelta completa)
+N_MERIDIANS = 72              # Meridianos (ángulos de momento, vuelta completa)
+N_RAYS = 181                  # Rayos en el plano P-M, de -90° a 90°
+
+_PN, _MN, _PHI, _PHI_PN, _PHI_MN, _C, _EPS = range(len(CURVE_COLUMNS))
+
+
+# =============================================================================
+# SECCIÓN
+# =============================================================================
+
+@dataclass(eq=False)
+class BiaxialSection:
+    """
+    Sección de hormigón armado en 2D para la superficie biaxial.
+
+    polygons: polígonos convexos de hormigón (n_pol, n_vert, 2) en mm; las
+        secciones compuestas usan un rectángulo por WallSegment (igual que
+        CompositeSection.Ag)
+    bars: barras (n_bars, 3) con columnas x, y (mm), área (mm²)
+    """
+    polygons: np.ndarray
+    bars: np.ndarray
+    fc: float
+    fy: float
+    is_unconfined: bool = False
+
+    def __post_init__(self):
+        self.polygons = np.asarray(self.polygons, dtype=float).reshape(len(self.polygons), -1, 2)
+        self.bars = np.asarray(self.bars, dtype=float).reshape(-1, 3)
+
+    @classmethod
+    def rectangle(
+        cls,
+        length: float,
+        thickness: float,
+        bars: ArrayLike,
+        fc: float,
+        fy: float,
+        is_unconfined: bool = False
+    ) -> 'BiaxialSection':
+        """Sección rectangular length × thickness con origen en una esquina."""
+        corners = [(0.0, 0.0), (length, 0.0), (length, thickness), (0.0, thickness)]
+        return cls([corners], bars, fc, fy, is_unconfined)
+
+    @classmethod
+    def from_element(cls, element: 'VerticalElement') -> 'BiaxialSection':
+        """
+        Sección de un pier o columna: contorno (rectángulo o segmentos de
+        CompositeSection) y barras del RebarLayout.
+
+        Las secciones compuestas están en coordenadas de planta: se giran
+        por axis_angle para que x quede a lo largo del eje local del pier
+        (M3), igual que la curva P-M de fibras.
+
+        Sin barras en el layout pero con acero declarado, se reparte
+        As_flexure_total en 4 barras de esquina (como el modelo simplificado
+        de la curva P-M).
+        """
+        if element.is_composite:
+            polygons = np.array([segment.get_corners()
+                                 for segment in element.composite_section.segments], dtype=float)
+        else:
+            polygons = np.array([[(0.0, 0.0), (element.length, 0.0),
+                                  (element.length, element.thickness), (0.0, element.thickness)]])
+
+        bars = [(bar.x, bar.y, bar.area) for bar in element.get_rebar_layout().bars]
+        if not bars and element.As_flexure_total > 0:
+            bars = corner_bars(polygons.reshape(-1, 2), element.cover, element.As_flexure_total)
+        bars = np.array(bars, dtype=float).reshape(-1, 3)
+
+        if element.is_composite and element.axis_angle:
+            theta = math.radians(element.axis_angle)
+            rotation = np.array([[math.cos(theta), -math.sin(theta)],
+                                 [math.sin(theta), math.cos(theta)]])
+            polygons = polygons @ rotation
+            bars[:, :2] = bars[:, :2] @ rotation
+        return cls(polygons, bars, element.fc, element.fy)
+
+    @property
+    def vertices(self) -> np.ndarray:
+        """Todos los vértices de hormigón (n, 2)."""
+        return self.polygons.reshape(-1, 2)
+
+    @property
+    def Ag(self) -> float:
+        """Área bruta de hormigón (mm²)."""
+        return float(np.abs(_signed_areas(self.polygons)).sum())
+
+    @property
+    def As_total(self) -> float:
+        """Área total de acero (mm²)."""
+        return float(self.bars[:, 2].sum())
+
+    @property
+    def centroid(self) -> Tuple[float, float]:
+        """Centroide geométrico del hormigón (mm); los momentos se toman respecto a él."""
+        P1, P2 = self.polygons, np.roll(self.polygons, -1, axis=1)
+        cross = P1[..., 0] * P2[..., 1] - P2[..., 0] * P1[..., 1]
+        sign = np.sign(cross.sum(axis=1))[:, np.newaxis]
+        area = (cross * sign).sum() / 2
+        if area <= 0:
+            return 0.0, 0.0
+        x = ((P1[..., 0] + P2[..., 0]) * cross * sign).sum() / 6 / area
+        y = ((P1[..., 1] + P2[..., 1]) * cross * sign).sum() / 6 / area
+        return float(x), float(y)
+
+
+def _signed_areas(polygons: np.ndarray) -> np.ndarray:
+    P1, P2 = polygons, np.roll(polygons, -1, axis=1)
+    return (P1[..., 0] * P2[..., 1] - P2[..., 0] * P1[..., 1]).sum(axis=1) / 2
+
+
+# =============================================================================
+# INTEGRACIÓN DE LA SECCIÓN
+# =============================================================================
+
+def _compression_block(
+    polygons: np.ndarray,
+    u: np.ndarray,
+    limit: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Área y primeros momentos del hormigón con u·p >= limit (bloque de Whitney).
+
+    Recorta cada polígono convexo con el semiplano (Sutherland-Hodgman sobre
+    todos los ángulos y profundidades a la vez) y aplica el teorema de Green
+    a las aristas recortadas más la cuerda sobre la línea de corte.
+
+    Args:
+        polygons: (n_pol, n_vert, 2)
+        u: Dirección de compresión unitaria por ángulo (n_t, 2)
+        limit: Proyección del borde del bloque (n_t, n_c)
+
+    Returns:
+        (área, ∫x dA, ∫y dA), cada uno (n_t, n_c)
+    """
+    P1 = polygons
+    P2 = np.roll(polygons, -1, axis=1)
+    proj = np.einsum('pvk,tk->tpv', P1, u)[:, np.newaxis]             # (n_t, 1, n_pol, n_v)
+    s1 = proj - limit[:, :, np.newaxis, np.newaxis]                   # (n_t, n_c, n_pol, n_v)
+    s2 = np.roll(s1, -1, axis=3)
+    in1, in2 = s1 >= 0, s2 >= 0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(in1 != in2, s1 / (s1 - s2), 0.0)[..., np.newaxis]
+    X = P1 + ratio * (P2 - P1)
+    A = np.where(in1[..., np.newaxis], P1, X)   # Inicio de la parte comprimida de cada arista
+    B = np.where(in2[..., np.newaxis], P2, X)   # Fin de la parte comprimida
+
+    cross = np.where(in1 | in2, A[..., 0] * B[..., 1] - B[..., 0] * A[..., 1], 0.0)
+    area2 = cross.sum(axis=-1)
+    sx6 = ((A[..., 0] + B[..., 0]) * cross).sum(axis=-1)
+    sy6 = ((A[..., 1] + B[..., 1]) * cross).sum(axis=-1)
+
+    # Cuerda de cierre: del punto de salida al de entrada (polígono convexo)
+    E = np.where((in1 & ~in2)[..., np.newaxis], B, 0.0).sum(axis=-2)
+    N = np.where((~in1 & in2)[..., np.newaxis], A, 0.0).sum(axis=-2)
+    chord = E[..., 0] * N[..., 1] - N[..., 0] * E[..., 1]
+    area2 += chord
+    sx6 += (E[..., 0] + N[..., 0]) * chord
+    sy6 += (E[..., 1] + N[..., 1]) * chord
+
+    # Orientación de cada polígono (horario o antihorario)
+    sign = np.sign(_signed_areas(polygons))
+    return (area2 * sign).sum(axis=-1) / 2, (sx6 * sign).sum(axis=-1) / 6, (sy6 * sign).sum(axis=-1) / 6
+
+
+def _neutral_axis_directions(section: BiaxialSection, n_angles: int) -> np.ndarray:
+    """Direcciones de compresión (n, 2), uniformes en la sección normalizada a su caja."""
+    extent = np.ptp(section.vertices, axis=0)
+    extent = np.where(extent > 0, extent, 1.0)
+    angles = 2 * np.pi * np.arange(n_angles) / n_angles
+    u = np.column_stack([np.cos(angles) / extent[0], np.sin(angles) / extent[1]])
+    return u / np.linalg.norm(u, axis=1, keepdims=True)
+
+
+def _evaluate_grid(section: BiaxialSection, u: np.ndarray, c_fractions: np.ndarray):
+    """
+    Equilibrio de la sección para cada dirección u y cada c = fracción × d.
+
+    Returns:
+        (Pn en N, M3 en N-mm, M2 en N-mm, c en mm, εt), cada uno (n_t, n_c)
+    """
+    fc, fy = section.fc, section.fy
+    xc, yc = section.centroid
+    top = (section.vertices @ u.T).max(axis=0)                        # Fibra extrema comprimida
+    bar_xy, bar_area = section.bars[:, :2], section.bars[:, 2]
+
+    depth = top[:, np.newaxis] - u @ bar_xy.T                        # (n_t, n_bars)
+    if len(bar_area):
+        d = depth.max(axis=1)
+    else:
+        d = top - (section.vertices @ u.T).min(axis=0)
+    c = d[:, np.newaxis] * c_fractions                                # (n_t, n_c)
+
+    # Hormigón: bloque de Whitney de profundidad β1·c
+    a = calculate_beta1(fc) * c
+    area, Sx, Sy = _compression_block(section.polygons, u, top[:, np.newaxis] - a)
+    Cc = 0.85 * fc * area
+    M3 = 0.85 * fc * (Sx - xc * area)
+    M2 = 0.85 * fc * (Sy - yc * area)
+
+    # Acero: εi = εcu × (di - c) / c → positivo = tracción
+    c3 = c[..., np.newaxis]
+    depth3 = depth[:, np.newaxis, :]
+    epsilon = EPSILON_CU * (depth3 - c3) / c3
+    fs = np.minimum(np.abs(epsilon) * ES_MPA, fy)
+    fs = np.where(epsilon < 0, -fs, fs)
+    in_block = (depth3 <= a[..., np.newaxis]) & (fs < 0)
+    F = bar_area * np.where(in_block, fs + 0.85 * fc, fs)
+
+    Pn = Cc - F.sum(axis=-1)
+    M3 = M3 - (F * (bar_xy[:, 0] - xc)).sum(axis=-1)
+    M2 = M2 - (F * (bar_xy[:, 1] - yc)).sum(axis=-1)
+    epsilon_t = epsilon.max(axis=-1, initial=0.0)
+    return Pn, M3, M2, c, epsilon_t
+
+
+def _to_meridians(psi: np.ndarray, values: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    Interpola la grilla (ángulo del eje neutro × profundidad) a ángulos de
+    momento fijos.
+
+    Para cada profundidad, el ángulo de momento normalizado psi recorre la
+    vuelta completa a medida que gira el eje neutro; se interpola en él.
+    Si no es monótono (momentos ~0 cerca de compresión pura) se usa el
+    ángulo del eje neutro.
+
+    Args:
+        psi: Ángulo de momento normalizado (n_t, n_c)
+        values: Magnitudes a interpolar (n_val, n_t, n_c)
+        targets: Ángulos de los meridianos en [0, 2π) (n_m,)
+
+    Returns:
+        (n_val, n_m, n_c)
+    """
+    n_t, n_c = psi.shape
+    fallback = 2 * np.pi * np.arange(n_t + 1) / n_t
+    closed = np.concatenate([values, values[:, :1]], axis=1)
+    out = np.empty((len(values), len(targets), n_c))
+    for j in range(n_c):
+        xp = np.unwrap(psi[:, j])
+        xp = np.append(xp, xp[0] + 2 * np.pi)
+        if not np.all(np.diff(xp) > 0):
+            xp = fallback
+        x = xp[0] + np.mod(targets - xp[0], 2 * np.pi)
+        for k in range(len(values)):
+            out[k, :, j] = np.interp(x, xp, closed[k, :, j])
+    return out
+
+
+# =============================================================================
+# SUPERFICIE
+# =============================================================================
+
+class BiaxialSurface:
+    """
+    Superficie P-M2-M3 como meridianos (curvas P-M por ángulo de momento) y
+    tabla de radios de la curva de diseño.
+
+    Inmutable: se comparte entre elementos con la misma sección (ver
+    FlexocompressionService.biaxial_surface).
+    """
+
+    __slots__ = ('meridians', 'inverse_radius', 'M3_scale', 'M2_scale', 'P_scale',
+                 'M_scales', 'is_unconfined')
+
+    def __init__(
+        self,
+        meridians: np.ndarray,
+        inverse_radius: np.ndarray,
+        M3_scale: float,
+        M2_scale: float,
+        P_scale: float,
+        M_scales: np.ndarray,
+        is_unconfined: bool = False
+    ):
+        """
+        Args:
+            meridians: (n_m, n, 7) con columnas CURVE_COLUMNS; el meridiano k
+                está en el ángulo normalizado 2πk/n_m
+            inverse_radius: (n_m, N_RAYS) DCR de una demanda unitaria por rayo
+            M3_scale, M2_scale: Escalas de momento nominal (tonf-m) que
+                normalizan el ángulo de momento
+            P_scale: Escala de φPn (tonf) del plano P-M normalizado
+            M_scales: Escala de φMn (tonf-m) por meridiano
+        """
+        for array in (meridians, inverse_radius, M_scales):
+            array.setflags(write=False)
+        self.meridians = meridians
+        self.inverse_radius = inverse_radius
+        self.M3_scale = M3_scale
+        self.M2_scale = M2_scale
+        self.P_scale = P_scale
+        self.M_scales = M_scales
+        self.is_unconfined = is_unconfined
+
+    @property
+    def n_meridians(self) -> int:
+        return len(self.meridians)
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria de los arreglos (para el límite del cache)."""
+        return self.meridians.nbytes + self.inverse_radius.nbytes + self.M_scales.nbytes
+
+    def _locate(self, M2: ArrayLike, M3: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Meridianos vecinos (k, k + 1) y peso de interpolación de cada demanda."""
+        psi = np.arctan2(np.asarray(M2, dtype=float) / self.M2_scale,
+                         np.asarray(M3, dtype=float) / self.M3_scale)
+        position = np.mod(psi, 2 * np.pi) / (2 * np.pi) * self.n_meridians
+        k = np.floor(position).astype(np.intp) % self.n_meridians
+        return k, (k + 1) % self.n_meridians, position - np.floor(position)
+
+    def _dcr_on(self, k: np.ndarray, Pu: np.ndarray, M: np.ndarray) -> np.ndarray:
+        """DCR de (Pu, M) en el meridiano k: radio de demanda × tabla por rayo."""
+        p = Pu / self.P_scale
+        m = M / self.M_scales[k]
+        position = (np.arctan2(p, m) + np.pi / 2) / np.pi * (N_RAYS - 1)
+        i = np.clip(np.floor(position).astype(np.intp), 0, N_RAYS - 2)
+        t = position - i
+        table = self.inverse_radius
+        return np.hypot(p, m) * (table[k, i] * (1 - t) + table[k, i + 1] * t)
+
+    def dcr(self, Pu: ArrayLike, M2: ArrayLike, M3: ArrayLike) -> np.ndarray:
+        """
+        DCR = 1/SF por demanda (Pu en tonf, positivo = compresión; M2 y M3
+        en tonf-m con signo). Interpolación bilineal: ángulo de momento ×
+        dirección del rayo.
+        """
+        Pu = np.asarray(Pu, dtype=float)
+        M2, M3 = np.asarray(M2, dtype=float), np.asarray(M3, dtype=float)
+        M = np.hypot(M2, M3)
+        k1, k2, w = self._locate(M2, M3)
+        return (1 - w) * self._dcr_on(k1, Pu, M) + w * self._dcr_on(k2, Pu, M)
+
+    def safety_factors(self, Pu: ArrayLike, M2: ArrayLike, M3: ArrayLike) -> np.ndarray:
+        """SF = capacidad / demanda a lo largo del rayo desde el origen (inf sin demanda)."""
+        dcr = self.dcr(Pu, M2, M3)
+        with np.errstate(divide='ignore'):
+            return np.where(dcr > 0, 1.0 / dcr, np.inf)
+
+    def safety_factor(self, Pu: float, M2: float, M3: float) -> float:
+        """safety_factors() para una sola demanda."""
+        return float(self.safety_factors(Pu, M2, M3))
+
+    def curve_at(self, M2: float, M3: float) -> InteractionCurve:
+        """
+        Curva P-M (φ incluido) en el plano del momento (M2, M3), interpolada
+        entre los meridianos vecinos. Mn es el momento resultante.
+        """
+        k1, k2, w = self._locate(M2, M3)
+        a, b = self.meridians[int(k1)], self.meridians[int(k2)]
+        w = float(w)
+        with np.errstate(invalid='ignore'):
+            curve = np.where(a == b, a, a + w * (b - a))
+        # φ, φPn y φMn desde la deformación interpolada (filas intermedias)
+        inner = slice(1, len(curve) - 1)
+        curve[inner, _PHI] = calculate_phi_array(
+            curve[inner, _EPS], self.is_unconfined
+        )
+        curve[:, _PHI_PN] = curve[:, _PHI] * curve[:, _PN]
+        curve[:, _PHI_MN] = curve[:, _PHI] * curve[:, _MN]
+        return InteractionCurve(curve)
+
+
+def generate_biaxial_surface(
+    section: BiaxialSection,
+    n_points: int = 50,
+    n_angles: int = N_NEUTRAL_AXIS_ANGLES,
+    n_meridians: int = N_MERIDIANS
+) -> BiaxialSurface:
+    """
+    Genera la superficie de interacción biaxial de una sección.
+
+    Args:
+        section: Sección 2D (ver BiaxialSection.from_element)
+        n_points: Profundidades c por ángulo (mismo reparto que la curva P-M)
+        n_angles: Ángulos del eje neutro evaluados
+        n_meridians: Meridianos (ángulos de momento) guardados
+
+    Returns:
+        BiaxialSurface
+    """
+    fc, fy = section.fc, section.fy
+    As_total = section.As_total
+
+    # Mismas profundidades relativas que la curva uniaxial (c = fracción × d)
+    reference = 1000.0
+    c_fractions = generate_c_values(
+        reference, fy / ES_MPA, n_points
+    ) / reference
+
+    u = _neutral_axis_directions(section, n_angles)
+    Pn, M3, M2, c, epsilon_t = _evaluate_grid(section, u, c_fractions)
+
+    M3_scale = float(np.abs(M3).max()) or 1.0
+    M2_scale = float(np.abs(M2).max()) or 1.0
+    psi = np.arctan2(M2 / M2_scale, M3 / M3_scale)
+    targets = 2 * np.pi * np.arange(n_meridians) / n_meridians
+    Pn_m, M3_m, M2_m, c_m, eps_m = _to_meridians(
+        psi, np.stack([Pn, M3, M2, c, epsilon_t]), targets
+    )
+
+    # Límites de compresión y tracción pura (igual que la curva uniaxial)
+    P0_max = 0.80 * (0.85 * fc * (section.Ag - As_total) + fy * As_total)
+    phi_P0 = PHI_COMPRESSION_UNCONFINED if section.is_unconfined else PHI_COMPRESSION
+    Pt = -As_total * fy
+    phi_Pt = PHI_COMPRESSION_UNCONFINED if section.is_unconfined else PHI_TENSION
+
+    Pn_m = np.minimum(Pn_m, P0_max)
+    Mn_m = np.hypot(M3_m, M2_m)
+    phi_m = calculate_phi_array(eps_m, section.is_unconfined)
+
+    n_c = len(c_fractions)
+    meridians = np.empty((n_meridians, n_c + 2, len(CURVE_COLUMNS)))
+    meridians[:, 0] = (P0_max / N_TO_TONF, 0.0, phi_P0, phi_P0 * P0_max / N_TO_TONF, 0.0, math.inf, 0.0)
+    meridians[:, 1:-1, _PN] = Pn_m / N_TO_TONF
+    meridians[:, 1:-1, _MN] = Mn_m / NMM_TO_TONFM
+    meridians[:, 1:-1, _PHI] = phi_m
+    meridians[:, 1:-1, _PHI_PN] = phi_m * Pn_m / N_TO_TONF
+    meridians[:, 1:-1, _PHI_MN] = phi_m * Mn_m / NMM_TO_TONFM
+    meridians[:, 1:-1, _C] = c_m
+    meridians[:, 1:-1, _EPS] = eps_m
+    meridians[:, -1] = (Pt / N_TO_TONF, 0.0, phi_Pt, phi_Pt * Pt / N_TO_TONF, 0.0, 0.0, math.inf)
+
+    # Tabla de DCR por rayo en el plano P-M normalizado de cada meridiano
+    P_scale = float(np.abs(meridians[:, :, _PHI_PN]).max()) or 1.0
+    M_scales = meridians[:, :, _PHI_MN].max(axis=1)
+    M_scales = np.where(M_scales > 0, M_scales, 1.0)
+    rays = np.linspace(-np.pi / 2, np.pi / 2, N_RAYS)
+    inverse_radius = np.empty((n_meridians, N_RAYS))
+    for k in range(n_meridians):
+        design = InteractionCurve(meridians[k]).design / (M_scales[k], P_scale)
+        sf, _ = FlexureChecker.calculate_safety_factors(design, np.sin(rays), np.cos(rays))
+        inverse_radius[k] = np.where(np.isfinite(sf) & (sf > 0), 1.0 / sf, 0.0)
+
+    return BiaxialSurface(
+        meridians, inverse_radius,
+        M3_scale=M3_scale / NMM_TO_TONFM,
+        M2_scale=M2_scale / NMM_TO_TONFM,
+        P_scale=P_scale,
+        M_scales=M_scales,
+        is_unconfined=section.is_unconfined,
+    )
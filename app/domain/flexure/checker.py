@@ -3,9 +3,10 @@
 Verificador de flexocompresión para secciones de hormigón armado.
 Extrae la lógica de verificación que antes estaba en interaction_diagram.py.
 """
-import math
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, TYPE_CHECKING
+from typing import List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
 
 from ..constants.tolerances import (
     ZERO_TOLERANCE,
@@ -14,9 +15,18 @@ from ..constants.tolerances import (
     INSIDE_SF_THRESHOLD,
     AXIAL_CAPACITY_TOLERANCE,
 )
+from .interaction_curve import CURVE_COLUMNS, InteractionCurve, interpolate_between
 
 if TYPE_CHECKING:
-    from .interaction_diagram import InteractionPoint
+    from .interaction_curve import InteractionPoint
+
+# Curva aceptada por el verificador (ver FlexureChecker.pack_curve)
+CurveLike = Union[InteractionCurve, List['InteractionPoint'], np.ndarray]
+
+
+def combo_location(combo_name: str) -> str:
+    """Ubicación desde el nombre de combinación: "D1 (Bottom)" → "Bottom"."""
+    return combo_name.split('(')[1].rstrip(')') if '(' in combo_name else 'Middle'
 
 
 @dataclass
@@ -69,6 +79,11 @@ class FlexureCheckResult:
     phi_Pt_min: float = 0.0  # Capacidad de tracción mínima (tonf, negativo)
     # Resultados de TODAS las combinaciones (para cache del modal)
     combo_results: List[ComboFlexureResult] = field(default_factory=list)
+    # Mismos resultados como arreglos (Pu, |Mu|, SF y φMn al Pu por combinación)
+    Pu_values: Optional[np.ndarray] = None
+    Mu_values: Optional[np.ndarray] = None
+    sf_values: Optional[np.ndarray] = None
+    phi_Mn_values: Optional[np.ndarray] = None
 
 
 class FlexureChecker:
@@ -81,18 +96,37 @@ class FlexureChecker:
     - Interpolar capacidad de momento a P=0
     """
 
+    @staticmethod
+    def pack_curve(points: CurveLike) -> np.ndarray:
+        """
+        Empaqueta la curva de diseño como arreglo (n, 2) de (φMn, φPn).
+
+        Acepta InteractionCurve (usa su curva de diseño, sin copia), lista
+        de InteractionPoint, un arreglo compacto (n, 7) de
+        InteractionDiagramService.generate_interaction_arrays(), o un
+        arreglo (n, 2) ya empaquetado (se retorna tal cual).
+
+        Empaquetar una vez y reutilizar evita reconstruir la curva en
+        cada verificación.
+        """
+        if isinstance(points, InteractionCurve):
+            return points.design
+        if isinstance(points, np.ndarray):
+            if points.ndim == 2 and points.shape[1] == 2:
+                return points
+            return points[:, [CURVE_COLUMNS.index('phi_Mn'), CURVE_COLUMNS.index('phi_Pn')]]
+        return np.array([(p.phi_Mn, p.phi_Pn) for p in points], dtype=float).reshape(-1, 2)
+
     @staticmethod
     def calculate_safety_factor(
-        points: List['InteractionPoint'],
+        points: CurveLike,
         Pu: float,
         Mu: float
     ) -> Tuple[float, bool]:
         """
         Calcula el factor de seguridad para un punto de demanda.
 
-        Metodo: Ray-casting desde el origen pasando por el punto de demanda.
-        Se busca la interseccion con cada segmento de la curva P-M.
-        SF = distancia_capacidad / distancia_demanda
+        Delegado a calculate_safety_factors() con un solo punto.
 
         Args:
             points: Puntos del diagrama de interaccion
@@ -102,78 +136,146 @@ class FlexureChecker:
         Returns:
             Tuple (factor_seguridad, is_inside)
         """
-        Mu = abs(Mu)
+        sf, inside = FlexureChecker.calculate_safety_factors(points, [Pu], [Mu])
+        return float(sf[0]), bool(inside[0])
 
-        # Distancia del origen al punto de demanda
-        d_demand = math.sqrt(Pu**2 + Mu**2)
+    @staticmethod
+    def calculate_safety_factors(
+        points: CurveLike,
+        Pu_array: Sequence[float],
+        Mu_array: Sequence[float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calcula el factor de seguridad para TODOS los puntos de demanda a la vez.
 
-        if d_demand < ZERO_TOLERANCE:
-            return float('inf'), True
+        Metodo: Ray-casting desde el origen pasando por cada punto de demanda,
+        evaluado como matriz (demandas × segmentos) contra la curva empaquetada.
+        SF = distancia_capacidad / distancia_demanda
 
-        # Obtener la curva de capacidad como lista de puntos (Mn, Pn)
-        curve_points = [(p.phi_Mn, p.phi_Pn) for p in points]
+        Si un rayo no intersecta ningun segmento, se usa point-in-polygon y el
+        punto de capacidad mas cercano al rayo (igual que la version escalar).
 
-        # Direccion normalizada desde origen hacia punto de demanda
-        dir_M = Mu / d_demand
-        dir_P = Pu / d_demand
+        Args:
+            points: Curva (InteractionCurve, lista o arreglo, ver pack_curve)
+            Pu_array: Cargas axiales de demanda (tonf), positivo = compresion
+            Mu_array: Momentos de demanda (tonf-m)
+
+        Returns:
+            Tuple (sf, is_inside) como arreglos de forma (n_demandas,)
+        """
+        curve = FlexureChecker.pack_curve(points)
+        Pu = np.asarray(Pu_array, dtype=float).reshape(-1)
+        Mu = np.abs(np.asarray(Mu_array, dtype=float).reshape(-1))
 
-        # Buscar interseccion del rayo con cada segmento de la curva
-        best_t = None
+        sf = np.full(Pu.shape, np.inf)
+        is_inside = np.ones(Pu.shape, dtype=bool)
 
-        n = len(curve_points)
-        for i in range(n - 1):
-            M1, P1 = curve_points[i]
-            M2, P2 = curve_points[i + 1]
+        # Distancia del origen al punto de demanda
+        d_demand = np.sqrt(Pu**2 + Mu**2)
+        active = d_demand >= ZERO_TOLERANCE
+        if not active.any():
+            return sf, is_inside
+
+        Pu, Mu, d = Pu[active], Mu[active], d_demand[active]
+
+        # Direccion normalizada desde origen hacia punto de demanda
+        dir_M = (Mu / d)[:, np.newaxis]
+        dir_P = (Pu / d)[:, np.newaxis]
+
+        # Segmentos de la curva (independientes de la demanda)
+        M1, P1 = curve[:-1, 0], curve[:-1, 1]
+        dM = curve[1:, 0] - M1
+        dP = curve[1:, 1] - P1
+        t_num = M1 * (-dP) - P1 * (-dM)
+
+        # Interseccion rayo-segmento para cada par (demanda, segmento)
+        det = dir_M * (-dP) - dir_P * (-dM)
+        valid = np.abs(det) >= PARALLEL_TOLERANCE
+        with np.errstate(divide='ignore', invalid='ignore'):
+            safe_det = np.where(valid, det, 1.0)
+            t = t_num / safe_det
+            s = (dir_M * P1 - dir_P * M1) / safe_det
+        hit = (
+            valid & (t > 0)
+            & (s >= -SEGMENT_PARAM_TOLERANCE) & (s <= 1 + SEGMENT_PARAM_TOLERANCE)
+        )
+        best_t = np.where(hit, t, np.inf).min(axis=1, initial=np.inf)
+
+        found = np.isfinite(best_t)
+        sf_active = np.empty(Pu.shape)
+        inside_active = np.empty(Pu.shape, dtype=bool)
+        sf_active[found] = best_t[found] / d[found]
+        inside_active[found] = sf_active[found] >= INSIDE_SF_THRESHOLD
+
+        missed = ~found
+        if missed.any():
+            sf_miss, inside_miss = FlexureChecker._closest_capacity_fallback(
+                curve, Mu[missed], Pu[missed], dir_M[missed, 0], dir_P[missed, 0], d[missed]
+            )
+            sf_active[missed] = sf_miss
+            inside_active[missed] = inside_miss
+
+        sf[active] = sf_active
+        is_inside[active] = inside_active
+        return sf, is_inside
 
-            dM = M2 - M1
-            dP = P2 - P1
+    @staticmethod
+    def _closest_capacity_fallback(
+        curve: np.ndarray,
+        Mu: np.ndarray,
+        Pu: np.ndarray,
+        dir_M: np.ndarray,
+        dir_P: np.ndarray,
+        d_demand: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        SF para demandas cuyo rayo no intersecta la curva.
 
-            det = dir_M * (-dP) - dir_P * (-dM)
+        Usa point-in-polygon para is_inside y el punto de capacidad mas
+        cercano al rayo de demanda para la distancia de capacidad.
+        Si no se puede calcular, retorna SF=0.5 (conservador) y fuera.
+        """
+        if len(curve) == 0:
+            return np.full(Mu.shape, 0.5), np.zeros(Mu.shape, dtype=bool)
 
-            if abs(det) < PARALLEL_TOLERANCE:
-                continue
+        is_inside = FlexureChecker._points_in_polygon(Mu, Pu, curve)
 
-            t = (M1 * (-dP) - P1 * (-dM)) / det
-            s = (dir_M * P1 - dir_P * M1) / det
+        M_cap = curve[:, 0]
+        P_cap = curve[:, 1]
 
-            if t > 0 and -SEGMENT_PARAM_TOLERANCE <= s <= 1 + SEGMENT_PARAM_TOLERANCE:
-                if best_t is None or t < best_t:
-                    best_t = t
+        # Proyeccion de cada punto de capacidad sobre cada rayo
+        dM = dir_M[:, np.newaxis]
+        dP = dir_P[:, np.newaxis]
+        proj = M_cap * dM + P_cap * dP
+        dist_to_ray = np.sqrt((M_cap - proj * dM)**2 + (P_cap - proj * dP)**2)
+        dist_to_ray = np.where(proj > 0, dist_to_ray, np.inf)
 
-        if best_t is not None:
-            d_capacity = best_t
-            sf = d_capacity / d_demand
-            is_inside = sf >= INSIDE_SF_THRESHOLD
-            return sf, is_inside
+        closest = np.argmin(dist_to_ray, axis=1)
+        has_closest = np.isfinite(dist_to_ray[np.arange(len(closest)), closest])
+        closest_capacity_dist = np.where(
+            has_closest, np.sqrt(M_cap[closest]**2 + P_cap[closest]**2), 0.0
+        )
 
-        # Si no se encontro interseccion, usar point-in-polygon como verificacion
-        # y calcular SF basado en el punto de capacidad mas cercano
-        is_inside = FlexureChecker._point_in_polygon(Mu, Pu, curve_points)
-
-        # Encontrar el punto de capacidad mas cercano al rayo de demanda
-        min_dist_to_ray = float('inf')
-        closest_capacity_dist = 0.0
-
-        for M_cap, P_cap in curve_points:
-            # Distancia del punto de capacidad al rayo desde origen
-            # Proyeccion del punto sobre el rayo
-            proj = (M_cap * dir_M + P_cap * dir_P)
-            if proj > 0:
-                # Punto proyectado sobre el rayo
-                proj_M = proj * dir_M
-                proj_P = proj * dir_P
-                # Distancia perpendicular al rayo
-                dist_to_ray = math.sqrt((M_cap - proj_M)**2 + (P_cap - proj_P)**2)
-                if dist_to_ray < min_dist_to_ray:
-                    min_dist_to_ray = dist_to_ray
-                    closest_capacity_dist = math.sqrt(M_cap**2 + P_cap**2)
-
-        if closest_capacity_dist > 0:
-            sf = closest_capacity_dist / d_demand
-            return sf, is_inside
+        computed = closest_capacity_dist > 0
+        sf = np.where(computed, closest_capacity_dist / d_demand, 0.5)
+        return sf, is_inside & computed
 
-        # Caso extremo: no se pudo calcular - conservador
-        return 0.5, False
+    @staticmethod
+    def _points_in_polygon(
+        x: np.ndarray,
+        y: np.ndarray,
+        polygon: np.ndarray
+    ) -> np.ndarray:
+        """Version vectorizada de _point_in_polygon() para varios puntos."""
+        xi, yi = polygon[:, 0], polygon[:, 1]
+        xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+
+        x = x[:, np.newaxis]
+        y = y[:, np.newaxis]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crosses = ((yi > y) != (yj > y)) & \
+                (x < (xj - xi) * (y - yi) / (yj - yi + PARALLEL_TOLERANCE) + xi)
+        return (crosses.sum(axis=1) % 2) == 1
 
     @staticmethod
     def _point_in_polygon(
@@ -198,7 +300,7 @@ class FlexureChecker:
         return inside
 
     @staticmethod
-    def get_phi_Mn_at_P0(points: List['InteractionPoint']) -> float:
+    def get_phi_Mn_at_P0(points: CurveLike) -> float:
         """
         Obtiene la capacidad de momento φMn a P=0 (flexión pura).
         Delegado a get_phi_Mn_at_P(points, 0).
@@ -212,10 +314,15 @@ class FlexureChecker:
         return FlexureChecker.get_phi_Mn_at_P(points, 0.0)
 
     @staticmethod
-    def get_phi_Mn_at_P(points: List['InteractionPoint'], Pu: float) -> float:
+    def get_phi_Mn_at_P(
+        points: CurveLike,
+        Pu: float
+    ) -> float:
         """
         Obtiene la capacidad de momento φMn a un P dado, interpolando en la curva.
 
+        Delegado a get_phi_Mn_at_P_batch() con un solo Pu.
+
         Args:
             points: Puntos del diagrama de interacción
             Pu: Carga axial (tonf), positivo = compresión
@@ -223,40 +330,45 @@ class FlexureChecker:
         Returns:
             φMn en tonf-m al nivel de P dado
         """
-        # Buscar los dos puntos que encierran el P dado
-        curve_points = [(p.phi_Mn, p.phi_Pn) for p in points]
-
-        # Separar por zona (compresión vs tracción)
-        above_points = [(M, P) for M, P in curve_points if P >= Pu]
-        below_points = [(M, P) for M, P in curve_points if P <= Pu]
-
-        if not above_points or not below_points:
-            # P está fuera del rango - buscar el más cercano
-            closest = min(curve_points, key=lambda mp: abs(mp[1] - Pu))
-            return closest[0]
+        return float(FlexureChecker.get_phi_Mn_at_P_batch(points, [Pu])[0])
 
-        # Encontrar el punto más cercano por arriba y por abajo
-        point_above = min(above_points, key=lambda mp: mp[1])  # Menor P >= Pu
-        point_below = max(below_points, key=lambda mp: mp[1])  # Mayor P <= Pu
+    @staticmethod
+    def get_phi_Mn_at_P_batch(
+        points: CurveLike,
+        Pu_array: Sequence[float]
+    ) -> np.ndarray:
+        """
+        Version vectorizada de get_phi_Mn_at_P() para varios Pu.
 
-        M1, P1 = point_below
-        M2, P2 = point_above
+        Misma regla: interpola entre el menor P >= Pu y el mayor P <= Pu;
+        fuera de rango retorna φMn del punto con P mas cercano. Con un
+        InteractionCurve (ya ordenada) cada consulta es una búsqueda binaria.
 
-        if abs(P2 - P1) < ZERO_TOLERANCE:
-            return M1
+        Args:
+            points: Curva (InteractionCurve, lista o arreglo, ver pack_curve)
+            Pu_array: Cargas axiales (tonf), positivo = compresión
 
-        # Interpolar linealmente
-        phi_Mn = M1 + (M2 - M1) * (Pu - P1) / (P2 - P1)
-        return max(0.0, phi_Mn)
+        Returns:
+            Arreglo de φMn (tonf-m), forma (n_demandas,)
+        """
+        Pu = np.asarray(Pu_array, dtype=float).reshape(-1)
+        if isinstance(points, InteractionCurve):
+            return points.phi_Mn_at(Pu)
+        curve = FlexureChecker.pack_curve(points)
+        order = np.argsort(-curve[:, 1], kind='stable')
+        return interpolate_between(curve[order, 1], curve[order, 0], Pu)
 
     @staticmethod
     def check_flexure(
-        points: List['InteractionPoint'],
+        points: CurveLike,
         demand_points: List[Tuple[float, float, str]]
     ) -> FlexureCheckResult:
         """
         Verifica flexocompresión para múltiples puntos de demanda.
 
+        Todas las combinaciones se evalúan en una sola pasada vectorizada
+        (calculate_safety_factors / get_phi_Mn_at_P_batch).
+
         Args:
             points: Puntos del diagrama de interacción
             demand_points: Lista de (Pu, Mu, combo_name)
@@ -264,55 +376,89 @@ class FlexureChecker:
         Returns:
             FlexureCheckResult con el resultado de la verificación
         """
+        names = [name for _, _, name in demand_points]
+        Pu_arr = np.array([Pu for Pu, _, _ in demand_points], dtype=float)
+        Mu_arr = np.array([Mu for _, Mu, _ in demand_points], dtype=float)
+        return FlexureChecker.check_flexure_arrays(points, Pu_arr, Mu_arr, names)
+
+    @staticmethod
+    def check_flexure_arrays(
+        points: CurveLike,
+        Pu_array: Sequence[float],
+        Mu_array: Sequence[float],
+        names: Sequence[str],
+        include_combo_results: bool = True
+    ) -> FlexureCheckResult:
+        """
+        Igual que check_flexure() con las demandas como arreglos.
+
+        Args:
+            points: Curva (InteractionCurve, lista o arreglo, ver pack_curve)
+            Pu_array: Cargas axiales (tonf), positivo = compresión
+            Mu_array: Momentos (tonf-m)
+            names: Nombre "name (location)" de cada combinación
+            include_combo_results: Crear un ComboFlexureResult por combinación.
+                Sin ellos, el detalle queda solo en los arreglos *_values
+
+        Returns:
+            FlexureCheckResult con el resultado de la verificación
+        """
+        curve = FlexureChecker.pack_curve(points)
+        # Interpolación de φMn: búsqueda binaria si la curva ya está ordenada
+        lookup = points if isinstance(points, InteractionCurve) else curve
+        Pu_arr = np.asarray(Pu_array, dtype=float).reshape(-1)
+        Mu_arr = np.abs(np.asarray(Mu_array, dtype=float).reshape(-1))
+
+        sf_arr, _ = FlexureChecker.calculate_safety_factors(curve, Pu_arr, Mu_arr)
+        phi_Mn_arr = FlexureChecker.get_phi_Mn_at_P_batch(lookup, Pu_arr)
+
+        # Contar combinaciones con tracción (Pu < 0)
+        tension_count = int(np.count_nonzero(Pu_arr < 0))
+
+        # Cachear resultado de CADA combinación (el análisis ya hace este trabajo)
+        combo_results = []
+        if include_combo_results:
+            for Pu, Mu, sf, phi_Mn_at_P, combo_name in zip(
+                Pu_arr.tolist(), Mu_arr.tolist(), sf_arr.tolist(), phi_Mn_arr.tolist(), names
+            ):
+                combo_results.append(ComboFlexureResult(
+                    combo_name=combo_name,
+                    combo_location=combo_location(combo_name),
+                    Pu=Pu,
+                    Mu=Mu,
+                    sf=sf,
+                    dcr=1.0 / sf if sf > 0 else 100.0,
+                    phi_Mn_at_Pu=phi_Mn_at_P,
+                    is_tension=(Pu < 0)
+                ))
+
+        # Combinación crítica: primer SF mínimo (SF infinito = sin demanda)
         min_sf = float('inf')
         critical_combo = ""
         critical_Pu = 0.0
         critical_Mu = 0.0
-        tension_count = 0
-        combo_results = []  # Cachear resultado de CADA combinación
-
-        for Pu, Mu, combo_name in demand_points:
-            # Contar combinaciones con tracción (Pu < 0)
-            if Pu < 0:
-                tension_count += 1
-
-            sf, _ = FlexureChecker.calculate_safety_factor(points, Pu, Mu)
-
-            # Cachear resultado de este combo (el análisis ya hace este trabajo)
-            phi_Mn_at_P = FlexureChecker.get_phi_Mn_at_P(points, Pu)
-            # Extraer location del combo_name: "D1 (Bottom)" → "Bottom"
-            location = combo_name.split('(')[1].rstrip(')') if '(' in combo_name else 'Middle'
-            combo_results.append(ComboFlexureResult(
-                combo_name=combo_name,
-                combo_location=location,
-                Pu=Pu,
-                Mu=abs(Mu),
-                sf=sf,
-                dcr=1.0 / sf if sf > 0 else 100.0,
-                phi_Mn_at_Pu=phi_Mn_at_P,
-                is_tension=(Pu < 0)
-            ))
-
-            if sf < min_sf:
-                min_sf = sf
-                critical_combo = combo_name
-                critical_Pu = Pu
-                critical_Mu = abs(Mu)
+        if len(sf_arr) > 0:
+            i_crit = int(np.argmin(sf_arr))
+            if sf_arr[i_crit] < min_sf:
+                min_sf = float(sf_arr[i_crit])
+                critical_combo = names[i_crit]
+                critical_Pu = float(Pu_arr[i_crit])
+                critical_Mu = float(Mu_arr[i_crit])
 
         status = "OK" if min_sf >= 1.0 else "NO OK"
-        phi_Mn_0 = FlexureChecker.get_phi_Mn_at_P0(points)
+        phi_Mn_0 = FlexureChecker.get_phi_Mn_at_P0(lookup)
 
         # φMn_at_Pu es la capacidad de momento en la curva P-M al nivel Pu critico.
         # Siempre usar interpolacion horizontal para obtener la capacidad real,
         # NO calcular como Mu × SF (eso da un valor escalado incorrecto).
-        phi_Mn_at_Pu = FlexureChecker.get_phi_Mn_at_P(points, critical_Pu)
+        phi_Mn_at_Pu = FlexureChecker.get_phi_Mn_at_P(lookup, critical_Pu)
 
         # Detectar si Pu excede la capacidad axial máxima (compresión)
-        phi_Pn_max = max(p.phi_Pn for p in points) if points else 0.0
+        phi_Pn_max = float(curve[:, 1].max()) if len(curve) else 0.0
         exceeds_axial = critical_Pu > phi_Pn_max * AXIAL_CAPACITY_TOLERANCE
 
         # Detectar si Pu excede la capacidad de tracción mínima
-        phi_Pt_min = min(p.phi_Pn for p in points) if points else 0.0
+        phi_Pt_min = float(curve[:, 1].min()) if len(curve) else 0.0
         exceeds_tension = critical_Pu < phi_Pt_min * AXIAL_CAPACITY_TOLERANCE
 
         return FlexureCheckResult(
@@ -329,5 +475,9 @@ class FlexureChecker:
             tension_combos=tension_count,
             exceeds_tension_capacity=exceeds_tension,
             phi_Pt_min=phi_Pt_min,
-            combo_results=combo_results  # Todos los resultados cacheados
+            combo_results=combo_results,  # Todos los resultados cacheados
+            Pu_values=Pu_arr,
+            Mu_values=Mu_arr,
+            sf_values=sf_arr,
+            phi_Mn_values=phi_Mn_arr,
         )
@@ -0,0 +1,271 @@
+# app/domain/flexure/fiber_section.py
+"""
+Sección de fibras para curvas P-M de secciones compuestas (L, T, C).
+
+La curva P-M rectangular (InteractionDiagramService) supone un rectángulo
+length × thickness con capas de acero 1D. Para piers compuestos eso es un
+rectángulo equivalente que no representa las alas ni la posición real de
+las barras. Aquí la sección se discretiza en:
+
+- Fibras de hormigón: cada WallSegment se divide en paralelogramos de
+  lado <= FIBER_SIZE_MM. Las fibras de un segmento cuyo centro cae dentro
+  de un segmento anterior se descartan (unión sin doble conteo en las
+  intersecciones).
+- Fibras de acero: las barras 2D del RebarLayout.
+
+El equilibrio se integra con NumPy para cualquier dirección de flexión
+(todas las profundidades c a la vez). El bloque de Whitney recorta cada
+fibra por su extensión proyectada, de modo que una fibra parcialmente
+comprimida aporta solo su fracción (exacto para fibras alineadas con la
+dirección de flexión).
+
+La malla de hormigón se calcula una vez por CompositeSection
+(CompositeSection.get_fiber_mesh()).
+
+Uso:
+    fibers = FiberSection.from_element(pier)
+    Pn, Mn, epsilon_t = fibers.evaluate(angle, c)
+"""
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+import numpy as np
+
+from ..constants.materials import EPSILON_CU, ES_MPA, calculate_beta1
+
+if TYPE_CHECKING:
+    from ..entities.vertical_element import VerticalElement
+
+# Tamaño máximo de fibra de hormigón (mm)
+FIBER_SIZE_MM = 25.0
+
+
+# =============================================================================
+# MALLA DE HORMIGÓN
+# =============================================================================
+
+@dataclass(eq=False)
+class FiberMesh:
+    """
+    Fibras de hormigón de una sección.
+
+    fibers: (n, 3) con columnas x, y (centro, mm), área (mm²)
+    edges: (n, 4) lados de cada fibra (e1x, e1y, e2x, e2y) en mm; la
+        extensión de la fibra en una dirección u es |e1·u| + |e2·u|
+    vertices: (m, 2) vértices del contorno (para la fibra extrema)
+    """
+    fibers: np.ndarray
+    edges: np.ndarray
+    vertices: np.ndarray
+
+    def __post_init__(self):
+        for array in (self.fibers, self.edges, self.vertices):
+            array.setflags(write=False)
+
+    @property
+    def area(self) -> float:
+        """Área de hormigón (mm²)."""
+        return float(self.fibers[:, 2].sum())
+
+    @property
+    def nbytes(self) -> int:
+        return self.fibers.nbytes + self.edges.nbytes + self.vertices.nbytes
+
+
+def _inside_convex(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """True para los puntos estrictamente dentro de un polígono convexo."""
+    P1, P2 = polygon, np.roll(polygon, -1, axis=0)
+    edge = P2 - P1
+    rel = points[:, np.newaxis, :] - P1
+    cross = edge[:, 0] * rel[..., 1] - edge[:, 1] * rel[..., 0]
+    orientation = np.sign((P1[:, 0] * P2[:, 1] - P2[:, 0] * P1[:, 1]).sum())
+    tolerance = 1e-9 * max(float(np.abs(edge).max()), 1.0) ** 2
+    return np.all(cross * orientation > tolerance, axis=1)
+
+
+def mesh_polygons(
+    polygons: Sequence[Sequence[Tuple[float, float]]],
+    fiber_size: float = FIBER_SIZE_MM
+) -> FiberMesh:
+    """
+    Discretiza cuadriláteros (esquinas en orden, ej: WallSegment.get_corners())
+    en fibras, como unión de los polígonos.
+
+    Args:
+        polygons: Lista de 4 esquinas (x, y) por polígono, en mm
+        fiber_size: Lado máximo de fibra (mm)
+
+    Returns:
+        FiberMesh
+    """
+    fibers: List[np.ndarray] = []
+    edges: List[np.ndarray] = []
+    kept: List[np.ndarray] = []
+
+    for corners in polygons:
+        c0, c1, c2, c3 = np.asarray(corners, dtype=float).reshape(4, 2)
+        n_s = max(1, math.ceil(np.hypot(*(c1 - c0)) / fiber_size))
+        n_t = max(1, math.ceil(np.hypot(*(c3 - c0)) / fiber_size))
+
+        # Nodos por interpolación bilineal (i a lo largo de c0→c1, j de c0→c3)
+        s = (np.arange(n_s + 1) / n_s)[:, np.newaxis, np.newaxis]
+        t = (np.arange(n_t + 1) / n_t)[np.newaxis, :, np.newaxis]
+        nodes = (1 - s) * (1 - t) * c0 + s * (1 - t) * c1 + s * t * c2 + (1 - s) * t * c3
+        n00, n10 = nodes[:-1, :-1], nodes[1:, :-1]
+        n11, n01 = nodes[1:, 1:], nodes[:-1, 1:]
+
+        center = ((n00 + n10 + n11 + n01) / 4).reshape(-1, 2)
+        e1 = (n10 - n00).reshape(-1, 2)
+        e2 = (n01 - n00).reshape(-1, 2)
+        area = np.abs(e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0])
+
+        keep = area > 0
+        for polygon in kept:
+            keep &= ~_inside_convex(center, polygon)
+        if area.sum() > 0:
+            kept.append(np.array([c0, c1, c2, c3]))
+
+        fibers.append(np.column_stack([center, area])[keep])
+        edges.append(np.column_stack([e1, e2])[keep])
+
+    vertices = np.array(kept).reshape(-1, 2) if kept else np.empty((0, 2))
+    return FiberMesh(
+        fibers=np.concatenate(fibers) if fibers else np.empty((0, 3)),
+        edges=np.concatenate(edges) if edges else np.empty((0, 4)),
+        vertices=vertices,
+    )
+
+
+def corner_bars(vertices: np.ndarray, cover: float, As_total: float) -> List[Tuple[float, float, float]]:
+    """
+    As_total repartido en 4 barras en las esquinas de la caja del contorno
+    (para elementos sin barras en el RebarLayout, como el modelo
+    simplificado de la curva P-M).
+    """
+    (x0, y0), (x1, y1) = vertices.min(axis=0), vertices.max(axis=0)
+    area = As_total / 4
+    return [(x0 + cover, y0 + cover, area), (x1 - cover, y0 + cover, area),
+            (x1 - cover, y1 - cover, area), (x0 + cover, y1 - cover, area)]
+
+
+# =============================================================================
+# SECCIÓN DE FIBRAS
+# =============================================================================
+
+@dataclass(eq=False)
+class FiberSection:
+    """
+    Sección de fibras de hormigón (FiberMesh) y barras (n_bars, 3) con
+    columnas x, y (mm), área (mm²). Coordenadas de la planta (las mismas de
+    los WallSegment y del RebarLayout).
+    """
+    mesh: FiberMesh
+    bars: np.ndarray
+    fc: float
+    fy: float
+
+    def __post_init__(self):
+        self.bars = np.asarray(self.bars, dtype=float).reshape(-1, 3)
+
+    @classmethod
+    def from_element(cls, element: 'VerticalElement') -> 'FiberSection':
+        """
+        Sección de fibras de un pier o columna.
+
+        Las secciones compuestas reutilizan la malla cacheada en
+        CompositeSection; las rectangulares se discretizan con origen en
+        una esquina (igual que el RebarLayout rectangular).
+        """
+        if element.is_composite:
+            mesh = element.composite_section.get_fiber_mesh()
+        else:
+            mesh = mesh_polygons([[(0.0, 0.0), (element.length, 0.0),
+                                   (element.length, element.thickness), (0.0, element.thickness)]])
+        bars = [(bar.x, bar.y, bar.area) for bar in element.get_rebar_layout().bars]
+        if not bars and element.As_flexure_total > 0:
+            bars = corner_bars(mesh.vertices, element.cover, element.As_flexure_total)
+        return cls(mesh, bars, element.fc, element.fy)
+
+    @property
+    def Ag(self) -> float:
+        """Área bruta de hormigón (mm²)."""
+        return self.mesh.area
+
+    @property
+    def As_total(self) -> float:
+        """Área total de acero (mm²)."""
+        return float(self.bars[:, 2].sum())
+
+    @property
+    def centroid(self) -> Tuple[float, float]:
+        """Centroide del hormigón (mm); los momentos se toman respecto a él."""
+        fibers = self.mesh.fibers
+        area = fibers[:, 2].sum()
+        if area <= 0:
+            return 0.0, 0.0
+        return (float(fibers[:, 0] @ fibers[:, 2] / area),
+                float(fibers[:, 1] @ fibers[:, 2] / area))
+
+    @staticmethod
+    def direction(angle: float) -> np.ndarray:
+        """Vector unitario de compresión para un ángulo (grados desde el eje x)."""
+        theta = math.radians(angle)
+        return np.array([math.cos(theta), math.sin(theta)])
+
+    def _top(self, u: np.ndarray) -> float:
+        """Proyección de la fibra extrema comprimida sobre u."""
+        return float((self.mesh.vertices @ u).max())
+
+    def max_bar_depth(self, angle: float) -> float:
+        """Profundidad de la barra más alejada de la fibra extrema comprimida (mm)."""
+        u = self.direction(angle)
+        if not len(self.bars):
+            return self._top(u) - float((self.mesh.vertices @ u).min())
+        return self._top(u) - float((self.bars[:, :2] @ u).min())
+
+    def evaluate(self, angle: float, c: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Equilibrio de la sección con compresión en la dirección angle para
+        todos los c a la vez.
+
+        Args:
+            angle: Dirección de la fibra comprimida (grados desde el eje x)
+            c: Profundidades del eje neutro (mm), forma (n_c,)
+
+        Returns:
+            (Pn en N, Mn en N-mm, epsilon_t máxima) — cada uno forma (n_c,).
+            Mn es el momento respecto al eje normal a la dirección de
+            flexión que pasa por el centroide (se omite la componente
+            cruzada de secciones asimétricas).
+        """
+        fc, fy = self.fc, self.fy
+        u = self.direction(angle)
+        s_centroid = np.dot(self.centroid, u)
+        top = self._top(u)
+        a = calculate_beta1(fc) * c[:, np.newaxis]
+
+        # Hormigón: porción de cada fibra dentro del bloque de Whitney
+        fibers, edges = self.mesh.fibers, self.mesh.edges
+        s = fibers[:, :2] @ u
+        height = np.abs(edges[:, :2] @ u) + np.abs(edges[:, 2:] @ u)
+        fiber_top = s + height / 2
+        depth_in = np.clip(a - (top - fiber_top), 0.0, height)
+        Fc = 0.85 * fc * fibers[:, 2] * depth_in / height
+        Cc = Fc.sum(axis=1)
+        Mc = (Fc * (fiber_top - depth_in / 2 - s_centroid)).sum(axis=1)
+
+        # Acero: εi = εcu × (di - c) / c → positivo = tracción
+        bar_s = self.bars[:, :2] @ u
+        depth = top - bar_s
+        c_col = c[:, np.newaxis]
+        epsilon = EPSILON_CU * (depth - c_col) / c_col
+        fs = np.minimum(np.abs(epsilon) * ES_MPA, fy)
+        fs = np.where(epsilon < 0, -fs, fs)
+        in_block = (depth <= a) & (fs < 0)
+        F = self.bars[:, 2] * np.where(in_block, fs + 0.85 * fc, fs)
+
+        Pn = Cc - F.sum(axis=1)
+        Mn = np.abs(Mc - (F * (bar_s - s_centroid)).sum(axis=1))
+        epsilon_t = epsilon.max(axis=1, initial=0.0)
+        return Pn, Mn, epsilon_t
@@ -0,0 +1,313 @@
+# app/domain/flexure/interaction_curve.py
+"""
+Curva de interacción P-M respaldada por un arreglo NumPy.
+
+InteractionCurve guarda los puntos del diagrama como UN arreglo float64
+(n, 7) de solo lectura, con columnas CURVE_COLUMNS y ordenado por φPn de
+mayor a menor. Se comporta como una secuencia de InteractionPoint
+(iterar, indexar, len, ==), pero las consultas trabajan sobre columnas:
+
+- phi_Mn_at(Pu) / phi_at(Pu): interpolación por búsqueda binaria, O(log n)
+- Mn_at_Pn(Pn): momento nominal a una carga axial nominal
+- at_phi_Pn(φPn): φMn, φ, c, εt en el primer segmento que contiene φPn
+- c_at(Pu, Mu): profundidad del eje neutro del punto más cercano
+
+Al estar ordenada desde su creación, ningún consumidor necesita volver a
+ordenar los puntos.
+"""
+import math
+from dataclasses import dataclass, fields
+from typing import Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+
+from ..constants.tolerances import ZERO_TOLERANCE
+
+
+@dataclass
+class InteractionPoint:
+    """Un punto en el diagrama de interacción."""
+    Pn: float       # Resistencia nominal axial (tonf)
+    Mn: float       # Resistencia nominal a flexión (tonf-m)
+    phi: float      # Factor de reducción
+    phi_Pn: float   # Resistencia de diseño axial (tonf)
+    phi_Mn: float   # Resistencia de diseño a flexión (tonf-m)
+    c: float        # Profundidad del eje neutro (mm)
+    epsilon_t: float  # Deformación del acero en tracción
+
+
+# Orden de columnas del arreglo compacto (mismo orden que InteractionPoint)
+CURVE_COLUMNS = tuple(f.name for f in fields(InteractionPoint))
+
+_PN, _MN, _PHI, _PHI_PN, _PHI_MN, _C, _EPS = range(len(CURVE_COLUMNS))
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+# =============================================================================
+# INTERPOLACIÓN SOBRE COLUMNAS ORDENADAS (P descendente)
+# =============================================================================
+
+def interpolate_between(P: np.ndarray, values: np.ndarray, x: ArrayLike) -> np.ndarray:
+    """
+    Interpola `values` en x entre el menor P >= x y el mayor P <= x.
+
+    P debe estar ordenado de mayor a menor (orden estable). Entre valores
+    de P repetidos se usa el primero; fuera de rango retorna el valor del
+    extremo más cercano. El resultado se limita a >= 0.
+
+    Args:
+        P: Cargas axiales de la curva, descendentes
+        values: Valor por punto (ej: φMn)
+        x: Cargas axiales a consultar
+
+    Returns:
+        Arreglo con la forma de x
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(P)
+    if n == 0:
+        return np.zeros(x.shape)
+    ascending = -P
+    i_below = np.searchsorted(ascending, -x, side='left')        # Mayor P <= x
+    j_above = np.searchsorted(ascending, -x, side='right') - 1   # Menor P >= x (último)
+    in_range = (i_below < n) & (j_above >= 0)
+
+    i_below = np.minimum(i_below, n - 1)
+    i_above = np.searchsorted(ascending, ascending[np.maximum(j_above, 0)], side='left')
+
+    P1, V1 = P[i_below], values[i_below]
+    P2, V2 = P[i_above], values[i_above]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        interp = np.maximum(0.0, V1 + (V2 - V1) * (x - P1) / (P2 - P1))
+    result = np.where(np.abs(P2 - P1) < ZERO_TOLERANCE, V1, interp)
+
+    # Fuera de rango: extremo superior (o sin dato) vs extremo inferior
+    lowest = np.searchsorted(ascending, ascending[-1], side='left')
+    closest = np.where((j_above < 0) | np.isnan(x), 0, lowest)
+    return np.where(in_range, result, values[closest])
+
+
+def first_segment(P: np.ndarray, x: ArrayLike) -> np.ndarray:
+    """
+    Primer segmento i con P[i] >= x >= P[i + 1] (P descendente).
+
+    Returns:
+        Índice del segmento por consulta, -1 si x queda fuera de la curva
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(P)
+    if n < 2:
+        return np.full(x.shape, -1, dtype=np.intp)
+    k = np.searchsorted(-P, -x, side='left')  # Primer índice con P <= x
+    segment = np.where((k == 0) & (P[0] == x), 0, k - 1)
+    return np.where((segment >= 0) & (segment <= n - 2), segment, -1)
+
+
+def _scalar_or_array(x: ArrayLike, result: np.ndarray):
+    return float(result) if np.ndim(x) == 0 else result
+
+
+# =============================================================================
+# CURVA
+# =============================================================================
+
+class InteractionCurve(Sequence):
+    """
+    Diagrama P-M como arreglo (n, 7) ordenado por φPn descendente.
+
+    Example:
+        curve = InteractionCurve(service.generate_interaction_arrays(...))
+        curve.phi_Mn_at(120.0)          # φMn a Pu = 120 tonf
+        curve.design                    # arreglo (n, 2) de (φMn, φPn)
+        points = list(curve)            # InteractionPoint (compatibilidad)
+    """
+
+    __slots__ = ('_data', '_design')
+
+    def __init__(self, data: np.ndarray, presorted: bool = False):
+        """
+        Args:
+            data: Arreglo (n, 7) con columnas CURVE_COLUMNS
+            presorted: True si ya viene ordenado por φPn descendente (ej:
+                generate_interaction_arrays) y no hay que verificarlo
+        """
+        data = np.asarray(data, dtype=float).reshape(-1, len(CURVE_COLUMNS))
+        if not presorted and len(data) > 1 and np.any(np.diff(data[:, _PHI_PN]) > 0):
+            data = data[np.argsort(-data[:, _PHI_PN], kind='stable')]
+        if data.flags.writeable:
+            data = data.copy()
+            data.setflags(write=False)
+        self._data = data
+        self._design: Optional[np.ndarray] = None
+
+    @classmethod
+    def of(cls, points: Union['InteractionCurve', Sequence[InteractionPoint], np.ndarray]) -> 'InteractionCurve':
+        """Curva desde otra curva (sin copia), lista de puntos o arreglo (n, 7)."""
+        if isinstance(points, InteractionCurve):
+            return points
+        if isinstance(points, np.ndarray):
+            return cls(points)
+        return cls(np.array(
+            [[getattr(p, name) for name in CURVE_COLUMNS] for p in points], dtype=float
+        ))
+
+    # =========================================================================
+    # Columnas
+    # =========================================================================
+
+    @property
+    def array(self) -> np.ndarray:
+        """Arreglo (n, 7) de solo lectura (formato de points_to_array)."""
+        return self._data
+
+    @property
+    def design(self) -> np.ndarray:
+        """Curva de diseño (n, 2) de (φMn, φPn), contigua (ver FlexureChecker.pack_curve)."""
+        if self._design is None:
+            design = np.ascontiguousarray(self._data[:, [_PHI_MN, _PHI_PN]])
+            design.setflags(write=False)
+            self._design = design
+        return self._design
+
+    Pn = property(lambda self: self._data[:, _PN], doc='Pn por punto (tonf)')
+    Mn = property(lambda self: self._data[:, _MN], doc='Mn por punto (tonf-m)')
+    phi = property(lambda self: self._data[:, _PHI], doc='φ por punto')
+    phi_Pn = property(lambda self: self._data[:, _PHI_PN], doc='φPn por punto, descendente (tonf)')
+    phi_Mn = property(lambda self: self._data[:, _PHI_MN], doc='φMn por punto (tonf-m)')
+    c = property(lambda self: self._data[:, _C], doc='Profundidad del eje neutro (mm)')
+    epsilon_t = property(lambda self: self._data[:, _EPS], doc='Deformación del acero en tracción')
+
+    def design_curve(self) -> List[Tuple[float, float]]:
+        """Lista de (φMn, φPn) para graficar o serializar."""
+        return [tuple(row) for row in self.design.tolist()]
+
+    # =========================================================================
+    # Consultas
+    # =========================================================================
+
+    def phi_Mn_at(self, Pu: ArrayLike):
+        """
+        φMn a una o varias cargas axiales Pu (tonf, positivo = compresión).
+
+        Interpola entre el menor φPn >= Pu y el mayor φPn <= Pu; fuera de
+        rango retorna φMn del extremo más cercano.
+        """
+        return _scalar_or_array(Pu, interpolate_between(self.phi_Pn, self.phi_Mn, Pu))
+
+    def phi_at(self, Pu: ArrayLike):
+        """Factor φ a una o varias cargas axiales (misma regla que phi_Mn_at)."""
+        return _scalar_or_array(Pu, interpolate_between(self.phi_Pn, self.phi, Pu))
+
+    def Mn_at_Pn(self, Pn: float) -> float:
+        """
+        Mn nominal (sin φ) a una carga axial nominal Pn (tonf).
+
+        Interpola en el primer segmento (ordenado por Pn) que contiene Pn;
+        fuera de rango retorna el extremo más cercano.
+        """
+        if len(self) == 0:
+            return 0.0
+        order = np.argsort(-self.Pn, kind='stable')
+        P, M = self.Pn[order], self.Mn[order]
+        i = int(first_segment(P, Pn))
+        if i < 0:
+            return float(M[0] if Pn > P[0] else M[-1])
+        if abs(P[i] - P[i + 1]) < 0.001:
+            return float(M[i])
+        ratio = (P[i] - Pn) / (P[i] - P[i + 1])
+        return float(M[i] + ratio * (M[i + 1] - M[i]))
+
+    def at_phi_Pn(self, phi_Pn: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        φMn, φ, c y εt en el primer segmento que contiene cada φPn.
+
+        Interpolación lineal (ratio 0.5 en segmentos horizontales); c y εt
+        no se interpolan si algún extremo es infinito. Fuera de rango se
+        usa el extremo más cercano.
+
+        Returns:
+            (phi_Mn, phi, c, epsilon_t), cada uno con la forma de phi_Pn
+        """
+        x = np.asarray(phi_Pn, dtype=float)
+        P = self.phi_Pn
+        i = first_segment(P, x)
+        found = i >= 0
+        i1 = np.where(found, i, np.where(x > P[0], 0, len(P) - 1))
+        i2 = np.where(found, i + 1, i1)
+
+        P1, P2 = P[i1], P[i2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(np.abs(P1 - P2) < 0.001, 0.5, (P1 - x) / (P1 - P2))
+        ratio = np.where(found, ratio, 0.0)
+
+        def interp(col: int, keep_inf: bool = False) -> np.ndarray:
+            v1, v2 = self._data[i1, col], self._data[i2, col]
+            with np.errstate(invalid='ignore'):
+                value = v1 + ratio * (v2 - v1)
+            if keep_inf:
+                value = np.where(np.isinf(v1) | np.isinf(v2), v1, value)
+            return np.where(found, value, v1)
+
+        return interp(_PHI_MN), interp(_PHI), interp(_C, True), interp(_EPS, True)
+
+    def c_at(self, Pu: float, Mu: float) -> Optional[float]:
+        """
+        Profundidad c (mm) del punto de la curva más cercano a (Pu, |Mu|).
+
+        Distancia normalizada por la magnitud de cada punto (evita
+        diferencias de escala entre P y M).
+
+        Returns:
+            c en mm, o None si la curva está vacía o c no es finito/positivo
+        """
+        if len(self) == 0:
+            return None
+        phi_Pn, phi_Mn = self.phi_Pn, self.phi_Mn
+        dP = (phi_Pn - Pu) / np.maximum(np.abs(phi_Pn), 1)
+        dM = (phi_Mn - abs(Mu)) / np.maximum(np.abs(phi_Mn), 1)
+        distance = (dP ** 2 + dM ** 2) ** 0.5
+        distance[np.isnan(distance)] = math.inf
+        i = int(np.argmin(distance))
+        if not distance[i] < math.inf:
+            return None
+        c = float(self.c[i])
+        return c if c and c < math.inf else None
+
+    # =========================================================================
+    # Secuencia de InteractionPoint (compatibilidad)
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> InteractionPoint: ...
+    @overload
+    def __getitem__(self, index: slice) -> 'InteractionCurve': ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return InteractionCurve(self._data[index], presorted=True)
+        return InteractionPoint(*self._data[index].tolist())
+
+    def __iter__(self) -> Iterator[InteractionPoint]:
+        return (InteractionPoint(*row) for row in self._data.tolist())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, InteractionCurve):
+            return np.array_equal(self._data, other._data)
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return InteractionCurve, (np.array(self._data), True)
+
+    def __repr__(self) -> str:
+        if len(self) == 0:
+            return 'InteractionCurve(0 puntos)'
+        return (f'InteractionCurve({len(self)} puntos, '
+                f'φPn {self.phi_Pn[-1]:.1f}..{self.phi_Pn[0]:.1f} tonf)')
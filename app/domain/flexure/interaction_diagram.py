@@ -4,8 +4,9 @@ Cálculo del diagrama de interacción P-M para muros rectangulares de hormigón
 Implementa el método de compatibilidad de deformaciones según ACI 318.
 """
 import math
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, Tuple, Optional, Union
+
+import numpy as np
 
 from ..calculations.steel_layer_calculator import SteelLayer, SteelLayerCalculator
 from ..constants.units import N_TO_TONF, NMM_TO_TONFM
@@ -13,27 +14,153 @@ from ..constants.phi_chapter21 import (
     PHI_COMPRESSION,
     PHI_COMPRESSION_UNCONFINED,
     PHI_TENSION,
-    EPSILON_TY,
-    EPSILON_T_LIMIT,
     calculate_phi_flexure,
+    calculate_phi_flexure_array,
 )
 from ..constants.materials import (
     calculate_beta1 as _calculate_beta1,
     EPSILON_CU,
     ES_MPA,
 )
+from .fiber_section import FiberSection
+from .interaction_curve import CURVE_COLUMNS, InteractionCurve, InteractionPoint
+
+
+# Valor mínimo de c (mm) para estabilidad numérica (evita dividir por ~0)
+C_MIN_MM = 1.0
+
+
+def points_to_array(points: Union[InteractionCurve, List[InteractionPoint]]) -> np.ndarray:
+    """
+    Empaqueta una curva (o lista de InteractionPoint) en un arreglo (n, 7).
+
+    Formato compacto y serializable (pickle) para enviar curvas a procesos
+    worker o persistirlas. Columnas en el orden de CURVE_COLUMNS.
+    """
+    if isinstance(points, InteractionCurve):
+        return np.array(points.array)
+    if not points:
+        return np.empty((0, len(CURVE_COLUMNS)), dtype=float)
+    return np.array(
+        [[getattr(p, name) for name in CURVE_COLUMNS] for p in points],
+        dtype=float
+    )
+
+
+def generate_c_values(
+    d: float,
+    epsilon_y: float,
+    n_points: int
+) -> np.ndarray:
+    """
+    Genera las profundidades del eje neutro c en tres zonas.
+
+    Zona 1: compresión alta (c > d), zona 2: transición (d > c > cb),
+    zona 3: tracción controlada (c < cb).
+
+    Returns:
+        Arreglo de c (mm) únicos, de mayor a menor, con c > C_MIN_MM
+    """
+    c_balanced = d * EPSILON_CU / (EPSILON_CU + epsilon_y)
+
+    # Zona 1: Compresión alta (c > d)
+    n_zone1 = n_points // 4
+    zone1 = d * (10 - 9 * (np.arange(n_zone1) / n_zone1))
+
+    # Zona 2: Transición (d > c > c_balanced)
+    n_zone2 = n_points // 3
+    zone2 = d - (d - c_balanced) * (np.arange(n_zone2 + 1) / n_zone2)
 
+    # Zona 3: Tracción controlada (c < c_balanced)
+    n_zone3 = n_points // 3
+    c_min = 0.05 * d
+    zone3 = c_balanced - (c_balanced - c_min) * (np.arange(n_zone3 + 1) / n_zone3)
+
+    c_values = np.unique(np.concatenate([zone1, zone2, zone3]))[::-1]
+
+    # Valor minimo de c para evitar division por numeros muy pequenos
+    return c_values[c_values > C_MIN_MM]
+
+
+def calculate_phi_array(
+    epsilon_t: np.ndarray,
+    is_unconfined: bool = False
+) -> np.ndarray:
+    """
+    Arreglo de φ según la deformación del acero (§21.2.2).
+
+    Delega a calculate_phi_flexure_array() de constants/phi_chapter21.py.
+
+    Args:
+        epsilon_t: Deformaciones del acero en tracción
+        is_unconfined: True si es hormigón no confinado (Cap. 14)
+
+    Returns:
+        Arreglo de φ
+    """
+    return calculate_phi_flexure_array(epsilon_t, is_unconfined=is_unconfined)
+
+
+def max_curve_rows(n_points: int = 50, envelope: bool = False) -> int:
+    """
+    Cota superior de filas de una curva generada con n_points.
+
+    Las tres zonas de c más los puntos de compresión y tracción pura; los
+    valores de c repetidos o menores que C_MIN_MM solo reducen el total.
+    Con envelope (secciones de fibras) la curva une los puntos de ambos
+    sentidos de momento.
+    """
+    points = n_points // 4 + 2 * (n_points // 3 + 1)
+    return (2 * points if envelope else points) + 2
 
-@dataclass
-class InteractionPoint:
-    """Un punto en el diagrama de interacción."""
-    Pn: float       # Resistencia nominal axial (tonf)
-    Mn: float       # Resistencia nominal a flexión (tonf-m)
-    phi: float      # Factor de reducción
-    phi_Pn: float   # Resistencia de diseño axial (tonf)
-    phi_Mn: float   # Resistencia de diseño a flexión (tonf-m)
-    c: float        # Profundidad del eje neutro (mm)
-    epsilon_t: float  # Deformación del acero en tracción
+
+def array_to_points(curve: np.ndarray) -> List[InteractionPoint]:
+    """Inverso de points_to_array(): reconstruye la lista de InteractionPoint."""
+    return [InteractionPoint(*row) for row in curve.tolist()]
+
+
+def _rows_at(curve: np.ndarray, phi_Pn: np.ndarray) -> np.ndarray:
+    """Filas de la curva en los φPn dados: exactas si existen, interpoladas si no."""
+    phi_Mn, phi, c, epsilon_t = InteractionCurve(curve, presorted=True).at_phi_Pn(phi_Pn)
+    rows = np.column_stack([phi_Pn / phi, phi_Mn / phi, phi, phi_Pn, phi_Mn, c, epsilon_t])
+    first = {}
+    for i, value in enumerate(curve[:, 3].tolist()):
+        first.setdefault(value, i)
+    for j, value in enumerate(phi_Pn.tolist()):
+        if value in first:
+            rows[j] = curve[first[value]]
+    return rows
+
+
+def _lower_envelope(curve: np.ndarray, other: np.ndarray) -> np.ndarray:
+    """
+    Envolvente inferior (menor φMn) de dos curvas con los mismos extremos
+    (compresión y tracción pura).
+
+    Ambas se evalúan en la unión de sus φPn y se toma la menor por fila. El
+    tramo horizontal de compresión máxima se toma de la curva cuyo tramo
+    termina antes.
+    """
+    cap, bottom = curve[0, 3], curve[-1, 3]
+    tolerance = 1e-9 * max(abs(cap), abs(bottom), 1.0)
+
+    def plateau(c: np.ndarray) -> np.ndarray:
+        return c[c[:, 3] >= cap - tolerance]
+
+    top = min(plateau(curve), plateau(other), key=lambda rows: rows[:, 4].max())
+
+    def interior(c: np.ndarray) -> np.ndarray:
+        return c[(c[:, 3] < cap - tolerance) & (c[:, 3] > bottom + tolerance), 3]
+
+    # φPn de other que no coinciden (salvo redondeo) con uno de curve
+    own, extra = interior(curve), interior(other)
+    if len(own):
+        nearest = np.abs(extra[:, np.newaxis] - own).min(axis=1)
+        extra = extra[nearest > tolerance]
+    grid = np.unique(np.concatenate([own, extra]))[::-1]
+    a, b = _rows_at(curve, grid), _rows_at(other, grid)
+    middle = np.where((b[:, 4] < a[:, 4])[:, np.newaxis], b, a)
+    return np.concatenate([top, middle, curve[-1:]])
 
 
 class InteractionDiagramService:
@@ -125,13 +252,21 @@ class InteractionDiagramService:
         cover: float = 25,  # Recubrimiento (mm) - 2.5cm default
         n_points: int = 50, # Número de puntos en la curva
         steel_layers: Optional[List[SteelLayer]] = None,  # Capas de acero (opcional)
-        is_unconfined: bool = False  # True para hormigón no confinado (Cap. 14)
-    ) -> List[InteractionPoint]:
+        is_unconfined: bool = False,  # True para hormigón no confinado (Cap. 14)
+        fibers: Optional[FiberSection] = None,  # Sección de fibras (compuestas)
+        fiber_angle: float = 0.0  # Dirección de flexión de las fibras (grados)
+    ) -> InteractionCurve:
         """
         Genera los puntos del diagrama de interacción P-M.
 
         Si se proporcionan steel_layers, usa las posiciones reales de las barras.
-        Si no, usa el modelo simplificado (As/2 en cada extremo).
+        Si no, usa el modelo simplificado (As/2 en cada extremo). Con fibers
+        (secciones compuestas L, T, C) la curva se integra sobre la sección
+        de fibras y se ignoran width, thickness, As_total, cover y
+        steel_layers.
+
+        El cálculo se delega a generate_interaction_arrays() (motor NumPy);
+        este método solo envuelve el arreglo en un InteractionCurve.
 
         Args:
             width: Largo del muro en la dirección del momento (mm)
@@ -143,10 +278,59 @@ class InteractionDiagramService:
             n_points: Número de puntos a generar
             steel_layers: Lista de capas de acero con posiciones reales
             is_unconfined: True si es hormigón no confinado (Cap. 14, pedestales)
+            fibers: Sección de fibras (ver FiberSection.from_element)
+            fiber_angle: Dirección de flexión en planta (grados desde el eje x)
 
         Returns:
-            Lista de InteractionPoint ordenados de compresión pura a tracción pura
+            InteractionCurve ordenada de compresión pura a tracción pura
         """
+        curve = self.generate_interaction_arrays(
+            width=width,
+            thickness=thickness,
+            fc=fc,
+            fy=fy,
+            As_total=As_total,
+            cover=cover,
+            n_points=n_points,
+            steel_layers=steel_layers,
+            is_unconfined=is_unconfined,
+            fibers=fibers,
+            fiber_angle=fiber_angle
+        )
+        return InteractionCurve(curve, presorted=True)
+
+    def generate_interaction_arrays(
+        self,
+        width: float,
+        thickness: float,
+        fc: float,
+        fy: float,
+        As_total: float,
+        cover: float = 25,
+        n_points: int = 50,
+        steel_layers: Optional[List[SteelLayer]] = None,
+        is_unconfined: bool = False,
+        fibers: Optional[FiberSection] = None,
+        fiber_angle: float = 0.0
+    ) -> np.ndarray:
+        """
+        Genera el diagrama de interacción P-M como arreglo compacto (motor NumPy).
+
+        Evalúa todas las profundidades c contra todas las capas de acero como
+        una sola matriz de deformaciones (n_c × n_capas), en vez de iterar
+        punto por punto en Python.
+
+        Args:
+            Ver generate_interaction_curve().
+
+        Returns:
+            Arreglo float64 de forma (n, 7) con columnas CURVE_COLUMNS
+            (Pn, Mn, phi, phi_Pn, phi_Mn, c, epsilon_t), ordenado por
+            phi_Pn de mayor a menor.
+        """
+        if fibers is not None:
+            return self._generate_fiber_arrays(fibers, fiber_angle, n_points, is_unconfined)
+
         # Parámetros geométricos
         b = thickness                    # Ancho de la sección
         h = width                        # Altura de la sección (dirección del momento)
@@ -158,6 +342,9 @@ class InteractionDiagramService:
                 SteelLayer(position=h - cover, area=As_total / 2)
             ]
 
+        positions = np.array([layer.position for layer in steel_layers], dtype=float)
+        areas = np.array([layer.area for layer in steel_layers], dtype=float)
+
         # Calcular As_total desde las capas (para P0)
         As_total_calc = sum(layer.area for layer in steel_layers)
 
@@ -168,158 +355,164 @@ class InteractionDiagramService:
         beta1 = self.calculate_beta1(fc)
         epsilon_y = fy / ES_MPA
 
-        points = []
+        # Puntos intermedios por compatibilidad de deformaciones
+        c = generate_c_values(d, epsilon_y, n_points)
+        Pn, Mn, epsilon_t = self._evaluate_strain_compatibility(
+            c, positions, areas, b=b, h=h, fc=fc, fy=fy, beta1=beta1
+        )
+        return self._assemble_curve(
+            c, Pn, Mn, epsilon_t,
+            Ag=b * h, As_total=As_total_calc, fc=fc, fy=fy, is_unconfined=is_unconfined
+        )
 
+    def _generate_fiber_arrays(
+        self,
+        fibers: FiberSection,
+        angle: float,
+        n_points: int,
+        is_unconfined: bool
+    ) -> np.ndarray:
+        """
+        Curva P-M de una sección de fibras en la dirección angle.
+
+        Las secciones asimétricas (L, T, C) tienen distinta capacidad según
+        el sentido del momento; como la verificación usa |Mu|, se evalúan
+        ambos sentidos y se guarda la envolvente inferior.
+        """
+        curves = []
+        for sense in (angle, angle + 180.0):
+            d = fibers.max_bar_depth(sense)
+            c = generate_c_values(d, fibers.fy / ES_MPA, n_points)
+            Pn, Mn, epsilon_t = fibers.evaluate(sense, c)
+            curves.append(self._assemble_curve(
+                c, Pn, Mn, epsilon_t,
+                Ag=fibers.Ag, As_total=fibers.As_total, fc=fibers.fc, fy=fibers.fy,
+                is_unconfined=is_unconfined
+            ))
+        return _lower_envelope(*curves)
+
+    def _assemble_curve(
+        self,
+        c: np.ndarray,
+        Pn: np.ndarray,
+        Mn: np.ndarray,
+        epsilon_t: np.ndarray,
+        *,
+        Ag: float,
+        As_total: float,
+        fc: float,
+        fy: float,
+        is_unconfined: bool
+    ) -> np.ndarray:
+        """
+        Arma la curva (n, 7) con los puntos de compresión y tracción pura.
+
+        Args:
+            c, Pn (N), Mn (N-mm), epsilon_t: Puntos por compatibilidad
+            Ag, As_total: Áreas de hormigón y acero (mm²)
+            fc, fy: Resistencias (MPa)
+            is_unconfined: True si es hormigón no confinado (Cap. 14)
+
+        Returns:
+            Arreglo (n + 2, 7) ordenado por phi_Pn de mayor a menor
+        """
         # 1. Punto de compresión pura (P0)
-        Ag = b * h
-        P0 = 0.85 * fc * (Ag - As_total_calc) + fy * As_total_calc
+        P0 = 0.85 * fc * (Ag - As_total) + fy * As_total
         P0_max = 0.80 * P0  # Límite ACI 318
 
         # φ para compresión pura: 0.60 para no confinado, 0.65 normal
         phi_P0 = PHI_COMPRESSION_UNCONFINED if is_unconfined else PHI_COMPRESSION
-        points.append(InteractionPoint(
-            Pn=P0_max / N_TO_TONF,
-            Mn=0,
-            phi=phi_P0,
-            phi_Pn=phi_P0 * P0_max / N_TO_TONF,
-            phi_Mn=0,
-            c=float('inf'),
-            epsilon_t=0
-        ))
 
-        # 2. Generar valores de c para la curva
-        c_balanced = d * EPSILON_CU / (EPSILON_CU + epsilon_y)
-        c_values = []
-
-        # Zona 1: Compresión alta (c > d)
-        n_zone1 = n_points // 4
-        for i in range(n_zone1):
-            ratio = i / n_zone1
-            c = d * (10 - 9 * ratio)
-            c_values.append(c)
-
-        # Zona 2: Transición (d > c > c_balanced)
-        n_zone2 = n_points // 3
-        for i in range(n_zone2 + 1):
-            ratio = i / n_zone2
-            c = d - (d - c_balanced) * ratio
-            c_values.append(c)
-
-        # Zona 3: Tracción controlada (c < c_balanced)
-        n_zone3 = n_points // 3
-        c_min = 0.05 * d
-        for i in range(n_zone3 + 1):
-            ratio = i / n_zone3
-            c = c_balanced - (c_balanced - c_min) * ratio
-            if c > 0:
-                c_values.append(c)
-
-        c_values = sorted(set(c_values), reverse=True)
+        # 2. Factor phi basado en deformación máxima del acero en tracción
+        phi = calculate_phi_array(epsilon_t, is_unconfined)
+
+        # Verificar límite de compresión
+        Pn = np.minimum(Pn, P0_max)
+
+        # 3. Punto de tracción pura
+        Pt = -As_total * fy  # N (negativo)
+        # Para tracción pura, hormigón no confinado también usa φ = 0.60
+        phi_Pt = PHI_COMPRESSION_UNCONFINED if is_unconfined else PHI_TENSION
+
+        n = len(c)
+        curve = np.empty((n + 2, len(CURVE_COLUMNS)), dtype=float)
+        curve[0] = (P0_max / N_TO_TONF, 0.0, phi_P0,
+                    phi_P0 * P0_max / N_TO_TONF, 0.0, math.inf, 0.0)
+        curve[1:n + 1, 0] = Pn / N_TO_TONF
+        curve[1:n + 1, 1] = Mn / NMM_TO_TONFM
+        curve[1:n + 1, 2] = phi
+        curve[1:n + 1, 3] = phi * Pn / N_TO_TONF
+        curve[1:n + 1, 4] = phi * Mn / NMM_TO_TONFM
+        curve[1:n + 1, 5] = c
+        curve[1:n + 1, 6] = epsilon_t
+        curve[n + 1] = (Pt / N_TO_TONF, 0.0, phi_Pt,
+                        phi_Pt * Pt / N_TO_TONF, 0.0, 0.0, math.inf)
+
+        # Ordenar por phi_Pn de mayor a menor (estable, igual que list.sort)
+        order = np.argsort(-curve[:, 3], kind='stable')
+        return curve[order]
+
+    @staticmethod
+    def _evaluate_strain_compatibility(
+        c: np.ndarray,
+        positions: np.ndarray,
+        areas: np.ndarray,
+        *,
+        b: float,
+        h: float,
+        fc: float,
+        fy: float,
+        beta1: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evalúa equilibrio de la sección para todos los c a la vez.
+
+        Args:
+            c: Profundidades del eje neutro (mm), forma (n_c,)
+            positions: Posición de cada capa desde la fibra comprimida (mm)
+            areas: Área de acero de cada capa (mm²)
+            b, h: Ancho y altura de la sección (mm)
+            fc, fy: Resistencias del hormigón y acero (MPa)
+            beta1: Factor del bloque de Whitney
 
+        Returns:
+            (Pn en N, Mn en N-mm, epsilon_t máxima) — cada uno forma (n_c,)
+        """
         # Centro de la sección para calcular momentos
         y_centroid = h / 2
 
-        # Valor minimo de c para evitar division por numeros muy pequenos
-        c_tolerance = 1.0  # mm - minimo 1mm para estabilidad numerica
-
-        for c in c_values:
-            if c <= c_tolerance:
-                continue
-
-            # Bloque de compresion de Whitney
-            a = beta1 * c
-            if a > h:
-                a = h
-
-            # Compresión del hormigón
-            Cc = 0.85 * fc * a * b  # N
-            Mc = Cc * (y_centroid - a / 2)  # N-mm
-
-            # Sumar contribución de cada capa de acero
-            Pn_steel = 0.0
-            Mn_steel = 0.0
-            epsilon_t_max = 0.0  # Para calcular phi
-
-            for layer in steel_layers:
-                di = layer.position
-                Asi = layer.area
-
-                # Deformación en esta capa
-                # εi = εcu × (di - c) / c
-                # Positivo = tracción, Negativo = compresión
-                epsilon_i = EPSILON_CU * (di - c) / c
-
-                # Esfuerzo (limitado por fy)
-                fs_i = min(abs(epsilon_i) * ES_MPA, fy)
-                if epsilon_i < 0:
-                    fs_i = -fs_i  # Compresión
-
-                # Descontar hormigón si la barra está en zona comprimida
-                if di <= a:
-                    # La barra está dentro del bloque de compresión
-                    # Fuerza neta = As × (fs - 0.85×fc) si está comprimida
-                    if fs_i < 0:  # Compresión
-                        Fi = Asi * (fs_i + 0.85 * fc)  # +0.85fc porque fs_i es negativo
-                    else:
-                        Fi = Asi * fs_i
-                else:
-                    # La barra está en zona de tracción
-                    Fi = Asi * fs_i
-
-                # Contribución a P (positivo = compresión)
-                Pn_steel += -Fi  # Negativo porque tracción resta a P
-
-                # Contribución a M respecto al centroide
-                Mn_steel += Fi * (di - y_centroid)
-
-                # Guardar deformación máxima en tracción (para phi)
-                if epsilon_i > epsilon_t_max:
-                    epsilon_t_max = epsilon_i
-
-            # Fuerzas totales
-            Pn = Cc + Pn_steel  # N
-            Mn = abs(Mc + Mn_steel)  # N-mm (siempre positivo)
-
-            # Factor phi basado en deformación máxima del acero en tracción
-            phi = self.calculate_phi(epsilon_t_max, is_unconfined=is_unconfined)
-
-            # Verificar límite de compresión
-            if Pn > P0_max:
-                Pn = P0_max
+        # Bloque de compresion de Whitney
+        a = np.minimum(beta1 * c, h)
 
-            points.append(InteractionPoint(
-                Pn=Pn / N_TO_TONF,
-                Mn=Mn / NMM_TO_TONFM,
-                phi=phi,
-                phi_Pn=phi * Pn / N_TO_TONF,
-                phi_Mn=phi * Mn / NMM_TO_TONFM,
-                c=c,
-                epsilon_t=epsilon_t_max
-            ))
+        # Compresión del hormigón
+        Cc = 0.85 * fc * a * b  # N
+        Mc = Cc * (y_centroid - a / 2)  # N-mm
 
-        # 3. Punto de tracción pura
-        Pt = -As_total_calc * fy  # N (negativo)
-        # Para tracción pura, hormigón no confinado también usa φ = 0.60
-        phi_Pt = PHI_COMPRESSION_UNCONFINED if is_unconfined else PHI_TENSION
+        # Matriz de deformaciones (n_c × n_capas)
+        # εi = εcu × (di - c) / c  → positivo = tracción, negativo = compresión
+        c_col = c[:, np.newaxis]
+        epsilon = EPSILON_CU * (positions - c_col) / c_col
 
-        points.append(InteractionPoint(
-            Pn=Pt / N_TO_TONF,
-            Mn=0,
-            phi=phi_Pt,
-            phi_Pn=phi_Pt * Pt / N_TO_TONF,
-            phi_Mn=0,
-            c=0,
-            epsilon_t=float('inf')
-        ))
+        # Esfuerzo (limitado por fy), con signo de la deformación
+        fs = np.minimum(np.abs(epsilon) * ES_MPA, fy)
+        fs = np.where(epsilon < 0, -fs, fs)
 
-        # Ordenar por Pn de mayor a menor
-        points.sort(key=lambda p: p.phi_Pn, reverse=True)
+        # Descontar hormigón desplazado si la barra está comprimida dentro del bloque
+        in_block = (positions <= a[:, np.newaxis]) & (fs < 0)
+        F = areas * np.where(in_block, fs + 0.85 * fc, fs)
 
-        return points
+        # Tracción resta a P; momento respecto al centroide
+        Pn = Cc - F.sum(axis=1)
+        Mn = np.abs(Mc + (F * (positions - y_centroid)).sum(axis=1))
+
+        # Deformación máxima en tracción (para phi)
+        epsilon_t = epsilon.max(axis=1, initial=0.0)
+
+        return Pn, Mn, epsilon_t
 
     def get_design_curve(
         self,
-        points: List[InteractionPoint]
+        points: Union[InteractionCurve, List[InteractionPoint]]
     ) -> List[Tuple[float, float]]:
         """
         Extrae la curva de diseño (φPn, φMn) del diagrama.
@@ -327,8 +520,9 @@ class InteractionDiagramService:
         Returns:
             Lista de tuplas (φMn, φPn) para graficar
         """
-        curve = [(p.phi_Mn, p.phi_Pn) for p in points]
-        return curve
+        if isinstance(points, InteractionCurve):
+            return points.design_curve()
+        return [(p.phi_Mn, p.phi_Pn) for p in points]
 
     def generate_strut_interaction_curve(
         self,
@@ -44,6 +44,10 @@ class DesignGenerator:
     - verify_shear: función que verifica corte y retorna DCR
     - wall_pier_service: servicio para clasificación de piers
 
+    Las búsquedas combinada y best-effort verifican candidatos en paralelo
+    (max_workers threads, ver strategies/search.py), por lo que las
+    funciones de verificación deben ser thread-safe.
+
     Esto permite que la lógica de búsqueda sea independiente
     de los servicios de verificación (inversión de dependencias).
     """
@@ -52,7 +56,8 @@ class DesignGenerator:
         self,
         verify_flexure: Callable,
         verify_shear: Callable,
-        wall_pier_service: 'WallPierService'
+        wall_pier_service: 'WallPierService',
+        max_workers: Optional[int] = None
     ):
         """
         Inicializa el generador con funciones de verificación.
@@ -61,10 +66,13 @@ class DesignGenerator:
             verify_flexure: Función (pier, forces) -> SF
             verify_shear: Función (pier, forces) -> DCR
             wall_pier_service: Servicio para clasificación de piers
+            max_workers: Threads de verificación de candidatos
+                (None = INGEO_PROPOSAL_WORKERS)
         """
         self._verify_flexure = verify_flexure
         self._verify_shear = verify_shear
         self._wall_pier_service = wall_pier_service
+        self._max_workers = max_workers
 
     # =========================================================================
     # CLASIFICACIÓN Y UTILIDADES
@@ -226,7 +234,7 @@ class DesignGenerator:
             return propose_combined(
                 pier, pier_forces, original_config, flexure_sf, shear_dcr,
                 self._verify_flexure, self._verify_shear, self._apply_config_to_pier,
-                self._get_min_thickness_for_pier
+                self._get_min_thickness_for_pier, self._max_workers
             )
 
         elif failure_mode == FailureMode.SLENDERNESS:
@@ -274,7 +282,7 @@ class DesignGenerator:
         return create_best_effort_proposal(
             pier, pier_forces, failure_mode, original_config, original_sf, original_dcr,
             self._verify_flexure, self._verify_shear, self._apply_config_to_pier,
-            self._get_min_thickness_for_pier
+            self._get_min_thickness_for_pier, self._max_workers
         )
 
     # =========================================================================
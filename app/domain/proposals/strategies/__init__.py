@@ -11,6 +11,7 @@ from .combined import propose_combined
 from .reduction import propose_for_reduction
 from .thickness import propose_with_thickness, propose_for_slenderness
 from .column_min import propose_for_column_min_thickness
+from .search import CandidateSearch
 
 __all__ = [
     "propose_for_flexure",
@@ -20,4 +21,5 @@ __all__ = [
     "propose_with_thickness",
     "propose_for_slenderness",
     "propose_for_column_min_thickness",
+    "CandidateSearch",
 ]
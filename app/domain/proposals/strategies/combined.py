@@ -2,11 +2,14 @@
 """
 Estrategia de propuesta para falla combinada (flexión + corte).
 
-Búsqueda exhaustiva por espesor creciente, probando combinaciones
-de refuerzo hasta encontrar SF >= 1.0 y DCR <= 1.0.
+Búsqueda por espesor creciente, probando combinaciones de refuerzo
+(por volumen de acero, con poda y verificación en paralelo) hasta
+encontrar SF >= 1.0 y DCR <= 1.0.
 """
-from typing import Optional, Callable, TYPE_CHECKING
+from typing import List, Optional, Callable, TYPE_CHECKING
 from copy import deepcopy
+from dataclasses import replace
+from itertools import product
 
 from ...entities.design_proposal import (
     DesignProposal,
@@ -19,13 +22,35 @@ from ...entities.design_proposal import (
     THICKNESS_SEQUENCE,
     STIRRUP_LEGS_SEQUENCE,
 )
-from ...constants.phi_chapter21 import RHO_MAX
-from .base import TARGET_SF, create_proposal, build_changes
+from .base import create_proposal, build_changes
+from .search import CandidateSearch
 
 if TYPE_CHECKING:
     from ...entities import VerticalElement, ElementForces
 
 
+def _candidates_for_thickness(
+    original_config: ReinforcementConfig,
+    thickness: float,
+    max_legs: int
+) -> List[ReinforcementConfig]:
+    """Configuraciones borde × malla × ramas para un espesor dado."""
+    candidates = []
+    for (n_bars, diameter), spacing, mesh_diameter, n_legs in product(
+        BOUNDARY_BAR_SEQUENCE, MESH_SPACING_SEQUENCE, MESH_DIAMETER_SEQUENCE, STIRRUP_LEGS_SEQUENCE
+    ):
+        if n_legs > max_legs:
+            continue
+        candidates.append(replace(
+            original_config, thickness=thickness,
+            n_edge_bars=n_bars, diameter_edge=diameter,
+            spacing_h=spacing, spacing_v=spacing,
+            diameter_h=mesh_diameter, diameter_v=mesh_diameter,
+            n_stirrup_legs=n_legs
+        ))
+    return candidates
+
+
 def find_solution_for_thickness(
     pier: 'VerticalElement',
     pier_forces: Optional['ElementForces'],
@@ -36,13 +61,16 @@ def find_solution_for_thickness(
     original_dcr: float,
     verify_flexure: Callable,
     verify_shear: Callable,
-    apply_config: Callable
+    apply_config: Callable,
+    search: Optional[CandidateSearch] = None
 ) -> Optional[DesignProposal]:
     """
     Busca la solución mínima para un espesor dado.
 
-    Itera borde → malla → ramas hasta encontrar SF >= 1.0.
-    Verifica que la cuantía no exceda ρmax para asegurar ductilidad.
+    Prueba las combinaciones borde × malla × ramas por volumen de acero
+    creciente hasta encontrar SF >= 1.0 y DCR <= 1.0. Las que exceden
+    ρmax se saltan (falla frágil). Si la configuración máxima del espesor
+    no cumple, no se verifica ninguna otra (ver CandidateSearch).
 
     Args:
         pier: Pier a analizar
@@ -55,54 +83,28 @@ def find_solution_for_thickness(
         verify_flexure: Función para verificar flexión
         verify_shear: Función para verificar corte
         apply_config: Función para aplicar config a pier
+        search: Búsqueda compartida entre espesores (memoria de verificaciones)
 
     Returns:
         DesignProposal si encuentra solución, None si no
     """
-    proposed_config = deepcopy(original_config)
-    proposed_config.thickness = thickness
-
-    # Iterar barras de borde (ordenadas por área creciente)
-    for n_bars, diameter in BOUNDARY_BAR_SEQUENCE:
-        proposed_config.n_edge_bars = n_bars
-        proposed_config.diameter_edge = diameter
-
-        # Iterar espaciamiento de malla (de mayor a menor = menos acero primero)
-        for spacing in MESH_SPACING_SEQUENCE:
-            proposed_config.spacing_h = spacing
-            proposed_config.spacing_v = spacing
-
-            # Iterar diámetro de malla
-            for mesh_diameter in MESH_DIAMETER_SEQUENCE:
-                proposed_config.diameter_h = mesh_diameter
-                proposed_config.diameter_v = mesh_diameter
-
-                # Iterar ramas de estribos
-                for n_legs in STIRRUP_LEGS_SEQUENCE:
-                    if n_legs > max_legs:
-                        continue
-
-                    proposed_config.n_stirrup_legs = n_legs
-
-                    test_pier = apply_config(pier, proposed_config)
-
-                    # Verificar cuantía máxima para asegurar ductilidad
-                    # Si ρ > ρmax, saltar esta configuración (falla frágil)
-                    if test_pier.rho_vertical > RHO_MAX:
-                        continue
-
-                    new_sf = verify_flexure(test_pier, pier_forces)
-                    new_dcr = verify_shear(test_pier, pier_forces)
-
-                    if new_sf >= TARGET_SF and new_dcr <= 1.0:
-                        changes = build_changes(original_config, proposed_config)
-                        return create_proposal(
-                            pier, FailureMode.COMBINED, ProposalType.COMBINED,
-                            original_config, proposed_config, original_sf, new_sf,
-                            original_dcr, new_dcr, 1, changes
-                        )
-
-    return None
+    if search is None:
+        search = CandidateSearch(pier, pier_forces, verify_flexure, verify_shear, apply_config)
+
+    candidates = search.sort_by_steel(_candidates_for_thickness(original_config, thickness, max_legs))
+    bound = _get_max_config_for_thickness(original_config, thickness, max_legs)
+    outcome = search.first_passing(candidates, bounds=[bound])
+
+    if outcome.solution is None:
+        return None
+
+    solution = outcome.solution
+    changes = build_changes(original_config, solution.config)
+    return create_proposal(
+        pier, FailureMode.COMBINED, ProposalType.COMBINED,
+        original_config, solution.config, original_sf, solution.sf,
+        original_dcr, solution.dcr, max(outcome.evaluated, 1), changes
+    )
 
 
 def _get_max_config_for_thickness(
@@ -131,14 +133,16 @@ def propose_combined(
     verify_flexure: Callable,
     verify_shear: Callable,
     apply_config: Callable,
-    get_min_thickness: Callable
+    get_min_thickness: Callable,
+    max_workers: Optional[int] = None
 ) -> Optional[DesignProposal]:
     """
     Propone solución para falla combinada (flexión + corte).
 
-    Estrategia: búsqueda exhaustiva por espesor creciente.
-    Para cada espesor, prueba combinaciones de refuerzo hasta encontrar SF >= 1.0.
-    Se detiene en la primera solución viable (la más económica).
+    Estrategia: búsqueda por espesor creciente.
+    Para cada espesor, prueba combinaciones de refuerzo por volumen de acero
+    creciente hasta encontrar SF >= 1.0. Se detiene en la primera solución
+    viable (la más económica). Las verificaciones se comparten entre espesores.
 
     Args:
         pier: Pier a analizar
@@ -150,6 +154,7 @@ def propose_combined(
         verify_shear: Función para verificar corte
         apply_config: Función para aplicar config a pier
         get_min_thickness: Función que retorna espesor mínimo para el pier
+        max_workers: Threads de verificación (None = INGEO_PROPOSAL_WORKERS)
 
     Returns:
         DesignProposal (con success=True si resuelve, False si no)
@@ -157,6 +162,7 @@ def propose_combined(
     best_config = deepcopy(original_config)
     best_sf = original_sf
     best_dcr = original_dcr
+    search = CandidateSearch(pier, pier_forces, verify_flexure, verify_shear, apply_config, max_workers)
 
     # Obtener espesor mínimo según clasificación del pier
     min_thickness = get_min_thickness(pier)
@@ -174,22 +180,20 @@ def propose_combined(
         result = find_solution_for_thickness(
             pier, pier_forces, original_config, thickness, max_legs,
             original_sf, original_dcr,
-            verify_flexure, verify_shear, apply_config
+            verify_flexure, verify_shear, apply_config, search
         )
 
         if result is not None:
             return result
 
-        # Actualizar mejor configuración si mejoró
+        # Actualizar mejor configuración si mejoró (la cota ya está verificada)
         test_config = _get_max_config_for_thickness(original_config, thickness, max_legs)
-        test_pier = apply_config(pier, test_config)
-        test_sf = verify_flexure(test_pier, pier_forces)
-        test_dcr = verify_shear(test_pier, pier_forces)
+        bound = search.evaluate(test_config)
 
-        if test_sf > best_sf:
+        if bound.sf > best_sf:
             best_config = test_config
-            best_sf = test_sf
-            best_dcr = test_dcr
+            best_sf = bound.sf
+            best_dcr = bound.dcr
 
     # No se encontró solución, retornar mejor esfuerzo con success=False
     changes = build_changes(original_config, best_config)
@@ -0,0 +1,325 @@
+# app/domain/proposals/strategies/search.py
+"""
+Motor de búsqueda de configuraciones de refuerzo para propuestas.
+
+Las estrategias combinada y best-effort recorrían el producto
+borde × espaciamiento × diámetro × ramas × espesor en lazos anidados,
+copiando el pier y regenerando la curva P-M en cada paso. Este motor:
+
+- Ordena los candidatos por volumen de acero (el más económico primero).
+- Poda por dominancia: la capacidad a flexión crece con el acero vertical
+  y el espesor; la de corte con el acero horizontal, los estribos y el
+  espesor, y su verificación también puede depender del acero vertical
+  (ρv >= ρh en muros bajos, §18.10.4.3). Un candidato con todas esas cantidades menores o iguales que
+  las de otro que ya falló flexión (o corte) también falla y no se
+  verifica. Las cotas (configuración máxima de cada grupo) se verifican
+  primero para descartar grupos completos.
+- Verifica primero el corte (barato) y la flexión (curva P-M) solo si
+  el corte cumple; memoriza ambas por huella de configuración.
+- Verifica los candidatos por lotes en un pool de threads. El resultado
+  es el mismo que el recorrido secuencial en orden: se retorna el primer
+  candidato (en orden) que cumple.
+
+Variables de entorno:
+- INGEO_PROPOSAL_WORKERS: threads de verificación (default min(4, CPUs))
+
+Uso:
+    search = CandidateSearch(pier, forces, verify_flexure, verify_shear, apply_config)
+    outcome = search.first_passing(candidates, bounds=[max_config])
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import astuple, dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ...constants.materials import get_bar_area
+from ...constants.phi_chapter21 import RHO_MAX
+from ...entities.design_proposal import ReinforcementConfig
+from .base import TARGET_SF
+
+if TYPE_CHECKING:
+    from ...entities import VerticalElement, ElementForces
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def resolve_workers(max_workers: Optional[int] = None) -> int:
+    """Threads de verificación (parámetro, INGEO_PROPOSAL_WORKERS o default)."""
+    if max_workers is None:
+        value = os.environ.get('INGEO_PROPOSAL_WORKERS')
+        max_workers = int(value) if value else min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    return max(1, max_workers)
+
+
+# =============================================================================
+# CANTIDADES DE UNA CONFIGURACIÓN
+# =============================================================================
+
+def config_fingerprint(config: ReinforcementConfig) -> tuple:
+    """Huella hashable de una configuración (todos sus campos)."""
+    return astuple(config)
+
+
+def _mesh_per_mm(config: ReinforcementConfig, diameter: int, spacing: int) -> float:
+    """Área de malla por mm (mm²/mm) para un diámetro y espaciamiento."""
+    return config.n_meshes * get_bar_area(diameter) / spacing
+
+
+def _stirrups_per_mm(config: ReinforcementConfig) -> float:
+    """Área de ramas de estribo por mm de altura (mm²/mm)."""
+    return config.n_stirrup_legs * get_bar_area(config.stirrup_diameter, 78.5) / config.stirrup_spacing
+
+
+def steel_volume(config: ReinforcementConfig, length: float, thickness: float) -> float:
+    """
+    Volumen de acero por mm de altura del pier (mm³/mm).
+
+    Barras de borde + malla vertical + malla horizontal (a lo largo de
+    length) + ramas de estribo en ambos bordes (a lo ancho del espesor).
+    Es la clave de orden de los candidatos.
+    """
+    thickness = config.thickness or thickness
+    vertical = config.As_edge + _mesh_per_mm(config, config.diameter_v, config.spacing_v) * length
+    horizontal = _mesh_per_mm(config, config.diameter_h, config.spacing_h) * length
+    return vertical + horizontal + 2 * _stirrups_per_mm(config) * thickness
+
+
+def flexure_vector(config: ReinforcementConfig, thickness: float) -> Tuple[float, ...]:
+    """Cantidades de las que crece monótonamente la capacidad a flexión."""
+    return (config.thickness or thickness, config.As_edge,
+            _mesh_per_mm(config, config.diameter_v, config.spacing_v))
+
+
+def shear_vector(config: ReinforcementConfig, thickness: float) -> Tuple[float, ...]:
+    """
+    Cantidades de las que crece monótonamente la verificación a corte.
+
+    Incluye el acero vertical: en muros bajos la verificación exige
+    ρv >= ρh (§18.10.4.3), así que un candidato con más acero vertical
+    puede cumplir aunque otro con igual acero horizontal haya fallado.
+    """
+    return (config.thickness or thickness,
+            _mesh_per_mm(config, config.diameter_h, config.spacing_h), _stirrups_per_mm(config),
+            config.As_edge, _mesh_per_mm(config, config.diameter_v, config.spacing_v))
+
+
+def _dominated(vector: Tuple[float, ...], frontier: List[Tuple[float, ...]]) -> bool:
+    """True si algún vector de la frontera es >= en todas las componentes."""
+    return any(all(v <= f for v, f in zip(vector, failed)) for failed in frontier)
+
+
+# =============================================================================
+# RESULTADOS
+# =============================================================================
+
+@dataclass
+class CandidateResult:
+    """
+    Verificación de una configuración.
+
+    dcr/sf son None mientras no se verifican: no se verifica una
+    configuración con cuantía > ρmax, ni la flexión de una que ya falló
+    corte (el corte se verifica primero por ser más barato).
+    """
+    config: ReinforcementConfig
+    feasible: bool
+    sf: Optional[float] = None
+    dcr: Optional[float] = None
+
+    @property
+    def verified(self) -> bool:
+        """True si se verificaron flexión y corte."""
+        return self.sf is not None and self.dcr is not None
+
+    @property
+    def passes(self) -> bool:
+        """True si es factible y cumple SF >= TARGET_SF y DCR <= 1.0."""
+        return self.feasible and self.verified and self.sf >= TARGET_SF and self.dcr <= 1.0
+
+
+@dataclass
+class SearchOutcome:
+    """
+    Resultado de una búsqueda.
+
+    solution: primer candidato (en orden) que cumple, o None
+    best: candidato factible verificado con mayor SF (menor DCR en
+        empate), o None
+    evaluated: candidatos verificados (sin contar aciertos de memoria)
+    pruned: candidatos descartados por dominancia
+    """
+    solution: Optional[CandidateResult]
+    best: Optional[CandidateResult]
+    evaluated: int
+    pruned: int
+
+
+# =============================================================================
+# MOTOR DE BÚSQUEDA
+# =============================================================================
+
+class CandidateSearch:
+    """
+    Búsqueda de la configuración mínima que cumple para un pier.
+
+    La memoria de verificaciones vive en la instancia: las búsquedas
+    sucesivas sobre el mismo pier (ej: un espesor tras otro) reutilizan
+    los resultados. Las funciones de verificación se llaman desde varios
+    threads y deben ser thread-safe (los servicios de flexión y corte lo
+    son: la caché de curvas P-M usa lock).
+    """
+
+    def __init__(
+        self,
+        pier: 'VerticalElement',
+        pier_forces: Optional['ElementForces'],
+        verify_flexure: Callable,
+        verify_shear: Callable,
+        apply_config: Callable,
+        max_workers: Optional[int] = None
+    ):
+        self.pier = pier
+        self.pier_forces = pier_forces
+        self._verify_flexure = verify_flexure
+        self._verify_shear = verify_shear
+        self._apply_config = apply_config
+        self.max_workers = resolve_workers(max_workers)
+        self._memo: Dict[tuple, CandidateResult] = {}
+
+    def steel_volume(self, config: ReinforcementConfig) -> float:
+        """Volumen de acero de una configuración para este pier (mm³/mm)."""
+        return steel_volume(config, self.pier.length, self.pier.thickness)
+
+    def sort_by_steel(self, configs: Sequence[ReinforcementConfig]) -> List[ReinforcementConfig]:
+        """Ordena por volumen de acero y luego espesor (orden estable)."""
+        return sorted(configs, key=lambda c: (self.steel_volume(c), c.thickness or self.pier.thickness))
+
+    # -------------------------------------------------------------------------
+    # Verificación memorizada
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _complete(result: CandidateResult, full: bool) -> bool:
+        """True si el resultado ya tiene lo que pide la verificación."""
+        if full:
+            return result.verified
+        if not result.feasible:
+            return True
+        return result.dcr is not None and (result.sf is not None or result.dcr > 1.0)
+
+    def _verify(self, config: ReinforcementConfig, full: bool) -> CandidateResult:
+        key = config_fingerprint(config)
+        test_pier = self._apply_config(self.pier, config)
+        result = self._memo.get(key) or CandidateResult(config, feasible=test_pier.rho_vertical <= RHO_MAX)
+        if not (result.feasible or full):
+            return result
+        if result.dcr is None:
+            result.dcr = self._verify_shear(test_pier, self.pier_forces)
+        if result.sf is None and (full or result.dcr <= 1.0):
+            result.sf = self._verify_flexure(test_pier, self.pier_forces)
+        return result
+
+    def evaluate_many(
+        self,
+        configs: Sequence[ReinforcementConfig],
+        full: bool = False
+    ) -> Tuple[List[CandidateResult], int]:
+        """
+        Verifica configuraciones (en paralelo las que no están en memoria).
+
+        Args:
+            configs: Configuraciones a verificar
+            full: Verificar flexión y corte siempre, aunque la cuantía
+                exceda ρmax o el corte falle (para cotas y mejor esfuerzo)
+
+        Returns:
+            (resultados en el orden de configs, configuraciones verificadas)
+        """
+        pending: Dict[tuple, ReinforcementConfig] = {}
+        for config in configs:
+            key = config_fingerprint(config)
+            cached = self._memo.get(key)
+            if key not in pending and (cached is None or not self._complete(cached, full)):
+                pending[key] = deepcopy(config)
+
+        if len(pending) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                results = list(executor.map(lambda c: self._verify(c, full), pending.values()))
+        else:
+            results = [self._verify(config, full) for config in pending.values()]
+        self._memo.update(zip(pending, results))
+
+        return [self._memo[config_fingerprint(config)] for config in configs], len(pending)
+
+    def evaluate(self, config: ReinforcementConfig, full: bool = True) -> CandidateResult:
+        """Verifica una configuración (memorizada)."""
+        return self.evaluate_many([config], full)[0][0]
+
+    # -------------------------------------------------------------------------
+    # Búsqueda
+    # -------------------------------------------------------------------------
+
+    def first_passing(
+        self,
+        candidates: Sequence[ReinforcementConfig],
+        bounds: Sequence[ReinforcementConfig] = (),
+        limit: Optional[int] = None
+    ) -> SearchOutcome:
+        """
+        Primer candidato (en el orden dado) con SF >= TARGET_SF y DCR <= 1.0.
+
+        Args:
+            candidates: Configuraciones ordenadas por preferencia
+            bounds: Configuraciones máximas de cada grupo; se verifican
+                primero y sus fallas podan los candidatos dominados
+            limit: Máximo de candidatos a verificar (None = todos)
+
+        Returns:
+            SearchOutcome
+        """
+        thickness = self.pier.thickness
+        flexure_failures: List[Tuple[float, ...]] = []
+        shear_failures: List[Tuple[float, ...]] = []
+        pruned = 0
+        best: Optional[CandidateResult] = None
+
+        def record(result: CandidateResult) -> None:
+            nonlocal best
+            if result.sf is not None and result.sf < TARGET_SF:
+                flexure_failures.append(flexure_vector(result.config, thickness))
+            if result.dcr is not None and result.dcr > 1.0:
+                shear_failures.append(shear_vector(result.config, thickness))
+            if result.feasible and result.verified and (
+                    best is None or result.sf > best.sf or (result.sf == best.sf and result.dcr < best.dcr)):
+                best = result
+
+        def is_pruned(config: ReinforcementConfig) -> bool:
+            return (_dominated(flexure_vector(config, thickness), flexure_failures)
+                    or _dominated(shear_vector(config, thickness), shear_failures))
+
+        bound_results, evaluated = self.evaluate_many(list(bounds), full=True)
+        for result in bound_results:
+            record(result)
+
+        index = 0
+        while index < len(candidates):
+            if limit is not None and evaluated >= limit:
+                break
+            batch = []
+            while index < len(candidates) and len(batch) < self.max_workers:
+                config = candidates[index]
+                index += 1
+                if is_pruned(config):
+                    pruned += 1
+                else:
+                    batch.append(config)
+
+            results, count = self.evaluate_many(batch)
+            evaluated += count
+            for result in results:
+                record(result)
+                if result.passes:
+                    return SearchOutcome(result, best, evaluated, pruned)
+
+        return SearchOutcome(None, best, evaluated, pruned)
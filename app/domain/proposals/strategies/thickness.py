@@ -7,6 +7,8 @@ y para problemas de esbeltez que requieren mayor rigidez.
 """
 from typing import Optional, Callable, TYPE_CHECKING
 from copy import deepcopy
+from dataclasses import replace
+from itertools import product
 
 from ...entities.design_proposal import (
     DesignProposal,
@@ -18,12 +20,15 @@ from ...entities.design_proposal import (
     MESH_SPACING_SEQUENCE,
     THICKNESS_SEQUENCE,
 )
-from ...constants.phi_chapter21 import RHO_MAX
 from .base import TARGET_SF, MAX_ITERATIONS, create_proposal, build_changes
+from .search import CandidateSearch
 
 if TYPE_CHECKING:
     from ...entities import VerticalElement, ElementForces
 
+# Máximo de candidatos verificados en la propuesta best-effort
+BEST_EFFORT_MAX_CANDIDATES = 100
+
 
 def propose_with_thickness(
     pier: 'VerticalElement',
@@ -158,13 +163,16 @@ def create_best_effort_proposal(
     verify_flexure: Callable,
     verify_shear: Callable,
     apply_config: Callable,
-    get_min_thickness: Callable
+    get_min_thickness: Callable,
+    max_workers: Optional[int] = None
 ) -> DesignProposal:
     """
     Crea la mejor propuesta posible iterando incrementalmente.
 
-    Busca la configuración mínima que logra el mejor SF/DCR posible.
-    Si ninguna configuración resuelve el problema, retorna success=False.
+    Busca la configuración mínima (por volumen de acero) que resuelve con
+    borde, malla y espesor; verifica a lo más BEST_EFFORT_MAX_CANDIDATES
+    candidatos (ver CandidateSearch). Si ninguna configuración resuelve el
+    problema, retorna la de mejor SF/DCR con success=False.
 
     Args:
         pier: Pier a analizar
@@ -177,82 +185,74 @@ def create_best_effort_proposal(
         verify_shear: Función para verificar corte
         apply_config: Función para aplicar config a pier
         get_min_thickness: Función que retorna espesor mínimo
+        max_workers: Threads de verificación (None = INGEO_PROPOSAL_WORKERS)
 
     Returns:
         DesignProposal con success=True si resuelve, False si no
     """
-    proposed_config = deepcopy(original_config)
     best_config = deepcopy(original_config)
     best_sf = original_sf
     best_dcr = original_dcr
-    iterations = 0
 
     # Obtener espesor mínimo según clasificación del pier
     min_thickness = get_min_thickness(pier)
     effective_min = max(pier.thickness, min_thickness)
-
-    # Iterar incrementalmente: borde -> malla -> espesor
-    for n_bars, diameter in BOUNDARY_BAR_SEQUENCE:
-        proposed_config.n_edge_bars = n_bars
-        proposed_config.diameter_edge = diameter
-
-        for spacing in MESH_SPACING_SEQUENCE:
-            proposed_config.spacing_h = spacing
-            proposed_config.spacing_v = spacing
-
-            for mesh_diameter in MESH_DIAMETER_SEQUENCE:
-                proposed_config.diameter_h = mesh_diameter
-                proposed_config.diameter_v = mesh_diameter
-
-                for thickness in THICKNESS_SEQUENCE:
-                    if thickness < effective_min:
-                        continue
-
-                    proposed_config.thickness = thickness
-                    iterations += 1
-
-                    test_pier = apply_config(pier, proposed_config)
-
-                    # Verificar cuantía máxima para asegurar ductilidad
-                    if test_pier.rho_vertical > RHO_MAX:
-                        continue
-
-                    new_sf = verify_flexure(test_pier, pier_forces)
-                    new_dcr = verify_shear(test_pier, pier_forces)
-
-                    # Guardar si es mejor
-                    if new_sf > best_sf or (new_sf == best_sf and new_dcr < best_dcr):
-                        best_config = deepcopy(proposed_config)
-                        best_sf = new_sf
-                        best_dcr = new_dcr
-
-                    # Si resuelve, retornar con success=True
-                    if new_sf >= TARGET_SF and new_dcr <= 1.0:
-                        changes = build_changes(original_config, proposed_config)
-                        return DesignProposal(
-                            pier_key=f"{pier.story}_{pier.label}",
-                            failure_mode=failure_mode,
-                            proposal_type=ProposalType.COMBINED,
-                            original_config=original_config,
-                            proposed_config=proposed_config,
-                            original_sf_flexure=original_sf,
-                            proposed_sf_flexure=new_sf,
-                            original_dcr_shear=original_dcr,
-                            proposed_dcr_shear=new_dcr,
-                            iterations=iterations,
-                            success=True,
-                            changes=changes
-                        )
-
-                    # Limitar iteraciones para evitar búsqueda exhaustiva
-                    if iterations > 100:
-                        break
-                if iterations > 100:
-                    break
-            if iterations > 100:
-                break
-        if iterations > 100:
-            break
+    thicknesses = [t for t in THICKNESS_SEQUENCE if t >= effective_min]
+
+    # Candidatos borde × malla × espesor, por volumen de acero creciente
+    # (a igual acero, primero el espesor menor)
+    candidates = [
+        replace(
+            original_config, thickness=thickness,
+            n_edge_bars=n_bars, diameter_edge=diameter,
+            spacing_h=spacing, spacing_v=spacing,
+            diameter_h=mesh_diameter, diameter_v=mesh_diameter
+        )
+        for (n_bars, diameter), spacing, mesh_diameter, thickness in product(
+            BOUNDARY_BAR_SEQUENCE, MESH_SPACING_SEQUENCE, MESH_DIAMETER_SEQUENCE, thicknesses
+        )
+    ]
+    bounds = [
+        replace(
+            original_config, thickness=thickness,
+            n_edge_bars=BOUNDARY_BAR_SEQUENCE[-1][0], diameter_edge=BOUNDARY_BAR_SEQUENCE[-1][1],
+            spacing_h=MESH_SPACING_SEQUENCE[-1], spacing_v=MESH_SPACING_SEQUENCE[-1],
+            diameter_h=MESH_DIAMETER_SEQUENCE[-1], diameter_v=MESH_DIAMETER_SEQUENCE[-1]
+        )
+        for thickness in thicknesses
+    ]
+
+    search = CandidateSearch(pier, pier_forces, verify_flexure, verify_shear, apply_config, max_workers)
+    outcome = search.first_passing(
+        search.sort_by_steel(candidates), bounds=bounds, limit=BEST_EFFORT_MAX_CANDIDATES
+    )
+    iterations = outcome.evaluated
+
+    # Si resuelve, retornar con success=True
+    if outcome.solution is not None:
+        solution = outcome.solution
+        changes = build_changes(original_config, solution.config)
+        return DesignProposal(
+            pier_key=f"{pier.story}_{pier.label}",
+            failure_mode=failure_mode,
+            proposal_type=ProposalType.COMBINED,
+            original_config=original_config,
+            proposed_config=solution.config,
+            original_sf_flexure=original_sf,
+            proposed_sf_flexure=solution.sf,
+            original_dcr_shear=original_dcr,
+            proposed_dcr_shear=solution.dcr,
+            iterations=iterations,
+            success=True,
+            changes=changes
+        )
+
+    # Guardar la mejor configuración verificada si mejora la original
+    best = outcome.best
+    if best is not None and (best.sf > best_sf or (best.sf == best_sf and best.dcr < best_dcr)):
+        best_config = best.config
+        best_sf = best.sf
+        best_dcr = best.dcr
 
     # No se encontró solución, retornar mejor esfuerzo
     changes = build_changes(original_config, best_config)
@@ -15,7 +15,7 @@ Nota: La amplificación de cortante sísmico (§18.10.3.3) está en chapter18/.
 """
 from .verification import ShearVerificationService
 from .classification import WallClassificationService, WallClassification, ElementType
-from .results import ShearResult, CombinedShearResult, WallGroupShearResult
+from .results import ShearResult, CombinedShearResult, CombinedShearBatchResult, WallGroupShearResult
 from .shear_friction import (
     ShearFrictionService,
     ShearFrictionResult,
@@ -41,6 +41,7 @@ __all__ = [
     # results
     'ShearResult',
     'CombinedShearResult',
+    'CombinedShearBatchResult',
     'WallGroupShearResult',
     # classification
     'WallClassificationService',
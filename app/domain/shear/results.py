@@ -3,7 +3,9 @@
 Dataclasses de resultados para verificacion de corte segun ACI 318-25.
 """
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
+
+import numpy as np
 
 
 @dataclass
@@ -69,6 +71,35 @@ class CombinedShearResult:
     phi_v: float = 0.75         # 0.60 para SPECIAL, 0.75 para otros
 
 
+@dataclass
+class CombinedShearBatchResult:
+    """
+    Resultado de corte combinado V2+V3 para N combinaciones a la vez.
+
+    Cada campo es un arreglo de largo N (tonf), salvo phi_v. Equivale a
+    llamar verify_combined_shear() por combinación, sin crear objetos.
+    """
+    Vu2: np.ndarray         # |Vu| en el plano (tonf)
+    Vu3: np.ndarray         # |Vu| fuera del plano (tonf)
+    Nu: np.ndarray          # Carga axial (tonf, positivo = compresion)
+    Vc_2: np.ndarray        # Vc en V2 (tonf), depende de Nu
+    Vs_2: np.ndarray        # Vs en V2 (tonf)
+    phi_Vn_2: np.ndarray    # phi*Vn en V2 (tonf)
+    phi_Vn_3: np.ndarray    # phi*Vn en V3 (tonf)
+    dcr_2: np.ndarray       # Vu2/phi*Vn2
+    dcr_3: np.ndarray       # Vu3/phi*Vn3
+    dcr_combined: np.ndarray  # SRSS de dcr_2 y dcr_3
+    phi_v: float = 0.75
+
+    @property
+    def critical_index(self) -> Optional[int]:
+        """Primera combinación con el mayor DCR combinado (None si todos son 0)."""
+        if len(self.dcr_combined) == 0:
+            return None
+        i = int(np.argmax(self.dcr_combined))
+        return i if self.dcr_combined[i] > 0 else None
+
+
 @dataclass
 class WallGroupShearResult:
     """
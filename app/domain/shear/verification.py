@@ -12,6 +12,8 @@ Ver constants/shear.py para las referencias ACI completas.
 import math
 from typing import Tuple, List, Optional
 
+import numpy as np
+
 from ..constants.materials import (
     LAMBDA_NORMAL,
     get_effective_fc_shear,
@@ -40,6 +42,7 @@ from ..constants.reinforcement import check_rho_vertical_ge_horizontal
 from .results import (
     ShearResult,
     CombinedShearResult,
+    CombinedShearBatchResult,
     WallGroupShearResult,
 )
 from .concrete_shear import calculate_Vc_beam
@@ -473,6 +476,141 @@ class ShearVerificationService:
             phi_v=phi_v
         )
 
+    # =========================================================================
+    # VERIFICACION VECTORIZADA (todas las combinaciones de un elemento)
+    # =========================================================================
+
+    def calculate_Vn_batch(
+        self,
+        lw: float,
+        tw: float,
+        hw: float,
+        fc: float,
+        fy: float,
+        rho_h: float,
+        Nu: np.ndarray,
+        lambda_factor: float = 1.0
+    ) -> Tuple[np.ndarray, float, np.ndarray]:
+        """
+        Vc, Vs y Vn para un arreglo de cargas axiales.
+
+        Misma formulación que calculate_Vn_wall / calculate_Vn_column (con
+        bcf = tcf = 0 y recubrimiento por defecto): solo Vc depende de Nu
+        (alpha_c con tracción en muros, factor axial en columnas).
+
+        Args:
+            Nu: Cargas axiales factoradas (N, positivo = compresion)
+
+        Returns:
+            Tuple (Vc, Vs, Vn) en tonf; Vs es escalar
+        """
+        Nu = np.asarray(Nu, dtype=float)
+
+        if self.is_wall(lw, tw):
+            Acv = lw * tw
+            Ag = Acv
+            fc_eff = get_effective_fc_shear(fc, False)
+            fy_eff = get_effective_fyt_shear(fy)
+
+            # alpha_c por Tabla 18.10.4.1; Ec. 11.5.4.4 donde hay tension neta
+            alpha_c = np.full(Nu.shape, self.calculate_alpha_c(hw, lw))
+            if lw > 0 and Ag > 0:
+                tension = Nu < 0
+                sigma_u = Nu[tension] / Ag
+                alpha_c[tension] = np.maximum(
+                    0.0, ALPHA_C_SLENDER * (1.0 + sigma_u / ALPHA_C_TENSION_STRESS_MPA)
+                )
+
+            alpha_sh = calculate_alpha_sh(bw=tw, bcf=0, tcf=0, lw=lw)
+
+            Vc = Acv * alpha_c * lambda_factor * math.sqrt(fc_eff)
+            Vs = Acv * rho_h * fy_eff
+            Vn = Vc + Vs
+
+            Vn_max = alpha_sh * VN_MAX_INDIVIDUAL_COEF * math.sqrt(fc_eff) * Acv
+            Vn = np.where(Vn > Vn_max, Vn_max, Vn)
+        else:
+            bw = tw
+            d = max(lw - DEFAULT_COVER_MM, lw * 0.9)
+            Ag = lw * tw
+
+            # Factor axial: compresion §22.5.5.1, tension §22.5.6.1
+            if Ag > 0:
+                axial_factor = np.where(
+                    Nu >= 0,
+                    1.0 + Nu / (14.0 * Ag),
+                    np.maximum(0.0, 1.0 + Nu / (3.5 * Ag))
+                )
+            else:
+                axial_factor = np.where(Nu >= 0, 1.0, 0.0)
+
+            Vc = VC_COEF_COLUMN * axial_factor * LAMBDA_NORMAL * math.sqrt(fc) * bw * d
+            Vs = rho_h * bw * fy * d
+
+            Vs_max = VS_MAX_COEF * math.sqrt(fc) * bw * d
+            if Vs > Vs_max:
+                Vs = Vs_max
+
+            Vn = Vc + Vs
+
+        return Vc / N_TO_TONF, Vs / N_TO_TONF, Vn / N_TO_TONF
+
+    def verify_combined_shear_batch(
+        self,
+        lw: float,
+        tw: float,
+        hw: float,
+        fc: float,
+        fy: float,
+        rho_h: float,
+        Vu2: np.ndarray,
+        Vu3: np.ndarray,
+        Nu: np.ndarray,
+        lambda_factor: float = 1.0,
+        seismic_category=None
+    ) -> CombinedShearBatchResult:
+        """
+        Verifica interaccion V2-V3 (SRSS) para todas las combinaciones.
+
+        Equivalente a verify_combined_shear() combinación por combinación,
+        pero en forma de arreglos: para elementos con cientos de
+        combinaciones evita crear un CombinedShearResult por cada una.
+
+        Args:
+            Vu2, Vu3: Cortantes por combinación (tonf)
+            Nu: Cargas axiales por combinación (tonf, negativo para tension)
+            seismic_category: Categoria sismica (SPECIAL usa phi=0.60, otros phi=0.75)
+        """
+        if seismic_category is None:
+            from ..chapter18.common import SeismicCategory
+            seismic_category = SeismicCategory.SPECIAL
+
+        Vu2 = np.abs(np.asarray(Vu2, dtype=float))
+        Vu3 = np.abs(np.asarray(Vu3, dtype=float))
+        Nu = np.asarray(Nu, dtype=float)
+        Nu_N = Nu * TONF_TO_N
+
+        phi_v = get_phi_shear(seismic_category)
+
+        # V2: en el plano; V3: dimensiones intercambiadas (fuera del plano)
+        Vc_2, Vs_2, Vn_2 = self.calculate_Vn_batch(lw, tw, hw, fc, fy, rho_h, Nu_N, lambda_factor)
+        _, _, Vn_3 = self.calculate_Vn_batch(tw, lw, hw, fc, fy, rho_h, Nu_N, lambda_factor)
+        phi_Vn_2 = phi_v * Vn_2
+        phi_Vn_3 = phi_v * Vn_3
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dcr_2 = np.where(phi_Vn_2 > 0, Vu2 / phi_Vn_2, 0.0)
+            dcr_3 = np.where(phi_Vn_3 > 0, Vu3 / phi_Vn_3, 0.0)
+        dcr_combined = np.sqrt(dcr_2**2 + dcr_3**2)
+
+        return CombinedShearBatchResult(
+            Vu2=Vu2, Vu3=Vu3, Nu=Nu,
+            Vc_2=Vc_2, Vs_2=np.broadcast_to(Vs_2, Nu.shape),
+            phi_Vn_2=phi_Vn_2, phi_Vn_3=phi_Vn_3,
+            dcr_2=dcr_2, dcr_3=dcr_3, dcr_combined=dcr_combined,
+            phi_v=phi_v
+        )
+
     def verify_wall_group(
         self,
         segments: List[Tuple[float, float, float]],
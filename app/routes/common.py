@@ -87,8 +87,11 @@ def get_element_details_service() -> ElementDetailsService:
     if _element_details_service is None:
         with _singleton_lock:
             if _element_details_service is None:
-                session_manager = get_analysis_service()._session_manager
-                _element_details_service = ElementDetailsService(session_manager)
+                analysis_service = get_analysis_service()
+                _element_details_service = ElementDetailsService(
+                    analysis_service._session_manager,
+                    plot_renderer=analysis_service._plot_renderer
+                )
     return _element_details_service
 
 
@@ -16,7 +16,7 @@ import logging
 
 from flask import Blueprint, request, jsonify, Response
 
-from ..services.report import PDFReportGenerator, ReportConfig
+from ..services.report import ReportConfig, ReportPipeline, report_spool
 from .common import (
     get_analysis_service,
     get_json_data,
@@ -463,73 +463,136 @@ def assign_coupling_beam(session_id: str, pier_key: str, data: dict):
 # Reportes
 # =============================================================================
 
-@bp.route('/generate-report', methods=['POST'])
-@handle_errors
-@require_session
-def generate_report(session_id: str, data: dict):
-    """Genera un informe PDF descargable."""
+def _report_pipeline() -> ReportPipeline:
+    """Pipeline de informes sobre el servicio de análisis compartido."""
+    service = get_analysis_service()
+    return ReportPipeline(service, service._session_manager, service._plot_renderer)
+
+
+def _report_config(session_id: str, data: dict):
+    """
+    Configuración del informe validada.
+
+    Returns:
+        (ReportConfig, None) o (None, respuesta de error)
+    """
     parsed_data, error = get_session_or_404(session_id)
     if error:
-        return error
+        return None, error
 
-    # Crear configuración del informe
     config = ReportConfig.from_dict(data)
-
-    # Validar configuración
-    total_piers = len(parsed_data.vertical_elements)
-    validation_errors = config.validate(total_piers)
+    validation_errors = config.validate(len(parsed_data.vertical_elements))
     if validation_errors:
-        return jsonify({
+        return None, (jsonify({
             'success': False,
             'error': 'Errores de validación',
             'validation_errors': validation_errors
-        }), 400
+        }), 400)
+    return config, None
 
-    # Ejecutar análisis para obtener resultados actualizados
-    moment_axis = data.get('moment_axis', 'M3')
-    service = get_analysis_service()
-    analysis_result = service.analyze(
-        session_id=session_id,
-        generate_plots=config.include_pm_diagrams,
-        moment_axis=moment_axis
+
+def _report_analysis_options(data: dict) -> dict:
+    """
+    Opciones del análisis previo al informe. Deben coincidir con las del
+    análisis de la UI para que se reutilicen sus resultados cacheados.
+    """
+    return {
+        'moment_axis': data.get('moment_axis', 'M3'),
+        'materials_config': data.get('materials_config', {}),
+        'seismic_category': data.get('seismic_category', 'SPECIAL'),
+    }
+
+
+def _report_response(report) -> Response:
+    """Descarga del PDF en chunks desde su archivo temporal."""
+    return Response(
+        report.iter_chunks(),
+        mimetype='application/pdf',
+        headers={
+            'Content-Disposition': f'attachment; filename="{report.filename}"',
+            'Content-Length': str(report.size)
+        }
     )
 
-    if not analysis_result.get('success'):
-        return jsonify({
-            'success': False,
-            'error': 'Error al ejecutar análisis: ' + analysis_result.get('error', '')
-        }), 500
 
-    results = analysis_result.get('results', [])
-    statistics = analysis_result.get('statistics', {})
+@bp.route('/generate-report', methods=['POST'])
+@handle_errors
+@require_session
+def generate_report(session_id: str, data: dict):
+    """
+    Genera un informe PDF descargable.
+
+    Reutiliza los resultados cacheados del análisis y entrega el PDF en
+    chunks desde un archivo temporal. Para informes grandes usar
+    /generate-report-stream (progreso SSE) + /report/<report_id>.
+    """
+    config, error = _report_config(session_id, data)
+    if error:
+        return error
 
-    if not results:
-        return jsonify({
-            'success': False,
-            'error': 'No se generaron resultados de análisis'
-        }), 400
+    complete = None
+    for event in _report_pipeline().run(session_id, config, **_report_analysis_options(data)):
+        if event['type'] == 'error':
+            return error_response(f"Error al generar el informe: {event['message']}", 500)
+        if event['type'] == 'complete':
+            complete = event['result']
 
-    # Generar PDF
-    generator = PDFReportGenerator()
-    pdf_bytes = generator.generate_report(
-        results=results,
-        piers=parsed_data.vertical_elements,
-        config=config,
-        statistics=statistics
-    )
+    report = report_spool.take(complete['report_id'])
+    return _report_response(report)
+
+
+@bp.route('/generate-report-stream', methods=['POST'])
+@handle_errors
+@require_session
+def generate_report_stream(session_id: str, data: dict):
+    """
+    Genera un informe PDF con progreso en tiempo real (SSE).
+
+    Response:
+        Stream SSE con eventos:
+        - progress: {type: 'progress', phase, current, total, element|pier}
+          (fases: curves, elements, report_plots, report_pages)
+        - complete: {type: 'complete', result: {success, report_id, filename, pages, bytes}}
+        - error: {type: 'error', message}
+
+    El PDF se descarga luego con GET /report/<report_id> (una vez).
+    """
+    config, error = _report_config(session_id, data)
+    if error:
+        return error
 
-    filename = f"Informe_{config.project_name.replace(' ', '_')}.pdf"
+    pipeline = _report_pipeline()
+    options = _report_analysis_options(data)
+
+    def generate():
+        try:
+            for event in pipeline.run(session_id, config, **options):
+                yield f"data: {json.dumps(event)}\n\n"
+        except Exception as e:
+            logger.exception(f"[Report-Stream] ERROR: {str(e)}")
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
 
     return Response(
-        pdf_bytes,
-        mimetype='application/pdf',
+        generate(),
+        mimetype='text/event-stream',
         headers={
-            'Content-Disposition': f'attachment; filename="{filename}"',
-            'Content-Length': str(len(pdf_bytes))
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive',
+            'X-Accel-Buffering': 'no'
         }
     )
 
 
+@bp.route('/report/<report_id>', methods=['GET'])
+@handle_errors
+def download_report(report_id: str):
+    """Descarga (una vez) un informe generado por /generate-report-stream."""
+    report = report_spool.take(report_id)
+    if report is None:
+        return error_response('Informe no encontrado o expirado', 404)
+    return _report_response(report)
+
+
 # =============================================================================
 # Vigas - Edición de Enfierradura
 # =============================================================================
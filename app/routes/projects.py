@@ -8,6 +8,7 @@ Proporciona:
 - Cargar proyecto existente (instantáneo)
 - Listar y eliminar proyectos
 """
+import logging
 import threading
 import uuid
 from flask import Blueprint, request, jsonify
@@ -23,6 +24,8 @@ from ..services.presentation.summary_builder import build_summary_from_parsed_da
 
 bp = Blueprint('projects', __name__, url_prefix='/api/projects')
 
+logger = logging.getLogger(__name__)
+
 _project_manager = None
 _pm_lock = threading.Lock()
 
@@ -107,8 +110,15 @@ def save_project(session_id: str, data: dict):
 
     pm = get_project_manager()
 
-    # Guardar parsed_data
+    # Guardar parsed_data y la caché de análisis por elemento
     result = pm.save_parsed_data(project_id, parsed_data)
+    if result.get('success'):
+        try:
+            pm.save_analysis_cache(project_id, parsed_data)
+        except Exception as e:
+            # La caché es opcional: sin ella el próximo análisis recalcula todo
+            logger.warning(f"No se pudo guardar la caché de análisis de {project_id}: {e}",
+                           exc_info=True)
 
     # Guardar resultados de análisis si vienen en el request
     results = data.get('results')
@@ -143,7 +153,7 @@ def load_project():
     parsed_data = result['parsed_data']
 
     # Registrar en session_manager
-    service._session_manager._sessions[session_id] = parsed_data
+    service._session_manager.register_session(session_id, parsed_data)
 
     # Construir summary para el frontend
     summary = build_summary_from_parsed_data(parsed_data)
@@ -156,6 +166,7 @@ def load_project():
         'summary': summary,
         'results': result.get('results'),
         'has_results': result.get('has_results', False),
+        'cached_results': result.get('cached_results', 0),
     })
 
 
@@ -14,6 +14,10 @@ from .design_behavior_resolver import DesignBehaviorResolver
 from .force_extractor import ForceExtractor, ForceEnvelope
 from .geometry_normalizer import GeometryNormalizer, ColumnGeometry, BeamGeometry, WallGeometry
 from .verification_config import VerificationConfig, get_config
+from .analysis_backend import AnalysisBackend, resolve_backend
+from .curve_cache import InteractionCurveCache, interaction_curve_cache, section_fingerprint
+from .curve_generation import CurveGeneration, CurveError
+from .input_fingerprint import task_fingerprint
 
 __all__ = [
     # Servicios principales
@@ -37,4 +41,16 @@ __all__ = [
     # Configuración
     'VerificationConfig',
     'get_config',
+    # Ejecución paralela
+    'AnalysisBackend',
+    'resolve_backend',
+    # Cache de curvas P-M
+    'InteractionCurveCache',
+    'interaction_curve_cache',
+    'section_fingerprint',
+    # Pre-generación de curvas P-M
+    'CurveGeneration',
+    'CurveError',
+    # Análisis incremental
+    'task_fingerprint',
 ]
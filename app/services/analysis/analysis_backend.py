@@ -0,0 +1,186 @@
+# app/services/analysis/analysis_backend.py
+"""
+Backends de ejecución para el análisis paralelo de elementos.
+
+El análisis de cada elemento es cálculo puro en Python (CPU-bound), por lo
+que un pool de threads queda limitado por el GIL. Este módulo ofrece dos
+backends intercambiables:
+
+- 'thread': ThreadPoolExecutor (comportamiento histórico, sin costo de
+  serialización; útil con servicios inyectados/mocks en tests).
+- 'process': ProcessPoolExecutor con tareas agrupadas en chunks. Cada tarea
+  viaja como payload compacto (elemento, DataFrame de fuerzas y curva P-M
+  empaquetada como arreglo NumPy) y escala con el número de núcleos.
+
+Selección: parámetro explícito, o variable de entorno INGEO_ANALYSIS_BACKEND.
+
+También expone lo que comparten los demás pools del servicio (parseo,
+gráficos): el inicializador de procesos worker y la resolución del número
+de workers.
+"""
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from ..logging import claude_logger
+
+BACKEND_THREAD = 'thread'
+BACKEND_PROCESS = 'process'
+ANALYSIS_BACKENDS = (BACKEND_THREAD, BACKEND_PROCESS)
+
+# Workers del backend de threads (histórico: compensar latencia, no el GIL)
+THREAD_WORKERS_PER_CPU = 4
+
+# Chunks por worker: suficientes para balancear carga y emitir progreso
+# frecuente, sin pagar overhead de IPC por cada elemento
+CHUNKS_PER_WORKER = 4
+MAX_CHUNK_SIZE = 64
+
+# Workers de los pools auxiliares (parseo, gráficos): tareas pocas y cortas
+DEFAULT_MAX_WORKERS = 4
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """
+    Resuelve el backend a usar.
+
+    Args:
+        backend: 'thread', 'process' o None (usar INGEO_ANALYSIS_BACKEND)
+
+    Returns:
+        Nombre de backend válido (default 'thread')
+    """
+    name = (backend or os.environ.get('INGEO_ANALYSIS_BACKEND') or BACKEND_THREAD).lower()
+    return name if name in ANALYSIS_BACKENDS else BACKEND_THREAD
+
+
+def resolve_workers(
+    max_workers: Optional[int] = None,
+    env_var: Optional[str] = None,
+    default: Optional[int] = None
+) -> int:
+    """
+    Resuelve el número de workers de un pool auxiliar.
+
+    Args:
+        max_workers: Valor explícito (tiene prioridad)
+        env_var: Variable de entorno a consultar si no hay valor explícito
+        default: Valor si no hay ninguno de los anteriores
+            (None: min(DEFAULT_MAX_WORKERS, núcleos))
+
+    Returns:
+        Workers (>= 1)
+    """
+    if max_workers is None:
+        value = os.environ.get(env_var) if env_var else None
+        if value:
+            max_workers = int(value)
+        elif default is not None:
+            max_workers = default
+        else:
+            max_workers = min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    return max(1, max_workers)
+
+
+def init_worker_process() -> None:
+    """Inicializa un proceso worker: el log de estado lo escribe solo el padre."""
+    claude_logger.enabled = False
+
+
+def chunk_tasks(tasks: List[Any], n_workers: int) -> List[List[Any]]:
+    """
+    Divide las tareas en chunks contiguos para el backend de procesos.
+
+    Args:
+        tasks: Lista de tareas
+        n_workers: Número de procesos worker
+
+    Returns:
+        Lista de chunks (listas de tareas)
+    """
+    if not tasks:
+        return []
+    size = math.ceil(len(tasks) / (max(n_workers, 1) * CHUNKS_PER_WORKER))
+    size = max(1, min(size, MAX_CHUNK_SIZE))
+    return [tasks[i:i + size] for i in range(0, len(tasks), size)]
+
+
+class AnalysisBackend:
+    """
+    Ejecuta tareas de análisis en paralelo y entrega resultados a medida
+    que terminan.
+
+    Para 'process', el pool se crea una vez y se reutiliza entre análisis
+    (el arranque de procesos no se paga en cada recálculo).
+
+    Example:
+        backend = AnalysisBackend('process')
+        for results in backend.run(tasks, task_fn, chunk_fn):
+            ...  # results: lista de resultados de un chunk
+    """
+
+    def __init__(self, backend: Optional[str] = None, max_workers: Optional[int] = None):
+        self.name = resolve_backend(backend)
+        cpu_count = os.cpu_count() or 8
+        if max_workers is None:
+            max_workers = cpu_count if self.name == BACKEND_PROCESS else cpu_count * THREAD_WORKERS_PER_CPU
+        self.max_workers = max_workers
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def is_process(self) -> bool:
+        """True si el backend usa procesos."""
+        return self.name == BACKEND_PROCESS
+
+    def _get_process_pool(self, initializer: Optional[Callable] = None) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=initializer
+            )
+        return self._process_pool
+
+    def run(
+        self,
+        tasks: List[Dict[str, Any]],
+        task_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+        chunk_fn: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None,
+        initializer: Optional[Callable] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Ejecuta las tareas y produce resultados por lotes completados.
+
+        Args:
+            tasks: Tareas de análisis
+            task_fn: Función por tarea (backend de threads)
+            chunk_fn: Función picklable de nivel de módulo que procesa un
+                chunk completo (backend de procesos)
+            initializer: Inicializador de cada proceso worker
+
+        Yields:
+            Listas de resultados (1 por tarea en threads, 1 chunk en procesos)
+        """
+        if not tasks:
+            return
+
+        if self.is_process and chunk_fn is not None:
+            executor: Executor = self._get_process_pool(initializer)
+            futures = [
+                executor.submit(chunk_fn, chunk)
+                for chunk in chunk_tasks(tasks, self.max_workers)
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(task_fn, task) for task in tasks]
+            for future in as_completed(futures):
+                yield [future.result()]
+
+    def shutdown(self) -> None:
+        """Libera el pool de procesos (si existe)."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True, cancel_futures=True)
+            self._process_pool = None
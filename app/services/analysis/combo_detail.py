@@ -0,0 +1,159 @@
+# app/services/analysis/combo_detail.py
+"""
+Detalle por combinación de carga bajo demanda.
+
+El análisis guarda por elemento solo los valores gobernantes más una tabla
+compacta por combinación ('combo_table': columnas NumPy con nombre,
+ubicación y los valores calculados). Las filas que muestra el modal
+('combo_results') se arman recién cuando se piden y quedan memorizadas en
+el mismo resultado cacheado.
+
+Uso:
+    rows = combo_results(cached, 'flexure')   # arma y memoriza si falta
+    detail = with_combo_results(cached)       # copia lista para JSON
+"""
+import math
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from ...domain.entities import ElementForces
+from ...domain.flexure.checker import FlexureCheckResult, combo_location
+from ...domain.shear import CombinedShearBatchResult
+from ..presentation.formatters import format_safety_factor
+
+COMBO_TABLE_KEY = 'combo_table'
+COMBO_RESULTS_KEY = 'combo_results'
+
+
+# =============================================================================
+# FLEXOCOMPRESIÓN
+# =============================================================================
+
+def flexure_combo_table(forces: ElementForces, result: FlexureCheckResult) -> Dict[str, Any]:
+    """Tabla compacta por combinación desde el resultado vectorizado de flexión."""
+    return {
+        'name': forces.labels('name'),
+        'location': forces.labels('location'),
+        'Pu': result.Pu_values,
+        'Mu': result.Mu_values,
+        'sf': result.sf_values,
+        'phi_Mn_at_Pu': result.phi_Mn_values,
+    }
+
+
+def flexure_combo_rows(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Filas por combinación (formato del modal) desde flexure_combo_table()."""
+    rows = []
+    for name, location, Pu, Mu, sf, phi_Mn in zip(
+        table['name'], table['location'],
+        *(np.asarray(table[col], dtype=float).tolist()
+          for col in ('Pu', 'Mu', 'sf', 'phi_Mn_at_Pu'))
+    ):
+        combo_name = f"{name} ({location})"
+        dcr = 1.0 / sf if sf > 0 else 100.0
+        rows.append({
+            'name': combo_name,
+            'location': combo_location(combo_name),
+            'Pu': round(Pu, 2),
+            'Mu': round(Mu, 2),
+            'sf': format_safety_factor(sf, as_string=False),
+            'dcr': round(dcr, 3) if not math.isinf(dcr) else 0,
+            'phi_Mn_at_Pu': round(phi_Mn, 2),
+            'is_tension': Pu < 0,
+            'status': 'OK' if sf >= 1.0 else 'NO OK'
+        })
+    return rows
+
+
+# =============================================================================
+# CORTANTE
+# =============================================================================
+
+def shear_combo_table(forces: ElementForces, batch: CombinedShearBatchResult) -> Dict[str, Any]:
+    """Tabla compacta por combinación desde el resultado vectorizado de corte."""
+    return {
+        'name': forces.labels('name'),
+        'location': forces.labels('location'),
+        'Vu_2': batch.Vu2,
+        'Vu_3': batch.Vu3,
+        'Nu': batch.Nu,
+        'phi_Vn_2': batch.phi_Vn_2,
+        'phi_Vn_3': batch.phi_Vn_3,
+        'Vc': batch.Vc_2,
+        'Vs': batch.Vs_2,
+        'dcr_2': batch.dcr_2,
+        'dcr_3': batch.dcr_3,
+        'dcr_combined': batch.dcr_combined,
+        'phi_v': batch.phi_v,
+    }
+
+
+def shear_combo_rows(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Filas por combinación (formato del modal) desde shear_combo_table()."""
+    phi_v = table['phi_v']
+    rows = []
+    for name, location, Vu2, Vu3, Nu, phi_Vn_2, phi_Vn_3, Vc, Vs, dcr_2, dcr_3, dcr in zip(
+        table['name'], table['location'],
+        *(np.asarray(table[col], dtype=float).tolist()
+          for col in ('Vu_2', 'Vu_3', 'Nu', 'phi_Vn_2', 'phi_Vn_3', 'Vc', 'Vs',
+                      'dcr_2', 'dcr_3', 'dcr_combined'))
+    ):
+        rows.append({
+            'combo_name': f"{name} ({location})",  # Formato normalizado con location
+            'combo_location': location,
+            'Vu_2': round(Vu2, 2),
+            'Vu_3': round(Vu3, 2),
+            'Pu': round(-Nu, 2),
+            'phi_Vn_2': round(phi_Vn_2, 2),
+            'phi_Vn_3': round(phi_Vn_3, 2),
+            'phi_Vc': round(Vc * phi_v, 2),
+            'Vc': round(Vc, 2),
+            'Vs': round(Vs, 2),
+            'dcr_2': round(dcr_2, 3),
+            'dcr_3': round(dcr_3, 3),
+            'dcr_combined': round(dcr, 3),
+            'sf': round(1.0 / dcr, 2) if dcr > 0 else 100.0,
+            'status': 'OK' if dcr <= 1.0 else 'NO OK'
+        })
+    return rows
+
+
+# =============================================================================
+# MATERIALIZACIÓN
+# =============================================================================
+
+# Sección del resultado formateado → armador de filas
+ROW_BUILDERS: Dict[str, Callable[[Dict[str, Any]], List[Dict[str, Any]]]] = {
+    'flexure': flexure_combo_rows,
+    'shear': shear_combo_rows,
+}
+
+
+def combo_results(result: Dict[str, Any], section: str) -> List[Dict[str, Any]]:
+    """
+    Filas por combinación de una sección ('flexure' o 'shear') del resultado.
+
+    Si solo existe la tabla compacta, arma las filas y las memoriza en el
+    resultado (las siguientes consultas no recalculan).
+    """
+    data = result.get(section) or {}
+    rows = data.get(COMBO_RESULTS_KEY)
+    if rows is None and COMBO_TABLE_KEY in data:
+        rows = data[COMBO_RESULTS_KEY] = ROW_BUILDERS[section](data[COMBO_TABLE_KEY])
+    return rows if rows is not None else []
+
+
+def with_combo_results(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copia del resultado con combo_results armados y sin tablas compactas.
+
+    Memoriza las filas en el resultado original; la copia es apta para JSON.
+    """
+    detail = dict(result)
+    for section in ROW_BUILDERS:
+        data = result.get(section)
+        if isinstance(data, dict) and COMBO_TABLE_KEY in data:
+            combo_results(result, section)
+            detail[section] = {k: v for k, v in data.items() if k != COMBO_TABLE_KEY}
+    return detail
@@ -0,0 +1,216 @@
+# app/services/analysis/curve_cache.py
+"""
+Cache de curvas de interacción P-M direccionado por contenido.
+
+Los modelos ETABS repiten la misma sección de muro (espesor, largo, f'c,
+fy, recubrimiento, disposición de capas) en decenas de pisos. La curva P-M
+depende solo de esos datos, por lo que se indexa por una huella (hash) de
+las entradas y se comparte entre elementos, direcciones y sesiones. Las
+secciones compuestas (L, T, C) se identifican por su malla de fibras.
+
+Las curvas se guardan como arreglo compacto (n, 7) de solo lectura y se
+entregan como InteractionCurve sobre ese mismo arreglo (sin copia), con
+desalojo LRU limitado por número de entradas y por memoria.
+
+El mismo cache guarda las superficies biaxiales (BiaxialSurface), con
+huella biaxial_fingerprint() y contadas en el mismo límite de memoria.
+
+Configuración (variables de entorno):
+- INGEO_CURVE_CACHE_ENTRIES: máximo de curvas (default 4096)
+- INGEO_CURVE_CACHE_MB: memoria máxima en MB (default 64)
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from ...domain.flexure import InteractionCurve, InteractionPoint, SteelLayer
+from ...domain.flexure.biaxial_surface import BiaxialSection
+from ...domain.flexure.fiber_section import FiberSection
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_MB = 64
+
+
+def section_fingerprint(
+    width: float,
+    thickness: float,
+    fc: float,
+    fy: float,
+    As_total: float,
+    cover: float,
+    steel_layers: Optional[List[SteelLayer]] = None,
+    n_points: int = 50,
+    is_unconfined: bool = False,
+    fibers: Optional[FiberSection] = None,
+    fiber_angle: float = 0.0
+) -> str:
+    """
+    Huella de las entradas que determinan la curva P-M.
+
+    Recibe los mismos argumentos que
+    InteractionDiagramService.generate_interaction_curve().
+
+    Returns:
+        Hash hexadecimal (dos secciones con igual huella tienen igual curva)
+    """
+    if fibers is not None:
+        # Curva de fibras: solo dependen de la malla, las barras y materiales
+        mesh = fibers.mesh
+        values = np.concatenate([
+            [fibers.fc, fibers.fy, n_points, float(is_unconfined), fiber_angle,
+             len(mesh.fibers), len(mesh.vertices)],
+            mesh.fibers.ravel(), mesh.edges.ravel(), mesh.vertices.ravel(), fibers.bars.ravel(),
+        ]).astype(np.float64)
+        return hashlib.blake2b(b'F' + values.tobytes(), digest_size=16).hexdigest()
+
+    layers = steel_layers or []
+    values = np.array(
+        [width, thickness, fc, fy, As_total, cover, n_points, float(is_unconfined), len(layers)]
+        + [v for layer in layers for v in (layer.position, layer.area)],
+        dtype=np.float64
+    )
+    # steel_layers=None usa el modelo simplificado: distinguirlo de lista vacía
+    prefix = b'L' if steel_layers is not None else b'S'
+    return hashlib.blake2b(prefix + values.tobytes(), digest_size=16).hexdigest()
+
+
+def biaxial_fingerprint(section: BiaxialSection, n_points: int = 50) -> str:
+    """
+    Huella de las entradas que determinan la superficie biaxial.
+
+    Returns:
+        Hash hexadecimal (distinto de cualquier section_fingerprint)
+    """
+    values = np.concatenate([
+        [section.fc, section.fy, float(section.is_unconfined), n_points],
+        section.polygons.shape, section.polygons.ravel(), section.bars.ravel(),
+    ]).astype(np.float64)
+    return hashlib.blake2b(b'B' + values.tobytes(), digest_size=16).hexdigest()
+
+
+class InteractionCurveCache:
+    """
+    Cache LRU de curvas P-M con límite de entradas y de memoria.
+
+    Thread-safe: se usa desde la pre-generación de curvas y desde el
+    análisis en paralelo.
+
+    Example:
+        cache = InteractionCurveCache(max_entries=1000)
+        curve = cache.get_or_create(key, lambda: service.generate_interaction_curve(...))
+        cache.stats()  # {'hits': ..., 'misses': ..., ...}
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        if max_entries is None:
+            max_entries = int(os.environ.get('INGEO_CURVE_CACHE_ENTRIES', DEFAULT_MAX_ENTRIES))
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get('INGEO_CURVE_CACHE_MB', DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._curves: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[InteractionCurve]:
+        """Obtiene la curva (o None) y la marca como usada recientemente."""
+        curve = self.get_array(key)
+        return InteractionCurve(curve) if curve is not None else None
+
+    def get_array(self, key: str) -> Optional[np.ndarray]:
+        """Como get(), pero retorna el arreglo (n, 7) de solo lectura."""
+        return self.get_value(key)
+
+    def get_value(self, key: str) -> Any:
+        """Valor guardado con put_value() o put_array() (o None)."""
+        with self._lock:
+            value = self._curves.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._curves.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def put(self, key: str, points: Union[InteractionCurve, Sequence[InteractionPoint]]) -> None:
+        """Guarda una curva, desalojando las menos usadas si se excede el límite."""
+        self.put_array(key, InteractionCurve.of(points).array)
+
+    def put_array(self, key: str, curve: np.ndarray) -> None:
+        """Como put(), pero recibe la curva empaquetada (points_to_array)."""
+        curve = np.array(curve, dtype=float)
+        curve.setflags(write=False)
+        self.put_value(key, curve)
+
+    def put_value(self, key: str, value: Any) -> None:
+        """
+        Guarda un valor inmutable con atributo nbytes (ej: BiaxialSurface),
+        sin copiarlo.
+        """
+        if value.nbytes > self.max_bytes or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            previous = self._curves.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._curves[key] = value
+            self._bytes += value.nbytes
+
+            while len(self._curves) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._curves.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def get_or_create(
+        self,
+        key: str,
+        factory: Callable[[], InteractionCurve]
+    ) -> InteractionCurve:
+        """
+        Retorna la curva cacheada o la genera con factory() y la guarda.
+
+        La generación ocurre fuera del lock: dos threads con la misma clave
+        pueden calcularla a la vez, pero el resultado es idéntico.
+        """
+        curve = self.get(key)
+        if curve is None:
+            curve = InteractionCurve.of(factory())
+            self.put(key, curve)
+        return curve
+
+    def clear(self) -> None:
+        """Vacía el cache y reinicia los contadores."""
+        with self._lock:
+            self._curves.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._curves)
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de uso del cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._curves),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+# Instancia compartida entre servicios y sesiones
+interaction_curve_cache = InteractionCurveCache()
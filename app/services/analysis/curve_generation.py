@@ -0,0 +1,282 @@
+# app/services/analysis/curve_generation.py
+"""
+Pre-generación paralela de curvas de interacción P-M.
+
+Etapa previa a la verificación de elementos: reúne las secciones (elemento
+y dirección) de las tareas, resuelve desde InteractionCurveCache las que ya
+existen (por huella de sección) y genera el resto en paralelo con el mismo
+AnalysisBackend del análisis.
+
+Con el backend 'process' los workers escriben las curvas empaquetadas
+(points_to_array) directamente en un bloque de memoria compartida indexado
+por sección (CurveBuffer): al padre solo vuelven los índices y errores, no
+las curvas. Con 'thread' el mismo buffer vive en memoria local.
+
+Los fallos se reportan por elemento y dirección (CurveError) en vez de
+descartarse.
+
+Uso:
+    generation = CurveGeneration(backend, interaction_curve_cache)
+    for done, total in generation.run(jobs, service.interaction_section):
+        ...  # progreso de la fase
+    curve = generation.points(key, 'primary')  # InteractionCurve
+    generation.errors  # [CurveError, ...]
+"""
+from dataclasses import asdict, dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ...domain.flexure import InteractionCurve
+from ...domain.flexure.interaction_diagram import (
+    CURVE_COLUMNS,
+    InteractionDiagramService,
+    max_curve_rows,
+)
+from .analysis_backend import AnalysisBackend
+from .curve_cache import InteractionCurveCache, section_fingerprint
+
+# Fase de los eventos de progreso de esta etapa
+CURVE_PHASE = 'curves'
+
+# Trabajo de curva: (clave del elemento, dirección, elemento)
+CurveJob = Tuple[str, str, Any]
+
+_diagram_service = InteractionDiagramService()
+
+
+@dataclass(frozen=True)
+class CurveError:
+    """Curva P-M que no se pudo generar para un elemento y dirección."""
+    key: str
+    direction: str
+    error: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return asdict(self)
+
+
+def _describe(exc: Exception) -> str:
+    return str(exc) or type(exc).__name__
+
+
+# =============================================================================
+# BUFFER DE CURVAS
+# =============================================================================
+
+class CurveBuffer:
+    """
+    Curvas empaquetadas de n secciones en un solo bloque de memoria.
+
+    Layout: largos int64 (n,) seguidos de curvas float64 (n, n_rows, 7). Un
+    largo -1 indica que la sección no tiene curva (pendiente o con error).
+
+    Con shared=True el bloque es memoria compartida: los procesos worker se
+    conectan con attach(spec) y escriben sin copiar la curva al padre.
+    """
+
+    def __init__(
+        self,
+        n_sections: int,
+        n_rows: int,
+        shared: bool = False,
+        name: Optional[str] = None
+    ):
+        self.n_sections = n_sections
+        self.n_rows = n_rows
+        curves_offset = n_sections * np.dtype(np.int64).itemsize
+        size = curves_offset + n_sections * n_rows * len(CURVE_COLUMNS) * np.dtype(np.float64).itemsize
+
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        if shared or name is not None:
+            self._shm = shared_memory.SharedMemory(name=name, create=name is None, size=max(size, 1))
+            buffer = self._shm.buf
+        else:
+            buffer = bytearray(size)
+
+        self.lengths = np.ndarray((n_sections,), dtype=np.int64, buffer=buffer)
+        self.curves = np.ndarray(
+            (n_sections, n_rows, len(CURVE_COLUMNS)), dtype=np.float64,
+            buffer=buffer, offset=curves_offset
+        )
+        if name is None:
+            self.lengths[:] = -1
+
+    @property
+    def spec(self) -> Tuple[str, int, int]:
+        """(nombre, n_sections, n_rows) para conectar un worker (solo compartido)."""
+        return self._shm.name, self.n_sections, self.n_rows
+
+    @classmethod
+    def attach(cls, spec: Tuple[str, int, int]) -> 'CurveBuffer':
+        """Conecta a un buffer compartido existente."""
+        name, n_sections, n_rows = spec
+        return cls(n_sections, n_rows, name=name)
+
+    def write(self, index: int, curve: np.ndarray) -> None:
+        """Escribe la curva empaquetada de una sección."""
+        n = len(curve)
+        if n > self.n_rows:
+            raise ValueError(f'Curva de {n} filas excede el buffer ({self.n_rows})')
+        self.curves[index, :n] = curve
+        self.lengths[index] = n
+
+    def read(self, index: int) -> Optional[np.ndarray]:
+        """Copia de la curva de una sección (None si no se escribió)."""
+        n = int(self.lengths[index])
+        return self.curves[index, :n].copy() if n >= 0 else None
+
+    def close(self, unlink: bool = False) -> None:
+        """Libera las vistas y el bloque compartido (unlink: solo el creador)."""
+        self.lengths = self.curves = None
+        if self._shm is not None:
+            self._shm.close()
+            if unlink:
+                self._shm.unlink()
+            self._shm = None
+
+
+# =============================================================================
+# GENERACIÓN (threads y procesos worker)
+# =============================================================================
+
+def _generate_into(buffer: CurveBuffer, index: int, section: Dict[str, Any]) -> Tuple[int, Optional[str]]:
+    """Genera una curva y la escribe en el buffer. Retorna (índice, error)."""
+    try:
+        buffer.write(index, _diagram_service.generate_interaction_arrays(**section))
+        return index, None
+    except Exception as exc:
+        return index, _describe(exc)
+
+
+def _generate_curve_chunk(items: List[Dict[str, Any]]) -> List[Tuple[int, Optional[str]]]:
+    """
+    Genera un chunk de secciones dentro de un proceso worker.
+
+    Las curvas quedan en la memoria compartida; solo se retornan los
+    índices procesados y sus errores.
+    """
+    buffer = CurveBuffer.attach(items[0]['buffer'])
+    try:
+        return [_generate_into(buffer, item['index'], item['section']) for item in items]
+    finally:
+        buffer.close()
+
+
+# =============================================================================
+# ETAPA
+# =============================================================================
+
+class CurveGeneration:
+    """
+    Etapa de pre-generación de curvas P-M de un análisis.
+
+    run() es un generador de progreso (secciones listas, total); al
+    terminar, points()/packed() entregan la curva de cada elemento y
+    dirección, y errors los fallos.
+    """
+
+    def __init__(self, backend: AnalysisBackend, cache: InteractionCurveCache):
+        self._backend = backend
+        self._cache = cache
+        self._fingerprints: Dict[Tuple[str, str], str] = {}
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._points: Dict[str, InteractionCurve] = {}
+        self.errors: List[CurveError] = []
+
+    def run(
+        self,
+        jobs: List[CurveJob],
+        section_fn: Callable[[Any, str], Dict[str, Any]],
+        initializer: Optional[Callable] = None
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Resuelve las curvas de todos los trabajos.
+
+        Args:
+            jobs: [(clave, dirección, elemento)]
+            section_fn: Entradas de la curva de un elemento y dirección
+                (ej: FlexocompressionService.interaction_section)
+            initializer: Inicializador de procesos worker (pool compartido
+                con el análisis)
+
+        Yields:
+            (secciones generadas, secciones a generar); el primero es (0, n)
+        """
+        pending: Dict[str, Dict[str, Any]] = {}
+        for key, direction, element in jobs:
+            try:
+                section = section_fn(element, direction)
+                fingerprint = section_fingerprint(**section)
+            except Exception as exc:
+                self.errors.append(CurveError(key, direction, _describe(exc)))
+                continue
+            self._fingerprints[(key, direction)] = fingerprint
+            if fingerprint in self._arrays or fingerprint in pending:
+                continue
+            cached = self._cache.get_array(fingerprint)
+            if cached is not None:
+                self._arrays[fingerprint] = cached
+            else:
+                pending[fingerprint] = section
+
+        fingerprints = list(pending)
+        total = len(fingerprints)
+        yield 0, total
+        if not fingerprints:
+            return
+
+        envelope = any(section.get('fibers') is not None for section in pending.values())
+        buffer = CurveBuffer(total, max_curve_rows(envelope=envelope), shared=self._backend.is_process)
+        failed: Dict[str, str] = {}
+        try:
+            items = [
+                {'index': i, 'section': pending[fp],
+                 'buffer': buffer.spec if self._backend.is_process else None}
+                for i, fp in enumerate(fingerprints)
+            ]
+            done = 0
+            for batch in self._backend.run(
+                items,
+                task_fn=lambda item: _generate_into(buffer, item['index'], item['section']),
+                chunk_fn=_generate_curve_chunk,
+                initializer=initializer
+            ):
+                for index, error in batch:
+                    fingerprint = fingerprints[index]
+                    if error is not None:
+                        failed[fingerprint] = error
+                        continue
+                    curve = buffer.read(index)
+                    curve.setflags(write=False)
+                    self._cache.put_array(fingerprint, curve)
+                    self._arrays[fingerprint] = curve
+                done += len(batch)
+                yield done, total
+        finally:
+            buffer.close(unlink=True)
+
+        if failed:
+            for (key, direction), fingerprint in self._fingerprints.items():
+                if fingerprint in failed:
+                    self.errors.append(CurveError(key, direction, failed[fingerprint]))
+
+    def packed(self, key: str, direction: str = 'primary') -> Optional[np.ndarray]:
+        """Curva empaquetada (n, 7) de un elemento, o None si falló."""
+        fingerprint = self._fingerprints.get((key, direction))
+        return self._arrays.get(fingerprint) if fingerprint is not None else None
+
+    def points(self, key: str, direction: str = 'primary') -> Optional[InteractionCurve]:
+        """
+        Curva de un elemento como InteractionCurve, o None si falló.
+
+        Elementos con la misma sección comparten la misma curva (sobre el
+        arreglo de packed(), sin copia).
+        """
+        fingerprint = self._fingerprints.get((key, direction))
+        if fingerprint not in self._arrays:
+            return None
+        if fingerprint not in self._points:
+            self._points[fingerprint] = InteractionCurve(self._arrays[fingerprint], presorted=True)
+        return self._points[fingerprint]
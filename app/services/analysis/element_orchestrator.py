@@ -14,6 +14,8 @@ Usa ForceExtractor y GeometryNormalizer para evitar duplicación de código.
 from typing import Union, Optional, Dict, Any, List, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .element_classifier import ElementClassifier, ElementType
 from .design_behavior_resolver import DesignBehaviorResolver
 from .design_behavior import DesignBehavior
@@ -39,6 +41,12 @@ if TYPE_CHECKING:
     from ...domain.entities import LoadCombination
 
 
+# Los resultados van al cache de análisis: el detalle por combinación se
+# guarda como tabla compacta y las filas del modal se arman bajo demanda
+# (ver combo_detail)
+LAZY_COMBO_DETAIL = {'include_combo_results': False, 'include_combo_table': True}
+
+
 @dataclass
 class OrchestrationResult:
     """
@@ -55,8 +63,8 @@ class OrchestrationResult:
     dcr_max: float
     critical_check: str
     warnings: list
-    flexure_data: Optional[Dict[str, Any]] = None  # Datos de flexión (Mu, phi_Mn, combo_results)
-    shear_data: Optional[Dict[str, Any]] = None    # Datos de cortante (combo_results de ShearService)
+    flexure_data: Optional[Dict[str, Any]] = None  # Datos de flexión (Mu, phi_Mn, combo_table)
+    shear_data: Optional[Dict[str, Any]] = None    # Datos de cortante (combo_table de ShearService)
 
 
 @dataclass
@@ -293,15 +301,17 @@ class ElementOrchestrator:
             lambda_factor=lambda_factor,
         )
 
-        # Calcular datos de flexión usando FlexocompressionService (incluye combo_results)
+        # Calcular datos de flexión usando FlexocompressionService (tabla por combinación)
         # Usar curva pre-calculada si está disponible
         flexure_data = self._flexo_service.check_flexure(
-            element, forces, moment_axis='M3', interaction_points=interaction_curve
+            element, forces, moment_axis='M3', interaction_points=interaction_curve,
+            **LAZY_COMBO_DETAIL
         )
 
-        # Calcular datos de cortante usando ShearService (incluye combo_results)
+        # Calcular datos de cortante usando ShearService (tabla por combinación)
         shear_data = self._shear_service.check_shear(
-            element, forces, lambda_factor=lambda_factor, seismic_category=category
+            element, forces, lambda_factor=lambda_factor, seismic_category=category,
+            **LAZY_COMBO_DETAIL
         )
 
         return OrchestrationResult(
@@ -354,15 +364,17 @@ class ElementOrchestrator:
                 category=category,
             )
 
-        # Calcular datos de flexión usando FlexocompressionService (incluye combo_results)
+        # Calcular datos de flexión usando FlexocompressionService (tabla por combinación)
         # Usar curva pre-calculada si está disponible
         flexure_data = self._flexo_service.check_flexure(
-            element, forces, moment_axis='M3', interaction_points=interaction_curve
+            element, forces, moment_axis='M3', interaction_points=interaction_curve,
+            **LAZY_COMBO_DETAIL
         )
 
-        # Calcular datos de cortante usando ShearService (incluye combo_results)
+        # Calcular datos de cortante usando ShearService (tabla por combinación)
         shear_data = self._shear_service.check_shear(
-            element, forces, lambda_factor=lambda_factor, seismic_category=category
+            element, forces, lambda_factor=lambda_factor, seismic_category=category,
+            **LAZY_COMBO_DETAIL
         )
 
         return OrchestrationResult(
@@ -417,7 +429,8 @@ class ElementOrchestrator:
         # Calcular datos de flexión usando FlexocompressionService
         # Usar curva pre-calculada si está disponible
         flexure_data = self._flexo_service.check_flexure(
-            element, forces, moment_axis='M3', interaction_points=interaction_curve
+            element, forces, moment_axis='M3', interaction_points=interaction_curve,
+            **LAZY_COMBO_DETAIL
         )
 
         return OrchestrationResult(
@@ -445,7 +458,8 @@ class ElementOrchestrator:
         # Calcular capacidad usando flexocompression service
         # Usar curva pre-calculada si está disponible
         flexure_data = self._flexo_service.check_flexure(
-            element, forces, moment_axis, interaction_points=interaction_curve
+            element, forces, moment_axis, interaction_points=interaction_curve,
+            **LAZY_COMBO_DETAIL
         )
 
         # DCR viene directamente del servicio (centralizado)
@@ -487,7 +501,9 @@ class ElementOrchestrator:
         from .design_behavior import DesignBehavior
 
         # Calcular datos de flexión para DCR (igual que elementos normales)
-        flexure_data = self._flexo_service.check_flexure(element, forces, moment_axis='M3')
+        flexure_data = self._flexo_service.check_flexure(
+            element, forces, moment_axis='M3', **LAZY_COMBO_DETAIL
+        )
         dcr = flexure_data.get('dcr', 0) if flexure_data else 0
 
         # Crear resultado Non-SFRS simplificado
@@ -564,8 +580,8 @@ class ElementOrchestrator:
         # Contar combinaciones con tracción
         # ETABS: P > 0 = tracción (al igual que get_critical_pm_points usa -combo.P)
         tension_combos = 0
-        if hasattr(forces, 'combinations') and forces.combinations:
-            tension_combos = sum(1 for c in forces.combinations if getattr(c, 'P', 0) > 0)
+        if getattr(forces, 'n_combinations', 0):
+            tension_combos = int((forces.values('P') > 0).sum())
         has_tension = tension_combos > 0
 
         # Determinar SDC para warnings
@@ -603,8 +619,8 @@ class ElementOrchestrator:
         # Esto garantiza que el modal pueda leer datos por combo sin recalcular
         # =====================================================================
         combo_results = []
-        if hasattr(forces, 'combinations') and forces.combinations:
-            for combo in forces.combinations:
+        if getattr(forces, 'n_combinations', 0):
+            for combo in forces.iter_combinations():
                 # ETABS: P>0=tracción, P<0=compresión
                 # Internamente: P>0=compresión
                 combo_Pu = -combo.P
@@ -723,6 +739,7 @@ class ElementOrchestrator:
         *,
         interaction_points: Optional[List] = None,
         lambda_factor: float = 1.0,
+        flexure_sf: Optional[float] = None,
     ) -> CombinationResult:
         """
         Verifica un elemento para UNA combinación de carga específica.
@@ -737,12 +754,13 @@ class ElementOrchestrator:
             index: Índice de la combinación (para tracking)
             interaction_points: Puntos del diagrama P-M (si ya calculado, para reutilizar)
             lambda_factor: Factor para concreto liviano (default 1.0)
+            flexure_sf: SF de flexión pre-calculado en lote (verify_all_combinations)
 
         Returns:
             CombinationResult con SF de flexión, cortante y estado general
         """
-        # Si no tenemos interaction_points, generarlos
-        if interaction_points is None:
+        # Si no tenemos interaction_points ni SF, generarlos
+        if interaction_points is None and flexure_sf is None:
             interaction_points, _ = self._flexo_service.generate_interaction_curve(
                 element, direction='primary', apply_slenderness=True, k=0.8
             )
@@ -753,11 +771,10 @@ class ElementOrchestrator:
         V2 = abs(combination.V2)
         V3 = abs(combination.V3)
 
-        # 1. Verificar flexión usando FlexureChecker
-        demand_point = [(P, M, combination.name)]
-        flexure_result = FlexureChecker.check_flexure(interaction_points, demand_point)
-        flexure_sf = flexure_result.safety_factor
-        flexure_status = flexure_result.status
+        # 1. Verificar flexión usando FlexureChecker (kernel en lote)
+        if flexure_sf is None:
+            flexure_sf, _ = FlexureChecker.calculate_safety_factor(interaction_points, P, M)
+        flexure_status = "OK" if flexure_sf >= 1.0 else "NO OK"
 
         # 2. Verificar cortante bidireccional
         # Obtener geometría para verificación de cortante
@@ -834,15 +851,25 @@ class ElementOrchestrator:
             element, direction='primary', apply_slenderness=apply_slenderness, k=0.8
         )
 
+        # SF de flexión de TODAS las combinaciones en una sola pasada
+        # (directo desde las columnas del almacén, sin crear objetos)
+        M2, M3 = forces.values('M2'), forces.values('M3')
+        flexure_sfs, _ = FlexureChecker.calculate_safety_factors(
+            interaction_points,
+            -forces.values('P'),
+            np.sqrt(M2**2 + M3**2),
+        )
+
         # Verificar cada combinación
         results = []
-        for i, combo in enumerate(forces.combinations):
+        for i, combo in enumerate(forces.iter_combinations()):
             result = self.verify_combination(
                 element=element,
                 combination=combo,
                 index=i,
                 interaction_points=interaction_points,
                 lambda_factor=lambda_factor,
+                flexure_sf=float(flexure_sfs[i]),
             )
             results.append(result)
 
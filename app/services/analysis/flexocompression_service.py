@@ -12,10 +12,10 @@ de flexocompresion segun ACI 318-25 Capitulo 22.
 OPTIMIZACIÓN DE RENDIMIENTO:
 Las curvas P-M se pre-generan y almacenan en ParsedData.interaction_curves
 antes del análisis paralelo. Esto evita recálculos costosos durante la
-verificación de múltiples combinaciones de carga.
+verificación de múltiples combinaciones de carga. Además, las curvas se
+comparten entre secciones idénticas vía InteractionCurveCache.
 """
-from typing import Dict, List, Any, Optional, Tuple, Union
-import math
+from typing import Dict, Any, Optional, Tuple, Union
 
 from ...domain.entities import VerticalElement, HorizontalElement, ElementForces
 from ...domain.entities.protocols import FlexuralElement
@@ -23,8 +23,12 @@ from ...domain.flexure import (
     InteractionDiagramService,
     SlendernessService,
     SteelLayer,
-    InteractionPoint,
+    InteractionCurve,
     FlexureChecker,
+    BiaxialSection,
+    BiaxialSurface,
+    FiberSection,
+    generate_biaxial_surface,
 )
 from ...domain.constants.phi_chapter21 import (
     PHI_COMPRESSION,
@@ -34,6 +38,13 @@ from ...domain.constants.phi_chapter21 import (
 )
 from ...domain.constants.units import N_TO_TONF
 from ..presentation.formatters import format_safety_factor
+from .curve_cache import (
+    InteractionCurveCache,
+    biaxial_fingerprint,
+    interaction_curve_cache,
+    section_fingerprint,
+)
+from .combo_detail import COMBO_TABLE_KEY, flexure_combo_rows, flexure_combo_table
 from ...domain.chapter18.beams.service import (
     calculate_Mpr as _calculate_Mpr,
     calculate_Ve_beam as _calculate_Ve_beam,
@@ -58,9 +69,16 @@ class FlexocompressionService:
         result = service.check_flexure(column, forces, k=1.0)
     """
 
-    def __init__(self):
+    def __init__(self, curve_cache: Optional[InteractionCurveCache] = None):
         self._interaction_service = InteractionDiagramService()
         self._slenderness_service = SlendernessService()
+        # Cache compartido por defecto (entre elementos y sesiones)
+        self._curve_cache = curve_cache if curve_cache is not None else interaction_curve_cache
+
+    @property
+    def curve_cache(self) -> InteractionCurveCache:
+        """Cache de curvas P-M usado por este servicio."""
+        return self._curve_cache
 
     # =========================================================================
     # Curva de Interaccion
@@ -73,14 +91,15 @@ class FlexocompressionService:
         apply_slenderness: bool = True,
         k: float = 0.8,
         braced: bool = True,
-        use_cache: bool = True  # Mantenido por compatibilidad, ignorado
-    ) -> Tuple[List[InteractionPoint], Dict[str, Any]]:
+        use_cache: bool = True
+    ) -> Tuple[InteractionCurve, Dict[str, Any]]:
         """
         Genera la curva de interaccion P-M para cualquier elemento.
 
-        NOTA: El cache ahora se maneja externamente en ParsedData.interaction_curves.
-        Las curvas se pre-generan en structural_analysis.py antes del análisis
-        paralelo para optimizar rendimiento.
+        La curva se busca primero en InteractionCurveCache por la huella de
+        la sección (dimensiones, capas de acero, materiales), de modo que
+        secciones repetidas en distintos pisos se calculan una sola vez.
+        Por sesión, las curvas además se guardan en ParsedData.interaction_curves.
 
         Args:
             element: Pier, Column, o cualquier FlexuralElement
@@ -88,10 +107,11 @@ class FlexocompressionService:
             apply_slenderness: Si aplicar reduccion por esbeltez
             k: Factor de longitud efectiva (0.8 para muros, 1.0 para columnas)
             braced: Si el elemento esta arriostrado
-            use_cache: Ignorado (mantenido por compatibilidad)
+            use_cache: Usar el cache compartido de curvas
 
         Returns:
-            Tuple (interaction_points, slenderness_data)
+            Tuple (curva, slenderness_data); la curva es de solo lectura y
+            puede estar compartida con otros elementos
         """
         # Analizar esbeltez
         slenderness = self._slenderness_service.analyze(element, k=k, braced=braced)
@@ -102,24 +122,79 @@ class FlexocompressionService:
             'magnification_pct': round(slenderness.magnification_pct, 1) if slenderness.is_slender else 0.0
         }
 
-        # Obtener dimensiones y capas de acero
-        width, thickness = element.get_section_dimensions(direction)
-        steel_layers = element.get_steel_layers(direction)
-
         # Generar curva de interaccion
         # NOTA: No se reduce la curva P-M. El efecto de esbeltez se aplica
         # magnificando Mu segun ACI 318-25 §6.6.4: Mc = δns × Mu
-        interaction_points = self._interaction_service.generate_interaction_curve(
+        section = self.interaction_section(element, direction)
+        if use_cache:
+            interaction_points = self._curve_cache.get_or_create(
+                section_fingerprint(**section),
+                lambda: self._interaction_service.generate_interaction_curve(**section)
+            )
+        else:
+            interaction_points = self._interaction_service.generate_interaction_curve(**section)
+
+        return interaction_points, slenderness_data
+
+    @staticmethod
+    def interaction_section(element: FlexuralElement, direction: str = 'primary') -> Dict[str, Any]:
+        """
+        Entradas de la curva P-M de un elemento en una dirección.
+
+        Los piers compuestos (L, T, C) usan su sección de fibras en la
+        dirección del eje local (axis_angle para 'primary', +90° para
+        'secondary') en vez del rectángulo equivalente.
+
+        Returns:
+            Dict con los argumentos de
+            InteractionDiagramService.generate_interaction_curve() (y de
+            section_fingerprint())
+        """
+        width, thickness = element.get_section_dimensions(direction)
+        section = dict(
             width=width,
             thickness=thickness,
             fc=element.fc,
             fy=element.fy,
             As_total=element.As_flexure_total,
             cover=element.cover,
-            steel_layers=steel_layers
         )
+        if getattr(element, 'is_composite', False):
+            section['fibers'] = FiberSection.from_element(element)
+            section['fiber_angle'] = element.axis_angle + (0.0 if direction == 'primary' else 90.0)
+        else:
+            section['steel_layers'] = element.get_steel_layers(direction)
+        return section
 
-        return interaction_points, slenderness_data
+    def biaxial_surface(
+        self,
+        element: 'VerticalElement',
+        use_cache: bool = True
+    ) -> BiaxialSurface:
+        """
+        Superficie de interacción biaxial P-M2-M3 de un pier o columna.
+
+        Se genera una vez por sección (huella de contorno, barras y
+        materiales) y se comparte vía InteractionCurveCache: las consultas
+        por combinación posteriores son solo interpolación.
+
+        Args:
+            element: VerticalElement (rectangular o compuesto)
+            use_cache: Usar el cache compartido
+
+        Returns:
+            BiaxialSurface (inmutable, puede estar compartida)
+        """
+        section = BiaxialSection.from_element(element)
+        if not use_cache:
+            return generate_biaxial_surface(section)
+
+        key = biaxial_fingerprint(section)
+        surface = self._curve_cache.get_value(key)
+        if surface is None:
+            surface = generate_biaxial_surface(section)
+            self._curve_cache.put_value(key, surface)
+        return surface
 
     # =========================================================================
     # Verificacion de Flexocompresion
@@ -134,11 +209,18 @@ class FlexocompressionService:
         angle_deg: float = 0,
         k: float = 0.8,
         braced: bool = True,
-        interaction_points: Optional[List[InteractionPoint]] = None
+        interaction_points: Optional[InteractionCurve] = None,
+        include_combo_results: bool = True,
+        include_combo_table: bool = False
     ) -> Dict[str, Any]:
         """
         Verifica flexocompresion de cualquier elemento.
 
+        Sin include_combo_results el resultado omite el detalle por
+        combinación (combo_results, design_curve, demand_points); con
+        include_combo_table agrega la tabla compacta para armarlo bajo
+        demanda (ver combo_detail).
+
         Args:
             element: Pier, Column, o cualquier FlexuralElement
             forces: Fuerzas del elemento (PierForces o ColumnForces)
@@ -148,12 +230,15 @@ class FlexocompressionService:
             k: Factor de longitud efectiva
             braced: Si el elemento esta arriostrado
             interaction_points: Curva P-M pre-calculada (optimización de rendimiento)
+            include_combo_results: Incluir filas por combinación y curvas (modal)
+            include_combo_table: Incluir la tabla compacta por combinación
 
         Returns:
             Dict con resultados de la verificacion
         """
         # Usar curva pre-calculada si se proporciona, sino generar
         if interaction_points is not None:
+            interaction_points = InteractionCurve.of(interaction_points)
             # Analizar esbeltez para slenderness_data
             slenderness = self._slenderness_service.analyze(element, k=k, braced=braced)
             slenderness_data = {
@@ -167,20 +252,22 @@ class FlexocompressionService:
             interaction_points, slenderness_data = self.generate_interaction_curve(
                 element, direction, apply_slenderness=True, k=k, braced=braced
             )
-        design_curve = self._interaction_service.get_design_curve(interaction_points)
 
-        # Obtener puntos de demanda
-        demand_points = []
-        if forces and hasattr(forces, 'combinations') and forces.combinations:
-            demand_points = forces.get_critical_pm_points(
+        # Obtener puntos de demanda (arreglos, sin tuplas por combinación)
+        has_demand = bool(forces and getattr(forces, 'n_combinations', 0))
+        if has_demand:
+            Pu_arr, Mu_arr, names = forces.get_pm_arrays(
                 moment_axis=moment_axis,
                 angle_deg=angle_deg
             )
 
         # Verificar - llamar directamente a FlexureChecker (evita nivel intermedio)
         combo_results_list = []
-        if demand_points:
-            result = FlexureChecker.check_flexure(interaction_points, demand_points)
+        combo_table = None
+        if has_demand:
+            result = FlexureChecker.check_flexure_arrays(
+                interaction_points, Pu_arr, Mu_arr, names, include_combo_results=False
+            )
             sf = result.safety_factor
             status = result.status
             critical = result.critical_combo
@@ -194,21 +281,11 @@ class FlexocompressionService:
             tension_combos = result.tension_combos
             exceeds_tension = result.exceeds_tension_capacity
             phi_Pt_min = result.phi_Pt_min
-            # Propagar resultados de TODAS las combinaciones
-            combo_results_list = [
-                {
-                    'name': c.combo_name,
-                    'location': c.combo_location,
-                    'Pu': round(c.Pu, 2),
-                    'Mu': round(c.Mu, 2),
-                    'sf': format_safety_factor(c.sf, as_string=False),
-                    'dcr': round(c.dcr, 3) if not math.isinf(c.dcr) else 0,
-                    'phi_Mn_at_Pu': round(c.phi_Mn_at_Pu, 2),
-                    'is_tension': c.is_tension,
-                    'status': 'OK' if c.sf >= 1.0 else 'NO OK'
-                }
-                for c in result.combo_results
-            ]
+            # Resultados de TODAS las combinaciones: tabla compacta y,
+            # si se piden, filas formateadas
+            combo_table = flexure_combo_table(forces, result)
+            if include_combo_results:
+                combo_results_list = flexure_combo_rows(combo_table)
         else:
             sf, status, critical = float('inf'), "OK", "N/A"
             phi_Mn_0, phi_Mn_at_Pu, critical_Pu, critical_Mu = 0.0, 0.0, 0.0, 0.0
@@ -220,7 +297,7 @@ class FlexocompressionService:
         # DCR = 1/SF = Mu/φMn (demand/capacity)
         dcr = 1 / sf if sf > 0 and sf < float('inf') else 0
 
-        return {
+        flexure = {
             'sf': format_safety_factor(sf, as_string=False),
             'dcr': round(dcr, 3),            # DCR centralizado (Mu/φMn)
             'status': status,
@@ -229,8 +306,6 @@ class FlexocompressionService:
             'phi_Mn_at_Pu': phi_Mn_at_Pu,   # Capacidad a Pu critico (via ray-casting)
             'Pu': critical_Pu,
             'Mu': critical_Mu,
-            'design_curve': design_curve,
-            'demand_points': demand_points,
             'slenderness': slenderness_data,
             'exceeds_axial_capacity': exceeds_axial,
             'phi_Pn_max': phi_Pn_max,
@@ -238,8 +313,17 @@ class FlexocompressionService:
             'tension_combos': tension_combos,
             'exceeds_tension': exceeds_tension,
             'phi_Pt_min': round(phi_Pt_min, 2),
-            'combo_results': combo_results_list  # Resultados de TODAS las combinaciones
         }
+        if include_combo_results:
+            flexure['design_curve'] = self._interaction_service.get_design_curve(interaction_points)
+            flexure['demand_points'] = (
+                [(p, m, n) for p, m, n in zip(Pu_arr.tolist(), Mu_arr.tolist(), names)]
+                if has_demand else []
+            )
+            flexure['combo_results'] = combo_results_list  # Resultados de TODAS las combinaciones
+        if include_combo_table and combo_table is not None:
+            flexure[COMBO_TABLE_KEY] = combo_table
+        return flexure
 
     # =========================================================================
     # Capacidades Puras
@@ -306,7 +390,7 @@ class FlexocompressionService:
 
     def get_c_at_point(
         self,
-        interaction_points: List[InteractionPoint],
+        interaction_points: InteractionCurve,
         Pu: float,
         Mu: float
     ) -> Optional[float]:
@@ -316,30 +400,16 @@ class FlexocompressionService:
         Busca el punto en la curva de interaccion mas cercano y extrae c.
 
         Args:
-            interaction_points: Lista de puntos de interaccion
+            interaction_points: Curva de interaccion (o lista de puntos)
             Pu: Carga axial (tonf)
             Mu: Momento (tonf-m)
 
         Returns:
             Profundidad c en mm, o None si no se puede calcular
         """
-        if not interaction_points:
+        if interaction_points is None or len(interaction_points) == 0:
             return None
-
-        min_distance = float('inf')
-        closest_c = None
-
-        for point in interaction_points:
-            # Normalizar para comparar (evitar diferencias de escala)
-            dP = (point.phi_Pn - Pu) / max(abs(point.phi_Pn), 1)
-            dM = (point.phi_Mn - abs(Mu)) / max(abs(point.phi_Mn), 1)
-            distance = (dP ** 2 + dM ** 2) ** 0.5
-
-            if distance < min_distance:
-                min_distance = distance
-                closest_c = point.c
-
-        return closest_c if closest_c and closest_c < float('inf') else None
+        return InteractionCurve.of(interaction_points).c_at(Pu, Mu)
 
     # =========================================================================
     # Momento Probable (Mpr) para Vigas Sismicas §18.6.5.1
@@ -430,28 +500,5 @@ class FlexocompressionService:
             apply_slenderness=False
         )
 
-        # Interpolar Mn en la curva
-        if not interaction_points:
-            return 0.0
-
-        # Ordenar por Pn (de mayor a menor)
-        points_sorted = sorted(interaction_points, key=lambda p: p.Pn, reverse=True)
-
-        # Buscar el rango donde cae Pu
-        for i in range(len(points_sorted) - 1):
-            p1, p2 = points_sorted[i], points_sorted[i + 1]
-            # Convertir Pn a tonf (si no lo esta)
-            Pn1 = p1.Pn if p1.Pn < 1e6 else p1.Pn / (1000 * 9.80665)
-            Pn2 = p2.Pn if p2.Pn < 1e6 else p2.Pn / (1000 * 9.80665)
-
-            if Pn1 >= Pu >= Pn2:
-                if abs(Pn1 - Pn2) < 0.001:
-                    return p1.Mn
-                ratio = (Pn1 - Pu) / (Pn1 - Pn2)
-                Mn = p1.Mn + ratio * (p2.Mn - p1.Mn)
-                return round(Mn, 2)
-
-        # Si Pu esta fuera del rango, usar extremo
-        if Pu > points_sorted[0].Pn:
-            return points_sorted[0].Mn
-        return points_sorted[-1].Mn
+        # Interpolar Mn en la curva (ordenada por Pn)
+        return round(interaction_points.Mn_at_Pn(Pu), 2)
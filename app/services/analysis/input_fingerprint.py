@@ -0,0 +1,155 @@
+# app/services/analysis/input_fingerprint.py
+"""
+Huella de las entradas del análisis de un elemento.
+
+El resultado de verificar un elemento depende solo de su tarea de análisis:
+geometría y armadura del elemento, fuerzas, configuración de materiales,
+categoría sísmica, continuidad y vigas de acople. Si la huella de esas
+entradas no cambia entre dos análisis, el resultado cacheado sigue siendo
+válido y el elemento no se re-verifica (análisis incremental).
+
+Los elementos se recorren por TODOS sus campos públicos de dataclass (no
+vía to_dict(), que omite campos según el layout), de modo que cualquier
+edición que afecte la verificación cambia la huella.
+
+La huella solo cubre las entradas; code_version() identifica además el
+código que calculó los resultados (para cachés persistidos en disco).
+"""
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from ...domain.entities import ElementForces
+from ...domain.entities.force_store import FORCE_COLUMNS, LABEL_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Cambiar al modificar el formato de la huella (invalida huellas guardadas)
+FINGERPRINT_VERSION = 3
+
+# Claves de la tarea que no son entradas del cálculo
+_NON_INPUT_KEYS = ('interaction_curve', 'label')
+
+# Paquetes cuyo código determina los resultados del análisis
+_APP_DIR = Path(__file__).resolve().parents[2]
+_ANALYSIS_PACKAGES = ('domain', 'services')
+
+
+def hash_bytes(data: bytes) -> str:
+    """Hash hexadecimal de 128 bits (blake2b) de un bloque de bytes."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def canonical(obj: Any) -> Any:
+    """
+    Convierte un valor a una estructura JSON determinística.
+
+    - dataclasses: campos públicos (los que empiezan con '_' son caches)
+    - ElementForces: metadatos + hash de las columnas de combinaciones
+    - DataFrames/arreglos: hash del contenido
+    - floats: repr() (distingue -0.0, inf y nan sin perder precisión)
+    """
+    if obj is None or isinstance(obj, (bool, int, str)):
+        return obj
+    if isinstance(obj, float):
+        # float() normaliza np.float64 (subclase de float) al mismo texto
+        return repr(float(obj))
+    if isinstance(obj, Enum):
+        return canonical(obj.value)
+    if isinstance(obj, np.generic):
+        return canonical(obj.item())
+    if isinstance(obj, pd.DataFrame):
+        hashed = pd.util.hash_pandas_object(obj, index=False).values
+        return hash_bytes(hashed.tobytes() + repr(list(obj.columns)).encode())
+    if isinstance(obj, np.ndarray):
+        return hash_bytes(obj.tobytes() + str(obj.shape).encode())
+    if isinstance(obj, ElementForces):
+        return {
+            'fields': canonical_fields(obj),
+            'combinations': {
+                **{col: canonical(obj.values(col)) for col in FORCE_COLUMNS},
+                **{col: canonical(obj.labels(col).tolist()) for col in LABEL_COLUMNS},
+            },
+        }
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return canonical_fields(obj)
+    if isinstance(obj, dict):
+        return {str(k): canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        items = [canonical(v) for v in obj]
+        return sorted(items, key=repr) if isinstance(obj, (set, frozenset)) else items
+    if hasattr(obj, '__dict__'):
+        return {k: canonical(v) for k, v in vars(obj).items() if not k.startswith('_')}
+    return repr(obj)
+
+
+def canonical_fields(obj: Any) -> Dict[str, Any]:
+    """Campos públicos de una dataclass en forma canónica."""
+    return {
+        f.name: canonical(getattr(obj, f.name))
+        for f in dataclasses.fields(obj)
+        if not f.name.startswith('_')
+    }
+
+
+def task_fingerprint(task: Dict[str, Any]) -> str:
+    """
+    Huella de una tarea de análisis (ver StructuralAnalysisService).
+
+    Args:
+        task: Tarea con 'type', 'key', 'element', 'forces' y contexto
+            (materials_config, seismic_category, continuity_info, ...)
+
+    Returns:
+        Hash hexadecimal de todas las entradas del cálculo
+    """
+    inputs = {
+        k: canonical(v) for k, v in task.items()
+        if k not in _NON_INPUT_KEYS
+    }
+    inputs['__version__'] = FINGERPRINT_VERSION
+    payload = json.dumps(inputs, sort_keys=True, separators=(',', ':'))
+    return hash_bytes(payload.encode())
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """
+    Versión del código de análisis: hash de las fuentes de app/domain y
+    app/services más FINGERPRINT_VERSION e INGEO_RELEASE.
+
+    Cualquier cambio en el cálculo (o en el formato de los resultados)
+    invalida los resultados guardados con una versión anterior. En despliegues
+    sin fuentes se usan los .pyc; si tampoco hay (ejecutable congelado), solo
+    FINGERPRINT_VERSION e INGEO_RELEASE distinguen las versiones, por lo que
+    cada release debe fijar INGEO_RELEASE.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(FINGERPRINT_VERSION).encode())
+    digest.update(os.environ.get('INGEO_RELEASE', '').encode())
+    files = _analysis_files('*.py') or _analysis_files('*.pyc')
+    if not files and not os.environ.get('INGEO_RELEASE'):
+        logger.warning("Sin fuentes del análisis: code_version() depende solo de "
+                       "FINGERPRINT_VERSION; fije INGEO_RELEASE en cada release")
+    for path in files:
+        digest.update(path.relative_to(_APP_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _analysis_files(pattern: str) -> list:
+    """Archivos de los paquetes de análisis que cumplen pattern, ordenados."""
+    return [
+        path
+        for package in _ANALYSIS_PACKAGES
+        for path in sorted((_APP_DIR / package).rglob(pattern))
+    ]
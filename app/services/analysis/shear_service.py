@@ -18,6 +18,7 @@ from ...domain.shear import (
     WallClassificationService as DomainWallClassificationService,
     WallClassification,
     WallGroupShearResult,
+    CombinedShearBatchResult,
 )
 from ...domain.chapter18 import (
     ShearAmplificationService as DomainShearAmplificationService,
@@ -32,6 +33,7 @@ from ...domain.chapter18.design_forces import ShearAmplificationResult
 from ...domain.constants.units import TONF_TO_N, TONFM_TO_NMM, N_TO_TONF
 from ...domain.constants.shear import PHI_SHEAR
 from ..presentation.formatters import format_safety_factor
+from .combo_detail import COMBO_TABLE_KEY, shear_combo_rows, shear_combo_table
 
 
 class ShearService:
@@ -64,11 +66,17 @@ class ShearService:
         Mpr_total: float = 0,
         lu: float = 0,
         lambda_factor: float = 1.0,
-        seismic_category: SeismicCategory = None
+        seismic_category: SeismicCategory = None,
+        include_combo_results: bool = True,
+        include_combo_table: bool = False
     ) -> Dict[str, Any]:
         """
         Verifica corte con interacción V2-V3 y retorna el caso crítico.
 
+        Todas las combinaciones se verifican en una sola pasada vectorizada
+        (verify_combined_shear_batch); solo la combinación crítica se detalla
+        con verify_combined_shear.
+
         Args:
             pier: Pier a verificar
             pier_forces: Fuerzas del pier (combinaciones)
@@ -76,11 +84,14 @@ class ShearService:
             lu: Altura libre del pier (mm)
             lambda_factor: Factor de concreto liviano
             seismic_category: Categoría sísmica (SPECIAL usa φ=0.60, otros φ=0.75)
+            include_combo_results: Incluir filas por combinación (modal)
+            include_combo_table: Incluir la tabla compacta por combinación
+                ('combo_table'), para armar las filas bajo demanda
 
         Returns:
             Dict con resultados de la verificación de corte
         """
-        if not pier_forces or not pier_forces.combinations:
+        if not pier_forces or not pier_forces.n_combinations:
             return self._empty_shear_result()
 
         # Default seismic_category a SPECIAL si no se proporciona
@@ -92,63 +103,43 @@ class ShearService:
             lw=pier.length, tw=pier.thickness, hw=pier.height
         )
 
-        # Encontrar combinación crítica y cachear TODOS los resultados
-        critical_result = None
-        critical_combo = None
-        max_dcr = 0
-        combo_shear_results = []  # Cachear resultado de CADA combinación
-
-        for combo in pier_forces.combinations:
-            Vu2 = abs(combo.V2) if hasattr(combo, 'V2') else 0
-            Vu3 = abs(combo.V3) if hasattr(combo, 'V3') else 0
-            Nu = -combo.P if hasattr(combo, 'P') else 0  # Compresión positiva
-
-            result = self._shear_verification.verify_combined_shear(
-                lw=pier.length,
-                tw=pier.thickness,
-                hw=pier.height,
-                fc=pier.fc,
-                fy=pier.fy,
-                rho_h=pier.rho_horizontal,
-                Vu2=Vu2,
-                Vu3=Vu3,
-                Nu=Nu,
-                combo_name=combo.name,
-                rho_v=pier.rho_vertical,
-                lambda_factor=lambda_factor,
-                seismic_category=seismic_category
-            )
+        # Verificar TODAS las combinaciones de una vez (compresión positiva)
+        batch = self._shear_verification.verify_combined_shear_batch(
+            lw=pier.length,
+            tw=pier.thickness,
+            hw=pier.height,
+            fc=pier.fc,
+            fy=pier.fy,
+            rho_h=pier.rho_horizontal,
+            Vu2=pier_forces.values('V2'),
+            Vu3=pier_forces.values('V3'),
+            Nu=-pier_forces.values('P'),
+            lambda_factor=lambda_factor,
+            seismic_category=seismic_category
+        )
 
-            # Cachear resultado de este combo (ya se calculó, no desperdiciar)
-            r2 = result.result_V2
-            r3 = result.result_V3
-            combo_location = combo.location if hasattr(combo, 'location') else 'Middle'
-            combo_shear_results.append({
-                'combo_name': f"{combo.name} ({combo_location})",  # Formato normalizado con location
-                'combo_location': combo_location,
-                'Vu_2': round(Vu2, 2),
-                'Vu_3': round(Vu3, 2),
-                'Pu': round(-Nu, 2),
-                'phi_Vn_2': round(r2.phi_Vn, 2),
-                'phi_Vn_3': round(r3.phi_Vn, 2),
-                'phi_Vc': round(r2.Vc * result.phi_v, 2),
-                'Vc': round(r2.Vc, 2),
-                'Vs': round(r2.Vs, 2),
-                'dcr_2': round(result.dcr_2, 3),
-                'dcr_3': round(result.dcr_3, 3),
-                'dcr_combined': round(result.dcr_combined, 3),
-                'sf': round(1.0 / result.dcr_combined, 2) if result.dcr_combined > 0 else 100.0,
-                'status': 'OK' if result.dcr_combined <= 1.0 else 'NO OK'
-            })
-
-            if result.dcr_combined > max_dcr:
-                max_dcr = result.dcr_combined
-                critical_result = result
-                critical_combo = combo
-
-        if critical_result is None:
+        i_critical = batch.critical_index
+        if i_critical is None:
             return self._empty_shear_result()
 
+        # Detalle completo solo de la combinación crítica
+        critical_combo = pier_forces.get_combination(i_critical)
+        critical_result = self._shear_verification.verify_combined_shear(
+            lw=pier.length,
+            tw=pier.thickness,
+            hw=pier.height,
+            fc=pier.fc,
+            fy=pier.fy,
+            rho_h=pier.rho_horizontal,
+            Vu2=abs(critical_combo.V2),
+            Vu3=abs(critical_combo.V3),
+            Nu=-critical_combo.P,
+            combo_name=critical_combo.name,
+            rho_v=pier.rho_vertical,
+            lambda_factor=lambda_factor,
+            seismic_category=seismic_category
+        )
+
         sf = 1.0 / critical_result.dcr_combined if critical_result.dcr_combined > 0 else float('inf')
 
         # Extraer resultados de V2 y V3 del CombinedShearResult
@@ -156,10 +147,9 @@ class ShearService:
         r3 = critical_result.result_V3
 
         # Formato normalizado: "name (location)" para consistencia con FlexureChecker
-        critical_location = critical_combo.location if critical_combo and hasattr(critical_combo, 'location') else 'Middle'
-        return {
+        result = {
             'status': 'OK' if sf >= 1.0 else 'NO OK',
-            'critical_combo': f"{critical_combo.name} ({critical_location})" if critical_combo else 'N/A',
+            'critical_combo': f"{critical_combo.name} ({critical_combo.location})",
             'phi_Vn_2': round(r2.phi_Vn, 2),
             'Vu_2': round(r2.Vu, 2),
             'dcr_2': round(critical_result.dcr_2, 3),
@@ -172,8 +162,21 @@ class ShearService:
             'Vs': round(r2.Vs, 2),
             'aci_reference': r2.aci_reference,
             'phi_v': critical_result.phi_v,
-            'combo_results': combo_shear_results,  # Resultados de TODAS las combinaciones
         }
+        if include_combo_results:
+            # Resultados de TODAS las combinaciones
+            result['combo_results'] = self._combo_shear_rows(pier_forces, batch)
+        if include_combo_table:
+            result[COMBO_TABLE_KEY] = shear_combo_table(pier_forces, batch)
+        return result
+
+    @staticmethod
+    def _combo_shear_rows(
+        pier_forces: ElementForces,
+        batch: CombinedShearBatchResult
+    ) -> List[Dict[str, Any]]:
+        """Filas por combinación (formato del modal) desde el resultado vectorizado."""
+        return shear_combo_rows(shear_combo_table(pier_forces, batch))
 
     def _empty_shear_result(self) -> Dict[str, Any]:
         """Resultado vacío cuando no hay fuerzas."""
@@ -6,8 +6,16 @@ Genera un archivo claude_state.log con secciones estructuradas:
 - [PARSING]: tablas encontradas/faltantes, elementos creados
 - [ANALYSIS]: resultados de verificacion, DCRs
 - [FRONTEND]: estado actual de la UI
+
+Los eventos se encolan y un hilo en segundo plano los aplica y reescribe el
+archivo en lotes, para no pagar una escritura completa por elemento.
+INGEO_STATE_LOG=0 lo desactiva.
 """
+import os
+import threading
+import time
 from dataclasses import dataclass, field
+from queue import Empty, SimpleQueue
 from typing import Dict, List
 from pathlib import Path
 
@@ -15,6 +23,12 @@ from pathlib import Path
 _PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 CLAUDE_LOG_PATH = _PROJECT_ROOT / "claude_state.log"
 
+# Resultados de elementos que se muestran en [ANALYSIS]
+MAX_RESULTS_SHOWN = 10
+
+# Intervalo mínimo entre escrituras del archivo (segundos)
+FLUSH_INTERVAL_S = 1.0
+
 
 @dataclass
 class ParsingState:
@@ -42,14 +56,36 @@ class FrontendState:
     last_action: str = ""
 
 
+def _enabled_from_env() -> bool:
+    """INGEO_STATE_LOG=0/false/off desactiva el log de estado."""
+    value = os.environ.get('INGEO_STATE_LOG', '1').strip().lower()
+    return value not in ('0', 'false', 'off', 'no')
+
+
 class ClaudeStateLogger:
-    """Singleton que centraliza el estado de la aplicacion para Claude."""
+    """
+    Singleton que centraliza el estado de la aplicacion para Claude.
+
+    Los métodos log_* solo encolan el evento (SimpleQueue, sin lock del
+    lado del llamador) y retornan: un hilo escritor en segundo plano aplica
+    los eventos al estado y reescribe el archivo como máximo una vez por
+    FLUSH_INTERVAL_S, o de inmediato en los límites de fase (nueva sesión,
+    inicio de análisis, acción del frontend, flush()).
+
+    Con enabled=False (o INGEO_STATE_LOG=0) los eventos se descartan.
+    """
 
     _instance = None
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance.enabled = _enabled_from_env()
+            cls._instance.log_path = CLAUDE_LOG_PATH
+            cls._instance.flush_interval = FLUSH_INTERVAL_S
+            cls._instance._queue = SimpleQueue()
+            cls._instance._writer = None
+            cls._instance._writer_lock = threading.Lock()
             cls._instance._init_state()
         return cls._instance
 
@@ -58,84 +94,192 @@ class ClaudeStateLogger:
         self.analysis = AnalysisState()
         self.frontend = FrontendState()
 
+    # =========================================================================
+    # Cola de eventos
+    # =========================================================================
+
+    def _emit(self, handler, *args, urgent: bool = False) -> None:
+        """Encola un evento para el hilo escritor (no bloquea)."""
+        if not self.enabled:
+            return
+        self._queue.put((handler, args, urgent))
+        if self._writer is None or not self._writer.is_alive():
+            self._start_writer()
+
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._run_writer, name='claude-state-logger', daemon=True
+                )
+                self._writer.start()
+
+    def _run_writer(self) -> None:
+        """Aplica eventos en lotes y escribe el archivo a tasa acotada."""
+        dirty = False
+        last_write = 0.0
+        while True:
+            timeout = None
+            if dirty:
+                timeout = max(0.0, last_write + self.flush_interval - time.monotonic())
+            try:
+                batch = [self._queue.get(timeout=timeout)]
+            except Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+
+            urgent = False
+            waiters = []
+            for handler, args, is_urgent in batch:
+                urgent = urgent or is_urgent
+                if handler is None:
+                    waiters.append(args[0])  # Pedido de flush()
+                    continue
+                try:
+                    handler(*args)
+                    dirty = True
+                except Exception:
+                    pass  # Un evento malformado no debe detener el log
+
+            if dirty and (urgent or waiters or time.monotonic() - last_write >= self.flush_interval):
+                self._write()
+                dirty = False
+                last_write = time.monotonic()
+            for done in waiters:
+                done.set()
+
+    def flush(self, wait: bool = True, timeout: float = 5.0) -> bool:
+        """
+        Aplica los eventos pendientes y escribe el archivo ya.
+
+        Args:
+            wait: Esperar a que el archivo quede escrito
+            timeout: Espera máxima en segundos
+
+        Returns:
+            True si se escribió (o no había nada que esperar)
+        """
+        if not self.enabled:
+            return True
+        done = threading.Event()
+        self._emit(None, done, urgent=True)
+        return done.wait(timeout) if wait else True
+
+    # =========================================================================
+    # API pública (encola eventos)
+    # =========================================================================
+
     def reset(self):
         """Reinicia el estado (nueva sesion)."""
-        self._init_state()
-        self._write()
+        self._emit(self._init_state, urgent=True)
 
     # --- Parsing methods ---
     def set_session(self, session_id: str):
         # Nueva sesión = limpiar todo
+        self._emit(self._apply_set_session, session_id, urgent=True)
+
+    def log_file_received(self, filename: str):
+        self._emit(self._apply_file_received, filename)
+
+    def log_table_found(self, table_name: str, row_count: int):
+        self._emit(self._apply_table_found, table_name, row_count)
+
+    def log_table_missing(self, table_name: str):
+        self._emit(self._apply_table_missing, table_name)
+
+    def log_elements_created(self, element_type: str, count: int, fallback_count: int = 0):
+        self._emit(self._apply_elements_created, element_type, count, fallback_count)
+
+    def log_parsing_warning(self, msg: str):
+        self._emit(self._apply_parsing_warning, msg)
+
+    # --- Analysis methods ---
+    def log_analysis_start(self, element_count: int):
+        self._emit(self._apply_analysis_start, element_count, urgent=True)
+
+    def log_element_result(self, label: str, story: str, dcr: float, pu: float = 0, mn: float = 0):
+        # Se llama una vez por elemento desde los workers: solo encolar
+        self._emit(self._apply_element_result, label, story, dcr, pu, mn)
+
+    def log_analysis_warning(self, msg: str):
+        self._emit(self._apply_analysis_warning, msg)
+
+    def log_analysis_error(self, msg: str):
+        self._emit(self._apply_analysis_error, msg)
+
+    # --- Frontend methods ---
+    def update_frontend_state(self, page: str, tables: Dict[str, str], warnings: int, action: str):
+        self._emit(self._apply_frontend_state, page, dict(tables), warnings, action, urgent=True)
+
+    # =========================================================================
+    # Aplicación de eventos (solo en el hilo escritor)
+    # =========================================================================
+
+    def _apply_set_session(self, session_id: str):
         self._init_state()
         self.parsing.session_id = session_id
-        self._write()
 
-    def log_file_received(self, filename: str):
+    def _apply_file_received(self, filename: str):
         if filename not in self.parsing.files:
             self.parsing.files.append(filename)
-        self._write()
 
-    def log_table_found(self, table_name: str, row_count: int):
+    def _apply_table_found(self, table_name: str, row_count: int):
         self.parsing.tables_found[table_name] = row_count
-        self._write()
 
-    def log_table_missing(self, table_name: str):
+    def _apply_table_missing(self, table_name: str):
         if table_name not in self.parsing.tables_missing:
             self.parsing.tables_missing.append(table_name)
-        self._write()
 
-    def log_elements_created(self, element_type: str, count: int, fallback_count: int = 0):
+    def _apply_elements_created(self, element_type: str, count: int, fallback_count: int):
         self.parsing.elements_created[element_type] = count
         if fallback_count > 0:
             warning = f"{element_type}: {fallback_count} usando fallback"
             if warning not in self.parsing.warnings:
                 self.parsing.warnings.append(warning)
-        self._write()
 
-    def log_parsing_warning(self, msg: str):
+    def _apply_parsing_warning(self, msg: str):
         if msg not in self.parsing.warnings:
             self.parsing.warnings.append(msg)
-        self._write()
 
-    # --- Analysis methods ---
-    def log_analysis_start(self, element_count: int):
+    def _apply_analysis_start(self, element_count: int):
         self.analysis.elements_analyzed = 0
         self.analysis.results = []
-        self._write()
 
-    def log_element_result(self, label: str, story: str, dcr: float, pu: float = 0, mn: float = 0):
+    def _apply_element_result(self, label: str, story: str, dcr: float, pu: float, mn: float):
         self.analysis.elements_analyzed += 1
         result_str = f"{label} ({story}): DCR={dcr:.2f}"
         if pu != 0:
             result_str += f", Pu={pu:.0f}kN"
         if mn != 0:
             result_str += f", Mn={mn:.0f}kN-m"
-        self.analysis.results.append(result_str)
-        self._write()
+        results = self.analysis.results
+        results.append(result_str)
+        if len(results) > 2 * MAX_RESULTS_SHOWN:
+            del results[:-MAX_RESULTS_SHOWN]  # Solo se muestran los últimos
 
-    def log_analysis_warning(self, msg: str):
+    def _apply_analysis_warning(self, msg: str):
         if msg not in self.analysis.warnings:
             self.analysis.warnings.append(msg)
-        self._write()
 
-    def log_analysis_error(self, msg: str):
+    def _apply_analysis_error(self, msg: str):
         if msg not in self.analysis.errors:
             self.analysis.errors.append(msg)
-        self._write()
 
-    # --- Frontend methods ---
-    def update_frontend_state(self, page: str, tables: Dict[str, str], warnings: int, action: str):
+    def _apply_frontend_state(self, page: str, tables: Dict[str, str], warnings: int, action: str):
         self.frontend.current_page = page
         self.frontend.tables_visible = tables
         self.frontend.warnings_shown = warnings
         self.frontend.last_action = action
-        self._write()
 
     def _write(self):
         """Escribe el estado actual al archivo."""
         try:
             content = self._format()
-            CLAUDE_LOG_PATH.write_text(content, encoding='utf-8')
+            self.log_path.write_text(content, encoding='utf-8')
         except Exception:
             pass  # No fallar si hay error de escritura
 
@@ -178,8 +322,8 @@ class ClaudeStateLogger:
         lines.append(f"  Elements Analyzed: {self.analysis.elements_analyzed}")
 
         if self.analysis.results:
-            lines.append("  Results (last 10):")
-            for r in self.analysis.results[-10:]:
+            lines.append(f"  Results (last {MAX_RESULTS_SHOWN}):")
+            for r in self.analysis.results[-MAX_RESULTS_SHOWN:]:
                 lines.append(f"    - {r}")
 
         if self.analysis.warnings:
@@ -7,6 +7,7 @@ from .material_mapper import parse_material_to_fc
 from .table_extractor import normalize_columns, extract_tables_fast, extract_units_from_df
 from .reinforcement_config import ReinforcementConfig
 from .session_manager import SessionManager
+from .session_store import SessionStore
 from ...domain.entities import ParsedData
 
 __all__ = [
@@ -17,5 +18,6 @@ __all__ = [
     'extract_tables_fast',
     'extract_units_from_df',
     'ReinforcementConfig',
-    'SessionManager'
+    'SessionManager',
+    'SessionStore',
 ]
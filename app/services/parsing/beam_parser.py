@@ -9,12 +9,11 @@ Soporta dos tipos de vigas:
 OPTIMIZADO: Usa operaciones vectorizadas de pandas en lugar de iterrows()
 para procesar tablas grandes (240k+ filas) eficientemente.
 """
+from collections import Counter
 from typing import Dict, List, Tuple
 import logging
-import os
 import pandas as pd
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor
 
 from ...domain.entities import (
     HorizontalElement,
@@ -23,10 +22,11 @@ from ...domain.entities import (
     ElementForces,
     ElementForceType,
 )
-from ...domain.entities.element_forces import COMBO_COLUMNS
+from ...domain.entities.force_store import ForceStore
 from ...domain.constants.reinforcement import FY_DEFAULT_MPA
 from .material_mapper import parse_material_to_fc
 from .table_extractor import normalize_columns, extract_units_from_df
+from .section_index import SectionNameIndex
 from ..logging import claude_logger
 
 logger = logging.getLogger(__name__)
@@ -336,10 +336,10 @@ class BeamParser:
 
         # Calcular min/max station por viga (vectorizado con groupby)
         station_stats = df.groupby('beam_key')['station'].agg(['min', 'max'])
-        beam_lengths = {
-            key: (row['min'], row['max'])
-            for key, row in station_stats.iterrows()
-        }
+        beam_lengths = dict(zip(
+            station_stats.index,
+            zip(station_stats['min'].to_numpy(), station_stats['max'].to_numpy())
+        ))
 
         # Obtener stories únicos (vectorizado)
         stories = df['story'].astype(str).unique().tolist()
@@ -377,66 +377,44 @@ class BeamParser:
         df_combos = df[['beam_key', '_output_case', '_location', '_step_type', 'p', 'v2', 'v3', 't', 'm2', 'm3']].copy()
         df_combos.columns = ['beam_key', 'name', 'location', 'step_type', 'P', 'V2', 'V3', 'T', 'M2', 'M3']
 
-        # AGRESIVO: Procesar grupos en PARALELO con todos los cores
-        grouped = df_combos.groupby('beam_key')
-        group_items = list(grouped)
-        
-        # Función worker para procesar un chunk de grupos
-        def process_beam_chunk(chunk_items):
-            chunk_forces = {}
-            for beam_key, group in chunk_items:
-                parts = beam_key.split('_', 1)
-                if len(parts) != 2 or len(group) == 0:
-                    continue
-                story, beam_label = parts
-                forces = ElementForces(
-                    label=beam_label,
-                    story=story,
-                    element_type=ElementForceType.BEAM
-                )
-                forces.set_combinations_from_df(group[COMBO_COLUMNS])
-                chunk_forces[beam_key] = forces
-            return chunk_forces
-        
-        # Dividir en chunks y procesar en paralelo
-        n_workers = min(os.cpu_count() or 8, len(group_items))
-        if n_workers > 1 and len(group_items) > 100:
-            chunk_size = max(1, len(group_items) // n_workers)
-            chunks = [group_items[i:i+chunk_size] for i in range(0, len(group_items), chunk_size)]
-            
-            with ThreadPoolExecutor(max_workers=n_workers) as executor:
-                results = list(executor.map(process_beam_chunk, chunks))
-                for chunk_result in results:
-                    beam_forces.update(chunk_result)
-        else:
-            beam_forces = process_beam_chunk(group_items)
+        # Un solo almacén columnar para toda la tabla; cada elemento es una vista
+        store, ranges = ForceStore.from_frame(df_combos, key_column='beam_key')
+
+        beam_forces = ElementForces.views(store, ranges, ElementForceType.BEAM)
 
         # Crear vigas con longitud calculada
         skipped_beams = []
+        name_index = SectionNameIndex(section_defs)
+        resolved_by: Counter = Counter()
         for beam_key, forces in beam_forces.items():
             story, beam_label = beam_key.split('_', 1)
 
             # Buscar sección específica de esta viga
             section = None
             section_name = None
+            strategy = None
 
             # 1. Primero intentar desde tabla de asignaciones
             if beam_key in section_assigns:
                 section_name = section_assigns[beam_key]
                 section = section_defs.get(section_name)
+                strategy = 'assignment'
 
             # 2. Desde datos de Element Forces - Beams
             if section is None and beam_key in beam_sections:
                 section_name = beam_sections[beam_key]
                 section = section_defs.get(section_name)
+                strategy = 'forces_table'
 
-            # 3. Matchear por nombre
+            # 3. Matchear por nombre (label contenido en la sección o viceversa)
             if section is None:
-                for sec_name, sec_props in section_defs.items():
-                    if beam_label in sec_name or sec_name in beam_label:
-                        section = sec_props
-                        section_name = sec_name
-                        break
+                match = name_index.find(beam_label)
+                if match is not None:
+                    section_name = match
+                    section = section_defs[match]
+                    strategy = 'name_match'
+
+            resolved_by[strategy if section is not None else 'unresolved'] += 1
 
             # Si no hay seccion, saltar esta viga
             if section is None:
@@ -494,7 +472,10 @@ class BeamParser:
             if len(skipped_beams) > 20:
                 claude_logger.log_parsing_warning(f"... y {len(skipped_beams) - 20} vigas mas sin seccion")
 
-        logger.info(f"Frame beams: {len(beams)} importadas OK")
+        logger.info(
+            f"Frame beams: {len(beams)} importadas OK "
+            f"(sección por {', '.join(f'{k}={v}' for k, v in sorted(resolved_by.items()))})"
+        )
         return beams, beam_forces, stories
 
     def _parse_spandrels(
@@ -612,36 +593,21 @@ class BeamParser:
                 df_combos = forces_df[['_key', '_output_case', '_location', '_step_type', 'p', 'v2', 'v3', 't', 'm2', 'm3']].copy()
                 df_combos.columns = ['spandrel_key', 'name', 'location', 'step_type', 'P', 'V2', 'V3', 'T', 'M2', 'M3']
 
-                # AGRESIVO: Procesar spandrels en paralelo
-                grouped = df_combos.groupby('spandrel_key')
-                group_items = list(grouped)
-                
-                def process_spandrel_chunk(chunk_items):
-                    chunk_forces = {}
-                    for spandrel_key, group in chunk_items:
-                        parts = spandrel_key.split('_', 1)
-                        if len(parts) != 2 or len(group) == 0:
-                            continue
-                        story, spandrel_label = parts
-                        forces = ElementForces(
-                            label=spandrel_label,
-                            story=story,
-                            element_type=ElementForceType.BEAM
-                        )
-                        forces.set_combinations_from_df(group[COMBO_COLUMNS])
-                        chunk_forces[spandrel_key] = forces
-                    return chunk_forces
-                
-                n_workers = min(os.cpu_count() or 8, len(group_items))
-                if n_workers > 1 and len(group_items) > 20:
-                    chunk_size = max(1, len(group_items) // n_workers)
-                    chunks = [group_items[i:i+chunk_size] for i in range(0, len(group_items), chunk_size)]
-                    with ThreadPoolExecutor(max_workers=n_workers) as executor:
-                        results = list(executor.map(process_spandrel_chunk, chunks))
-                        for chunk_result in results:
-                            beam_forces.update(chunk_result)
-                else:
-                    beam_forces = process_spandrel_chunk(group_items)
+                # Un solo almacén columnar para toda la tabla; cada elemento es una vista
+                store, ranges = ForceStore.from_frame(df_combos, key_column='spandrel_key')
+
+                for spandrel_key, (start, stop) in ranges.items():
+                    parts = spandrel_key.split('_', 1)
+                    if len(parts) != 2:
+                        continue
+                    story, spandrel_label = parts
+                    forces = ElementForces(
+                        label=spandrel_label,
+                        story=story,
+                        element_type=ElementForceType.BEAM
+                    )
+                    forces.bind(store, start, stop)
+                    beam_forces[spandrel_key] = forces
 
         # 3. Crear vigas spandrel
         skipped_invalid = 0
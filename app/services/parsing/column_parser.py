@@ -13,8 +13,6 @@ para procesar tablas grandes (180k+ filas) eficientemente.
 from typing import Dict, List, Tuple, Optional
 import pandas as pd
 import numpy as np
-import os
-from concurrent.futures import ThreadPoolExecutor
 
 from ...domain.entities import (
     VerticalElement,
@@ -22,7 +20,7 @@ from ...domain.entities import (
     ElementForces,
     ElementForceType,
 )
-from ...domain.entities.element_forces import COMBO_COLUMNS
+from ...domain.entities.force_store import ForceStore
 from ...domain.constants.reinforcement import FY_DEFAULT_MPA
 from .material_mapper import parse_material_to_fc
 from .table_extractor import normalize_columns, extract_units_from_df
@@ -31,6 +29,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Tolerancia (m) para comparar una station con el extremo de su columna
+STATION_TOLERANCE = 0.001
+
 
 class ColumnParser:
     """
@@ -75,6 +76,30 @@ class ColumnParser:
 
         return columns, column_forces, stories
 
+    @staticmethod
+    def _station_locations(df: pd.DataFrame) -> np.ndarray:
+        """
+        Convierte station numérico a Top/Bottom/Middle (VECTORIZADO).
+
+        station = min de la columna -> Bottom, station = max -> Top, otros
+        -> Middle. El min/max de cada columna se difunde a sus filas con
+        groupby().transform() en lugar de evaluar fila por fila.
+        """
+        if 'station' not in df.columns:
+            return np.full(len(df), 'Middle', dtype=object)
+
+        station = df['station'].to_numpy(dtype=np.float64)
+        grouped = df.groupby('column_key', sort=False)['station']
+        station_min = grouped.transform('min').to_numpy(dtype=np.float64)
+        station_max = grouped.transform('max').to_numpy(dtype=np.float64)
+
+        return np.select(
+            [np.abs(station - station_min) < STATION_TOLERANCE,
+             np.abs(station - station_max) < STATION_TOLERANCE],
+            ['Bottom', 'Top'],
+            default='Middle'
+        ).astype(object)
+
     def _parse_section_definitions(
         self,
         df: pd.DataFrame,
@@ -205,10 +230,10 @@ class ColumnParser:
 
         # Calcular min/max station por columna (vectorizado con groupby)
         station_stats = df.groupby('column_key')['station'].agg(['min', 'max'])
-        column_heights = {
-            key: (row['min'], row['max'])
-            for key, row in station_stats.iterrows()
-        }
+        column_heights = dict(zip(
+            station_stats.index,
+            zip(station_stats['min'].to_numpy(), station_stats['max'].to_numpy())
+        ))
 
         # Obtener stories unicos (vectorizado)
         stories = df['story'].astype(str).unique().tolist()
@@ -224,26 +249,8 @@ class ColumnParser:
         )
         if has_valid_location:
             df['_location'] = df['location'].astype(str).replace('nan', 'Middle').replace('None', 'Middle').fillna('Middle')
-        elif 'station' in df.columns:
-            # Convertir station numérico a Top/Bottom/Middle
-            # station=0 o min → Bottom, station=max → Top, otros → Middle
-            def station_to_location(row):
-                station = row['station']
-                col_key = row['column_key']
-                if col_key not in column_heights:
-                    return 'Middle'
-                min_st, max_st = column_heights[col_key]
-                # Tolerancia para comparación de floats
-                tol = 0.001
-                if abs(station - min_st) < tol:
-                    return 'Bottom'
-                elif abs(station - max_st) < tol:
-                    return 'Top'
-                else:
-                    return 'Middle'
-            df['_location'] = df.apply(station_to_location, axis=1)
         else:
-            df['_location'] = 'Middle'
+            df['_location'] = self._station_locations(df)
 
         if 'output case' in df.columns:
             df['_output_case'] = df['output case'].astype(str).fillna('')
@@ -256,43 +263,13 @@ class ColumnParser:
             df['_step_type'] = ''
 
         # OPTIMIZADO: Renombrar columnas para match con COMBO_COLUMNS antes de agrupar
-        df_combos = df[['column_key', '_output_case', '_location', '_step_type', 'p', 'v2', 'v3', 't', 'm2', 'm3']].copy()
+        # (la selección ya es una copia)
+        df_combos = df[['column_key', '_output_case', '_location', '_step_type', 'p', 'v2', 'v3', 't', 'm2', 'm3']]
         df_combos.columns = ['column_key', 'name', 'location', 'step_type', 'P', 'V2', 'V3', 'T', 'M2', 'M3']
 
-        # AGRESIVO: Procesar grupos en PARALELO con todos los cores
-        grouped = df_combos.groupby('column_key')
-        group_items = list(grouped)
-        
-        # Función worker para procesar un chunk de grupos
-        def process_chunk(chunk_items):
-            chunk_forces = {}
-            for column_key, group in chunk_items:
-                parts = column_key.split('_', 1)
-                if len(parts) != 2 or len(group) == 0:
-                    continue
-                story, column_label = parts
-                forces = ElementForces(
-                    label=column_label,
-                    story=story,
-                    element_type=ElementForceType.COLUMN
-                )
-                forces.set_combinations_from_df(group[COMBO_COLUMNS])
-                chunk_forces[column_key] = forces
-            return chunk_forces
-        
-        # Dividir en chunks y procesar en paralelo
-        n_workers = min(os.cpu_count() or 8, len(group_items))
-        if n_workers > 1 and len(group_items) > 100:
-            chunk_size = max(1, len(group_items) // n_workers)
-            chunks = [group_items[i:i+chunk_size] for i in range(0, len(group_items), chunk_size)]
-            
-            with ThreadPoolExecutor(max_workers=n_workers) as executor:
-                results = list(executor.map(process_chunk, chunks))
-                for chunk_result in results:
-                    column_forces.update(chunk_result)
-        else:
-            # Secuencial para datasets pequeños
-            column_forces = process_chunk(group_items)
+        # Un solo almacén columnar para toda la tabla; cada elemento es una vista
+        store, ranges = ForceStore.from_frame(df_combos, key_column='column_key')
+        column_forces = ElementForces.views(store, ranges, ElementForceType.COLUMN)
 
         # Crear columnas con altura calculada
         skipped_columns = []
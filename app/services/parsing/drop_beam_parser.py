@@ -20,7 +20,7 @@ from ...domain.entities import (
 )
 from ...domain.entities.reinforcement import BeamReinforcement
 from ...domain.entities.section_cut import SectionCutInfo
-from ...domain.entities.element_forces import COMBO_COLUMNS
+from ...domain.entities.force_store import ForceStore
 from ...domain.constants.reinforcement import FY_DEFAULT_MPA
 from .table_extractor import normalize_columns
 
@@ -73,7 +73,7 @@ class DropBeamParser:
         """
         Parsea vigas capitel desde Section Cut Forces - Analysis.
 
-        OPTIMIZADO: Usa operaciones vectorizadas y set_combinations_from_df.
+        OPTIMIZADO: Usa operaciones vectorizadas y un ForceStore columnar.
 
         Args:
             section_cut_df: DataFrame con datos de Section Cut Forces
@@ -151,27 +151,26 @@ class DropBeamParser:
             'M3': df['m2']    # M2 -> M3
         })
 
-        # Agrupar por element_key
-        grouped = df_combos.groupby('element_key')
+        # Un solo almacén columnar para toda la tabla; cada section cut es una vista
+        store, ranges = ForceStore.from_frame(df_combos, key_column='element_key')
 
-        for element_key, group in grouped:
-            if len(group) == 0:
-                continue
+        # Primer section cut de cada element_key (sin filtrar el DataFrame por clave)
+        first_scut = df.drop_duplicates('_element_key').set_index('_element_key')['sectioncut']
 
+        for element_key, (start, stop) in ranges.items():
             # Obtener SectionCutInfo del cache (ya parseado)
-            scut_name = df[df['_element_key'] == element_key]['sectioncut'].iloc[0]
-            section_cut = section_cut_cache.get(scut_name)
+            section_cut = section_cut_cache.get(first_scut[element_key])
             if section_cut is None:
                 continue
 
-            # Crear ElementForces usando set_combinations_from_df
+            # Crear ElementForces como vista sobre el almacén
             forces = ElementForces(
                 label=section_cut.display_name,
                 story=section_cut.story,
                 element_type=ElementForceType.DROP_BEAM,
                 section_cut=section_cut
             )
-            forces.set_combinations_from_df(group[COMBO_COLUMNS])
+            forces.bind(store, start, stop)
             drop_beam_forces[element_key] = forces
 
             # Agregar story a la lista
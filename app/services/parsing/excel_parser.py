@@ -16,8 +16,8 @@ Tablas soportadas:
 """
 import logging
 import time
-from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,8 @@ from ...domain.entities import (
     ElementForceType,
     ParsedData,
 )
-from ...domain.entities.element_forces import COMBO_COLUMNS
+from ...domain.entities.force_store import ForceStore
+from ...domain.calculations import WallContinuityService
 from ...domain.constants.reinforcement import FY_DEFAULT_MPA
 from .material_mapper import parse_material_to_fc
 from .table_extractor import (
@@ -43,6 +44,8 @@ from .column_parser import ColumnParser
 from .beam_parser import BeamParser
 from .drop_beam_parser import DropBeamParser
 from .composite_pier_parser import CompositePierParser
+from .parse_pipeline import ParsePipeline, StageTiming
+from ..analysis.analysis_backend import BACKEND_PROCESS
 from ..logging import claude_logger
 
 
@@ -78,6 +81,44 @@ SUPPORTED_TABLES = {
 TABLE_KEYS = {key for _, key in TABLE_NAME_MAPPINGS}
 
 
+# =============================================================================
+# Etapas sin Estado del Pipeline
+# =============================================================================
+
+def _merge_stories(*results: tuple) -> List[str]:
+    """
+    Combina los pisos de cada parser sin duplicados.
+
+    Cada resultado es una tupla cuyo ultimo item es su lista de pisos; el
+    orden es el de los piers seguido de los pisos nuevos de los demas.
+    """
+    all_stories: List[str] = []
+    for result in results:
+        for story in result[-1]:
+            if story not in all_stories:
+                all_stories.append(story)
+    return all_stories
+
+
+def _analyze_continuity(
+    piers_result: Tuple[Dict[str, VerticalElement], List[str]],
+    stories: List[str],
+    hn_ft: Optional[float] = None
+) -> tuple:
+    """
+    Continuidad de muros e informacion del edificio.
+
+    Returns:
+        (continuity_info, building_info), o (None, None) sin piers o pisos
+    """
+    piers, _ = piers_result
+    if not piers or not stories:
+        return None, None
+    service = WallContinuityService()
+    continuity_info = service.analyze_continuity(piers=piers, stories=stories, hn_ft=hn_ft)
+    return continuity_info, service.get_building_info()
+
+
 # =============================================================================
 # Parser Principal
 # =============================================================================
@@ -139,140 +180,175 @@ class EtabsExcelParser:
     # FASE 2: Procesamiento desde Tablas Fusionadas
     # =========================================================================
 
-    def parse_from_tables(self, tables: Dict[str, pd.DataFrame]) -> ParsedData:
+    def parse_from_tables(
+        self,
+        tables: Dict[str, pd.DataFrame],
+        hn_ft: Optional[float] = None,
+        on_stage: Optional[Callable[[StageTiming, int, int], None]] = None,
+        backend: Optional[str] = None
+    ) -> ParsedData:
         """
         Procesa elementos desde tablas ya fusionadas.
 
+        Cada parser de tablas es una etapa de un ParsePipeline con sus
+        dependencias declaradas; las etapas independientes (piers, fuerzas,
+        columnas, vigas, vigas capitel) corren en paralelo.
+
         Args:
             tables: Dict con tablas fusionadas de multiples archivos
+            hn_ft: Altura del edificio en pies para la continuidad de muros
+                (opcional, se estima de los piers)
+            on_stage: Callback (timing, etapas_terminadas, total) por etapa
+            backend: 'thread' o 'process' (default: INGEO_PARSE_BACKEND)
 
         Returns:
-            ParsedData con elementos parseados
+            ParsedData con elementos parseados, continuidad de muros e
+            informacion del edificio
         """
         t0 = time.perf_counter()
 
-        # Extraer tablas del dict
-        wall_props_df = tables.get('wall_props')
-        pier_props_df = tables.get('pier_props')
-        pier_forces_df = tables.get('pier_forces')
-        frame_section_df = tables.get('frame_section')
-        frame_circular_df = tables.get('frame_circular')
-        frame_assigns_df = tables.get('frame_assigns')
-        column_forces_df = tables.get('column_forces')
-        beam_forces_df = tables.get('beam_forces')
-        spandrel_props_df = tables.get('spandrel_props')
-        spandrel_forces_df = tables.get('spandrel_forces')
-        section_cut_df = tables.get('section_cut')
-        walls_connectivity_df = tables.get('walls_connectivity')
-        points_connectivity_df = tables.get('points_connectivity')
-        pier_assigns_df = tables.get('pier_assigns')
-
-        # Procesar materiales
-        t1 = time.perf_counter()
-        materials: Dict[str, float] = {}
-        if wall_props_df is not None:
-            materials = self._parse_materials(wall_props_df)
-        if frame_section_df is not None:
-            frame_materials = self._parse_frame_materials(frame_section_df)
-            materials.update(frame_materials)
-        _perf_logger.info(f"[PERF] parse_materials: {time.perf_counter()-t1:.2f}s")
-
-        # Procesar piers
-        t1 = time.perf_counter()
-        piers, pier_stories = self._parse_piers(pier_props_df, materials)
-        _perf_logger.info(f"[PERF] parse_piers: {time.perf_counter()-t1:.2f}s ({len(piers)} piers)")
-
-        t1 = time.perf_counter()
-        pier_forces = self._parse_forces(pier_forces_df)
-        _perf_logger.info(f"[PERF] parse_pier_forces: {time.perf_counter()-t1:.2f}s ({len(pier_forces)} forces)")
-
-        # Geometria compuesta de piers (L, T, C)
-        t1 = time.perf_counter()
-        if walls_connectivity_df is not None and points_connectivity_df is not None:
-            # Extraer espesores de piers para usar como fallback
-            # (ETABS no incluye espesor en Area/Perimeter de Wall Object Connectivity)
-            pier_thicknesses: Dict[str, float] = {}
-            for key, pier in piers.items():
-                pier_thicknesses[key] = pier.thickness  # Ya está en mm desde _parse_piers
-            composite_sections = self.composite_pier_parser.parse_composite_piers(
-                walls_connectivity_df, points_connectivity_df, pier_assigns_df,
-                pier_thicknesses=pier_thicknesses
-            )
-            for key, pier in piers.items():
-                if key in composite_sections:
-                    pier.composite_section = composite_sections[key]
-        _perf_logger.info(f"[PERF] parse_composite: {time.perf_counter()-t1:.2f}s")
-
-        # OPTIMIZADO: Procesar columnas y vigas EN PARALELO
-        t1 = time.perf_counter()
-        columns = {}
-        column_forces = {}
-        column_stories = []
-        beams = {}
-        beam_forces = {}
-        beam_stories = []
-
-        def parse_columns_task():
-            if column_forces_df is not None:
-                return self.column_parser.parse_columns(
-                    frame_section_df, frame_assigns_df, column_forces_df, materials
-                )
-            return {}, {}, []
-
-        def parse_beams_task():
-            if beam_forces_df is not None or spandrel_forces_df is not None:
-                return self.beam_parser.parse_beams(
-                    frame_section_df, frame_assigns_df, beam_forces_df,
-                    spandrel_props_df, spandrel_forces_df,
-                    materials, frame_circular_df
-                )
-            return {}, {}, []
-
-        # Ejecutar ambos parsers en paralelo
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            col_future = executor.submit(parse_columns_task)
-            beam_future = executor.submit(parse_beams_task)
+        pipeline = self.build_pipeline(tables, hn_ft=hn_ft, backend=backend)
+        results = pipeline.run(on_stage=on_stage)
+
+        piers, _ = results['piers']
+        for key, section in results['composite'].items():
+            if key in piers:
+                piers[key].composite_section = section
+
+        columns, column_forces, _ = results['columns']
+        beams, beam_forces, _ = results['beams']
+        drop_beams, drop_beam_forces, _ = results['drop_beams']
+        continuity_info, building_info = results['continuity']
+
+        if any(t.backend == BACKEND_PROCESS for t in pipeline.timings):
+            # Las fuerzas parseadas en otro proceso llegan con un almacén por
+            # elemento (ElementForces.__getstate__): volver a uno por tabla
+            for forces in (results['pier_forces'], column_forces, beam_forces, drop_beam_forces):
+                ElementForces.share_store(forces)
+
+        _perf_logger.info(
+            f"[PERF] parse_from_tables TOTAL: {time.perf_counter()-t0:.2f}s "
+            f"({len(piers)} piers, {len(columns)} columns, {len(beams)} beams, "
+            f"{len(drop_beams)} drop_beams)"
+        )
 
-            columns, column_forces, column_stories = col_future.result()
-            beams, beam_forces, beam_stories = beam_future.result()
+        return ParsedData(
+            vertical_elements={**piers, **columns},
+            horizontal_elements={**beams, **drop_beams},
+            vertical_forces={**results['pier_forces'], **column_forces},
+            horizontal_forces={**beam_forces, **drop_beam_forces},
+            materials=results['materials'],
+            stories=results['stories'],
+            raw_tables=tables,
+            continuity_info=continuity_info,
+            building_info=building_info,
+        )
 
-        _perf_logger.info(f"[PERF] parse_columns+beams (parallel): {time.perf_counter()-t1:.2f}s ({len(columns)} columns, {len(beams)} beams)")
+    def build_pipeline(
+        self,
+        tables: Dict[str, pd.DataFrame],
+        hn_ft: Optional[float] = None,
+        backend: Optional[str] = None
+    ) -> ParsePipeline:
+        """
+        Declara las etapas de parseo y sus dependencias.
+
+        Etapas (-> dependencias):
+        - materials
+        - piers -> materials
+        - pier_forces
+        - composite -> piers (espesores como fallback)
+        - columns, beams, drop_beams -> materials
+        - stories -> piers, columns, beams, drop_beams
+        - continuity -> piers, stories
+
+        Las etapas `isolated` reciben sus tablas via functools.partial para
+        poder correr en otro proceso con el backend 'process'.
+        """
+        get = tables.get
+        pipeline = ParsePipeline(backend=backend)
+        pipeline.add('materials', partial(self._parse_all_materials, get('wall_props'), get('frame_section')))
+        pipeline.add('piers', partial(self._parse_piers, get('pier_props')),
+                     depends_on=('materials',), isolated=True)
+        pipeline.add('pier_forces', partial(self._parse_forces, get('pier_forces')), isolated=True)
+        pipeline.add('composite', partial(self._parse_composite, get('walls_connectivity'),
+                                          get('points_connectivity'), get('pier_assigns')),
+                     depends_on=('piers',), isolated=True)
+        pipeline.add('columns', partial(self._parse_columns, get('frame_section'), get('frame_assigns'),
+                                        get('column_forces')),
+                     depends_on=('materials',), isolated=True)
+        pipeline.add('beams', partial(self._parse_beams, get('frame_section'), get('frame_assigns'),
+                                      get('beam_forces'), get('spandrel_props'), get('spandrel_forces'),
+                                      get('frame_circular')),
+                     depends_on=('materials',), isolated=True)
+        pipeline.add('drop_beams', partial(self._parse_drop_beams, get('section_cut')),
+                     depends_on=('materials',), isolated=True)
+        pipeline.add('stories', _merge_stories, depends_on=('piers', 'columns', 'beams', 'drop_beams'))
+        pipeline.add('continuity', partial(_analyze_continuity, hn_ft=hn_ft),
+                     depends_on=('piers', 'stories'))
+        return pipeline
 
-        # Procesar vigas capitel (Section Cut Forces)
-        t1 = time.perf_counter()
-        drop_beams = {}
-        drop_beam_forces = {}
-        drop_beam_stories = []
-        if section_cut_df is not None:
-            drop_beams, drop_beam_forces, drop_beam_stories = self.drop_beam_parser.parse_drop_beams(
-                section_cut_df, materials
-            )
-        _perf_logger.info(f"[PERF] parse_drop_beams: {time.perf_counter()-t1:.2f}s ({len(drop_beams)} drop_beams)")
+    # =========================================================================
+    # Etapas del Pipeline
+    # =========================================================================
 
-        # Combinar stories sin duplicados
-        all_stories = pier_stories.copy()
-        for s in column_stories + beam_stories + drop_beam_stories:
-            if s not in all_stories:
-                all_stories.append(s)
+    def _parse_all_materials(
+        self,
+        wall_props_df: Optional[pd.DataFrame],
+        frame_section_df: Optional[pd.DataFrame]
+    ) -> Dict[str, float]:
+        """Mapeo material -> f'c de muros y secciones de frame."""
+        materials: Dict[str, float] = {}
+        if wall_props_df is not None:
+            materials = self._parse_materials(wall_props_df)
+        if frame_section_df is not None:
+            materials.update(self._parse_frame_materials(frame_section_df))
+        return materials
 
-        # Combinar elementos
-        vertical_elements = {**piers, **columns}
-        horizontal_elements = {**beams, **drop_beams}
-        vertical_forces = {**pier_forces, **column_forces}
-        horizontal_forces = {**beam_forces, **drop_beam_forces}
+    def _parse_composite(
+        self,
+        walls_connectivity_df: Optional[pd.DataFrame],
+        points_connectivity_df: Optional[pd.DataFrame],
+        pier_assigns_df: Optional[pd.DataFrame],
+        piers_result: Tuple[Dict[str, VerticalElement], List[str]]
+    ) -> Dict[str, Any]:
+        """Geometria compuesta de piers (L, T, C) por pier_key."""
+        piers, _ = piers_result
+        if not piers or walls_connectivity_df is None or points_connectivity_df is None:
+            return {}
+        # Espesores de piers como fallback
+        # (ETABS no incluye espesor en Area/Perimeter de Wall Object Connectivity)
+        pier_thicknesses = {key: pier.thickness for key, pier in piers.items()}
+        return self.composite_pier_parser.parse_composite_piers(
+            walls_connectivity_df, points_connectivity_df, pier_assigns_df,
+            pier_thicknesses=pier_thicknesses
+        )
 
-        _perf_logger.info(f"[PERF] parse_from_tables TOTAL: {time.perf_counter()-t0:.2f}s")
+    def _parse_columns(self, frame_section_df, frame_assigns_df, column_forces_df, materials):
+        """Columnas desde Element Forces - Columns."""
+        if column_forces_df is None:
+            return {}, {}, []
+        return self.column_parser.parse_columns(
+            frame_section_df, frame_assigns_df, column_forces_df, materials
+        )
 
-        return ParsedData(
-            vertical_elements=vertical_elements,
-            horizontal_elements=horizontal_elements,
-            vertical_forces=vertical_forces,
-            horizontal_forces=horizontal_forces,
-            materials=materials,
-            stories=all_stories,
-            raw_tables=tables,
+    def _parse_beams(self, frame_section_df, frame_assigns_df, beam_forces_df,
+                     spandrel_props_df, spandrel_forces_df, frame_circular_df, materials):
+        """Vigas (frames y spandrels)."""
+        if beam_forces_df is None and spandrel_forces_df is None:
+            return {}, {}, []
+        return self.beam_parser.parse_beams(
+            frame_section_df, frame_assigns_df, beam_forces_df,
+            spandrel_props_df, spandrel_forces_df,
+            materials, frame_circular_df
         )
 
+    def _parse_drop_beams(self, section_cut_df, materials):
+        """Vigas capitel desde Section Cut Forces."""
+        if section_cut_df is None:
+            return {}, {}, []
+        return self.drop_beam_parser.parse_drop_beams(section_cut_df, materials)
+
     # =========================================================================
     # Metodos de Parsing Internos
     # =========================================================================
@@ -492,26 +568,10 @@ class EtabsExcelParser:
         df_combos = df[['_key', '_output_case', '_location', '_step_type', 'p', 'v2', 'v3', 't', 'm2', 'm3']].copy()
         df_combos.columns = ['pier_key', 'name', 'location', 'step_type', 'P', 'V2', 'V3', 'T', 'M2', 'M3']
 
-        # Procesar por grupos usando set_combinations_from_df (SIN crear objetos)
-        grouped = df_combos.groupby('pier_key')
-
-        for pier_key, group in grouped:
-            parts = pier_key.split('_', 1)
-            if len(parts) != 2:
-                continue
-            story, pier_label = parts
-
-            if len(group) == 0:
-                continue
+        # Un solo almacén columnar para toda la tabla; cada pier es una vista
+        store, ranges = ForceStore.from_frame(df_combos, key_column='pier_key')
 
-            # OPTIMIZADO: Usar DataFrame directamente sin crear LoadCombination objects
-            forces = ElementForces(
-                label=pier_label,
-                story=story,
-                element_type=ElementForceType.PIER
-            )
-            forces.set_combinations_from_df(group[COMBO_COLUMNS])
-            pier_forces[pier_key] = forces
+        pier_forces = ElementForces.views(store, ranges, ElementForceType.PIER)
 
         return pier_forces
 
@@ -553,7 +613,7 @@ class EtabsExcelParser:
             'axes': sorted(list(axes)),
             'grillas': sorted(list(grillas)),
             'total_combinations': sum(
-                len(f.combinations) for f in data.vertical_forces.values()
+                f.n_combinations for f in data.vertical_forces.values()
             ),
             'materials': list(data.materials.keys()),
             'piers_list': [
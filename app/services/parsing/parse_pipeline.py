@@ -0,0 +1,224 @@
+# app/services/parsing/parse_pipeline.py
+"""
+Pipeline de parseo por etapas con dependencias explícitas (DAG).
+
+EtabsExcelParser.parse_from_tables() declara cada parser de tablas como una
+etapa con las etapas de las que depende (ej: piers después de materiales,
+continuidad después de piers y pisos). Las etapas independientes corren
+en paralelo y el tiempo de cada una queda registrado para el progreso del
+upload-stream.
+
+Backends:
+- 'thread' (default): todas las etapas en un ThreadPoolExecutor.
+- 'process': las etapas marcadas `isolated` (parsers pesados de pandas)
+  corren en un ProcessPoolExecutor; su función y sus entradas deben ser
+  picklables (métodos de nivel de instancia envueltos en functools.partial).
+  Las etapas livianas siguen en threads del proceso principal. Los
+  resultados vuelven por pickle: EtabsExcelParser reúne las fuerzas en un
+  almacén por tabla (ElementForces.share_store).
+
+Selección: parámetro explícito, o variable de entorno INGEO_PARSE_BACKEND
+(si no está definida se usa la misma que el análisis, INGEO_ANALYSIS_BACKEND).
+Workers: parámetro explícito, INGEO_PARSE_WORKERS o 4 (threads: las etapas
+son pocas y pandas libera el GIL en buena parte del trabajo).
+"""
+import logging
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..analysis.analysis_backend import (
+    BACKEND_PROCESS, BACKEND_THREAD, DEFAULT_MAX_WORKERS, init_worker_process, resolve_backend,
+    resolve_workers,
+)
+
+_perf_logger = logging.getLogger('perf')
+
+# Fase de los eventos de progreso del upload-stream por etapa de parseo
+PARSE_PHASE = 'parsing'
+
+
+# =============================================================================
+# ETAPAS
+# =============================================================================
+
+@dataclass(frozen=True)
+class ParseStage:
+    """
+    Etapa del pipeline.
+
+    `fn` recibe como argumentos posicionales los resultados de
+    `depends_on`, en el orden declarado.
+    """
+    name: str
+    fn: Callable[..., Any]
+    depends_on: Tuple[str, ...] = ()
+    isolated: bool = False  # Puede correr en otro proceso
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """Tiempo de ejecución de una etapa."""
+    name: str
+    seconds: float      # Duración de la etapa
+    started: float      # Inicio, en segundos desde el inicio del pipeline
+    backend: str        # 'thread' o 'process'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'seconds': round(self.seconds, 4),
+            'started': round(self.started, 4),
+            'backend': self.backend,
+        }
+
+
+def _timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    """Ejecuta fn(*args) y retorna (resultado, segundos). Picklable."""
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+class ParsePipeline:
+    """
+    Ejecuta un DAG de etapas de parseo.
+
+    Example:
+        pipeline = ParsePipeline()
+        pipeline.add('materials', parse_materials)
+        pipeline.add('piers', partial(parse_piers, df), depends_on=('materials',))
+        results = pipeline.run(on_stage=lambda timing, done, total: ...)
+        pipeline.timings  # List[StageTiming] en orden de término
+    """
+
+    def __init__(self, backend: Optional[str] = None, max_workers: Optional[int] = None):
+        self.backend = resolve_backend(backend or os.environ.get('INGEO_PARSE_BACKEND'))
+        self.max_workers = resolve_workers(
+            max_workers, 'INGEO_PARSE_WORKERS', default=DEFAULT_MAX_WORKERS
+        )
+        self.timings: List[StageTiming] = []
+        self._stages: Dict[str, ParseStage] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        depends_on: Tuple[str, ...] = (),
+        isolated: bool = False
+    ) -> None:
+        """
+        Agrega una etapa.
+
+        Raises:
+            ValueError: Si ya existe una etapa con ese nombre
+        """
+        if name in self._stages:
+            raise ValueError(f"Etapa duplicada: {name}")
+        self._stages[name] = ParseStage(name, fn, tuple(depends_on), isolated)
+
+    @property
+    def stages(self) -> List[str]:
+        """Nombres de las etapas en orden de declaración."""
+        return list(self._stages)
+
+    def _validate(self) -> None:
+        """
+        Verifica que las dependencias existan y no formen ciclos.
+
+        Raises:
+            ValueError: Dependencia desconocida o ciclo
+        """
+        for stage in self._stages.values():
+            unknown = [d for d in stage.depends_on if d not in self._stages]
+            if unknown:
+                raise ValueError(f"Etapa '{stage.name}' depende de etapas inexistentes: {unknown}")
+
+        resolved: set = set()
+        pending = dict(self._stages)
+        while pending:
+            ready = [n for n, s in pending.items() if all(d in resolved for d in s.depends_on)]
+            if not ready:
+                raise ValueError(f"Dependencias circulares entre etapas: {sorted(pending)}")
+            for name in ready:
+                resolved.add(name)
+                del pending[name]
+
+    def run(
+        self,
+        on_stage: Optional[Callable[[StageTiming, int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta todas las etapas respetando sus dependencias.
+
+        Args:
+            on_stage: Callback (timing, etapas_terminadas, total) llamado
+                desde el thread que ejecuta run() al terminar cada etapa
+
+        Returns:
+            Dict {nombre_etapa: resultado}
+
+        Raises:
+            ValueError: Si el DAG no es válido
+            Exception: La primera excepción de una etapa (las demás etapas
+                en curso terminan, las pendientes no se inician)
+        """
+        self._validate()
+        self.timings = []
+        results: Dict[str, Any] = {}
+        total = len(self._stages)
+        if not total:
+            return results
+
+        use_processes = self.backend == BACKEND_PROCESS and any(
+            s.isolated for s in self._stages.values()
+        )
+        t0 = time.perf_counter()
+        threads = ThreadPoolExecutor(max_workers=self.max_workers)
+        processes = (ProcessPoolExecutor(max_workers=min(self.max_workers, os.cpu_count() or 1),
+                                         initializer=init_worker_process)
+                     if use_processes else None)
+        if processes is not None:
+            # Con 'fork' todos los workers se crean en el primer submit:
+            # crearlos antes de iniciar etapas en threads evita que hereden
+            # locks tomados por una etapa en curso (deadlock en el hijo)
+            processes.submit(int).result()
+        running: Dict[Future, Tuple[ParseStage, float]] = {}
+        pending = dict(self._stages)
+        try:
+            while pending or running:
+                for name in [n for n, s in pending.items() if all(d in results for d in s.depends_on)]:
+                    stage = pending.pop(name)
+                    executor = processes if (processes and stage.isolated) else threads
+                    args = [results[d] for d in stage.depends_on]
+                    future = executor.submit(_timed, stage.fn, *args)
+                    running[future] = (stage, time.perf_counter() - t0)
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, started = running.pop(future)
+                    results[stage.name], seconds = future.result()
+                    timing = StageTiming(
+                        name=stage.name,
+                        seconds=seconds,
+                        started=started,
+                        backend=BACKEND_PROCESS if (processes and stage.isolated) else BACKEND_THREAD,
+                    )
+                    self.timings.append(timing)
+                    _perf_logger.info(f"[PERF] parse_{stage.name}: {seconds:.2f}s ({timing.backend})")
+                    if on_stage is not None:
+                        on_stage(timing, len(self.timings), total)
+        finally:
+            threads.shutdown(wait=True, cancel_futures=True)
+            if processes is not None:
+                processes.shutdown(wait=True, cancel_futures=True)
+
+        return results
@@ -0,0 +1,81 @@
+# app/services/parsing/section_index.py
+"""
+Índice de nombres de sección para resolver la sección de una viga por nombre.
+
+Cuando una viga no tiene asignación ni sección en la tabla de fuerzas, se
+busca la primera sección (en orden de definición) cuyo nombre contiene al
+label de la viga o está contenido en él. Recorrer todas las secciones por
+viga es O(vigas × secciones); este índice responde cada label en tiempo
+proporcional a len(label)² con dos diccionarios:
+
+- contained: substring de algún nombre -> primera sección que lo contiene
+  (cubre `label in nombre`)
+- exact: nombre -> primera sección con ese nombre (cubre `nombre in label`
+  recorriendo los substrings del label)
+
+Ambos se construyen una vez por parseo, en el primer uso, y el resultado
+de cada label se memoriza (el mismo label se repite en todos los pisos).
+"""
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+def _substrings(text: str) -> Iterator[str]:
+    """Todos los substrings no vacíos de text."""
+    n = len(text)
+    for start in range(n):
+        for stop in range(start + 1, n + 1):
+            yield text[start:stop]
+
+
+class SectionNameIndex:
+    """
+    Búsqueda por substring con el mismo desempate que el recorrido lineal:
+    gana la sección definida primero.
+
+    Example:
+        index = SectionNameIndex(section_defs)
+        name = index.find('B12')  # None si ninguna sección coincide
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self._names: List[str] = list(names)
+        self._contained: Optional[Dict[str, int]] = None
+        self._exact: Dict[str, int] = {}
+        self._memo: Dict[str, Optional[str]] = {}
+
+    def _build(self) -> None:
+        contained: Dict[str, int] = {}
+        for i, name in enumerate(self._names):
+            self._exact.setdefault(name, i)
+            for sub in _substrings(name):
+                contained.setdefault(sub, i)
+        self._contained = contained
+
+    def find(self, label: str) -> Optional[str]:
+        """
+        Primera sección tal que `label in nombre or nombre in label`.
+
+        Returns:
+            Nombre de la sección, o None si ninguna coincide
+        """
+        if label in self._memo:
+            return self._memo[label]
+        if self._contained is None:
+            self._build()
+
+        candidates: List[int] = []
+        if not label:
+            # '' está contenido en cualquier nombre
+            if self._names:
+                candidates.append(0)
+        elif label in self._contained:
+            candidates.append(self._contained[label])
+
+        # Nombres contenidos en el label ('' está contenido en cualquier label)
+        if '' in self._exact:
+            candidates.append(self._exact[''])
+        candidates.extend(self._exact[sub] for sub in _substrings(label) if sub in self._exact)
+
+        result = self._names[min(candidates)] if candidates else None
+        self._memo[label] = result
+        return result
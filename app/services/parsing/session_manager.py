@@ -3,12 +3,14 @@
 Gestión de sesiones para el análisis estructural.
 Maneja el cache de datos parseados y actualizaciones de armadura.
 """
-from typing import Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List
 import pandas as pd
 import logging
 
 from .excel_parser import EtabsExcelParser, ParsedData
-from ...domain.calculations import WallContinuityService
+from .parse_pipeline import StageTiming
+from .session_store import SessionStore
+from .table_extractor import concat_tables, with_units_row
 from ...domain.entities.coupling_beam import CouplingBeamConfig, PierCouplingConfig
 from ...domain.constants.reinforcement import FY_DEFAULT_MPA
 from ..logging import claude_logger
@@ -21,15 +23,18 @@ class SessionManager:
     Gestiona las sesiones de análisis estructural.
 
     Responsabilidades:
-    - Almacenar datos parseados por session_id
+    - Almacenar datos parseados por session_id (SessionStore acotado en memoria)
     - Aplicar actualizaciones de armadura a piers
     - Limpiar sesiones expiradas
+
+    Los métodos que escriben en una sesión la fijan en memoria
+    (SessionStore.pinned) mientras escriben: si se desalojara a mitad, lo
+    escrito después de serializarla se perdería al recargarla.
     """
 
-    def __init__(self):
-        self._cache: Dict[str, ParsedData] = {}
+    def __init__(self, store: Optional[SessionStore] = None):
+        self._cache: SessionStore = store if store is not None else SessionStore()
         self._excel_parser = EtabsExcelParser()
-        self._continuity_service = WallContinuityService()
 
     # =========================================================================
     # NUEVO FLUJO: Acumular → Fusionar → Procesar
@@ -64,40 +69,44 @@ class SessionManager:
         # Extraer tablas del archivo
         tables = self._excel_parser.extract_tables_only(file_content)
 
-        # Crear sesión si no existe
-        if session_id not in self._cache:
-            self._cache[session_id] = ParsedData()
+        # Fijada mientras se escribe: un desalojo a mitad perdería lo escrito
+        with self._cache.pinned(session_id):
+            # Crear sesión si no existe
+            if session_id not in self._cache:
+                self._cache[session_id] = ParsedData()
+
+            parsed_data = self._cache[session_id]
+
+            # Acumular tablas
+            for key, df in tables.items():
+                if key not in parsed_data.accumulated_tables:
+                    parsed_data.accumulated_tables[key] = []
+                parsed_data.accumulated_tables[key].append(df)
+            self._cache.refresh(session_id)
+
+            # Generar resumen de tablas encontradas
+            tables_found = list(tables.keys())
+            total_accumulated = {
+                k: len(v) for k, v in parsed_data.accumulated_tables.items()
+            }
 
-        parsed_data = self._cache[session_id]
+            logger.info(
+                f"Session {session_id}: Acumuladas {len(tables)} tablas. "
+                f"Total: {total_accumulated}"
+            )
 
-        # Acumular tablas
-        for key, df in tables.items():
-            if key not in parsed_data.accumulated_tables:
-                parsed_data.accumulated_tables[key] = []
-            parsed_data.accumulated_tables[key].append(df)
-
-        # Generar resumen de tablas encontradas
-        tables_found = list(tables.keys())
-        total_accumulated = {
-            k: len(v) for k, v in parsed_data.accumulated_tables.items()
-        }
-
-        logger.info(
-            f"Session {session_id}: Acumuladas {len(tables)} tablas. "
-            f"Total: {total_accumulated}"
-        )
-
-        return {
-            'success': True,
-            'session_id': session_id,
-            'tables_found': tables_found,
-            'total_accumulated': total_accumulated
-        }
+            return {
+                'success': True,
+                'session_id': session_id,
+                'tables_found': tables_found,
+                'total_accumulated': total_accumulated
+            }
 
     def process_session(
         self,
         session_id: str,
-        hn_ft: Optional[float] = None
+        hn_ft: Optional[float] = None,
+        on_stage: Optional[Callable[[StageTiming, int, int], None]] = None
     ) -> Dict[str, Any]:
         """
         Fusiona tablas acumuladas y procesa elementos.
@@ -107,78 +116,85 @@ class SessionManager:
         Args:
             session_id: ID de sesión
             hn_ft: Altura del edificio en pies (opcional)
+            on_stage: Callback (timing, etapas_terminadas, total) por etapa
+                de parseo terminada
 
         Returns:
-            Dict con resumen de elementos parseados
+            Dict con resumen de elementos parseados y tiempos por etapa
+            ('parse_timings')
         """
-        if session_id not in self._cache:
-            return {'success': False, 'error': 'Session not found'}
+        with self._cache.pinned(session_id):
+            if session_id not in self._cache:
+                return {'success': False, 'error': 'Session not found'}
 
-        parsed_data = self._cache[session_id]
+            parsed_data = self._cache[session_id]
 
-        if not parsed_data.accumulated_tables:
-            return {'success': False, 'error': 'No tables accumulated'}
+            if not parsed_data.accumulated_tables:
+                return {'success': False, 'error': 'No tables accumulated'}
 
-        # Fusionar tablas del mismo tipo
-        merged_tables: Dict[str, pd.DataFrame] = {}
-        logger.info(f"[process_session] Tablas acumuladas: {list(parsed_data.accumulated_tables.keys())}")
-        for key, df_list in parsed_data.accumulated_tables.items():
-            if len(df_list) == 1:
-                merged_tables[key] = df_list[0]
-                logger.info(f"[process_session] Tabla '{key}': 1 archivo, {len(df_list[0])} filas")
+            # Fusionar tablas del mismo tipo
+            merged_tables: Dict[str, pd.DataFrame] = {}
+            logger.info(f"[process_session] Tablas acumuladas: {list(parsed_data.accumulated_tables.keys())}")
+            for key, df_list in parsed_data.accumulated_tables.items():
+                if len(df_list) == 1:
+                    merged_tables[key] = df_list[0]
+                    logger.info(f"[process_session] Tabla '{key}': 1 archivo, {len(df_list[0])} filas")
+                else:
+                    # Concatenar DataFrames del mismo tipo
+                    merged_tables[key] = concat_tables(df_list)
+                    logger.info(f"[process_session] Fusionadas {len(df_list)} tablas '{key}' -> {len(merged_tables[key])} filas")
+
+            logger.info(f"[process_session] Tablas fusionadas: {list(merged_tables.keys())}")
+            if 'frame_section' in merged_tables:
+                logger.info(f"[process_session] frame_section tiene {len(merged_tables['frame_section'])} filas")
             else:
-                # Concatenar DataFrames del mismo tipo
-                merged_tables[key] = pd.concat(df_list, ignore_index=True)
-                logger.info(f"[process_session] Fusionadas {len(df_list)} tablas '{key}' -> {len(merged_tables[key])} filas")
+                logger.warning("[process_session] NO SE ENCONTRÓ frame_section en tablas fusionadas!")
 
-        logger.info(f"[process_session] Tablas fusionadas: {list(merged_tables.keys())}")
-        if 'frame_section' in merged_tables:
-            logger.info(f"[process_session] frame_section tiene {len(merged_tables['frame_section'])} filas")
-        else:
-            logger.warning("[process_session] NO SE ENCONTRÓ frame_section en tablas fusionadas!")
-
-        # Procesar elementos desde tablas fusionadas
-        new_parsed = self._excel_parser.parse_from_tables(merged_tables)
-
-        # Copiar datos procesados a la sesión actual
-        parsed_data.vertical_elements = new_parsed.vertical_elements
-        parsed_data.horizontal_elements = new_parsed.horizontal_elements
-        parsed_data.vertical_forces = new_parsed.vertical_forces
-        parsed_data.horizontal_forces = new_parsed.horizontal_forces
-        parsed_data.materials = new_parsed.materials
-        parsed_data.stories = new_parsed.stories
-        parsed_data.raw_tables = merged_tables  # Guardar tablas fusionadas
-
-        # Calcular continuidad de muros
-        from ...domain.entities import VerticalElementSource
-        piers = {k: v for k, v in parsed_data.vertical_elements.items()
-                 if v.source == VerticalElementSource.PIER}
-
-        if piers and parsed_data.stories:
-            continuity_info = self._continuity_service.analyze_continuity(
-                piers=piers,
-                stories=parsed_data.stories,
-                hn_ft=hn_ft
+            # Procesar elementos desde tablas fusionadas (pipeline por etapas,
+            # incluye la continuidad de muros)
+            timings: List[StageTiming] = []
+
+            def stage_done(timing: StageTiming, done: int, total: int) -> None:
+                timings.append(timing)
+                if on_stage is not None:
+                    on_stage(timing, done, total)
+
+            new_parsed = self._excel_parser.parse_from_tables(
+                merged_tables, hn_ft=hn_ft, on_stage=stage_done
             )
-            parsed_data.continuity_info = continuity_info
-            parsed_data.building_info = self._continuity_service.get_building_info()
-
-        # Generar resumen
-        summary = self._excel_parser.get_summary(parsed_data)
-
-        if parsed_data.building_info:
-            summary['building'] = {
-                'n_stories': parsed_data.building_info.n_stories,
-                'hn_ft': round(parsed_data.building_info.hn_ft, 1),
-                'hn_m': round(parsed_data.building_info.hn_m, 2),
-                'total_height_mm': round(parsed_data.building_info.total_height_mm, 0)
-            }
 
-        return {
-            'success': True,
-            'session_id': session_id,
-            'summary': summary
-        }
+            # Copiar datos procesados a la sesión actual
+            parsed_data.vertical_elements = new_parsed.vertical_elements
+            parsed_data.horizontal_elements = new_parsed.horizontal_elements
+            parsed_data.vertical_forces = new_parsed.vertical_forces
+            parsed_data.horizontal_forces = new_parsed.horizontal_forces
+            parsed_data.materials = new_parsed.materials
+            parsed_data.stories = new_parsed.stories
+            parsed_data.raw_tables = merged_tables  # Guardar tablas fusionadas
+
+            if new_parsed.continuity_info is not None:
+                parsed_data.continuity_info = new_parsed.continuity_info
+                parsed_data.building_info = new_parsed.building_info
+
+            self._cache.refresh(session_id)
+
+            # Generar resumen
+            summary = self._excel_parser.get_summary(parsed_data)
+
+            if parsed_data.building_info:
+                summary['building'] = {
+                    'n_stories': parsed_data.building_info.n_stories,
+                    'hn_ft': round(parsed_data.building_info.hn_ft, 1),
+                    'hn_m': round(parsed_data.building_info.hn_m, 2),
+                    'total_height_mm': round(parsed_data.building_info.total_height_mm, 0)
+                }
+
+            return {
+                'success': True,
+                'session_id': session_id,
+                'summary': summary,
+                'parse_timings': [timing.to_dict() for timing in timings]
+            }
 
     def get_raw_tables(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -203,27 +219,46 @@ class SessionManager:
         if not tables and parsed_data.accumulated_tables:
             for key, df_list in parsed_data.accumulated_tables.items():
                 if df_list:
-                    tables[key] = df_list[0] if len(df_list) == 1 else pd.concat(df_list)
+                    tables[key] = concat_tables(df_list)
 
         for key, df in tables.items():
             if df is not None and not df.empty:
                 # Convertir DataFrame a formato JSON-serializable
                 result[key] = {
                     'columns': [str(c) for c in df.columns.tolist()],
-                    'rows': df.head(100).fillna('').astype(str).values.tolist(),
+                    'rows': with_units_row(df.head(100)).fillna('').astype(str).values.tolist(),
                     'total_rows': len(df)
                 }
 
         return result
 
     def get_session(self, session_id: str) -> Optional[ParsedData]:
-        """Obtiene los datos de una sesión."""
+        """Obtiene los datos de una sesión (recargada de disco si fue desalojada)."""
         return self._cache.get(session_id)
 
     def has_session(self, session_id: str) -> bool:
         """Verifica si existe una sesión."""
         return session_id in self._cache
 
+    def register_session(self, session_id: str, parsed_data: ParsedData) -> None:
+        """Registra una sesión ya construida (ej: proyecto cargado desde disco)."""
+        self._cache[session_id] = parsed_data
+
+    def pinned(self, session_id: str):
+        """
+        Context manager que evita desalojar la sesión mientras dura el bloque
+        (análisis e informes que escriben resultados en ella).
+        """
+        return self._cache.pinned(session_id)
+
+    def update_session_size(self, session_id: str) -> None:
+        """Re-estima la memoria de una sesión tras hacerla crecer (ej: análisis)."""
+        self._cache.refresh(session_id)
+
+    def get_store_stats(self) -> Dict[str, Any]:
+        """Estado del almacén de sesiones (memoria, desalojos, recargas)."""
+        return self._cache.stats()
+
     # =========================================================================
     # Validación (centralizada para evitar duplicación)
     # =========================================================================
@@ -263,11 +298,8 @@ class SessionManager:
     # =========================================================================
 
     def clear_session(self, session_id: str) -> bool:
-        """Elimina una sesión del cache."""
-        if session_id in self._cache:
-            del self._cache[session_id]
-            return True
-        return False
+        """Elimina una sesión del cache (y su copia desalojada en disco)."""
+        return self._cache.pop(session_id)
 
     # =========================================================================
     # Métodos de acceso a elementos
@@ -432,28 +464,29 @@ class SessionManager:
         Returns:
             True si se aplicó la configuración
         """
-        parsed_data = self.get_session(session_id)
-        if not parsed_data:
-            return False
-
-        beam = CouplingBeamConfig(
-            width=kwargs.get('width', 200),
-            height=kwargs.get('height', 500),
-            ln=kwargs.get('ln', 1500),
-            n_bars_top=kwargs.get('n_bars_top', 3),
-            diameter_top=kwargs.get('diameter_top', 16),
-            n_bars_bottom=kwargs.get('n_bars_bottom', 3),
-            diameter_bottom=kwargs.get('diameter_bottom', 16),
-            stirrup_diameter=kwargs.get('stirrup_diameter', 10),
-            stirrup_spacing=kwargs.get('stirrup_spacing', 150),
-            n_legs=kwargs.get('n_legs', 2),
-            fy=kwargs.get('fy', FY_DEFAULT_MPA),
-            fc=kwargs.get('fc', 25),
-            cover=kwargs.get('cover', 40),
-        )
-
-        parsed_data.default_coupling_beam = beam
-        return True
+        with self._cache.pinned(session_id):
+            parsed_data = self.get_session(session_id)
+            if not parsed_data:
+                return False
+
+            beam = CouplingBeamConfig(
+                width=kwargs.get('width', 200),
+                height=kwargs.get('height', 500),
+                ln=kwargs.get('ln', 1500),
+                n_bars_top=kwargs.get('n_bars_top', 3),
+                diameter_top=kwargs.get('diameter_top', 16),
+                n_bars_bottom=kwargs.get('n_bars_bottom', 3),
+                diameter_bottom=kwargs.get('diameter_bottom', 16),
+                stirrup_diameter=kwargs.get('stirrup_diameter', 10),
+                stirrup_spacing=kwargs.get('stirrup_spacing', 150),
+                n_legs=kwargs.get('n_legs', 2),
+                fy=kwargs.get('fy', FY_DEFAULT_MPA),
+                fc=kwargs.get('fc', 25),
+                cover=kwargs.get('cover', 40),
+            )
+
+            parsed_data.default_coupling_beam = beam
+            return True
 
     def get_default_coupling_beam(
         self,
@@ -496,29 +529,30 @@ class SessionManager:
         Returns:
             True si se aplicó la configuración
         """
-        parsed_data = self.get_session(session_id)
-        if not parsed_data or pier_key not in parsed_data.vertical_elements:
-            return False
-
-        # Crear vigas específicas si se proveen configs
-        beam_left = None
-        if beam_left_config:
-            beam_left = CouplingBeamConfig(**beam_left_config)
-
-        beam_right = None
-        if beam_right_config:
-            beam_right = CouplingBeamConfig(**beam_right_config)
-
-        config = PierCouplingConfig(
-            pier_key=pier_key,
-            beam_left=beam_left,
-            beam_right=beam_right,
-            has_beam_left=has_beam_left,
-            has_beam_right=has_beam_right
-        )
+        with self._cache.pinned(session_id):
+            parsed_data = self.get_session(session_id)
+            if not parsed_data or pier_key not in parsed_data.vertical_elements:
+                return False
+
+            # Crear vigas específicas si se proveen configs
+            beam_left = None
+            if beam_left_config:
+                beam_left = CouplingBeamConfig(**beam_left_config)
+
+            beam_right = None
+            if beam_right_config:
+                beam_right = CouplingBeamConfig(**beam_right_config)
+
+            config = PierCouplingConfig(
+                pier_key=pier_key,
+                beam_left=beam_left,
+                beam_right=beam_right,
+                has_beam_left=has_beam_left,
+                has_beam_right=has_beam_right
+            )
 
-        parsed_data.pier_coupling_configs[pier_key] = config
-        return True
+            parsed_data.pier_coupling_configs[pier_key] = config
+            return True
 
     # =========================================================================
     # CACHE DE RESULTADOS DE ANÁLISIS
@@ -528,7 +562,8 @@ class SessionManager:
         self,
         session_id: str,
         element_key: str,
-        result: Dict[str, Any]
+        result: Dict[str, Any],
+        fingerprint: Optional[str] = None
     ) -> bool:
         """
         Almacena el resultado de análisis de un elemento.
@@ -539,16 +574,91 @@ class SessionManager:
             session_id: ID de sesión
             element_key: Clave del elemento (ej: "Cielo P1_PFel-A20-2")
             result: Resultado formateado del análisis
+            fingerprint: Huella de las entradas del análisis (análisis incremental)
 
         Returns:
             True si se almacenó correctamente
         """
+        with self._cache.pinned(session_id):
+            parsed_data = self.get_session(session_id)
+            if not parsed_data:
+                return False
+
+            parsed_data.analysis_cache[element_key] = result
+            if fingerprint is not None:
+                parsed_data.analysis_fingerprints[element_key] = fingerprint
+            else:
+                parsed_data.analysis_fingerprints.pop(element_key, None)
+            return True
+
+    def get_valid_analysis_result(
+        self,
+        session_id: str,
+        element_key: str,
+        fingerprint: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene el resultado cacheado solo si fue calculado con las mismas entradas.
+
+        Args:
+            session_id: ID de sesión
+            element_key: Clave del elemento
+            fingerprint: Huella actual de las entradas del análisis
+
+        Returns:
+            Resultado formateado, o None si no existe o está desactualizado
+        """
         parsed_data = self.get_session(session_id)
         if not parsed_data:
-            return False
+            return None
+
+        if parsed_data.analysis_fingerprints.get(element_key) != fingerprint:
+            return None
+        return parsed_data.analysis_cache.get(element_key)
+
+    def invalidate_element(self, session_id: str, element_key: str) -> bool:
+        """
+        Descarta el resultado y las curvas P-M cacheadas de un elemento.
+
+        Args:
+            session_id: ID de sesión
+            element_key: Clave del elemento
+
+        Returns:
+            True si la sesión existe
+        """
+        with self._cache.pinned(session_id):
+            parsed_data = self.get_session(session_id)
+            if not parsed_data:
+                return False
+
+            parsed_data.analysis_cache.pop(element_key, None)
+            parsed_data.analysis_fingerprints.pop(element_key, None)
+            parsed_data.interaction_curves.pop(element_key, None)
+            return True
+
+    def retain_analysis_results(self, session_id: str, element_keys) -> bool:
+        """
+        Descarta resultados y curvas de elementos que ya no existen.
+
+        Args:
+            session_id: ID de sesión
+            element_keys: Claves de los elementos vigentes
 
-        parsed_data.analysis_cache[element_key] = result
-        return True
+        Returns:
+            True si la sesión existe
+        """
+        with self._cache.pinned(session_id):
+            parsed_data = self.get_session(session_id)
+            if not parsed_data:
+                return False
+
+            keep = set(element_keys)
+            for cache in (parsed_data.analysis_cache, parsed_data.analysis_fingerprints,
+                          parsed_data.interaction_curves):
+                for key in [k for k in cache if k not in keep]:
+                    del cache[key]
+            return True
 
     def get_analysis_result(
         self,
@@ -583,14 +693,16 @@ class SessionManager:
         Returns:
             True si se limpió correctamente
         """
-        parsed_data = self.get_session(session_id)
-        if not parsed_data:
-            return False
+        with self._cache.pinned(session_id):
+            parsed_data = self.get_session(session_id)
+            if not parsed_data:
+                return False
 
-        parsed_data.analysis_cache.clear()
-        # También limpiar curvas P-M (dependen de la armadura)
-        parsed_data.interaction_curves.clear()
-        return True
+            parsed_data.analysis_cache.clear()
+            parsed_data.analysis_fingerprints.clear()
+            # También limpiar curvas P-M (dependen de la armadura)
+            parsed_data.interaction_curves.clear()
+            return True
 
     # =========================================================================
     # CACHE DE CURVAS DE INTERACCIÓN P-M
@@ -601,7 +713,7 @@ class SessionManager:
         session_id: str,
         element_key: str,
         direction: str,
-        curve: List[Any]
+        curve: Any
     ) -> bool:
         """
         Almacena una curva de interacción P-M para un elemento.
@@ -614,27 +726,28 @@ class SessionManager:
             session_id: ID de sesión
             element_key: Clave del elemento (Story_Label)
             direction: 'primary' o 'secondary'
-            curve: Lista de InteractionPoint
+            curve: InteractionCurve (de solo lectura, compartible)
 
         Returns:
             True si se guardó correctamente
         """
-        parsed_data = self.get_session(session_id)
-        if not parsed_data:
-            return False
+        with self._cache.pinned(session_id):
+            parsed_data = self.get_session(session_id)
+            if not parsed_data:
+                return False
 
-        if element_key not in parsed_data.interaction_curves:
-            parsed_data.interaction_curves[element_key] = {}
+            if element_key not in parsed_data.interaction_curves:
+                parsed_data.interaction_curves[element_key] = {}
 
-        parsed_data.interaction_curves[element_key][direction] = curve
-        return True
+            parsed_data.interaction_curves[element_key][direction] = curve
+            return True
 
     def get_interaction_curve(
         self,
         session_id: str,
         element_key: str,
         direction: str = 'primary'
-    ) -> Optional[List[Any]]:
+    ) -> Optional[Any]:
         """
         Obtiene una curva de interacción P-M previamente calculada.
 
@@ -644,7 +757,7 @@ class SessionManager:
             direction: 'primary' o 'secondary'
 
         Returns:
-            Lista de InteractionPoint o None si no existe
+            InteractionCurve o None si no existe
         """
         parsed_data = self.get_session(session_id)
         if not parsed_data:
@@ -668,12 +781,13 @@ class SessionManager:
         Returns:
             True si se limpió correctamente
         """
-        parsed_data = self.get_session(session_id)
-        if not parsed_data:
-            return False
+        with self._cache.pinned(session_id):
+            parsed_data = self.get_session(session_id)
+            if not parsed_data:
+                return False
 
-        parsed_data.interaction_curves.clear()
-        return True
+            parsed_data.interaction_curves.clear()
+            return True
 
     # =========================================================================
     # VIGAS DE ACOPLE
@@ -791,41 +905,42 @@ class SessionManager:
         Returns:
             Dict con 'success', 'beam_key' o 'error'
         """
-        from ...domain.entities import HorizontalElement, HorizontalElementSource
-        from ...domain.entities import HorizontalDiscreteReinforcement
+        with self._cache.pinned(session_id):
+            from ...domain.entities import HorizontalElement, HorizontalElementSource
+            from ...domain.entities import HorizontalDiscreteReinforcement
 
-        parsed_data = self.get_session(session_id)
-        if not parsed_data:
-            return {'success': False, 'error': 'Sesión no encontrada'}
+            parsed_data = self.get_session(session_id)
+            if not parsed_data:
+                return {'success': False, 'error': 'Sesión no encontrada'}
 
-        beam_key = f"{story}_{label}"
+            beam_key = f"{story}_{label}"
 
-        if beam_key in parsed_data.horizontal_elements:
-            return {
-                'success': False,
-                'error': f'Ya existe una viga con el nombre {label} en {story}'
-            }
+            if beam_key in parsed_data.horizontal_elements:
+                return {
+                    'success': False,
+                    'error': f'Ya existe una viga con el nombre {label} en {story}'
+                }
+
+            beam = HorizontalElement(
+                label=label,
+                story=story,
+                length=float(length),
+                depth=float(depth),
+                width=float(width),
+                fc=float(fc),
+                source=HorizontalElementSource.FRAME,
+                is_custom=True,
+                discrete_reinforcement=HorizontalDiscreteReinforcement(
+                    n_bars_top=int(n_bars_top),
+                    n_bars_bottom=int(n_bars_bottom),
+                    diameter_top=int(diameter_top),
+                    diameter_bottom=int(diameter_bottom),
+                ),
+                stirrup_diameter=int(stirrup_diameter),
+                stirrup_spacing=int(stirrup_spacing),
+                n_shear_legs=int(n_stirrup_legs)
+            )
+
+            parsed_data.horizontal_elements[beam_key] = beam
 
-        beam = HorizontalElement(
-            label=label,
-            story=story,
-            length=float(length),
-            depth=float(depth),
-            width=float(width),
-            fc=float(fc),
-            source=HorizontalElementSource.FRAME,
-            is_custom=True,
-            discrete_reinforcement=HorizontalDiscreteReinforcement(
-                n_bars_top=int(n_bars_top),
-                n_bars_bottom=int(n_bars_bottom),
-                diameter_top=int(diameter_top),
-                diameter_bottom=int(diameter_bottom),
-            ),
-            stirrup_diameter=int(stirrup_diameter),
-            stirrup_spacing=int(stirrup_spacing),
-            n_shear_legs=int(n_stirrup_legs)
-        )
-
-        parsed_data.horizontal_elements[beam_key] = beam
-
-        return {'success': True, 'beam_key': beam_key}
+            return {'success': True, 'beam_key': beam_key}
@@ -0,0 +1,602 @@
+# app/services/parsing/session_store.py
+"""
+Almacén acotado de sesiones (ParsedData) con desalojo a disco.
+
+Cada sesión mantiene tablas crudas, DataFrames de fuerzas, resultados de
+análisis y curvas P-M. Sin límite, un servidor compartido acumula sesiones
+hasta quedarse sin memoria. Este almacén:
+
+- Estima el tamaño de cada sesión (DataFrames, arreglos y objetos anidados)
+- Desaloja por LRU cuando se excede el presupuesto global de memoria
+- Desaloja por TTL las sesiones inactivas
+- Escribe las sesiones desalojadas a disco (parsed_data_serializer) y las
+  recarga de forma transparente en el siguiente acceso
+- No desaloja sesiones fijadas (pinned) mientras un análisis o informe
+  escribe en ellas
+
+Los resultados de análisis con huella y sus curvas P-M se escriben en un
+.npz aparte (mismo formato que analysis_store), así el análisis
+incremental que los reutiliza tras la recarga encuentra también las curvas.
+
+La serialización y el disco quedan fuera del lock del almacén: un
+desalojo o una recarga lentos solo bloquean a quien pide esa sesión.
+
+Configuración (variables de entorno):
+- INGEO_SESSION_MEMORY_MB: presupuesto global en MB (default 1024)
+- INGEO_SESSION_TTL_S: segundos de inactividad antes de desalojar (default 21600)
+- INGEO_SESSION_SPILL_DIR: directorio de desalojo (default <tmp>/ingeo-sessions)
+"""
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from enum import Enum
+from io import StringIO
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ...domain.entities.parsed_data import ParsedData
+from ..persistence.analysis_store import dump_analysis_cache, load_analysis_cache
+from ..persistence.parsed_data_serializer import serialize_parsed_data, deserialize_parsed_data
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_MB = 1024
+DEFAULT_TTL_S = 6 * 3600
+
+# Archivos de desalojo más antiguos se eliminan al iniciar (sesiones abandonadas)
+SPILL_MAX_AGE_S = 7 * 24 * 3600
+
+
+def _get_spill_dir() -> Path:
+    """Obtiene el directorio de desalojo de sesiones."""
+    base = os.environ.get('INGEO_SESSION_SPILL_DIR')
+    if base:
+        return Path(base)
+    return Path(tempfile.gettempdir()) / 'ingeo-sessions'
+
+
+# =============================================================================
+# ESTIMACIÓN DE TAMAÑO
+# =============================================================================
+
+def estimate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Estima los bytes ocupados por un objeto y todo lo que referencia.
+
+    DataFrames y arreglos NumPy se miden por su contenido; dicts, listas y
+    objetos (vía __dict__) se recorren recursivamente, contando cada objeto
+    una sola vez.
+    """
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if isinstance(obj, type) or callable(obj):
+        return 0  # Clases y funciones son compartidas, no pertenecen a la sesión
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None), Enum)):
+        return size
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in obj)
+    elif hasattr(obj, '__dict__'):
+        size += estimate_size(vars(obj), seen)
+    return size
+
+
+def estimate_session_size(parsed_data: ParsedData) -> int:
+    """Estima los bytes en memoria de una sesión."""
+    return estimate_size(parsed_data)
+
+
+# =============================================================================
+# SERIALIZACIÓN DE DESALOJO
+# =============================================================================
+
+def _json_default(obj: Any) -> Any:
+    """Convierte escalares NumPy (y otros) a tipos JSON."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def _df_to_json(df: pd.DataFrame) -> Any:
+    # RangeIndex se omite: read_json lo reconstruye sin materializarlo
+    data = df.to_json(orient='split', date_format='iso',
+                      index=not isinstance(df.index, pd.RangeIndex))
+    # to_json no guarda attrs (unidades de las columnas numéricas)
+    return {'frame': data, 'attrs': df.attrs} if df.attrs else data
+
+
+def _df_from_json(data: Any) -> pd.DataFrame:
+    if isinstance(data, dict):
+        df = pd.read_json(StringIO(data['frame']), orient='split', dtype=False)
+        df.attrs = data['attrs']
+        return df
+    return pd.read_json(StringIO(data), orient='split', dtype=False)
+
+
+def spill_payload(parsed_data: ParsedData) -> Dict[str, Any]:
+    """
+    Arma el contenido JSON a escribir en disco para una sesión.
+
+    Reutiliza serialize_parsed_data() y agrega lo que éste omite y la sesión
+    necesita para continuar: tablas (vista de verificación y fusión
+    multi-archivo) y los resultados de análisis sin huella. Los resultados
+    con huella y las curvas P-M van en spill_analysis().
+    """
+    accumulated = parsed_data.accumulated_tables
+    return {
+        'parsed_data': serialize_parsed_data(parsed_data),
+        # None = misma tabla que la única acumulada (se comparte, no se duplica)
+        'raw_tables': {
+            k: None if len(accumulated.get(k, [])) == 1 and accumulated[k][0] is df
+            else _df_to_json(df)
+            for k, df in parsed_data.raw_tables.items()
+        },
+        'accumulated_tables': {
+            k: [_df_to_json(df) for df in dfs]
+            for k, dfs in parsed_data.accumulated_tables.items()
+        },
+        'analysis_cache': {
+            k: result for k, result in parsed_data.analysis_cache.items()
+            if k not in parsed_data.analysis_fingerprints
+        },
+    }
+
+
+def spill_analysis(parsed_data: ParsedData) -> Optional[bytes]:
+    """
+    Resultados con huella y curvas P-M en formato .npz (analysis_store).
+
+    Returns:
+        Contenido del .npz, o None si la sesión no tiene resultados con huella
+    """
+    if not parsed_data.analysis_fingerprints:
+        return None
+    return dump_analysis_cache(parsed_data)
+
+
+def restore_payload(payload: Dict[str, Any], analysis: Optional[bytes] = None) -> ParsedData:
+    """Reconstruye una sesión desde spill_payload() y spill_analysis()."""
+    parsed_data = deserialize_parsed_data(payload['parsed_data'])
+    parsed_data.accumulated_tables = {
+        k: [_df_from_json(data) for data in dfs]
+        for k, dfs in payload.get('accumulated_tables', {}).items()
+    }
+    parsed_data.raw_tables = {
+        k: parsed_data.accumulated_tables[k][0] if data is None else _df_from_json(data)
+        for k, data in payload.get('raw_tables', {}).items()
+    }
+    parsed_data.analysis_cache = payload.get('analysis_cache', {})
+    parsed_data.analysis_fingerprints = {}
+    if analysis is not None:
+        load_analysis_cache(analysis, parsed_data)
+    return parsed_data
+
+
+# =============================================================================
+# ALMACÉN
+# =============================================================================
+
+class SessionStore:
+    """
+    Diccionario session_id → ParsedData acotado en memoria.
+
+    Thread-safe. Las sesiones desalojadas siguen "existiendo": `in`, get()
+    y [] las recargan desde disco.
+
+    Example:
+        store = SessionStore(memory_budget=512 * 1024**2)
+        store['abc'] = ParsedData()
+        store.refresh('abc')   # re-estimar tamaño tras modificar la sesión
+        store.get('abc')       # recarga desde disco si fue desalojada
+        with store.pinned('abc'):
+            ...                # 'abc' no se desaloja mientras se escribe en ella
+    """
+
+    def __init__(
+        self,
+        memory_budget: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        spill_dir: Optional[Path] = None
+    ):
+        if memory_budget is None:
+            memory_budget = int(float(os.environ.get('INGEO_SESSION_MEMORY_MB', DEFAULT_MEMORY_MB)) * 1024 * 1024)
+        if ttl_seconds is None:
+            ttl_seconds = float(os.environ.get('INGEO_SESSION_TTL_S', DEFAULT_TTL_S))
+        self.memory_budget = memory_budget
+        self.ttl_seconds = ttl_seconds
+        self._spill_dir = spill_dir or _get_spill_dir()
+
+        self._sessions: 'OrderedDict[str, ParsedData]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._last_access: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+        # Desalojos en curso: fuera de _sessions pero aún servibles (get() los
+        # recupera). _writing evita dos escrituras simultáneas de una sesión.
+        self._evicting: Dict[str, Tuple[ParsedData, int]] = {}
+        self._writing: set = set()
+        # Recargas en curso (quien pide la misma sesión espera el evento)
+        self._loading: Dict[str, threading.Event] = {}
+        # Sesiones fijadas (contador de usos): nunca se eligen para desalojo
+        self._pins: Dict[str, int] = {}
+
+        self.spills = 0
+        self.reloads = 0
+        self._purge_stale_spills()
+
+    # -------------------------------------------------------------------------
+    # Interfaz tipo dict
+    # -------------------------------------------------------------------------
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            if session_id in self._sessions or session_id in self._evicting:
+                return True
+        return self._spill_path(session_id).exists()
+
+    def __getitem__(self, session_id: str) -> ParsedData:
+        parsed_data = self.get(session_id)
+        if parsed_data is None:
+            raise KeyError(session_id)
+        return parsed_data
+
+    def __setitem__(self, session_id: str, parsed_data: ParsedData) -> None:
+        # Recorrer la sesión es lento: se mide antes de tomar el lock
+        size = estimate_session_size(parsed_data)
+        with self._lock:
+            self._evicting.pop(session_id, None)
+            self._discard_spill(session_id)
+            self._sessions[session_id] = parsed_data
+            self._sessions.move_to_end(session_id)
+            self._last_access[session_id] = time.monotonic()
+            self._sizes[session_id] = size
+            victims = self._select_victims(protect=session_id)
+        self._spill_all(victims)
+
+    def __delitem__(self, session_id: str) -> None:
+        if not self.pop(session_id):
+            raise KeyError(session_id)
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            keys = list(self._sessions) + list(self._evicting)
+        keys += [p.stem for p in self._spilled_paths() if p.stem not in keys]
+        return iter(keys)
+
+    def get(self, session_id: str, default: Optional[ParsedData] = None) -> Optional[ParsedData]:
+        """Obtiene una sesión (recargándola de disco si fue desalojada)."""
+        while True:
+            with self._lock:
+                parsed_data = self._take_in_memory(session_id)
+                if parsed_data is not None:
+                    victims = self._expire_victims(protect=session_id)
+                    break
+                loading = self._loading.get(session_id)
+                if loading is None:
+                    if not self._spill_path(session_id).exists():
+                        return default
+                    loading = self._loading[session_id] = threading.Event()
+                    owner = True
+                else:
+                    owner = False
+
+            if not owner:
+                # Otra petición la está recargando: esperar y reintentar
+                loading.wait()
+                continue
+
+            parsed_data, victims = self._reload(session_id, loading)
+            if parsed_data is None:
+                return default
+            break
+
+        self._spill_all(victims)
+        return parsed_data
+
+    def pop(self, session_id: str) -> bool:
+        """Elimina una sesión (en memoria y en disco). Retorna True si existía."""
+        with self._lock:
+            existed = self._forget(session_id) is not None
+            existed = self._evicting.pop(session_id, None) is not None or existed
+            return self._discard_spill(session_id) or existed
+
+    @contextmanager
+    def pinned(self, session_id: str) -> Iterator[None]:
+        """
+        Fija la sesión en memoria mientras dura el bloque.
+
+        Usar alrededor de operaciones que escriben en el ParsedData (análisis,
+        informes): si se desalojara a mitad, lo escrito después de serializar
+        se perdería al recargar. Los bloques pueden anidarse.
+        """
+        with self._lock:
+            self._pins[session_id] = self._pins.get(session_id, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                remaining = self._pins.pop(session_id) - 1
+                if remaining:
+                    self._pins[session_id] = remaining
+
+    # -------------------------------------------------------------------------
+    # Contabilidad de memoria
+    # -------------------------------------------------------------------------
+
+    def refresh(self, session_id: str) -> None:
+        """
+        Re-estima el tamaño de una sesión y aplica el presupuesto.
+
+        Llamar después de operaciones que hacen crecer la sesión
+        (acumular tablas, procesar, analizar). La sesión se mide sin el lock.
+        """
+        with self._lock:
+            parsed_data = self._sessions.get(session_id)
+        if parsed_data is None:
+            return
+        size = estimate_session_size(parsed_data)
+        with self._lock:
+            if self._sessions.get(session_id) is not parsed_data:
+                # Desalojada o reemplazada mientras se medía
+                return
+            self._sizes[session_id] = size
+            victims = self._select_victims(protect=session_id)
+        self._spill_all(victims)
+
+    @property
+    def memory_usage(self) -> int:
+        """Bytes estimados de las sesiones en memoria."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado del almacén (diagnóstico)."""
+        with self._lock:
+            in_memory = set(self._sessions) | set(self._evicting)
+            stats = {
+                'in_memory': len(in_memory),
+                'memory_bytes': sum(self._sizes.values()),
+                'memory_budget': self.memory_budget,
+                'pinned': len(self._pins),
+                'spills': self.spills,
+                'reloads': self.reloads,
+            }
+        stats['spilled'] = sum(1 for p in self._spilled_paths() if p.stem not in in_memory)
+        return stats
+
+    def _select_victims(self, protect: Optional[str] = None) -> List[str]:
+        """
+        Aplica TTL y presupuesto de memoria (LRU), sin desalojar `protect`
+        ni sesiones fijadas. Llamar con el lock tomado.
+
+        Returns:
+            Sesiones pasadas a _evicting (escribir con _spill_all sin el lock)
+        """
+        victims = self._expire_victims(protect)
+        total = sum(self._sizes.values())
+        for session_id in list(self._sessions):
+            if total <= self.memory_budget:
+                break
+            if not self._can_spill(session_id, protect):
+                continue
+            total -= self._sizes.get(session_id, 0)
+            victims.append(self._begin_spill(session_id))
+        return victims
+
+    def _expire_victims(self, protect: Optional[str] = None) -> List[str]:
+        """Sesiones inactivas por más de ttl_seconds (llamar con el lock tomado)."""
+        if self.ttl_seconds <= 0:
+            return []
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [
+            sid for sid in self._sessions
+            if self._can_spill(sid, protect) and self._last_access.get(sid, 0) < cutoff
+        ]
+        return [self._begin_spill(sid) for sid in expired]
+
+    def _can_spill(self, session_id: str, protect: Optional[str]) -> bool:
+        return (session_id != protect
+                and session_id not in self._pins
+                and session_id not in self._writing)
+
+    def _take_in_memory(self, session_id: str) -> Optional[ParsedData]:
+        """
+        Sesión en memoria (recuperándola si se estaba desalojando), marcada
+        como recién usada. Llamar con el lock tomado.
+        """
+        parsed_data = self._sessions.get(session_id)
+        if parsed_data is None:
+            evicting = self._evicting.pop(session_id, None)
+            if evicting is None:
+                return None
+            # El escritor en curso descarta su archivo al terminar
+            parsed_data, size = evicting
+            self._sessions[session_id] = parsed_data
+            self._sizes[session_id] = size
+        self._sessions.move_to_end(session_id)
+        self._last_access[session_id] = time.monotonic()
+        return parsed_data
+
+    # -------------------------------------------------------------------------
+    # Disco
+    # -------------------------------------------------------------------------
+
+    def _spill_path(self, session_id: str) -> Path:
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', session_id)
+        return self._spill_dir / f"{safe_id}.json"
+
+    def _analysis_path(self, session_id: str) -> Path:
+        return self._spill_path(session_id).with_suffix('.npz')
+
+    def _spilled_paths(self):
+        if not self._spill_dir.exists():
+            return []
+        return list(self._spill_dir.glob('*.json'))
+
+    def _purge_stale_spills(self) -> None:
+        """Elimina archivos de desalojo de sesiones abandonadas."""
+        if not self._spill_dir.exists():
+            return
+        cutoff = time.time() - SPILL_MAX_AGE_S
+        for path in list(self._spill_dir.glob('*.json')) + list(self._spill_dir.glob('*.npz')):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def _spill(self, session_id: str) -> None:
+        """Escribe la sesión a disco y la libera de memoria (si no está fijada)."""
+        with self._lock:
+            if session_id not in self._sessions or not self._can_spill(session_id, None):
+                return
+            victim = self._begin_spill(session_id)
+        self._spill_all([victim])
+
+    def _begin_spill(self, session_id: str) -> str:
+        """Pasa la sesión a _evicting (llamar con el lock tomado)."""
+        size = self._sizes.get(session_id, 0)
+        parsed_data = self._forget(session_id)
+        self._evicting[session_id] = (parsed_data, size)
+        self._writing.add(session_id)
+        return session_id
+
+    def _spill_all(self, session_ids: List[str]) -> None:
+        """Escribe a disco las sesiones elegidas por _select_victims (sin el lock)."""
+        for session_id in session_ids:
+            self._write_spill(session_id)
+
+    def _write_spill(self, session_id: str) -> None:
+        with self._lock:
+            entry = self._evicting.get(session_id)
+            if entry is None:
+                # Recuperada por get() antes de empezar a escribir
+                self._writing.discard(session_id)
+                return
+            parsed_data, size = entry
+
+        path = self._spill_path(session_id)
+        analysis_path = self._analysis_path(session_id)
+        try:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+            analysis = spill_analysis(parsed_data)
+            tmp_path = path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(spill_payload(parsed_data), f, default=_json_default)
+            if analysis is not None:
+                analysis_tmp = analysis_path.with_suffix('.npz.tmp')
+                analysis_tmp.write_bytes(analysis)
+                analysis_tmp.replace(analysis_path)
+            elif analysis_path.exists():
+                analysis_path.unlink()
+            # El .json es el que marca la sesión como desalojada: va último
+            tmp_path.replace(path)
+            error = None
+        except Exception as e:
+            error = e
+
+        with self._lock:
+            self._writing.discard(session_id)
+            current = self._evicting.get(session_id)
+            if current is None or current[0] is not parsed_data:
+                # Recuperada (get), reemplazada o eliminada durante la escritura:
+                # la copia en disco ya no corresponde
+                if error is None:
+                    self._discard_spill(session_id)
+                return
+            del self._evicting[session_id]
+
+            if error is not None:
+                # Sin disco disponible: mantener en memoria antes que perder datos
+                logger.error(f"No se pudo desalojar la sesión {session_id[:8]}", exc_info=error)
+                self._sessions[session_id] = parsed_data
+                self._sizes[session_id] = size
+                self._last_access[session_id] = time.monotonic()
+                return
+            self.spills += 1
+
+        logger.info(f"Sesión {session_id[:8]} desalojada a disco ({size / 1024 / 1024:.1f} MB)")
+
+    def _reload(
+        self,
+        session_id: str,
+        loading: threading.Event
+    ) -> Tuple[Optional[ParsedData], List[str]]:
+        """
+        Recarga una sesión desalojada (lectura sin el lock) y la vuelve a
+        poner en memoria.
+
+        Returns:
+            Tuple (sesión o None si ya no existe, sesiones a desalojar)
+        """
+        path = self._spill_path(session_id)
+        analysis_path = self._analysis_path(session_id)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            analysis = analysis_path.read_bytes() if analysis_path.exists() else None
+            parsed_data: Optional[ParsedData] = restore_payload(payload, analysis)
+            size = estimate_session_size(parsed_data)
+        except FileNotFoundError:
+            parsed_data = None
+        except Exception:
+            with self._lock:
+                del self._loading[session_id]
+                loading.set()
+            raise
+
+        with self._lock:
+            del self._loading[session_id]
+            loading.set()
+            if parsed_data is None or not path.exists():
+                # Eliminada o reemplazada mientras se leía
+                return None, []
+            self._discard_spill(session_id)
+            self._sessions[session_id] = parsed_data
+            self._sizes[session_id] = size
+            self._last_access[session_id] = time.monotonic()
+            self.reloads += 1
+            victims = self._select_victims(protect=session_id)
+
+        logger.info(f"Sesión {session_id[:8]} recargada desde disco")
+        return parsed_data, victims
+
+    def _forget(self, session_id: str) -> Optional[ParsedData]:
+        self._sizes.pop(session_id, None)
+        self._last_access.pop(session_id, None)
+        return self._sessions.pop(session_id, None)
+
+    def _discard_spill(self, session_id: str) -> bool:
+        existed = False
+        for path in (self._spill_path(session_id), self._analysis_path(session_id)):
+            if path.exists():
+                path.unlink()
+                existed = True
+        return existed
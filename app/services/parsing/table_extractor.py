@@ -12,7 +12,10 @@ Las tablas de ETABS tienen esta estructura:
 - Fila 2: Unidades (mm, m, tonf, etc.)
 - Fila 3+: Datos
 """
+from array import array
+from math import isnan, nan
 from typing import Optional, Dict, List, Tuple
+import numpy as np
 import pandas as pd
 import re
 from io import BytesIO
@@ -54,6 +57,8 @@ def extract_units_from_df(df: pd.DataFrame) -> Dict[str, float]:
 
     ETABS pone las unidades en la primera fila de datos (despues de headers).
     Esta funcion lee esa fila y retorna un dict con los factores de conversion.
+    Las columnas numericas de extract_tables_fast() llevan su unidad en
+    df.attrs['units'] (la celda de la fila 0 queda NaN).
 
     Args:
         df: DataFrame ya normalizado con headers
@@ -68,13 +73,45 @@ def extract_units_from_df(df: pd.DataFrame) -> Dict[str, float]:
 
     # La primera fila del DataFrame normalizado deberia tener las unidades
     first_row = df.iloc[0]
+    typed_units = df.attrs.get('units', {})
     for col in df.columns:
-        unit_value = first_row.get(col)
+        unit_value = typed_units.get(str(col).lower().strip(), first_row.get(col))
         units[str(col).lower()] = get_unit_factor(unit_value)
 
     return units
 
 
+def concat_tables(df_list: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Fusiona tablas del mismo tipo (ej: varios archivos Excel).
+
+    Conserva las unidades del primer archivo, igual que la fila de unidades
+    de la tabla fusionada (pd.concat descarta attrs si difieren).
+    """
+    if len(df_list) == 1:
+        return df_list[0]
+    merged = pd.concat(df_list, ignore_index=True)
+    merged.attrs = dict(df_list[0].attrs)
+    return merged
+
+
+def with_units_row(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copia del DataFrame con las unidades de df.attrs escritas en la fila 0.
+
+    Para mostrar la tabla tal como viene de ETABS (vista de verificación).
+    """
+    units = df.attrs.get('units')
+    if not units or len(df) == 0:
+        return df
+    df = df.astype(object)
+    for j, col in enumerate(df.columns):
+        unit = units.get(str(col).lower().strip())
+        if unit is not None:
+            df.iat[0, j] = unit
+    return df
+
+
 def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Normaliza los nombres de columnas a minusculas.
@@ -166,78 +203,190 @@ _perf_logger = logging.getLogger('perf')
 MAX_WORKERS = os.cpu_count() or 8
 
 
-def _process_sheet(file_content: bytes, sheet_name: str) -> Dict[str, pd.DataFrame]:
+_TABLE_MARKER = re.compile(r'TABLE:\s*(.+)', re.IGNORECASE)
+
+
+class _TableBuffer:
+    """
+    Acumula las filas de UNA tabla a medida que se leen de la hoja.
+
+    Las columnas con unidad (P en tonf, Depth en m, ...) se guardan en
+    arreglos float64 tipados; las demás (Story, Pier, Output Case, ...) en
+    listas de objetos como antes. Si una columna numérica recibe un texto se
+    degrada a lista de objetos sin perder valores.
+    """
+
+    def __init__(self, key: str, headers: tuple):
+        self.key = key
+        self.headers = headers
+        self.units: Optional[tuple] = None
+        self.n_rows = 0
+        self.seconds = 0.0
+        self._numeric: Dict[int, array] = {}
+        self._objects: Dict[int, list] = {}
+
+    def add_row(self, row: tuple) -> None:
+        """Agrega una fila (la primera es la de unidades). Ignora filas vacías."""
+        n_cols = len(self.headers)
+        if len(row) < n_cols:
+            row = row + (None,) * (n_cols - len(row))
+        empty = all(value is None for value in row[:n_cols])
+
+        if self.units is None:
+            # Fila de unidades: si viene vacía se descarta y no hay columnas
+            # numéricas (igual que dropna sobre la tabla completa)
+            self._start(() if empty else row[:n_cols])
+            if not empty:
+                return
+        if empty:
+            return
+
+        for i, values in self._objects.items():
+            values.append(row[i])
+        for i, buffer in list(self._numeric.items()):
+            value = row[i]
+            if value is None:
+                buffer.append(nan)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                buffer.append(value)
+            else:
+                self._demote(i).append(value)
+        self.n_rows += 1
+
+    def _start(self, units: tuple) -> None:
+        """Registra la fila de unidades y decide qué columnas son numéricas."""
+        self.units = units
+        for i in range(len(self.headers)):
+            unit = units[i] if units else None
+            if isinstance(unit, str) and unit.strip():
+                self._numeric[i] = array('d', [nan])
+            else:
+                self._objects[i] = [unit] if units else []
+        self.n_rows = 1 if units else 0
+
+    def _demote(self, i: int) -> list:
+        """Convierte una columna numérica en lista de objetos (NaN -> None)."""
+        values = [None if isnan(v) else v for v in self._numeric.pop(i)]
+        values[0] = self.units[i]
+        self._objects[i] = values
+        return values
+
+    @property
+    def nbytes(self) -> int:
+        """Memoria aproximada de los buffers (8 bytes por valor)."""
+        return 8 * self.n_rows * len(self.headers)
+
+    def to_frame(self) -> Optional[pd.DataFrame]:
+        """
+        DataFrame con el mismo contrato que las tablas de ETABS: la fila 0
+        es la de unidades. En columnas numéricas esa celda queda NaN y la
+        unidad va en df.attrs['units'] (ver extract_units_from_df).
+        """
+        if self.n_rows == 0:
+            return None
+        columns = {}
+        for i in range(len(self.headers)):
+            if i in self._numeric:
+                columns[i] = np.frombuffer(self._numeric.pop(i), dtype=np.float64)
+            else:
+                columns[i] = self._objects.pop(i)
+        df = pd.DataFrame(columns)
+        df.columns = list(self.headers)
+        df.attrs['units'] = {
+            str(header).lower().strip(): unit
+            for header, unit in zip(self.headers, self.units)
+            if isinstance(unit, str) and unit.strip()
+        }
+        return df
+
+
+def _process_sheet(
+    file_content: bytes,
+    sheet_name: str
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Dict[str, float]]]:
     """
-    Procesa una hoja individual en su propio thread.
+    Procesa una hoja individual en su propio thread, en streaming.
 
     Cada thread abre su propia copia del workbook para evitar conflictos.
+    Las filas se enrutan al buffer de su tabla a medida que se leen: las
+    tablas que no están en TABLE_NAME_MAPPINGS se saltan sin guardarlas,
+    así la memoria depende de las tablas útiles y no del tamaño de la hoja.
+
+    Returns:
+        (tablas, estadísticas) con estadísticas por tabla:
+        {'rows', 'seconds', 'estimated_bytes'}. estimated_bytes es una
+        estimación estática (buffers + DataFrame), no una medición.
     """
     tables: Dict[str, pd.DataFrame] = {}
+    stats: Dict[str, Dict[str, float]] = {}
 
     # Abrir workbook en modo read_only (cada thread su propia copia)
     wb = load_workbook(BytesIO(file_content), read_only=True, data_only=True)
     ws = wb[sheet_name]
 
     t_sheet = time.perf_counter()
-
-    # UNA SOLA PASADA: Cargar todas las filas y encontrar tablas simultáneamente
-    all_rows: List[tuple] = []
-    table_positions: List[Tuple[str, int]] = []  # (table_name, row_number)
-
-    for row_idx, row in enumerate(ws.iter_rows(values_only=True)):
-        all_rows.append(row)
+    n_rows = 0
+    current: Optional[_TableBuffer] = None
+    skipping = True          # Tabla desconocida (o aún sin tabla)
+    expecting_headers = False
+    pending_key: Optional[str] = None
+    t_table = t_sheet
+
+    def finish(buffer: Optional[_TableBuffer]) -> None:
+        if buffer is None:
+            return
+        df = buffer.to_frame()
+        buffer.seconds += time.perf_counter() - t_table
+        if df is None:
+            return
+        # Si la clave se repite en la hoja, gana la última tabla
+        tables[buffer.key] = df
+        # Estimación (buffers + DataFrame sin objetos anidados): las hojas se
+        # leen en threads paralelos, y tracemalloc no separa por tabla
+        estimated = buffer.nbytes + int(df.memory_usage(index=False).sum())
+        stats[buffer.key] = {'rows': len(df), 'seconds': buffer.seconds,
+                             'estimated_bytes': estimated}
+        _perf_logger.info(
+            f"[PERF] Table '{buffer.key}': {len(df)} rows in {buffer.seconds:.2f}s "
+            f"(est. ~{estimated / 1e6:.1f} MB)"
+        )
+
+    for row in ws.iter_rows(values_only=True):
+        n_rows += 1
         # Buscar "TABLE:" en la primera celda
         first_cell = row[0] if row else None
         if first_cell and isinstance(first_cell, str) and 'TABLE:' in first_cell.upper():
-            match = re.search(r'TABLE:\s*(.+)', first_cell, re.IGNORECASE)
+            match = _TABLE_MARKER.search(first_cell)
             if match:
-                table_name = match.group(1).strip()
-                table_positions.append((table_name, row_idx))
-
-    t_read = time.perf_counter()
-    _perf_logger.info(f"[PERF] Sheet '{sheet_name}': read {len(all_rows)} rows in {t_read-t_sheet:.2f}s")
-
-    wb.close()
-
-    if not table_positions:
-        return tables
-
-    # Extraer cada tabla
-    for i, (table_name, start_row) in enumerate(table_positions):
-        # Determinar fin de tabla
-        if i + 1 < len(table_positions):
-            end_row = table_positions[i + 1][1]
-        else:
-            end_row = len(all_rows)
-
-        # start_row apunta a "TABLE:", start_row+1 son headers
-        header_idx = start_row + 1
-        if header_idx >= len(all_rows):
+                finish(current)
+                current = None
+                t_table = time.perf_counter()
+                pending_key = _map_table_name_to_key(match.group(1).strip())
+                skipping = pending_key is None
+                expecting_headers = not skipping
+                continue
+
+        if skipping:
             continue
-
-        headers = all_rows[header_idx]
-        data_rows = all_rows[header_idx + 1:end_row]
-
-        if not data_rows:
+        if expecting_headers:
+            current = _TableBuffer(pending_key, row)
+            expecting_headers = False
             continue
+        current.add_row(row)
 
-        # Crear DataFrame
-        df = pd.DataFrame(data_rows, columns=headers)
-
-        # Eliminar filas completamente vacias
-        df = df.dropna(how='all')
-
-        if len(df) > 0:
-            # Mapear nombre de tabla a clave interna
-            table_key = _map_table_name_to_key(table_name)
-            if table_key:
-                tables[table_key] = df
-                _perf_logger.info(f"[PERF] Table '{table_key}': {len(df)} rows")
+    finish(current)
+    wb.close()
 
-    return tables
+    _perf_logger.info(
+        f"[PERF] Sheet '{sheet_name}': streamed {n_rows} rows in {time.perf_counter()-t_sheet:.2f}s"
+    )
+    return tables, stats
 
 
-def extract_tables_fast(file_content: bytes) -> Dict[str, pd.DataFrame]:
+def extract_tables_fast(
+    file_content: bytes,
+    stats: Optional[Dict[str, Dict[str, float]]] = None
+) -> Dict[str, pd.DataFrame]:
     """
     Extrae todas las tablas de un archivo Excel usando openpyxl read_only mode.
 
@@ -245,9 +394,12 @@ def extract_tables_fast(file_content: bytes) -> Dict[str, pd.DataFrame]:
     - Todas las hojas en paralelo con ThreadPoolExecutor
     - Usa todos los cores disponibles (24 en este sistema)
     - ThreadPool evita overhead de serializacion de ProcessPool en Windows
+    - Cada hoja se lee en streaming (ver _process_sheet)
 
     Args:
         file_content: Contenido binario del archivo Excel
+        stats: Si se entrega, se llena con {table_key: {'rows', 'seconds',
+            'estimated_bytes'}} de cada tabla extraída
 
     Returns:
         Dict[table_key -> DataFrame] con todas las tablas encontradas
@@ -278,10 +430,12 @@ def extract_tables_fast(file_content: bytes) -> Dict[str, pd.DataFrame]:
         for future in as_completed(future_to_sheet):
             sheet_name = future_to_sheet[future]
             try:
-                sheet_tables = future.result()
+                sheet_tables, sheet_stats = future.result()
                 for key, df in sheet_tables.items():
                     if key not in tables:
                         tables[key] = df
+                        if stats is not None:
+                            stats[key] = sheet_stats[key]
             except Exception as e:
                 _perf_logger.warning(f"[PERF] Error procesando {sheet_name}: {e}")
 
@@ -4,8 +4,9 @@ Servicio de persistencia de proyectos.
 
 Estructura de proyecto:
 - project.json: Metadata
-- parsed_data.json: Estado parseado completo
+- parsed_data.npz: Estado parseado completo (formato binario columnar)
 - results.json: Resultados de análisis (carga instantánea)
+- analysis.npz: Resultados por elemento y curvas P-M (análisis incremental)
 - source.xlsx: Excel original (backup)
 """
 from .project_manager import ProjectManager
@@ -0,0 +1,181 @@
+# app/services/persistence/analysis_store.py
+"""
+Caché de análisis persistente del proyecto (analysis.npz).
+
+Guarda junto al proyecto lo que la sesión necesita para no re-verificar
+al reabrirlo: ParsedData.analysis_cache (resultado formateado por
+elemento), analysis_fingerprints (huella de las entradas con que se
+calculó) e interaction_curves (curvas P-M).
+
+Formato: .npz comprimido, sin pickle:
+- 'meta': JSON con formato, code_version(), huellas y resultados. Los
+  arreglos NumPy de los resultados (tablas por combinación) se reemplazan
+  por una referencia {'__array__': i}.
+- 'arrays/<i>': arreglos de los resultados (los de objetos se guardan
+  como texto y se restauran como dtype object).
+- 'curves/<i>': InteractionCurve.array de cada (elemento, dirección).
+
+Al abrir, si la versión del código cambió se descarta todo; si no, los
+resultados se restauran en la sesión y el análisis incremental solo
+re-verifica los elementos cuya huella de entradas ya no coincide.
+"""
+import json
+import logging
+from io import BytesIO
+from typing import Any, Dict, List, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from ...domain.flexure import InteractionCurve
+from ..analysis.input_fingerprint import code_version
+
+if TYPE_CHECKING:
+    from ...domain.entities.parsed_data import ParsedData
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_FORMAT = 'ingeo-analysis'
+ANALYSIS_FORMAT_VERSION = 1
+
+ARRAY_REF = '__array__'
+
+
+# =============================================================================
+# CODIFICACIÓN DE RESULTADOS
+# =============================================================================
+
+def _encode(value: Any, arrays: List[np.ndarray]) -> Any:
+    """
+    Convierte un resultado a JSON, moviendo los arreglos a `arrays`.
+
+    Raises:
+        TypeError: Si contiene un valor que no se puede restaurar fielmente
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        is_object = value.dtype == object
+        arrays.append(value.astype(str) if is_object else value)
+        return {ARRAY_REF: len(arrays) - 1, 'object': is_object}
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            raise TypeError('Claves no textuales en resultado')
+        return {k: _encode(v, arrays) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v, arrays) for v in value]
+    raise TypeError(f'Tipo no persistible en resultado: {type(value).__name__}')
+
+
+def _decode(value: Any, arrays: Dict[int, np.ndarray]) -> Any:
+    """Inverso de _encode()."""
+    if isinstance(value, dict):
+        if ARRAY_REF in value:
+            array = arrays[value[ARRAY_REF]]
+            return array.astype(object) if value.get('object') else array
+        return {k: _decode(v, arrays) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v, arrays) for v in value]
+    return value
+
+
+# =============================================================================
+# ESCRITURA
+# =============================================================================
+
+def dump_analysis_cache(parsed_data: 'ParsedData') -> bytes:
+    """
+    Serializa los resultados y curvas P-M de una sesión.
+
+    Solo se guardan los resultados con huella (los demás no se podrían
+    validar al reabrir) y que se pueden restaurar fielmente.
+
+    Returns:
+        Contenido del archivo .npz
+    """
+    arrays: List[np.ndarray] = []
+    results: Dict[str, Any] = {}
+    fingerprints: Dict[str, str] = {}
+    for key, result in parsed_data.analysis_cache.items():
+        fingerprint = parsed_data.analysis_fingerprints.get(key)
+        if fingerprint is None:
+            continue
+        n_arrays = len(arrays)
+        try:
+            results[key] = _encode(result, arrays)
+        except TypeError as e:
+            del arrays[n_arrays:]
+            logger.warning(f"Resultado de {key} no persistido: {e}")
+            continue
+        fingerprints[key] = fingerprint
+
+    curves: List[Tuple[str, str]] = []
+    payload: Dict[str, np.ndarray] = {}
+    for key, by_direction in parsed_data.interaction_curves.items():
+        if key not in results:
+            continue
+        for direction, curve in by_direction.items():
+            if isinstance(curve, InteractionCurve):
+                payload[f'curves/{len(curves)}'] = curve.array
+                curves.append((key, direction))
+
+    meta = {
+        'format': ANALYSIS_FORMAT,
+        'format_version': ANALYSIS_FORMAT_VERSION,
+        'code_version': code_version(),
+        'fingerprints': fingerprints,
+        'results': results,
+        'curves': curves,
+    }
+    payload.update({f'arrays/{i}': array for i, array in enumerate(arrays)})
+    meta_json = json.dumps(meta, ensure_ascii=False, separators=(',', ':'))
+    payload['meta'] = np.frombuffer(meta_json.encode('utf-8'), dtype=np.uint8)
+
+    buffer = BytesIO()
+    np.savez_compressed(buffer, **payload)
+    return buffer.getvalue()
+
+
+# =============================================================================
+# LECTURA
+# =============================================================================
+
+def load_analysis_cache(content: bytes, parsed_data: 'ParsedData') -> int:
+    """
+    Restaura resultados y curvas P-M en una sesión recién cargada.
+
+    Solo se restauran elementos que existen en parsed_data. La validez de
+    cada resultado frente a las entradas actuales la decide el análisis
+    incremental (huellas); aquí solo se descarta el archivo completo si
+    fue escrito por otra versión del código o del formato.
+
+    Returns:
+        Cantidad de resultados restaurados (0 si el archivo no es válido)
+    """
+    with np.load(BytesIO(content), allow_pickle=False) as npz:
+        meta = json.loads(npz['meta'].tobytes().decode('utf-8'))
+        if (meta.get('format') != ANALYSIS_FORMAT
+                or meta.get('format_version') != ANALYSIS_FORMAT_VERSION
+                or meta.get('code_version') != code_version()):
+            return 0
+
+        elements = set(parsed_data.vertical_elements) | set(parsed_data.horizontal_elements)
+        arrays = {
+            int(name.split('/', 1)[1]): npz[name]
+            for name in npz.files if name.startswith('arrays/')
+        }
+        restored = 0
+        for key, result in meta['results'].items():
+            if key not in elements:
+                continue
+            parsed_data.analysis_cache[key] = _decode(result, arrays)
+            parsed_data.analysis_fingerprints[key] = meta['fingerprints'][key]
+            restored += 1
+
+        for i, (key, direction) in enumerate(meta['curves']):
+            if key in parsed_data.analysis_cache:
+                curve = InteractionCurve(npz[f'curves/{i}'])
+                parsed_data.interaction_curves.setdefault(key, {})[direction] = curve
+
+    return restored
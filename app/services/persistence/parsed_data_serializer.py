@@ -10,24 +10,35 @@ Arquitectura unificada:
 - HorizontalElement: vigas frame, spandrel y drop_beam
 - ElementForces: fuerzas unificadas para todos los elementos
 """
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from ...domain.entities.element_forces import COMBO_COLUMNS
+from ...domain.entities.force_store import FORCE_COLUMNS, LABEL_COLUMNS
 
 if TYPE_CHECKING:
     from ...domain.entities.parsed_data import ParsedData
 
 
-def serialize_parsed_data(parsed_data: 'ParsedData') -> Dict[str, Any]:
+def serialize_parsed_data(
+    parsed_data: 'ParsedData',
+    include_combinations: bool = True
+) -> Dict[str, Any]:
     """
     Serializa ParsedData completo a diccionario JSON-compatible.
 
     NO incluye raw_data (DataFrames) para minimizar tamaño.
+
+    Args:
+        parsed_data: Datos a serializar
+        include_combinations: Si es False, las fuerzas se serializan sin
+            combinaciones (el formato binario las guarda como arreglos)
     """
     return {
         'version': '4.0',  # Version con ElementForces unificado
         'vertical_elements': _serialize_vertical_elements(parsed_data.vertical_elements),
-        'vertical_forces': _serialize_forces(parsed_data.vertical_forces),
+        'vertical_forces': _serialize_forces(parsed_data.vertical_forces, include_combinations),
         'horizontal_elements': _serialize_horizontal_elements(parsed_data.horizontal_elements),
-        'horizontal_forces': _serialize_forces(parsed_data.horizontal_forces),
+        'horizontal_forces': _serialize_forces(parsed_data.horizontal_forces, include_combinations),
         'materials': parsed_data.materials,
         'stories': parsed_data.stories,
         'continuity_info': _serialize_continuity_info(parsed_data.continuity_info),
@@ -37,11 +48,20 @@ def serialize_parsed_data(parsed_data: 'ParsedData') -> Dict[str, Any]:
     }
 
 
-def deserialize_parsed_data(data: Dict[str, Any]) -> 'ParsedData':
+def deserialize_parsed_data(
+    data: Dict[str, Any],
+    force_stores: Optional[Dict[str, Tuple[Any, Dict[str, Tuple[int, int]]]]] = None
+) -> 'ParsedData':
     """
     Deserializa diccionario a ParsedData.
 
     Soporta migración desde versiones anteriores.
+
+    Args:
+        data: Diccionario de serialize_parsed_data()
+        force_stores: {'vertical_forces'|'horizontal_forces': (store, rangos)}
+            con las combinaciones ya en un ForceStore (formato binario). Sin
+            él, se leen de 'combinations' de cada fuerza.
     """
     from ...domain.entities.parsed_data import ParsedData
 
@@ -51,11 +71,16 @@ def deserialize_parsed_data(data: Dict[str, Any]) -> 'ParsedData':
     if version < '4.0':
         return _migrate_from_v2_v3(data)
 
+    force_stores = force_stores or {}
     return ParsedData(
         vertical_elements=_deserialize_vertical_elements(data.get('vertical_elements', {})),
-        vertical_forces=_deserialize_forces(data.get('vertical_forces', {})),
+        vertical_forces=_deserialize_forces(
+            data.get('vertical_forces', {}), force_stores.get('vertical_forces')
+        ),
         horizontal_elements=_deserialize_horizontal_elements(data.get('horizontal_elements', {})),
-        horizontal_forces=_deserialize_forces(data.get('horizontal_forces', {})),
+        horizontal_forces=_deserialize_forces(
+            data.get('horizontal_forces', {}), force_stores.get('horizontal_forces')
+        ),
         materials=data.get('materials', {}),
         stories=data.get('stories', []),
         raw_data={},  # No restauramos raw_data
@@ -78,7 +103,7 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
         HorizontalElement, HorizontalElementSource,
         DiscreteReinforcement, MeshReinforcement,
         HorizontalDiscreteReinforcement, HorizontalMeshReinforcement,
-        ElementForces, ElementForceType,
+        ElementForceType,
     )
     from ...domain.entities.load_combination import LoadCombination
 
@@ -107,14 +132,14 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
             ]
             # Detectar tipo por la clave del label
             if 'pier_label' in force_data:
-                vertical_forces[key] = ElementForces(
+                vertical_forces[key] = _build_forces(
                     label=force_data['pier_label'],
                     story=force_data['story'],
                     element_type=ElementForceType.PIER,
                     combinations=combinations,
                 )
             elif 'column_label' in force_data:
-                vertical_forces[key] = ElementForces(
+                vertical_forces[key] = _build_forces(
                     label=force_data['column_label'],
                     story=force_data['story'],
                     element_type=ElementForceType.COLUMN,
@@ -124,7 +149,7 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
             elif 'label' in force_data:
                 # Ya tiene formato nuevo
                 elem_type = force_data.get('element_type', 'pier')
-                vertical_forces[key] = ElementForces(
+                vertical_forces[key] = _build_forces(
                     label=force_data['label'],
                     story=force_data['story'],
                     element_type=ElementForceType(elem_type),
@@ -142,7 +167,7 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
                     elem_type = ElementForceType.DROP_BEAM
                 else:
                     elem_type = ElementForceType.BEAM
-                horizontal_forces[key] = ElementForces(
+                horizontal_forces[key] = _build_forces(
                     label=force_data['beam_label'],
                     story=force_data['story'],
                     element_type=elem_type,
@@ -152,7 +177,7 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
             elif 'label' in force_data:
                 # Ya tiene formato nuevo
                 elem_type = force_data.get('element_type', 'beam')
-                horizontal_forces[key] = ElementForces(
+                horizontal_forces[key] = _build_forces(
                     label=force_data['label'],
                     story=force_data['story'],
                     element_type=ElementForceType(elem_type),
@@ -200,7 +225,7 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
             combinations = [
                 LoadCombination(**c) for c in pf_data.get('combinations', [])
             ]
-            vertical_forces[key] = ElementForces(
+            vertical_forces[key] = _build_forces(
                 label=pf_data['pier_label'],
                 story=pf_data['story'],
                 element_type=ElementForceType.PIER,
@@ -239,7 +264,7 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
             combinations = [
                 LoadCombination(**c) for c in cf_data.get('combinations', [])
             ]
-            vertical_forces[key] = ElementForces(
+            vertical_forces[key] = _build_forces(
                 label=cf_data['column_label'],
                 story=cf_data['story'],
                 element_type=ElementForceType.COLUMN,
@@ -281,7 +306,7 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
             combinations = [
                 LoadCombination(**c) for c in bf_data.get('combinations', [])
             ]
-            horizontal_forces[key] = ElementForces(
+            horizontal_forces[key] = _build_forces(
                 label=bf_data['beam_label'],
                 story=bf_data['story'],
                 element_type=ElementForceType.BEAM,
@@ -323,7 +348,7 @@ def _migrate_from_v2_v3(data: Dict[str, Any]) -> 'ParsedData':
             combinations = [
                 LoadCombination(**c) for c in dbf_data.get('combinations', [])
             ]
-            horizontal_forces[key] = ElementForces(
+            horizontal_forces[key] = _build_forces(
                 label=dbf_data.get('drop_beam_label', dbf_data.get('beam_label', '')),
                 story=dbf_data['story'],
                 element_type=ElementForceType.DROP_BEAM,
@@ -371,35 +396,30 @@ def _deserialize_vertical_elements(data: Dict[str, Any]) -> Dict[str, Any]:
 # FORCES (UNIFICADO)
 # =============================================================================
 
-def _serialize_forces(forces: Dict[str, Any]) -> Dict[str, Any]:
+def _serialize_forces(forces: Dict[str, Any], include_combinations: bool = True) -> Dict[str, Any]:
     """Serializa diccionario de ElementForces."""
     return {
-        key: _serialize_force(force)
+        key: _serialize_force(force, include_combinations)
         for key, force in forces.items()
     }
 
 
-def _serialize_force(force) -> Dict[str, Any]:
+def _serialize_force(force, include_combinations: bool = True) -> Dict[str, Any]:
     """Serializa un objeto ElementForces."""
     result = {
         'label': force.label,
         'story': force.story,
         'element_type': force.element_type.value,
-        'combinations': [
-            {
-                'name': c.name,
-                'location': c.location,
-                'step_type': c.step_type,
-                'P': c.P,
-                'V2': c.V2,
-                'V3': c.V3,
-                'T': c.T,
-                'M2': c.M2,
-                'M3': c.M3,
-            }
-            for c in force.combinations
-        ]
     }
+    if include_combinations:
+        # Directo desde las columnas del almacén (sin crear LoadCombination)
+        result['combinations'] = [
+            dict(zip(COMBO_COLUMNS, row))
+            for row in zip(
+                *(force.labels(col).tolist() for col in LABEL_COLUMNS),
+                *(force.values(col).tolist() for col in FORCE_COLUMNS),
+            )
+        ]
 
     # Campos opcionales
     if force.height:
@@ -419,18 +439,49 @@ def _serialize_force(force) -> Dict[str, Any]:
     return result
 
 
-def _deserialize_forces(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Deserializa diccionario de ElementForces."""
-    from ...domain.entities import ElementForces, ElementForceType
-    from ...domain.entities.load_combination import LoadCombination
+def _build_forces(combinations: List[Any], **kwargs) -> Any:
+    """
+    Crea ElementForces y asigna sus combinaciones.
+
+    ElementForces guarda las combinaciones en un ForceStore columnar, por lo
+    que no acepta `combinations` en el constructor: se asignan vía setter.
+    """
+    from ...domain.entities import ElementForces
+
+    forces = ElementForces(**kwargs)
+    forces.combinations = combinations
+    return forces
+
+
+def _deserialize_forces(
+    data: Dict[str, Any],
+    force_store: Optional[Tuple[Any, Dict[str, Tuple[int, int]]]] = None
+) -> Dict[str, Any]:
+    """
+    Deserializa diccionario de ElementForces.
+
+    Todas las combinaciones se cargan en un único ForceStore y cada
+    ElementForces queda como vista sobre sus filas. Si se entrega
+    force_store=(store, rangos) se usa ese almacén directamente.
+    """
+    import pandas as pd
+    from ...domain.entities import ElementForces, ElementForceType, ForceStore
     from ...domain.entities.section_cut import SectionCutInfo
 
-    result = {}
-    for key, force_data in data.items():
-        combinations = [
-            LoadCombination(**c) for c in force_data.get('combinations', [])
+    if force_store is not None:
+        store, ranges = force_store
+    else:
+        rows = [
+            (key, *(c[col] for col in COMBO_COLUMNS))
+            for key, force_data in data.items()
+            for c in force_data.get('combinations', [])
         ]
+        store, ranges = ForceStore.from_frame(
+            pd.DataFrame(rows, columns=['_key', *COMBO_COLUMNS]), key_column='_key'
+        )
 
+    result = {}
+    for key, force_data in data.items():
         # Reconstruir section_cut si existe
         section_cut = None
         if 'section_cut' in force_data:
@@ -444,15 +495,17 @@ def _deserialize_forces(data: Dict[str, Any]) -> Dict[str, Any]:
                 location=sc_data.get('location', ''),
             )
 
-        result[key] = ElementForces(
+        forces = ElementForces(
             label=force_data['label'],
             story=force_data['story'],
             element_type=ElementForceType(force_data['element_type']),
-            combinations=combinations,
-            height=force_data.get('height', 0),
-            length=force_data.get('length', 0),
+            height=force_data.get('height', 0.0),
+            length=force_data.get('length', 0.0),
             section_cut=section_cut,
         )
+        if key in ranges:
+            forces.bind(store, *ranges[key])
+        result[key] = forces
 
     return result
 
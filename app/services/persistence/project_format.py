@@ -0,0 +1,123 @@
+# app/services/persistence/project_format.py
+"""
+Formato binario de proyecto (parsed_data.npz).
+
+Reemplaza a parsed_data.json: un .npz comprimido (zip de arreglos NumPy)
+con dos partes:
+- 'meta': JSON compacto de serialize_parsed_data() SIN combinaciones, más
+  la versión del formato y el rango de filas de cada fuerza.
+- '<grupo>/<columna>': combinaciones de cada grupo (vertical_forces,
+  horizontal_forces) en columnas: P..M3 en float64 y name/location/step_type
+  como códigos int32 + categorías.
+
+Al abrir, elementos, materiales y continuidad se restauran de inmediato; las
+combinaciones quedan en un ForceStore lazy que se descomprime recién cuando
+algún elemento consulta sus fuerzas.
+"""
+import json
+from io import BytesIO
+from typing import Any, Dict, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from ...domain.entities.force_store import ForceStore, FORCE_COLUMNS, LABEL_COLUMNS
+from .parsed_data_serializer import serialize_parsed_data, deserialize_parsed_data
+
+if TYPE_CHECKING:
+    from ...domain.entities.parsed_data import ParsedData
+
+PROJECT_FORMAT = 'ingeo-project'
+PROJECT_FORMAT_VERSION = 1
+
+# Grupos de fuerzas de ParsedData guardados como columnas
+FORCE_GROUPS = ('vertical_forces', 'horizontal_forces')
+
+
+# =============================================================================
+# ESCRITURA
+# =============================================================================
+
+def dump_parsed_data(parsed_data: 'ParsedData') -> bytes:
+    """
+    Serializa ParsedData al formato binario.
+
+    Returns:
+        Contenido del archivo .npz
+    """
+    meta = serialize_parsed_data(parsed_data, include_combinations=False)
+    meta['format'] = PROJECT_FORMAT
+    meta['format_version'] = PROJECT_FORMAT_VERSION
+    meta['force_ranges'] = {}
+
+    arrays: Dict[str, np.ndarray] = {}
+    for group in FORCE_GROUPS:
+        forces = getattr(parsed_data, group)
+        store, ranges = ForceStore.concat({
+            key: force.store_range for key, force in forces.items()
+        })
+        meta['force_ranges'][group] = ranges
+        numeric, codes, categories = store.arrays()
+        for col in FORCE_COLUMNS:
+            arrays[f'{group}/{col}'] = numeric[col]
+        for col in LABEL_COLUMNS:
+            arrays[f'{group}/{col}.codes'] = codes[col]
+            arrays[f'{group}/{col}.categories'] = np.asarray(categories[col], dtype=str)
+
+    meta_json = json.dumps(meta, ensure_ascii=False, separators=(',', ':'))
+    arrays['meta'] = np.frombuffer(meta_json.encode('utf-8'), dtype=np.uint8)
+
+    buffer = BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+# =============================================================================
+# LECTURA
+# =============================================================================
+
+def load_parsed_data(content: bytes) -> 'ParsedData':
+    """
+    Restaura ParsedData desde el formato binario.
+
+    Las combinaciones no se descomprimen aquí: cada grupo queda en un
+    ForceStore lazy sobre `content`.
+
+    Raises:
+        ValueError: Si el archivo no es un proyecto o su versión es más nueva
+    """
+    with np.load(BytesIO(content), allow_pickle=False) as npz:
+        meta = json.loads(npz['meta'].tobytes().decode('utf-8'))
+
+    if meta.get('format') != PROJECT_FORMAT:
+        raise ValueError('Archivo no es un proyecto INGEO')
+    if meta.get('format_version', 0) > PROJECT_FORMAT_VERSION:
+        raise ValueError(
+            f"Formato de proyecto v{meta['format_version']} no soportado "
+            f"(máximo v{PROJECT_FORMAT_VERSION})"
+        )
+
+    force_stores = {}
+    for group in FORCE_GROUPS:
+        ranges = {
+            key: (int(start), int(stop))
+            for key, (start, stop) in meta['force_ranges'].get(group, {}).items()
+        }
+        n_rows = max((stop for _, stop in ranges.values()), default=0)
+        store = ForceStore.lazy(n_rows, _group_loader(content, group))
+        force_stores[group] = (store, ranges)
+
+    return deserialize_parsed_data(meta, force_stores=force_stores)
+
+
+def _group_loader(content: bytes, group: str):
+    """Función que descomprime las columnas de un grupo de fuerzas."""
+    def load() -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        with np.load(BytesIO(content), allow_pickle=False) as npz:
+            numeric = {col: npz[f'{group}/{col}'] for col in FORCE_COLUMNS}
+            codes = {col: npz[f'{group}/{col}.codes'] for col in LABEL_COLUMNS}
+            categories: Dict[str, Any] = {
+                col: npz[f'{group}/{col}.categories'].astype(object)
+                for col in LABEL_COLUMNS
+            }
+        return numeric, codes, categories
+    return load
@@ -5,26 +5,33 @@ Gestor de proyectos con persistencia.
 Estructura de proyecto:
     ~/.ingeo-structures/projects/{project_id}/
         project.json         # Metadata del proyecto
-        parsed_data.json     # Estado completo parseado
+        parsed_data.npz      # Estado parseado (formato binario, ver project_format)
         results.json         # Resultados de análisis (carga instantánea)
+        analysis.npz         # Caché de análisis por elemento (ver analysis_store)
         source.xlsx          # Copia del Excel original (backup)
+
+Proyectos antiguos con parsed_data.json se migran al formato binario la
+primera vez que se abren.
 """
 import json
+import logging
 import os
 import shutil
 import uuid
+import zipfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
-from .parsed_data_serializer import (
-    serialize_parsed_data,
-    deserialize_parsed_data,
-)
+from .analysis_store import dump_analysis_cache, load_analysis_cache
+from .parsed_data_serializer import deserialize_parsed_data
+from .project_format import dump_parsed_data, load_parsed_data
 
 if TYPE_CHECKING:
     from ...domain.entities.parsed_data import ParsedData
 
+logger = logging.getLogger(__name__)
+
 
 def _get_projects_base_dir() -> Path:
     """Obtiene el directorio base para proyectos."""
@@ -57,6 +64,17 @@ class ProjectManager:
         """Obtiene el directorio de un proyecto."""
         return self._base_dir / project_id
 
+    @staticmethod
+    def _write_parsed_data(project_dir: Path, parsed_data: 'ParsedData') -> None:
+        """Escribe parsed_data.npz de forma atómica y elimina el JSON legado."""
+        tmp_path = project_dir / 'parsed_data.npz.tmp'
+        tmp_path.write_bytes(dump_parsed_data(parsed_data))
+        os.replace(tmp_path, project_dir / 'parsed_data.npz')
+
+        legacy_path = project_dir / 'parsed_data.json'
+        if legacy_path.exists():
+            legacy_path.unlink()
+
     # =========================================================================
     # CREAR PROYECTO
     # =========================================================================
@@ -112,17 +130,13 @@ class ProjectManager:
         parsed_data: 'ParsedData',
     ) -> Dict[str, Any]:
         """
-        Guarda el ParsedData completo.
+        Guarda el ParsedData completo en parsed_data.npz.
         """
         project_dir = self._get_project_dir(project_id)
         if not project_dir.exists():
             return {'success': False, 'error': 'Proyecto no encontrado'}
 
-        serialized = serialize_parsed_data(parsed_data)
-
-        parsed_data_path = project_dir / 'parsed_data.json'
-        with open(parsed_data_path, 'w', encoding='utf-8') as f:
-            json.dump(serialized, f, indent=2, ensure_ascii=False)
+        self._write_parsed_data(project_dir, parsed_data)
 
         self._update_project_timestamp(project_id)
 
@@ -153,6 +167,42 @@ class ProjectManager:
 
         return {'success': True}
 
+    def save_analysis_cache(
+        self,
+        project_id: str,
+        parsed_data: 'ParsedData'
+    ) -> Dict[str, Any]:
+        """
+        Guarda los resultados por elemento y las curvas P-M de la sesión en
+        analysis.npz, para que reabrir el proyecto no re-verifique los
+        elementos que no cambiaron.
+        """
+        project_dir = self._get_project_dir(project_id)
+        if not project_dir.exists():
+            return {'success': False, 'error': 'Proyecto no encontrado'}
+
+        tmp_path = project_dir / 'analysis.npz.tmp'
+        tmp_path.write_bytes(dump_analysis_cache(parsed_data))
+        os.replace(tmp_path, project_dir / 'analysis.npz')
+
+        return {'success': True, 'cached_results': len(parsed_data.analysis_fingerprints)}
+
+    @staticmethod
+    def _restore_analysis_cache(project_dir: Path, parsed_data: 'ParsedData') -> int:
+        """Restaura analysis.npz en parsed_data (0 si no existe o no es válido)."""
+        cache_path = project_dir / 'analysis.npz'
+        if not cache_path.exists():
+            return 0
+        try:
+            return load_analysis_cache(cache_path.read_bytes(), parsed_data)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            # Caché corrupta: se ignora y el análisis recalcula todo
+            logger.warning(f"Caché de análisis de {project_dir.name} ignorada: {e}")
+            parsed_data.analysis_cache.clear()
+            parsed_data.analysis_fingerprints.clear()
+            parsed_data.interaction_curves.clear()
+            return 0
+
     # =========================================================================
     # CARGAR
     # =========================================================================
@@ -162,7 +212,8 @@ class ProjectManager:
         Carga un proyecto existente.
 
         Returns:
-            Dict con parsed_data, results (si existe), y metadata
+            Dict con parsed_data (con la caché de análisis restaurada),
+            results (si existe), cached_results y metadata
         """
         project_dir = self._get_project_dir(project_id)
         if not project_dir.exists():
@@ -172,15 +223,21 @@ class ProjectManager:
         with open(project_dir / 'project.json', 'r', encoding='utf-8') as f:
             metadata = json.load(f)
 
-        # Cargar parsed_data
-        parsed_data_path = project_dir / 'parsed_data.json'
-        if not parsed_data_path.exists():
+        # Cargar parsed_data (las combinaciones se descomprimen bajo demanda)
+        parsed_data_path = project_dir / 'parsed_data.npz'
+        legacy_path = project_dir / 'parsed_data.json'
+        if parsed_data_path.exists():
+            parsed_data = load_parsed_data(parsed_data_path.read_bytes())
+        elif legacy_path.exists():
+            # Formato JSON anterior: migrar (incluye versiones v2/v3)
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                parsed_data = deserialize_parsed_data(json.load(f))
+            self._write_parsed_data(project_dir, parsed_data)
+        else:
             return {'success': False, 'error': 'Proyecto sin datos parseados'}
 
-        with open(parsed_data_path, 'r', encoding='utf-8') as f:
-            parsed_data_dict = json.load(f)
-
-        parsed_data = deserialize_parsed_data(parsed_data_dict)
+        # Resultados por elemento: el análisis solo re-verifica los que cambiaron
+        cached_results = self._restore_analysis_cache(project_dir, parsed_data)
 
         # Cargar resultados de análisis si existen
         results = self.load_results(project_id)
@@ -193,6 +250,7 @@ class ProjectManager:
             'hn_ft': metadata.get('hn_ft'),
             'results': results,
             'has_results': results is not None,
+            'cached_results': cached_results,
         }
 
     def load_results(self, project_id: str) -> Optional[Dict[str, Any]]:
@@ -3,9 +3,10 @@
 Servicios de presentación y visualización.
 """
 from .plot_generator import PlotGenerator
+from .plot_renderer import PlotRenderer
 from .result_formatter import ResultFormatter
 
-__all__ = ['PlotGenerator', 'ResultFormatter']
+__all__ = ['PlotGenerator', 'PlotRenderer', 'ResultFormatter']
 
 # ElementDetailsService se importa directamente desde modal_data_service
 # para evitar import circular con analysis/
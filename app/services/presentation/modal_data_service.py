@@ -15,17 +15,23 @@ Uso:
 from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 import logging
 
+import numpy as np
+
 from ..parsing.session_manager import SessionManager
 from .result_formatter import ResultFormatter
+from ..analysis.combo_detail import combo_results
+from .formatters import format_safety_factor
 
 logger = logging.getLogger(__name__)
 from ...domain.constants.units import TONF_TO_N, TONFM_TO_NMM
 from ...domain.chapter18.boundary_elements import (
     calculate_boundary_stress as _calculate_boundary_stress,
+    scan_boundary_stress as _scan_boundary_stress,
     BoundaryStressAnalysis,
 )
 
-from .plot_generator import PlotGenerator
+from .plot_generator import BIAXIAL_SF_LABEL, PlotGenerator
+from .plot_renderer import PlotRenderer
 from ..analysis.flexocompression_service import FlexocompressionService
 from ..analysis.shear_service import ShearService
 from ...domain.flexure import SlendernessService
@@ -66,7 +72,8 @@ class ElementDetailsService:
         flexocompression_service: Optional[FlexocompressionService] = None,
         shear_service: Optional[ShearService] = None,
         slenderness_service: Optional[SlendernessService] = None,
-        plot_generator: Optional[PlotGenerator] = None
+        plot_generator: Optional[PlotGenerator] = None,
+        plot_renderer: Optional[PlotRenderer] = None
     ):
         """
         Inicializa el servicio de detalles de elementos.
@@ -78,6 +85,8 @@ class ElementDetailsService:
             shear_service: Servicio para capacidades de corte (opcional)
             slenderness_service: Servicio de esbeltez (opcional)
             plot_generator: Generador de gráficos (opcional)
+            plot_renderer: Renderizador con cache de gráficos (opcional,
+                default uno sobre plot_generator)
         """
         self._session_manager = session_manager
 
@@ -92,6 +101,7 @@ class ElementDetailsService:
         self._shear_service = shear_service or ShearService()
         self._slenderness_service = slenderness_service or SlendernessService()
         self._plot_generator = plot_generator or PlotGenerator()
+        self._plot_renderer = plot_renderer or PlotRenderer(self._plot_generator)
         self._seismic_reinf_service = SeismicReinforcementService()
 
     # =========================================================================
@@ -194,7 +204,7 @@ class ElementDetailsService:
         Returns:
             La combinación encontrada o None
         """
-        for combo in pier_forces.combinations:
+        for combo in pier_forces.iter_combinations():
             # Coincidencia exacta con nombre completo
             combo_full_name = f"{combo.name} ({combo.location})"
             if combo_full_name == critical_combo_name:
@@ -233,11 +243,8 @@ class ElementDetailsService:
         if pier is not None:
             if proposed_config:
                 pier = self._apply_proposed_config_pier(pier, proposed_config)
-            # Detectar strut antes de elegir generador
-            if pier.is_strut:
-                section_diagram = self._plot_generator.generate_strut_section_diagram(pier)
-            else:
-                section_diagram = self._plot_generator.generate_section_diagram(pier)
+            # Strut, muro simple o compuesto (cacheado por huella del pier)
+            section_diagram = self._plot_renderer.section_diagram(pier)
             return {
                 'success': True,
                 'pier_key': element_key,
@@ -248,11 +255,8 @@ class ElementDetailsService:
         # Intentar obtener como columna
         column = self._session_manager.get_column(session_id, element_key)
         if column is not None:
-            # Detectar strut antes de elegir generador
-            if column.is_strut:
-                section_diagram = self._plot_generator.generate_strut_section_diagram(column)
-            else:
-                section_diagram = self._plot_generator.generate_column_section_diagram(column)
+            # Strut o columna (cacheado por huella de la columna)
+            section_diagram = self._plot_renderer.section_diagram(column, column=True)
             return {
                 'success': True,
                 'pier_key': element_key,
@@ -305,48 +309,33 @@ class ElementDetailsService:
         Returns:
             Dict con datos de boundary element check
         """
-        if not pier_forces or not pier_forces.combinations:
+        if not pier_forces or not pier_forces.n_combinations:
             return {
                 'has_data': False,
                 'rows': []
             }
 
-        # Buscar la combinación con mayor esfuerzo de compresión en cada borde
-        max_sigma_left = 0.0
-        max_sigma_right = 0.0
-        critical_combo_left = 'N/A'
-        critical_combo_right = 'N/A'
-        Pu_left = 0.0
-        Mu_left = 0.0
-        Pu_right = 0.0
-        Mu_right = 0.0
-        sigma_limit = 0.2 * pier.fc  # Se usará para el resultado
-
-        for combo in pier_forces.combinations:
-            M_max = max(abs(combo.M2), abs(combo.M3))
-            # Convertir unidades: tonf -> N, tonf-m -> N-mm
-            P_N = combo.P * TONF_TO_N
-            M_Nmm = abs(M_max) * TONFM_TO_NMM
-            stress = _calculate_boundary_stress(
-                width=pier.width,
-                thickness=pier.thickness,
-                fc=pier.fc,
-                P_N=P_N,
-                M_Nmm=M_Nmm
-            )
-            combo_name = f"{combo.name} ({combo.location})"
-
-            if stress.sigma_left > max_sigma_left:
-                max_sigma_left = stress.sigma_left
-                critical_combo_left = combo_name
-                Pu_left = combo.P
-                Mu_left = M_max
+        # Combinación con mayor esfuerzo de compresión en cada borde, en
+        # una sola pasada sobre las columnas de fuerzas
+        M_max = np.maximum(np.abs(pier_forces.values('M2')), np.abs(pier_forces.values('M3')))
+        # Convertir unidades: tonf -> N, tonf-m -> N-mm
+        scan = _scan_boundary_stress(
+            width=pier.width,
+            thickness=pier.thickness,
+            fc=pier.fc,
+            P_N=pier_forces.values('P') * TONF_TO_N,
+            M_Nmm=M_max * TONFM_TO_NMM
+        )
+        max_sigma_left = scan.sigma_left
+        max_sigma_right = scan.sigma_right
+        sigma_limit = scan.sigma_limit
 
-            if stress.sigma_right > max_sigma_right:
-                max_sigma_right = stress.sigma_right
-                critical_combo_right = combo_name
-                Pu_right = combo.P
-                Mu_right = M_max
+        critical_combo_left, Pu_left, Mu_left = self._boundary_critical_combo(
+            pier_forces, scan.index_left, M_max
+        )
+        critical_combo_right, Pu_right, Mu_right = self._boundary_critical_combo(
+            pier_forces, scan.index_right, M_max
+        )
 
         # Determinar si se requiere elemento de borde
         required_left = max_sigma_left >= sigma_limit
@@ -385,6 +374,14 @@ class ElementDetailsService:
             'any_required': required_left or required_right
         }
 
+    @staticmethod
+    def _boundary_critical_combo(pier_forces, index, M_max) -> Tuple[str, float, float]:
+        """(nombre, Pu, Mu) de la combinación crítica de un borde ('N/A' si no hay)."""
+        if index is None:
+            return 'N/A', 0.0, 0.0
+        combo = pier_forces.get_combination(index)
+        return f"{combo.name} ({combo.location})", combo.P, float(M_max[index])
+
     def get_combination_details(
         self,
         session_id: str,
@@ -397,6 +394,12 @@ class ElementDetailsService:
         ARQUITECTURA: Lee SIEMPRE del cache de combo_results calculado durante
         el análisis inicial. Esto garantiza que el modal muestre el mismo DCR
         que la tabla (sin recálculos que pueden dar resultados diferentes).
+        Las filas se arman desde la tabla compacta del análisis en la primera
+        consulta y quedan memorizadas en el cache.
+
+        La flexión incluye además el SF/DCR biaxial (superficie P-M2-M3, el
+        que muestra el diagrama de la combinación) rotulado aparte: el de la
+        tabla usa la curva primaria y puede diferir.
 
         Args:
             session_id: ID de sesión
@@ -420,19 +423,18 @@ class ElementDetailsService:
 
         # Obtener fuerzas para info adicional
         pier_forces = self._session_manager.get_pier_forces(session_id, pier_key)
-        if not pier_forces or not pier_forces.combinations:
+        if not pier_forces or not pier_forces.n_combinations:
             return {'success': False, 'error': 'No hay combinaciones de carga'}
 
-        if combo_index < 0 or combo_index >= len(pier_forces.combinations):
+        if combo_index < 0 or combo_index >= pier_forces.n_combinations:
             return {'success': False, 'error': 'Índice de combinación inválido'}
 
-        combo = pier_forces.combinations[combo_index]
+        combo = pier_forces.get_combination(combo_index)
 
         # =====================================================================
         # LEER FLEXURE DEL CACHE (combo_results)
         # =====================================================================
-        cached_flexure = cached_result.get('flexure', {})
-        flexure_combo_results = cached_flexure.get('combo_results', [])
+        flexure_combo_results = combo_results(cached_result, 'flexure')
 
         if combo_index < len(flexure_combo_results):
             # Usar resultado pre-calculado del combo específico
@@ -452,11 +454,14 @@ class ElementDetailsService:
             # Fallback: usar datos críticos del cache (no debería pasar)
             flexure_data = self._build_flexure_from_cache(cached_result, combo)
 
+        pier = self._session_manager.get_pier(session_id, pier_key)
+        if pier:
+            flexure_data.update(self._biaxial_flexure(pier, combo))
+
         # =====================================================================
         # LEER SHEAR DEL CACHE (combo_results)
         # =====================================================================
-        cached_shear = cached_result.get('shear', {})
-        shear_combo_results = cached_shear.get('combo_results', [])
+        shear_combo_results = combo_results(cached_result, 'shear')
 
         if combo_index < len(shear_combo_results):
             # Usar resultado pre-calculado del combo específico
@@ -482,7 +487,6 @@ class ElementDetailsService:
         # =====================================================================
         # BOUNDARY: Calcular para este combo (no se cachea por combo)
         # =====================================================================
-        pier = self._session_manager.get_pier(session_id, pier_key)
         if pier:
             boundary_data = self._calc_boundary_for_combo(pier, combo)
         else:
@@ -504,6 +508,19 @@ class ElementDetailsService:
             'boundary': boundary_data
         }
 
+    def _biaxial_flexure(self, pier, combo) -> Dict[str, Any]:
+        """
+        SF y DCR de la combinación contra la superficie biaxial del pier
+        (cacheada por sección), los mismos del diagrama P-M de la combinación.
+        """
+        surface = self._flexo_service.biaxial_surface(pier)
+        sf = surface.safety_factor(combo.P_compression, combo.M2, combo.M3)
+        return {
+            'sf_biaxial': format_safety_factor(sf, as_string=False),
+            'dcr_biaxial': round(1.0 / sf, 3) if sf > 0 and np.isfinite(sf) else 0,
+            'sf_biaxial_label': BIAXIAL_SF_LABEL,
+        }
+
     def _build_flexure_from_cache(
         self,
         cached_result: Dict[str, Any],
@@ -657,6 +674,7 @@ class ElementDetailsService:
         result['slenderness'] = cached.get('slenderness')
 
         # Flexión: extraer del cache usando método unificado (mismo DCR que la tabla)
+        combo_results(cached, 'flexure')  # Filas por combinación bajo demanda
         flexure_data = ResultFormatter.extract_flexure(cached)
         result['flexure_design'] = self._format_flexure_for_modal(flexure_data, cached)
 
@@ -668,7 +686,7 @@ class ElementDetailsService:
         result['boundary_check'] = cached.get('boundary_element')
 
         # Lista de combinaciones: simplificada desde fuerzas
-        if forces and forces.combinations:
+        if forces and forces.n_combinations:
             result['combinations_list'] = self._get_combinations_list_from_cache(
                 forces, cached
             )
@@ -1059,7 +1077,7 @@ class ElementDetailsService:
         Incluye fuerzas y flags de combinación crítica para el frontend.
         El frontend espera campos P, M2, M3, V2, V3 (sin sufijos).
         """
-        if not forces or not forces.combinations:
+        if not forces or not forces.n_combinations:
             return []
 
         # Obtener combinación crítica del cache
@@ -1071,7 +1089,7 @@ class ElementDetailsService:
         seen_combos: Dict[str, int] = {}
         combos_list = []
 
-        for i, combo in enumerate(forces.combinations):
+        for i, combo in enumerate(forces.iter_combinations()):
             combo_name = combo.name
             full_name = f"{combo_name} ({combo.location})"
 
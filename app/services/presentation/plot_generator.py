@@ -1,23 +1,34 @@
-# app/structural/services/presentation/plot_generator.py
+# app/services/presentation/plot_generator.py
 """
 Generador de gráficos para análisis estructural.
 Crea diagramas de interacción P-M usando matplotlib.
+
+Las figuras se crean con matplotlib.figure.Figure y no con pyplot: pyplot
+mantiene una figura "actual" global que no es thread-safe, y Flask atiende
+requests en varios threads. Cada figura es independiente y se libera al
+salir de alcance (no hay que cerrarla).
 """
 import base64
 from io import BytesIO
-from typing import List, Tuple, TYPE_CHECKING
+from typing import List, Tuple, Union, TYPE_CHECKING
 import math
 
 import matplotlib
 matplotlib.use('Agg')  # Backend sin GUI para servidor
-import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle, Circle, FancyBboxPatch
 
+from ...domain.flexure import InteractionCurve
+
 if TYPE_CHECKING:
     from ...domain.entities import VerticalElement
     from ...domain.entities.rebar import RebarLayout
 
+# Rótulo del SF de la superficie biaxial (diagrama de una combinación), para
+# distinguirlo del de la tabla de combinaciones (curva primaria)
+BIAXIAL_SF_LABEL = 'FS biaxial P-M2-M3'
+
 
 class PlotGenerator:
     """
@@ -30,25 +41,40 @@ class PlotGenerator:
     COLOR_DEMAND_FAIL = '#dc2626'   # Rojo
     COLOR_FILL = '#3b82f6'          # Azul claro
 
-    def __init__(self, dpi: int = 150):
+    # Formatos de imagen soportados por _encode()
+    IMAGE_FORMATS = ('png', 'svg')
+
+    def __init__(self, dpi: int = 150, image_format: str = 'png'):
+        if image_format not in self.IMAGE_FORMATS:
+            raise ValueError(f"Formato de imagen no soportado: {image_format}")
         self.dpi = dpi
+        self.image_format = image_format
+
+    def _encode(self, fig: Figure) -> str:
+        """Ajusta la figura y la retorna como imagen en base64."""
+        fig.tight_layout()
+        buffer = BytesIO()
+        fig.savefig(buffer, format=self.image_format, dpi=self.dpi, bbox_inches='tight',
+                    facecolor='white', edgecolor='none')
+        return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
     def generate_pm_diagram(
         self,
-        capacity_curve: List[Tuple[float, float]],
+        capacity_curve: Union[InteractionCurve, List[Tuple[float, float]]],
         demand_points: List[Tuple[float, float, str]],
         pier_label: str,
         safety_factor: float,
         show_legend: bool = True,
         figsize: Tuple[int, int] = (8, 6),
         moment_axis: str = 'M3',
-        angle_deg: float = 0
+        angle_deg: float = 0,
+        sf_label: str = 'Factor de Seguridad'
     ) -> str:
         """
         Genera el diagrama de interacción P-M.
 
         Args:
-            capacity_curve: Lista de (φMn, φPn) en tonf-m y tonf
+            capacity_curve: InteractionCurve o lista de (φMn, φPn) en tonf-m y tonf
             demand_points: Lista de (Pu, Mu, combo_name) en tonf y tonf-m
             pier_label: Etiqueta del pier
             safety_factor: Factor de seguridad calculado
@@ -56,15 +82,22 @@ class PlotGenerator:
             figsize: Tamaño de la figura
             moment_axis: 'M2', 'M3', 'combined', o 'SRSS'
             angle_deg: Ángulo para vista combinada
+            sf_label: Rótulo del factor de seguridad en el título
 
         Returns:
             Imagen en formato base64
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
 
         # Extraer datos de la curva de capacidad
-        M_capacity = [p[0] for p in capacity_curve]
-        P_capacity = [p[1] for p in capacity_curve]
+        if isinstance(capacity_curve, InteractionCurve):
+            M_capacity = capacity_curve.phi_Mn.tolist()
+            P_capacity = capacity_curve.phi_Pn.tolist()
+            capacity_curve = list(zip(M_capacity, P_capacity))
+        else:
+            M_capacity = [p[0] for p in capacity_curve]
+            P_capacity = [p[1] for p in capacity_curve]
 
         # Cerrar la curva para el relleno
         M_closed = M_capacity + [M_capacity[0]]
@@ -116,7 +149,7 @@ class PlotGenerator:
         status = "OK" if safety_factor >= 1.0 else "NO OK"
         status_color = self.COLOR_DEMAND_OK if safety_factor >= 1.0 else self.COLOR_DEMAND_FAIL
         ax.set_title(f'Diagrama de Interacción - {pier_label}\n'
-                    f'Factor de Seguridad: {safety_factor:.2f} ({status})',
+                    f'{sf_label}: {safety_factor:.2f} ({status})',
                     fontsize=12)
 
         # Grid
@@ -138,17 +171,7 @@ class PlotGenerator:
         ax.set_xlim(x_min - margin_x, x_max + margin_x)
         ax.set_ylim(y_min - margin_y, y_max + margin_y)
 
-        plt.tight_layout()
-
-        # Convertir a base64
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        plt.close(fig)
-
-        image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        return image_base64
+        return self._encode(fig)
 
     def _point_inside_curve(
         self,
@@ -260,7 +283,8 @@ class PlotGenerator:
         if pier.is_composite:
             return self._generate_composite_section_diagram(pier, figsize)
 
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
 
         # Dimensiones en mm
         lw = pier.length      # Largo del muro
@@ -443,16 +467,7 @@ class PlotGenerator:
         ax.set_ylim(y0 - dim_offset * 2, y0 + tw + dim_offset * 2)
         ax.axis('off')
 
-        plt.tight_layout()
-
-        # Convertir a base64
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        plt.close(fig)
-
-        return base64.b64encode(buffer.read()).decode('utf-8')
+        return self._encode(fig)
 
     def generate_column_section_diagram(
         self,
@@ -475,7 +490,8 @@ class PlotGenerator:
         Returns:
             Imagen en formato base64
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
 
         # Dimensiones en mm
         depth = column.depth    # Profundidad (eje 2)
@@ -599,16 +615,7 @@ class PlotGenerator:
         ax.set_ylim(y0 - dim_offset * 2, y0 + depth + dim_offset * 2)
         ax.axis('off')
 
-        plt.tight_layout()
-
-        # Convertir a base64
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        plt.close(fig)
-
-        return base64.b64encode(buffer.read()).decode('utf-8')
+        return self._encode(fig)
 
     def generate_strut_section_diagram(
         self,
@@ -631,7 +638,8 @@ class PlotGenerator:
         Returns:
             Imagen en formato base64
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
 
         # Dimensiones en mm (usar depth/width para columnas, length/thickness para piers)
         if hasattr(element, 'depth') and element.depth > 0:
@@ -722,16 +730,7 @@ class PlotGenerator:
         ax.set_ylim(y0 - dim_offset * 2, y0 + depth + dim_offset * 2)
         ax.axis('off')
 
-        plt.tight_layout()
-
-        # Convertir a base64
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        plt.close(fig)
-
-        return base64.b64encode(buffer.read()).decode('utf-8')
+        return self._encode(fig)
 
     # =========================================================================
     # Composite Section Diagram (L, T, C shapes)
@@ -759,11 +758,11 @@ class PlotGenerator:
         Returns:
             Imagen en formato base64
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig = Figure(figsize=figsize)
+        ax = fig.subplots()
 
         cs = pier.composite_section
         if cs is None:
-            plt.close(fig)
             return ""
 
         # Obtener bounding box de la seccion
@@ -952,13 +951,4 @@ class PlotGenerator:
         ax.axis('off')
         ax.legend(loc='lower right')
 
-        plt.tight_layout()
-
-        # Convertir a base64
-        buffer = BytesIO()
-        fig.savefig(buffer, format='png', dpi=self.dpi, bbox_inches='tight',
-                   facecolor='white', edgecolor='none')
-        buffer.seek(0)
-        plt.close(fig)
-
-        return base64.b64encode(buffer.read()).decode('utf-8')
\ No newline at end of file
+        return self._encode(fig)
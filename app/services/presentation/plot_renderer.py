@@ -0,0 +1,404 @@
+# app/services/presentation/plot_renderer.py
+"""
+Renderizado de gráficos en paralelo con cache de imágenes.
+
+Los diagramas (P-M por combinación y secciones transversales) se dibujan
+con PlotGenerator cada vez que se abre un modal: ~100-300 ms de matplotlib
+en el thread del request. PlotRenderer:
+
+- Guarda cada imagen ya codificada (base64 de PNG o SVG, lo que consumen la
+  API y el reporte PDF) en un cache LRU direccionado por contenido, con
+  clave (tipo, huella del elemento, hash de la curva, hash de la demanda,
+  dpi, formato). Un acierto es una consulta de diccionario.
+- Renderiza los faltantes en un pool (threads o procesos). Si un gráfico
+  ya se está renderizando (ej: lo pidió la pre-generación) el request
+  espera ese mismo resultado en vez de dibujarlo de nuevo.
+- Permite pre-generar (prefetch) en segundo plano los diagramas de los
+  elementos más críticos apenas termina el análisis.
+
+Backends:
+- 'thread' (default): ThreadPoolExecutor. PlotGenerator no usa el estado
+  global de pyplot, por lo que varias figuras se pueden dibujar a la vez.
+- 'process': ProcessPoolExecutor (el dibujo no compite por el GIL con los
+  requests); los argumentos (elementos, curvas) deben ser picklables y cada
+  worker usa un PlotGenerator propio con el dpi y formato del inyectado.
+
+Configuración (variables de entorno):
+- INGEO_PLOT_BACKEND: 'thread' o 'process' (default: INGEO_ANALYSIS_BACKEND)
+- INGEO_PLOT_WORKERS: workers del pool (default min(4, núcleos))
+- INGEO_PLOT_CACHE_ENTRIES: máximo de imágenes (default 512)
+- INGEO_PLOT_CACHE_MB: memoria máxima en MB (default 64)
+"""
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
+
+from ...domain.flexure import InteractionCurve
+from ..analysis.analysis_backend import (
+    BACKEND_PROCESS, init_worker_process, resolve_backend, resolve_workers,
+)
+from ..analysis.input_fingerprint import canonical, hash_bytes
+from .plot_generator import PlotGenerator
+
+if TYPE_CHECKING:
+    from ...domain.entities import VerticalElement
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_MB = 64
+
+# (tipo, huella del elemento, hash de la curva, hash de la demanda, dpi, formato)
+PlotKey = Tuple[str, str, str, str, int, str]
+
+
+# =============================================================================
+# HUELLAS
+# =============================================================================
+
+def _hash_json(value: Any) -> str:
+    payload = json.dumps(canonical(value), sort_keys=True, separators=(',', ':'))
+    return hash_bytes(payload.encode())
+
+
+def element_fingerprint(element: Any) -> str:
+    """
+    Huella de un elemento: cambia con cualquier campo público (geometría,
+    armadura, sección compuesta), por lo que una vista previa con armadura
+    propuesta no comparte imagen con el elemento original.
+    """
+    return _hash_json(element)
+
+
+def curve_hash(curve: Union[InteractionCurve, List[Tuple[float, float]]]) -> str:
+    """Hash de los puntos de una curva P-M (InteractionCurve o [(φMn, φPn)])."""
+    if isinstance(curve, InteractionCurve):
+        return hash_bytes(b'C' + curve.array.tobytes())
+    return hash_bytes(b'L' + np.asarray(curve, dtype=np.float64).tobytes())
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class PlotImageCache:
+    """
+    Cache LRU de imágenes codificadas con límite de entradas y de memoria.
+
+    Thread-safe: lo comparten los requests y la pre-generación.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        if max_entries is None:
+            max_entries = int(os.environ.get('INGEO_PLOT_CACHE_ENTRIES', DEFAULT_MAX_ENTRIES))
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get('INGEO_PLOT_CACHE_MB', DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._images: 'OrderedDict[PlotKey, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: PlotKey) -> Optional[str]:
+        """Imagen cacheada (o None), marcada como usada recientemente."""
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+        return image
+
+    def put(self, key: PlotKey, image: str) -> None:
+        """Guarda una imagen, desalojando las menos usadas si se excede el límite."""
+        if len(image) > self.max_bytes or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._images[key] = image
+            self._bytes += len(image)
+
+            while len(self._images) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Vacía el cache y reinicia los contadores."""
+        with self._lock:
+            self._images.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __contains__(self, key: PlotKey) -> bool:
+        return key in self._images
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de uso del cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._images),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+# Instancia compartida entre servicios y sesiones
+plot_image_cache = PlotImageCache()
+
+
+# =============================================================================
+# TRABAJOS DE RENDERIZADO
+# =============================================================================
+
+@dataclass(frozen=True)
+class PlotJob:
+    """Gráfico a renderizar: método de PlotGenerator y sus argumentos."""
+    key: PlotKey
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+# Generadores por proceso worker (backend 'process'), por (dpi, formato)
+_worker_generators: Dict[Tuple[int, str], PlotGenerator] = {}
+
+
+def _render_in_worker(
+    method: str,
+    dpi: int,
+    image_format: str,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any]
+) -> str:
+    """Renderiza un gráfico dentro de un proceso worker. Picklable."""
+    generator = _worker_generators.get((dpi, image_format))
+    if generator is None:
+        generator = _worker_generators.setdefault(
+            (dpi, image_format), PlotGenerator(dpi=dpi, image_format=image_format)
+        )
+    return getattr(generator, method)(*args, **kwargs)
+
+
+# =============================================================================
+# SERVICIO
+# =============================================================================
+
+class PlotRenderer:
+    """
+    Renderiza diagramas en un pool y los sirve desde cache.
+
+    Example:
+        renderer = PlotRenderer(PlotGenerator())
+        image = renderer.pm_diagram(curve, [(Pu, Mu, 'C1')], 'P1 - M1', 1.3)
+        image = renderer.section_diagram(pier)            # hit si ya se pidió
+        renderer.prefetch([renderer.section_job(e) for e in criticos])
+        renderer.stats()  # {'hits': ..., 'misses': ..., 'in_flight': ...}
+    """
+
+    def __init__(
+        self,
+        generator: Optional[PlotGenerator] = None,
+        backend: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        cache: Optional[PlotImageCache] = None
+    ):
+        self.generator = generator or PlotGenerator()
+        self.backend = resolve_backend(backend or os.environ.get('INGEO_PLOT_BACKEND'))
+        self.max_workers = resolve_workers(max_workers, 'INGEO_PLOT_WORKERS')
+        self.cache = cache if cache is not None else plot_image_cache
+        self._executor: Optional[Executor] = None
+        self._in_flight: Dict[PlotKey, Future] = {}
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # Trabajos
+    # =========================================================================
+
+    def _key(self, kind: str, element: str, curve: str = '', demand: str = '') -> PlotKey:
+        return (kind, element, curve, demand, self.generator.dpi, self.generator.image_format)
+
+    def pm_job(
+        self,
+        capacity_curve: Union[InteractionCurve, List[Tuple[float, float]]],
+        demand_points: List[Tuple[float, float, str]],
+        pier_label: str,
+        safety_factor: float,
+        **options: Any
+    ) -> PlotJob:
+        """
+        Trabajo del diagrama P-M (mismos argumentos que
+        PlotGenerator.generate_pm_diagram()).
+        """
+        demand = _hash_json([demand_points, safety_factor, options])
+        key = self._key('pm', _hash_json(pier_label), curve_hash(capacity_curve), demand)
+        return PlotJob(key, 'generate_pm_diagram',
+                       (capacity_curve, demand_points, pier_label, safety_factor), options)
+
+    def section_job(self, element: 'VerticalElement', column: bool = False) -> PlotJob:
+        """
+        Trabajo del diagrama de sección: strut, columna o muro (simple o
+        compuesto) según el elemento.
+
+        Args:
+            element: Pier o columna
+            column: True si el elemento es una columna
+        """
+        if element.is_strut:
+            method = 'generate_strut_section_diagram'
+        elif column:
+            method = 'generate_column_section_diagram'
+        else:
+            method = 'generate_section_diagram'
+        return PlotJob(self._key(method, element_fingerprint(element)), method, (element,))
+
+    # =========================================================================
+    # Renderizado
+    # =========================================================================
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.backend == BACKEND_PROCESS:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=init_worker_process
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='plot'
+                )
+        return self._executor
+
+    def _submit(self, job: PlotJob) -> Future:
+        """Future del gráfico, reutilizando el renderizado en curso si existe."""
+        with self._lock:
+            future = self._in_flight.get(job.key)
+            if future is not None:
+                return future
+            if self.backend == BACKEND_PROCESS:
+                future = self._get_executor().submit(
+                    _render_in_worker, job.method, self.generator.dpi,
+                    self.generator.image_format, job.args, job.kwargs
+                )
+            else:
+                future = self._get_executor().submit(
+                    getattr(self.generator, job.method), *job.args, **job.kwargs
+                )
+            self._in_flight[job.key] = future
+        future.add_done_callback(lambda f, key=job.key: self._finish(key, f))
+        return future
+
+    def _finish(self, key: PlotKey, future: Future) -> None:
+        """Guarda la imagen terminada y la saca de los renderizados en curso."""
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    def render(self, job: PlotJob) -> str:
+        """
+        Imagen del trabajo: desde cache, o renderizada y cacheada.
+
+        Returns:
+            Imagen en formato base64
+
+        Raises:
+            Exception: El error del renderizado (no se cachea)
+        """
+        image = self.cache.get(job.key)
+        if image is None:
+            image = self._submit(job).result()
+        return image
+
+    def pm_diagram(self, *args: Any, **kwargs: Any) -> str:
+        """Diagrama P-M en base64 (ver pm_job())."""
+        return self.render(self.pm_job(*args, **kwargs))
+
+    def section_diagram(self, element: 'VerticalElement', column: bool = False) -> str:
+        """Diagrama de sección en base64 (ver section_job())."""
+        return self.render(self.section_job(element, column))
+
+    def render_many(self, jobs: Iterable[PlotJob]) -> Iterator[Tuple[PlotJob, Optional[str]]]:
+        """
+        Renderiza varios trabajos en paralelo y los entrega a medida que
+        terminan (primero los que ya están en cache).
+
+        Yields:
+            (trabajo, imagen en base64 o None si el renderizado falló)
+        """
+        pending: Dict[Future, List[PlotJob]] = {}
+        for job in jobs:
+            image = self.cache.get(job.key)
+            if image is not None:
+                yield job, image
+            else:
+                pending.setdefault(self._submit(job), []).append(job)
+
+        for future in as_completed(pending):
+            try:
+                image = future.result()
+            except Exception as e:
+                logger.warning(f"Renderizado de {pending[future][0].method} falló: {e}")
+                image = None
+            for job in pending[future]:
+                yield job, image
+
+    def prefetch(self, jobs: Iterable[PlotJob]) -> int:
+        """
+        Encola en segundo plano los trabajos que no están en cache.
+
+        No espera a que terminen; los errores solo se registran en el log.
+
+        Returns:
+            Cantidad de gráficos encolados
+        """
+        queued = 0
+        for job in jobs:
+            if job.key in self.cache:
+                continue
+            self._submit(job).add_done_callback(
+                lambda f, method=job.method: self._log_prefetch_error(method, f)
+            )
+            queued += 1
+        return queued
+
+    @staticmethod
+    def _log_prefetch_error(method: str, future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Pre-generación de {method} falló: {future.exception()}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores del cache más renderizados en curso."""
+        with self._lock:
+            in_flight = len(self._in_flight)
+        return {**self.cache.stats(), 'in_flight': in_flight, 'backend': self.backend}
+
+    def shutdown(self) -> None:
+        """Libera el pool (los renderizados pendientes se cancelan)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
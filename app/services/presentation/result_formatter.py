@@ -55,6 +55,38 @@ class ResultFormatter:
         formatted = ResultFormatter.format_any_element(element, key, result)
     """
 
+    # Detalle por combinación: se omite en las filas resumen del streaming
+    # y se consulta bajo demanda desde el cache de la sesión
+    DETAIL_KEYS = ('combo_results', 'combo_table', 'design_curve')
+
+    @staticmethod
+    def _combo_detail(source: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Detalle por combinación a copiar al resultado formateado.
+
+        Filas ya armadas (combo_results) o, si el análisis solo produjo la
+        tabla compacta, la tabla para armarlas bajo demanda (combo_detail).
+        """
+        if 'combo_results' not in source and 'combo_table' in source:
+            return {'combo_table': source['combo_table']}
+        return {'combo_results': source.get('combo_results', [])}
+
+    @staticmethod
+    def summary_row(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fila resumen de un resultado formateado (sin detalle por combinación).
+
+        Copia superficial: no modifica el resultado cacheado.
+        """
+        row = {}
+        for key, value in result.items():
+            if key in ResultFormatter.DETAIL_KEYS:
+                continue
+            if isinstance(value, dict) and any(k in value for k in ResultFormatter.DETAIL_KEYS):
+                value = {k: v for k, v in value.items() if k not in ResultFormatter.DETAIL_KEYS}
+            row[key] = value
+        return row
+
     # =========================================================================
     # Formateo de continuidad de muros
     # =========================================================================
@@ -429,9 +461,9 @@ class ResultFormatter:
                 'sf': round(sf, 2) if sf < 100 else 100.0,
                 'dcr': round(dcr, 3),  # Precisión 3 decimales como el servicio
                 'status': flex.get('status', 'OK'),
-                # Resultados de TODAS las combinaciones (para modal sin recálculo)
-                'combo_results': flex.get('combo_results', []),
             })
+            # Resultados de TODAS las combinaciones (para modal sin recálculo)
+            flexure_data.update(ResultFormatter._combo_detail(flex))
             flexure_data['dcr_class'] = get_dcr_css_class(flexure_data['dcr'])
 
         return flexure_data
@@ -862,9 +894,9 @@ class ResultFormatter:
         formatted['shear'] = ResultFormatter._extract_shear_from_domain(
             domain_result, result.dcr_max, 'wall'
         )
-        # Agregar combo_results del ShearService (para modal sin recálculos)
+        # Agregar detalle por combinación del ShearService (para modal sin recálculos)
         if hasattr(result, 'shear_data') and result.shear_data:
-            formatted['shear']['combo_results'] = result.shear_data.get('combo_results', [])
+            formatted['shear'].update(ResultFormatter._combo_detail(result.shear_data))
 
         # Elementos de borde
         if hasattr(domain_result, 'boundary') and domain_result.boundary:
@@ -914,9 +946,9 @@ class ResultFormatter:
         formatted['shear'] = ResultFormatter._extract_shear_from_domain(
             domain_result, result.dcr_max, 'column'
         )
-        # Agregar combo_results del ShearService (para modal sin recálculos)
+        # Agregar detalle por combinación del ShearService (para modal sin recálculos)
         if hasattr(result, 'shear_data') and result.shear_data:
-            formatted['shear']['combo_results'] = result.shear_data.get('combo_results', [])
+            formatted['shear'].update(ResultFormatter._combo_detail(result.shear_data))
 
         # Verificaciones sísmicas de columna
         dimensional = None
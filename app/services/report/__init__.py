@@ -8,5 +8,6 @@ de verificacion estructural segun ACI 318-25.
 
 from .report_config import ReportConfig
 from .pdf_generator import PDFReportGenerator
+from .report_pipeline import ReportPipeline, report_spool
 
-__all__ = ['ReportConfig', 'PDFReportGenerator']
+__all__ = ['ReportConfig', 'PDFReportGenerator', 'ReportPipeline', 'report_spool']
@@ -5,7 +5,7 @@ Generador de informes PDF para verificacion estructural ACI 318-25.
 import io
 import base64
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, BinaryIO, Callable, Optional, Tuple
 from datetime import datetime
 
 from reportlab.lib import colors
@@ -45,6 +45,9 @@ class PDFReportGenerator:
     GRAY_LIGHT = colors.HexColor('#f3f4f6')
     GRAY_DARK = colors.HexColor('#374151')
 
+    # Flowables entre llamadas al callback de progreso de write_report()
+    PROGRESS_EVERY = 10
+
     def __init__(self):
         """Inicializa el generador."""
         self.styles = getSampleStyleSheet()
@@ -113,10 +116,15 @@ class PDFReportGenerator:
         piers: Dict[str, Any],
         config: ReportConfig,
         statistics: Optional[Dict[str, Any]] = None,
-        summary_plot_base64: Optional[str] = None
+        summary_plot_base64: Optional[str] = None,
+        pm_plots: Optional[Dict[str, str]] = None,
+        section_diagrams: Optional[Dict[str, str]] = None
     ) -> bytes:
         """
-        Genera el informe PDF completo.
+        Genera el informe PDF completo en memoria.
+
+        Para informes grandes usar build_story() + write_report() con un
+        archivo temporal (ver ReportPipeline).
 
         Args:
             results: Lista de resultados de verificacion (dicts de to_dict())
@@ -124,21 +132,37 @@ class PDFReportGenerator:
             config: Configuracion del informe
             statistics: Estadisticas del analisis
             summary_plot_base64: Grafico resumen en base64 (opcional)
+            pm_plots: Diagramas P-M en base64 por clave Story_Label
+                (default: los 'pm_plot' de los resultados)
+            section_diagrams: Secciones transversales en base64 por clave
 
         Returns:
             Bytes del PDF generado
         """
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch
+        story = self.build_story(
+            results, config, statistics, summary_plot_base64, pm_plots, section_diagrams
         )
+        buffer = io.BytesIO()
+        self.write_report(story, buffer)
+        return buffer.getvalue()
 
-        # Construir el contenido
+    def build_story(
+        self,
+        results: List[Dict[str, Any]],
+        config: ReportConfig,
+        statistics: Optional[Dict[str, Any]] = None,
+        summary_plot_base64: Optional[str] = None,
+        pm_plots: Optional[Dict[str, str]] = None,
+        section_diagrams: Optional[Dict[str, str]] = None
+    ) -> List:
+        """
+        Construye el contenido (flowables) del informe.
+
+        Args: ver generate_report()
+
+        Returns:
+            Lista de flowables para write_report()
+        """
         story = []
 
         # 1. Portada
@@ -166,20 +190,104 @@ class PDFReportGenerator:
             story.append(PageBreak())
             story.extend(self._build_full_results_table(results))
 
-        # 7. Diagramas P-M (recolectar de los resultados si tienen)
+        # 7. Diagramas P-M (si no se entregan, recolectar de los resultados;
+        # los struts traen un dict con datos del diagrama, no una imagen)
         if config.include_pm_diagrams:
-            pm_plots = {
-                f"{r['story']}_{r['pier_label']}": r.get('pm_plot', '')
-                for r in results if r.get('pm_plot')
-            }
+            if pm_plots is None:
+                pm_plots = {
+                    f"{r['story']}_{r['pier_label']}": r['pm_plot']
+                    for r in results if isinstance(r.get('pm_plot'), str) and r['pm_plot']
+                }
             if pm_plots:
                 story.append(PageBreak())
                 story.extend(self._build_pm_diagrams_section(pm_plots, results))
 
-        # Generar PDF
+        # 8. Secciones transversales
+        if config.include_sections and section_diagrams:
+            story.append(PageBreak())
+            story.extend(self._build_sections_section(section_diagrams, results))
+
+        return story
+
+    def write_report(
+        self,
+        story: List,
+        output: BinaryIO,
+        on_progress: Optional[Callable[[int, int, int], None]] = None
+    ) -> int:
+        """
+        Escribe el PDF en un archivo binario abierto (o BytesIO).
+
+        Args:
+            story: Flowables de build_story() (ReportLab los consume)
+            output: Destino del PDF
+            on_progress: Callback (flowables_dibujados, total, pagina_actual)
+                cada PROGRESS_EVERY flowables y al terminar
+
+        Returns:
+            Cantidad de paginas
+        """
+        doc = SimpleDocTemplate(
+            output,
+            pagesize=letter,
+            rightMargin=0.75*inch,
+            leftMargin=0.75*inch,
+            topMargin=0.75*inch,
+            bottomMargin=0.75*inch
+        )
+
+        if on_progress is not None:
+            total = len(story)
+            drawn = 0
+
+            def after_flowable(flowable) -> None:
+                nonlocal drawn
+                drawn += 1
+                # Las tablas que cruzan de pagina se dibujan por partes
+                if drawn % self.PROGRESS_EVERY == 0:
+                    on_progress(min(drawn, total), total, doc.page)
+
+            doc.afterFlowable = after_flowable
+
         doc.build(story)
-        buffer.seek(0)
-        return buffer.getvalue()
+        if on_progress is not None:
+            on_progress(total, total, doc.page)
+        return doc.page
+
+    # =========================================================================
+    # Seleccion de piers
+    # =========================================================================
+
+    @staticmethod
+    def axial_load(result: Dict[str, Any]) -> float:
+        """|Pu| critico de flexion (orden de 'criticos por carga')."""
+        pu = result.get('flexure', {}).get('Pu', 0)
+        return abs(pu) if pu else 0
+
+    @staticmethod
+    def vertical_ratio(result: Dict[str, Any]) -> float:
+        """Cuantia vertical (orden de 'criticos por cuantia')."""
+        return result.get('reinforcement', {}).get('rho_vertical', 0) or 0
+
+    @classmethod
+    def critical_keys(cls, results: List[Dict[str, Any]], config: ReportConfig) -> List[str]:
+        """
+        Claves Story_Label de los piers que el informe detalla: top por
+        carga, top por cuantia y los que fallan (si se incluyen), sin
+        repetir y en ese orden.
+        """
+        selected = []
+        if config.top_by_load > 0:
+            selected += sorted(results, key=cls.axial_load, reverse=True)[:config.top_by_load]
+        if config.top_by_cuantia > 0:
+            selected += sorted(results, key=cls.vertical_ratio, reverse=True)[:config.top_by_cuantia]
+        if config.include_failing:
+            selected += [r for r in results if r.get('overall_status') != 'OK']
+        return list(dict.fromkeys(f"{r.get('story', '')}_{r.get('pier_label', '')}" for r in selected))
+
+    # =========================================================================
+    # Secciones del informe
+    # =========================================================================
 
     def _build_cover_page(self, config: ReportConfig) -> List:
         """Construye la portada del informe."""
@@ -316,12 +424,7 @@ class PDFReportGenerator:
         ))
 
         # Ordenar por carga axial (|Pu|) descendente
-        def get_pu(r):
-            flexure = r.get('flexure', {})
-            pu = flexure.get('Pu', 0)
-            return abs(pu) if pu else 0
-
-        sorted_results = sorted(results, key=get_pu, reverse=True)[:n]
+        sorted_results = sorted(results, key=self.axial_load, reverse=True)[:n]
 
         if not sorted_results:
             elements.append(Paragraph("No hay datos disponibles.", self.styles['Normal']))
@@ -373,11 +476,7 @@ class PDFReportGenerator:
         ))
 
         # Ordenar por cuantia vertical descendente
-        def get_rho_v(r):
-            reinf = r.get('reinforcement', {})
-            return reinf.get('rho_vertical', 0) or 0
-
-        sorted_results = sorted(results, key=get_rho_v, reverse=True)[:n]
+        sorted_results = sorted(results, key=self.vertical_ratio, reverse=True)[:n]
 
         if not sorted_results:
             elements.append(Paragraph("No hay datos disponibles.", self.styles['Normal']))
@@ -0,0 +1,413 @@
+# app/services/report/report_pipeline.py
+"""
+Pipeline del informe PDF con progreso (SSE) y salida en archivo temporal.
+
+Etapas:
+1. Análisis incremental (analyze_with_progress): reutiliza los resultados
+   cacheados de la sesión y solo re-verifica elementos cuyas entradas
+   cambiaron. Sus eventos de progreso se reenvían tal cual.
+2. Gráficos: diagramas P-M (curva primaria + demanda de todas las
+   combinaciones) y secciones transversales de los piers críticos,
+   renderizados en paralelo por PlotRenderer (los ya cacheados, ej: por la
+   pre-generación al terminar el análisis, no se vuelven a dibujar).
+3. PDF: ReportLab escribe en un SpooledTemporaryFile (en memoria hasta
+   INGEO_REPORT_SPOOL_MB, luego en disco) con progreso por flowable.
+
+El informe terminado queda en ReportSpool hasta que el cliente lo descarga
+en chunks (ver /structural/report/<report_id>).
+
+Configuración (variables de entorno):
+- INGEO_REPORT_SPOOL_MB: tamaño en memoria antes de pasar a disco (default 16)
+- INGEO_REPORT_TTL_S: segundos que un informe espera su descarga (default 600)
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from queue import Empty, SimpleQueue
+from tempfile import SpooledTemporaryFile
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+from ..presentation.result_formatter import ResultFormatter
+from .pdf_generator import PDFReportGenerator
+from .report_config import ReportConfig
+
+if TYPE_CHECKING:
+    from ..analysis.flexocompression_service import FlexocompressionService
+    from ..parsing.session_manager import SessionManager
+    from ..presentation.plot_renderer import PlotJob, PlotRenderer
+    from ..structural_analysis import StructuralAnalysisService
+
+logger = logging.getLogger(__name__)
+
+# Fases de los eventos de progreso del informe
+REPORT_PLOTS_PHASE = 'report_plots'
+REPORT_PAGES_PHASE = 'report_pages'
+
+DEFAULT_SPOOL_MB = 16
+DEFAULT_TTL_S = 600
+MAX_PENDING_REPORTS = 16
+
+# Tamaño de los chunks de la descarga
+CHUNK_SIZE = 64 * 1024
+
+# Espera máxima (s) entre eventos de páginas antes de revisar si el PDF terminó
+PAGE_EVENT_POLL_S = 0.05
+
+
+class _ReportCancelled(Exception):
+    """El cliente abandonó el informe: corta la escritura del PDF."""
+
+
+# =============================================================================
+# INFORMES TERMINADOS
+# =============================================================================
+
+@dataclass
+class SpooledReport:
+    """PDF terminado en un archivo temporal, pendiente de descarga."""
+    file: Any                   # SpooledTemporaryFile
+    filename: str
+    size: int                   # Bytes del PDF
+    pages: int
+    created: float = field(default_factory=time.monotonic)
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """Lee el PDF en chunks y cierra el archivo al terminar (o al abortar)."""
+        try:
+            self.file.seek(0)
+            while True:
+                chunk = self.file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ReportSpool:
+    """
+    Informes esperando descarga, por report_id.
+
+    Cada informe se descarga una vez (take() lo retira). Los no descargados
+    se descartan al vencer su TTL o al superar MAX_PENDING_REPORTS.
+    Thread-safe.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_reports: int = MAX_PENDING_REPORTS):
+        if ttl_seconds is None:
+            ttl_seconds = float(os.environ.get('INGEO_REPORT_TTL_S', DEFAULT_TTL_S))
+        self.ttl_seconds = ttl_seconds
+        self.max_reports = max_reports
+        self._reports: Dict[str, SpooledReport] = {}
+        self._lock = threading.Lock()
+
+    def put(self, report: SpooledReport) -> str:
+        """Guarda un informe y retorna su report_id."""
+        report_id = uuid.uuid4().hex
+        with self._lock:
+            expired = self._expire()
+            self._reports[report_id] = report
+            while len(self._reports) > self.max_reports:
+                oldest = min(self._reports, key=lambda k: self._reports[k].created)
+                expired.append(self._reports.pop(oldest))
+        for old in expired:
+            old.close()
+        return report_id
+
+    def take(self, report_id: str) -> Optional[SpooledReport]:
+        """Retira el informe (None si no existe o venció)."""
+        with self._lock:
+            expired = self._expire()
+            report = self._reports.pop(report_id, None)
+        for old in expired:
+            old.close()
+        return report
+
+    def _expire(self) -> List[SpooledReport]:
+        """Retira los informes vencidos (llamar con el lock tomado)."""
+        limit = time.monotonic() - self.ttl_seconds
+        stale = [k for k, r in self._reports.items() if r.created < limit]
+        return [self._reports.pop(k) for k in stale]
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+
+# Instancia compartida entre requests
+report_spool = ReportSpool()
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+class ReportPipeline:
+    """
+    Genera el informe PDF de una sesión emitiendo eventos de progreso.
+
+    Example:
+        pipeline = ReportPipeline(service, session_manager, plot_renderer)
+        for event in pipeline.run(session_id, ReportConfig.from_dict(data)):
+            ...  # progress / complete {'report_id', ...} / error
+        report = report_spool.take(report_id)
+    """
+
+    def __init__(
+        self,
+        analysis_service: 'StructuralAnalysisService',
+        session_manager: 'SessionManager',
+        plot_renderer: 'PlotRenderer',
+        generator: Optional[PDFReportGenerator] = None,
+        spool: Optional[ReportSpool] = None,
+        flexo_service: Optional['FlexocompressionService'] = None
+    ):
+        self._analysis = analysis_service
+        self._session_manager = session_manager
+        self._renderer = plot_renderer
+        self._generator = generator or PDFReportGenerator()
+        self._spool = spool if spool is not None else report_spool
+        # Curvas P-M que falten en la sesión (cache compartido de curvas)
+        self._flexo_service = flexo_service or analysis_service._flexo_service
+
+    def run(
+        self,
+        session_id: str,
+        config: ReportConfig,
+        moment_axis: str = 'M3',
+        materials_config: Optional[Dict] = None,
+        seismic_category: str = 'SPECIAL'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Ejecuta las tres etapas, con la sesión fijada en memoria.
+
+        materials_config y seismic_category deben ser los del análisis de la
+        UI: forman parte de la huella de cada elemento, y con otros valores
+        el informe re-verificaría (y sobrescribiría) los resultados cacheados.
+
+        Yields:
+            - {"type": "progress", "phase": "curves"|"elements", ...}: análisis
+            - {"type": "progress", "phase": "report_plots", "current", "total", "element"}
+            - {"type": "progress", "phase": "report_pages", "current", "total", "element"}:
+              flowables dibujados de total (element: página actual)
+            - {"type": "complete", "result": {success, report_id, filename,
+               pages, bytes, plots, plot_errors}}
+            - {"type": "error", "message": "..."}
+        """
+        with self._session_manager.pinned(session_id):
+            yield from self._run(session_id, config, moment_axis, materials_config, seismic_category)
+
+    def _run(
+        self,
+        session_id: str,
+        config: ReportConfig,
+        moment_axis: str,
+        materials_config: Optional[Dict],
+        seismic_category: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Cuerpo de run()."""
+        # 1. Análisis (incremental: reutiliza el cache de la sesión)
+        analysis = None
+        for event in self._analysis.analyze_with_progress(
+            session_id=session_id,
+            generate_plots=False,
+            moment_axis=moment_axis,
+            materials_config=materials_config,
+            seismic_category=seismic_category
+        ):
+            if event.get('type') == 'progress':
+                yield event
+            elif event.get('type') == 'error':
+                yield event
+                return
+            elif event.get('type') == 'complete':
+                analysis = event['result']
+
+        cached = {
+            key: self._session_manager.get_analysis_result(session_id, key)
+            for key in (analysis or {}).get('order', {}).get('results', [])
+        }
+        cached = {key: result for key, result in cached.items() if result is not None}
+        if not cached:
+            yield {'type': 'error', 'message': 'No se generaron resultados de análisis'}
+            return
+        results = [ResultFormatter.summary_row(result) for result in cached.values()]
+
+        # 2. Gráficos de los piers críticos, en paralelo
+        jobs, plot_errors = self._plot_jobs(session_id, cached, results, config, moment_axis)
+        images: Dict[Tuple[str, str], str] = {}
+        targets = {id(job): target for target, job in jobs}
+        for done, (job, image) in enumerate(self._renderer.render_many(job for _, job in jobs), 1):
+            kind, key = targets[id(job)]
+            if image:
+                images[(kind, key)] = image
+            else:
+                plot_errors.append({'key': key, 'kind': kind, 'error': 'Error al dibujar el gráfico'})
+            yield {
+                'type': 'progress',
+                'phase': REPORT_PLOTS_PHASE,
+                'current': done,
+                'total': len(jobs),
+                'element': f'Gráfico {key}'
+            }
+
+        # Mismo orden que la selección (no el de término)
+        pm_plots = {key: images[kind, key] for (kind, key), _ in jobs
+                    if kind == 'pm' and (kind, key) in images}
+        section_diagrams = {key: images[kind, key] for (kind, key), _ in jobs
+                            if kind == 'section' and (kind, key) in images}
+
+        # 3. PDF en archivo temporal, con progreso por flowable
+        story = self._generator.build_story(
+            results, config,
+            statistics=analysis.get('statistics'),
+            pm_plots=pm_plots,
+            section_diagrams=section_diagrams
+        )
+        spool_mb = float(os.environ.get('INGEO_REPORT_SPOOL_MB', DEFAULT_SPOOL_MB))
+        output = SpooledTemporaryFile(max_size=int(spool_mb * 1024 * 1024))
+        page_events: SimpleQueue = SimpleQueue()
+        cancelled = threading.Event()
+
+        def on_progress(drawn: int, total: int, page: int) -> None:
+            if cancelled.is_set():
+                raise _ReportCancelled()
+            page_events.put({
+                'type': 'progress',
+                'phase': REPORT_PAGES_PHASE,
+                'current': drawn,
+                'total': total,
+                'element': f'Página {page}'
+            })
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._generator.write_report, story, output, on_progress)
+        handed_off = False
+        try:
+            while not future.done() or not page_events.empty():
+                try:
+                    yield page_events.get(timeout=PAGE_EVENT_POLL_S)
+                except Empty:
+                    continue
+            pages = future.result()
+
+            size = output.tell()
+            filename = f"Informe_{config.project_name.replace(' ', '_')}.pdf"
+            report_id = self._spool.put(SpooledReport(output, filename, size, pages))
+            handed_off = True
+        finally:
+            # Error o cliente desconectado (GeneratorExit en un yield): cortar
+            # la escritura sin esperarla y cerrar el archivo cuando termine
+            executor.shutdown(wait=False)
+            if not handed_off:
+                cancelled.set()
+                future.add_done_callback(lambda _: output.close())
+
+        logger.info(f"Informe {report_id[:8]}: {pages} páginas, {size / 1024:.0f} KB, "
+                    f"{len(images)} gráficos")
+
+        yield {
+            'type': 'complete',
+            'result': {
+                'success': True,
+                'report_id': report_id,
+                'filename': filename,
+                'pages': pages,
+                'bytes': size,
+                'plots': len(images),
+                'plot_errors': plot_errors,
+            }
+        }
+
+    def _plot_jobs(
+        self,
+        session_id: str,
+        cached: Dict[str, Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        config: ReportConfig,
+        moment_axis: str
+    ) -> Tuple[List[Tuple[Tuple[str, str], 'PlotJob']], List[Dict[str, str]]]:
+        """
+        Trabajos de renderizado [((tipo, clave), job)] para los piers que
+        detalla el informe, y los gráficos que no se pudieron preparar
+        [{key, kind, error}].
+        """
+        jobs: List[Tuple[Tuple[str, str], 'PlotJob']] = []
+        errors: List[Dict[str, str]] = []
+        if not (config.include_pm_diagrams or config.include_sections):
+            return jobs, errors
+
+        for key in PDFReportGenerator.critical_keys(results, config):
+            result = cached.get(key)
+            if result is None:
+                continue
+            element, is_column = self._element(session_id, key)
+
+            if config.include_pm_diagrams:
+                try:
+                    jobs.append((('pm', key),
+                                 self._pm_job(session_id, key, element, result, moment_axis)))
+                except Exception as e:
+                    logger.warning(f"Diagrama P-M de {key} no disponible: {e}")
+                    errors.append({'key': key, 'kind': 'pm', 'error': str(e)})
+
+            if config.include_sections and element is not None:
+                jobs.append((('section', key),
+                             self._renderer.section_job(element, column=is_column)))
+        return jobs, errors
+
+    def _element(self, session_id: str, key: str) -> Tuple[Optional[Any], bool]:
+        """(elemento, es_columna) de un pier o columna de la sesión."""
+        element = self._session_manager.get_pier(session_id, key)
+        if element is not None:
+            return element, False
+        return self._session_manager.get_column(session_id, key), True
+
+    def _pm_job(
+        self,
+        session_id: str,
+        key: str,
+        element: Optional[Any],
+        result: Dict[str, Any],
+        moment_axis: str
+    ) -> 'PlotJob':
+        """
+        Diagrama P-M con la curva primaria y la demanda de todas las
+        combinaciones (tabla compacta del resultado cacheado).
+
+        Si la sesión no tiene la curva (ej: resultado restaurado sin ella),
+        se obtiene del cache de curvas y se guarda en la sesión.
+
+        Raises:
+            ValueError: Si falta el elemento o la tabla por combinación
+        """
+        flexure = result.get('flexure') or {}
+        table = flexure.get('combo_table')
+        if table is None:
+            raise ValueError('El resultado no tiene tabla por combinación')
+
+        curve = self._session_manager.get_interaction_curve(session_id, key, 'primary')
+        if curve is None:
+            if element is None:
+                raise ValueError('Elemento no encontrado en la sesión')
+            curve, _ = self._flexo_service.generate_interaction_curve(element, direction='primary')
+            self._session_manager.store_interaction_curve(session_id, key, 'primary', curve)
+
+        demand_points = [
+            (float(Pu), float(Mu), f"{name} ({location})")
+            for name, location, Pu, Mu in zip(table['name'], table['location'], table['Pu'], table['Mu'])
+        ]
+        sf = flexure.get('sf', 0)
+        return self._renderer.pm_job(
+            capacity_curve=curve,
+            demand_points=demand_points,
+            pier_label=f"{result.get('story', '')} - {result.get('pier_label', '')}",
+            safety_factor=sf if isinstance(sf, (int, float)) else 100.0,
+            moment_axis=moment_axis
+        )
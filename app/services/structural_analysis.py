@@ -14,13 +14,15 @@ Referencias ACI 318-25:
 - Capitulo 11: Muros (Walls)
 - Capitulo 18: Estructuras resistentes a sismos
 """
-from typing import Dict, List, Any, Optional
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-import uuid
-import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, SimpleQueue
+from typing import Dict, List, Any, Optional, Tuple
 
 from .parsing.session_manager import SessionManager
-from .presentation.plot_generator import PlotGenerator
+from .parsing.parse_pipeline import PARSE_PHASE
+from .presentation.plot_generator import BIAXIAL_SF_LABEL, PlotGenerator
+from .presentation.plot_renderer import PlotRenderer
 from .presentation.result_formatter import ResultFormatter
 from .analysis.statistics_service import calculate_statistics
 from .analysis.flexocompression_service import FlexocompressionService
@@ -28,11 +30,59 @@ from .analysis.shear_service import ShearService
 from .analysis.reinforcement_update_service import ReinforcementUpdateService
 from .presentation.modal_data_service import ElementDetailsService
 from .analysis.element_orchestrator import ElementOrchestrator
+from .analysis.analysis_backend import AnalysisBackend, init_worker_process
+from .analysis.curve_generation import CURVE_PHASE, CurveGeneration
+from .analysis.input_fingerprint import task_fingerprint
+from .analysis.combo_detail import with_combo_results
+from .logging import claude_logger
 from ..domain.entities import VerticalElement, ElementForces
-from ..domain.flexure import InteractionDiagramService, SlendernessService, FlexureChecker, InteractionPoint
+from ..domain.flexure import InteractionDiagramService, SlendernessService, FlexureChecker, InteractionCurve
 from ..domain.chapter18 import SeismicCategory
 
 
+# Grupo de resultados (claves del evento 'complete'/'partial') por tipo de tarea
+RESULT_GROUPS = {
+    'pier': 'results',
+    'column': 'results',
+    'beam': 'beam_results',
+    'drop_beam': 'drop_beam_results',
+}
+
+# Fase de los eventos de progreso de la verificación de elementos
+ELEMENT_PHASE = 'elements'
+
+# Espera máxima (s) entre eventos de etapas de parseo antes de revisar si
+# el parseo terminó
+STAGE_EVENT_POLL_S = 0.05
+
+# Elementos verticales más críticos (mayor DCR) cuyos diagramas de sección
+# se pre-generan al terminar el análisis (INGEO_PLOT_PREFETCH, 0 = no)
+DEFAULT_PLOT_PREFETCH = 8
+
+# Servicio por proceso worker (backend 'process'), creado al primer chunk
+_worker_service: Optional['StructuralAnalysisService'] = None
+
+
+def _analyze_task_chunk(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Analiza un chunk de tareas dentro de un proceso worker.
+
+    Las curvas P-M llegan empaquetadas como arreglos NumPy (points_to_array)
+    y se envuelven como InteractionCurve (sin copia) antes de verificar.
+    """
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = StructuralAnalysisService()
+
+    results = []
+    for task in tasks:
+        curve = task.get('interaction_curve')
+        if curve is not None:
+            task = {**task, 'interaction_curve': InteractionCurve(curve, presorted=True)}
+        results.append(_worker_service._run_analysis_task(task))
+    return results
+
+
 class StructuralAnalysisService:
     """
     Servicio principal de análisis estructural.
@@ -58,7 +108,9 @@ class StructuralAnalysisService:
         interaction_service: Optional[InteractionDiagramService] = None,
         plot_generator: Optional[PlotGenerator] = None,
         details_formatter: Optional[ElementDetailsService] = None,
-        element_orchestrator: Optional[ElementOrchestrator] = None
+        element_orchestrator: Optional[ElementOrchestrator] = None,
+        analysis_backend: Optional[str] = None,
+        plot_renderer: Optional[PlotRenderer] = None
     ):
         """
         Inicializa el servicio de análisis.
@@ -72,6 +124,11 @@ class StructuralAnalysisService:
             plot_generator: Generador de graficos (opcional)
             details_formatter: Formateador de detalles de piers (opcional)
             element_orchestrator: Orquestador unificado de elementos (opcional)
+            analysis_backend: 'thread' o 'process' (default: INGEO_ANALYSIS_BACKEND
+                o 'thread'). El backend 'process' usa servicios por defecto en
+                cada worker, no los inyectados aquí.
+            plot_renderer: Renderizador con cache de gráficos (opcional,
+                default uno sobre plot_generator)
 
         Nota: Los servicios se crean por defecto si no se pasan.
               Pasar None explícito permite inyectar mocks para testing.
@@ -82,18 +139,23 @@ class StructuralAnalysisService:
         self._slenderness_service = slenderness_service or SlendernessService()
         self._interaction_service = interaction_service or InteractionDiagramService()
         self._plot_generator = plot_generator or PlotGenerator()
+        self._plot_renderer = plot_renderer or PlotRenderer(self._plot_generator)
 
         # Orquestador unificado de elementos: clasifica y delega al servicio apropiado
         # Verifica todos los elementos: Pier, Column, Beam, DropBeam
         self._orchestrator = element_orchestrator or ElementOrchestrator()
 
+        # Backend de ejecución del análisis paralelo (threads o procesos)
+        self._backend = AnalysisBackend(analysis_backend)
+
         self._details_formatter = details_formatter or ElementDetailsService(
             session_manager=self._session_manager,
             orchestrator=self._orchestrator,
             flexocompression_service=self._flexo_service,
             shear_service=self._shear_service,
             slenderness_service=self._slenderness_service,
-            plot_generator=self._plot_generator
+            plot_generator=self._plot_generator,
+            plot_renderer=self._plot_renderer
         )
 
     # =========================================================================
@@ -202,7 +264,31 @@ class StructuralAnalysisService:
             'element': 'Procesando elementos...'
         }
 
-        process_result = self._session_manager.process_session(session_id, hn_ft=hn_ft)
+        # El parseo corre en un thread aparte para emitir el progreso de
+        # cada etapa del pipeline (con su tiempo) a medida que termina
+        stage_events: SimpleQueue = SimpleQueue()
+
+        def on_stage(timing, done: int, total: int) -> None:
+            stage_events.put({
+                'type': 'progress',
+                'phase': PARSE_PHASE,
+                'current': done,
+                'total': total,
+                'element': f'Etapa {timing.name} ({timing.seconds:.2f}s)',
+                'stage': timing.to_dict()
+            })
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self._session_manager.process_session, session_id, hn_ft=hn_ft, on_stage=on_stage
+            )
+            while not future.done() or not stage_events.empty():
+                try:
+                    yield stage_events.get(timeout=STAGE_EVENT_POLL_S)
+                except Empty:
+                    continue
+            process_result = future.result()
+        claude_logger.flush(wait=False)
         if not process_result.get('success'):
             yield {'type': 'error', 'message': process_result.get('error', 'Error procesando sesión')}
             return
@@ -213,6 +299,7 @@ class StructuralAnalysisService:
                 'success': True,
                 'session_id': session_id,
                 'summary': process_result.get('summary', {}),
+                'parse_timings': process_result.get('parse_timings', []),
                 'merged': merge
             }
         }
@@ -255,7 +342,8 @@ class StructuralAnalysisService:
             materials_config: Configuración de materiales con lambda por tipo
 
         Returns:
-            Diccionario con estadísticas y resultados
+            Diccionario con estadísticas y filas resumen (sin detalle por
+            combinación, ver get_element_result)
         """
         # Consumir el generador y retornar el resultado final
         result = None
@@ -275,7 +363,17 @@ class StructuralAnalysisService:
             elif event.get('type') == 'error':
                 return {'success': False, 'error': event.get('message')}
 
-        return result or {'success': False, 'error': 'No result generated'}
+        if not result:
+            return {'success': False, 'error': 'No result generated'}
+
+        # Filas resumen desde el cache (el detalle por combinación se arma
+        # bajo demanda con get_element_result)
+        for group, keys in result.pop('order').items():
+            result[group] = [
+                ResultFormatter.summary_row(self._session_manager.get_analysis_result(session_id, key))
+                for key in keys
+            ]
+        return result
 
     def _get_lambda_for_element(
         self,
@@ -369,6 +467,26 @@ class StructuralAnalysisService:
             coupling_config=coupling_config
         )
 
+    def _run_analysis_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Analiza un elemento de una tarea y retorna resultado con metadata."""
+        formatted = self._analyze_element(
+            task['key'],
+            task['element'],
+            task['forces'],
+            materials_config=task.get('materials_config'),
+            continuity_info=task.get('continuity_info'),
+            hn_ft=task.get('hn_ft'),
+            seismic_category=task.get('seismic_category'),
+            coupling_config=task.get('coupling_config'),
+            interaction_curve=task.get('interaction_curve')
+        )
+        return {
+            'type': task['type'],
+            'key': task['key'],
+            'result': formatted,
+            'label': task['label']
+        }
+
     def _calculate_statistics(
         self,
         pier_results: List,
@@ -429,10 +547,40 @@ class StructuralAnalysisService:
 
         Yields:
             Dict con eventos de progreso:
-            - {"type": "progress", "current": 1, "total": 100, "element": "P1-A1"}
-            - {"type": "complete", "result": {...}}
+            - {"type": "progress", "phase": "curves", "current": 3, "total": 40, "pier": "..."}:
+               pre-generación de curvas P-M (secciones únicas sin cache)
+            - {"type": "progress", "phase": "elements", "current": 1, "total": 100, "pier": "..."}
+            - {"type": "partial", "results": [...], "beam_results": [...],
+               "drop_beam_results": [...]}: filas resumen (sin combo_results ni
+               design_curve) a medida que terminan los elementos
+            - {"type": "complete", "result": {statistics, order: {grupo: [keys]}},
+               "incremental": {reanalyzed, reused}, "curve_errors": [{key, direction, error}],
+               "curve_cache": {hits, misses, ...}, "plot_prefetch": n}
             - {"type": "error", "message": "..."}
+
+        El detalle completo de un elemento se obtiene con get_element_result().
+        La sesión queda fijada en memoria (no se desaloja) mientras dura.
         """
+        with self._session_manager.pinned(session_id):
+            yield from self._analyze_with_progress(
+                session_id, pier_updates, column_updates, beam_updates, drop_beam_updates,
+                generate_plots, moment_axis, angle_deg, materials_config, seismic_category
+            )
+
+    def _analyze_with_progress(
+        self,
+        session_id: str,
+        pier_updates: Optional[List[Dict]],
+        column_updates: Optional[List[Dict]],
+        beam_updates: Optional[List[Dict]],
+        drop_beam_updates: Optional[List[Dict]],
+        generate_plots: bool,
+        moment_axis: str,
+        angle_deg: float,
+        materials_config: Optional[Dict],
+        seismic_category: str
+    ):
+        """Cuerpo de analyze_with_progress (con la sesión ya fijada)."""
         materials_config = materials_config or {}
 
         # Convertir string a enum de categoría sísmica
@@ -462,9 +610,6 @@ class StructuralAnalysisService:
             drop_beam_updates=drop_beam_updates,
         )
 
-        # Limpiar cache de análisis previo (se recalculará todo)
-        self._session_manager.clear_analysis_cache(session_id)
-
         # Separar elementos por tipo usando la nueva arquitectura unificada
         from ..domain.entities import VerticalElementSource, HorizontalElementSource
 
@@ -488,80 +633,21 @@ class StructuralAnalysisService:
         # Obtener hn_ft del edificio
         hn_ft = parsed_data.building_info.hn_ft if parsed_data.building_info else None
 
-        # =====================================================================
-        # PRE-GENERACIÓN DE CURVAS P-M (OPTIMIZACIÓN)
-        # Las curvas P-M son determinísticas por elemento. Se generan UNA VEZ
-        # y se reutilizan en todo el análisis.
-        # =====================================================================
-        yield {
-            "type": "progress",
-            "current": 0,
-            "total": total_elements,
-            "pier": "Generando curvas de interacción P-M..."
-        }
-
-        # Pre-generar curvas para elementos verticales (piers y columnas)
-        for key, element in vertical_elements.items():
-            # Solo generar si no existe en cache
-            if not self._session_manager.get_interaction_curve(session_id, key, 'primary'):
-                try:
-                    curve_primary, _ = self._flexo_service.generate_interaction_curve(
-                        element, direction='primary', use_cache=False
-                    )
-                    self._session_manager.store_interaction_curve(
-                        session_id, key, 'primary', curve_primary
-                    )
-                except Exception:
-                    pass  # Continuar si falla un elemento
-
-            if not self._session_manager.get_interaction_curve(session_id, key, 'secondary'):
-                try:
-                    curve_secondary, _ = self._flexo_service.generate_interaction_curve(
-                        element, direction='secondary', use_cache=False
-                    )
-                    self._session_manager.store_interaction_curve(
-                        session_id, key, 'secondary', curve_secondary
-                    )
-                except Exception:
-                    pass
-
-        # Pre-generar curvas para vigas (solo primary)
-        for key, element in horizontal_elements.items():
-            if not self._session_manager.get_interaction_curve(session_id, key, 'primary'):
-                try:
-                    curve_primary, _ = self._flexo_service.generate_interaction_curve(
-                        element, direction='primary', use_cache=False
-                    )
-                    self._session_manager.store_interaction_curve(
-                        session_id, key, 'primary', curve_primary
-                    )
-                except Exception:
-                    pass
-
-        # =====================================================================
-        # ANÁLISIS PARALELO - Usa curvas pre-generadas
-        # =====================================================================
-        import os
         vertical_forces = parsed_data.vertical_forces or {}
         horizontal_forces = parsed_data.horizontal_forces or {}
 
-        # Configuración de paralelización AGRESIVA
-        MAX_WORKERS = (os.cpu_count() or 8) * 4  # 96 workers - compensar GIL
-        PROGRESS_INTERVAL = 200  # Solo para progreso, sin batching real
+        PROGRESS_INTERVAL = 200  # Emitir progreso cada N elementos
+        PARTIAL_CHUNK_SIZE = 200  # Filas resumen por evento 'partial'
 
-        # Preparar todas las tareas de análisis (con curvas P-M pre-calculadas)
+        # Preparar todas las tareas de análisis
         all_tasks = []
 
-        # Tareas de PIERS (incluir curva P-M pre-calculada)
+        # Tareas de PIERS
         for key, pier in piers.items():
             continuity_info = None
             if parsed_data.continuity_info and key in parsed_data.continuity_info:
                 continuity_info = parsed_data.continuity_info[key]
             coupling_config = parsed_data.pier_coupling_configs.get(key)
-            # Obtener curva pre-calculada del cache
-            interaction_curve = self._session_manager.get_interaction_curve(
-                session_id, key, 'primary'
-            )
 
             all_tasks.append({
                 'type': 'pier',
@@ -573,141 +659,273 @@ class StructuralAnalysisService:
                 'hn_ft': hn_ft,
                 'seismic_category': category_enum,
                 'coupling_config': coupling_config,
-                'interaction_curve': interaction_curve,
                 'label': f"Pier: {pier.story} - {pier.label}"
             })
 
-        # Tareas de COLUMNAS (incluir curva P-M pre-calculada)
+        # Tareas de COLUMNAS
         for key, column in columns.items():
-            interaction_curve = self._session_manager.get_interaction_curve(
-                session_id, key, 'primary'
-            )
             all_tasks.append({
                 'type': 'column',
                 'key': key,
                 'element': column,
                 'forces': vertical_forces.get(key),
                 'seismic_category': category_enum,
-                'interaction_curve': interaction_curve,
                 'label': f"Columna: {column.story} - {column.label}"
             })
 
-        # Tareas de VIGAS (incluir curva P-M pre-calculada)
+        # Tareas de VIGAS
         for key, beam in beams.items():
-            interaction_curve = self._session_manager.get_interaction_curve(
-                session_id, key, 'primary'
-            )
             all_tasks.append({
                 'type': 'beam',
                 'key': key,
                 'element': beam,
                 'forces': horizontal_forces.get(key),
                 'seismic_category': category_enum,
-                'interaction_curve': interaction_curve,
                 'label': f"Viga: {beam.story} - {beam.label}"
             })
 
-        # Tareas de VIGAS CAPITEL (incluir curva P-M pre-calculada)
+        # Tareas de VIGAS CAPITEL
         for key, drop_beam in drop_beams.items():
-            interaction_curve = self._session_manager.get_interaction_curve(
-                session_id, key, 'primary'
-            )
             all_tasks.append({
                 'type': 'drop_beam',
                 'key': key,
                 'element': drop_beam,
                 'forces': horizontal_forces.get(key),
                 'seismic_category': category_enum,
-                'interaction_curve': interaction_curve,
                 'label': f"V. Capitel: {drop_beam.story} - {drop_beam.label}"
             })
 
-        # Función worker para ejecutar en threads
-        def analyze_task(task):
-            """Analiza un elemento y retorna resultado con metadata."""
-            formatted = self._analyze_element(
-                task['key'],
-                task['element'],
-                task['forces'],
-                materials_config=task.get('materials_config'),
-                continuity_info=task.get('continuity_info'),
-                hn_ft=task.get('hn_ft'),
-                seismic_category=task.get('seismic_category'),
-                coupling_config=task.get('coupling_config'),
-                interaction_curve=task.get('interaction_curve')
+        # =====================================================================
+        # ANÁLISIS INCREMENTAL
+        # Solo se re-verifican los elementos cuya huella de entradas (armadura,
+        # geometría, fuerzas, materiales, categoría sísmica, acople) cambió
+        # desde el último análisis. El resto reutiliza el resultado cacheado.
+        # =====================================================================
+        self._session_manager.retain_analysis_results(
+            session_id, [task['key'] for task in all_tasks]
+        )
+
+        fingerprints = {}
+        dirty_tasks = []
+        reused_rows = []
+        for task in all_tasks:
+            fingerprints[task['key']] = task_fingerprint(task)
+            cached = self._session_manager.get_valid_analysis_result(
+                session_id, task['key'], fingerprints[task['key']]
             )
-            return {
-                'type': task['type'],
-                'key': task['key'],
-                'result': formatted,
-                'label': task['label']
-            }
+            if cached is None:
+                self._session_manager.invalidate_element(session_id, task['key'])
+                dirty_tasks.append(task)
+            else:
+                reused_rows.append((RESULT_GROUPS[task['type']], ResultFormatter.summary_row(cached)))
 
-        # Resultados por tipo
-        pier_results = []
-        column_results = []
-        beam_results = []
-        drop_beam_results = []
+        # Resultados reutilizados: se emiten de inmediato como filas resumen
+        for start in range(0, len(reused_rows), PARTIAL_CHUNK_SIZE):
+            yield self._partial_event(reused_rows[start:start + PARTIAL_CHUNK_SIZE])
+        del reused_rows
 
-        # ULTRA-AGRESIVO: Lanzar TODOS los elementos en paralelo sin batching
-        completed = 0
+        # =====================================================================
+        # PRE-GENERACIÓN DE CURVAS P-M (ETAPA PARALELA)
+        # Las curvas P-M son determinísticas por sección. Se resuelven UNA
+        # VEZ por sección única: las repetidas (mismo muro en varios pisos)
+        # salen de InteractionCurveCache y el resto se genera en paralelo
+        # (ver CurveGeneration). Los fallos se reportan por elemento.
+        # =====================================================================
+        completed = total_elements - len(dirty_tasks)
+        curve_jobs = []
+        for task in dirty_tasks:
+            # Verticales: ambas direcciones; vigas: solo primary
+            is_vertical = task['type'] in ('pier', 'column')
+            for direction in (('primary', 'secondary') if is_vertical else ('primary',)):
+                curve_jobs.append((task['key'], direction, task['element']))
+
+        curve_generation = CurveGeneration(self._backend, self._flexo_service.curve_cache)
         last_progress = 0
-        
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            # Enviar TODAS las tareas de una vez
-            futures = {executor.submit(analyze_task, task): task for task in all_tasks}
-
-            # Recoger resultados a medida que terminan
-            for future in as_completed(futures):
-                result = future.result()
+        for done, total in curve_generation.run(
+            curve_jobs,
+            section_fn=self._flexo_service.interaction_section,
+            initializer=init_worker_process
+        ):
+            if done == 0 or done == total or done - last_progress >= PROGRESS_INTERVAL:
+                last_progress = done
+                yield {
+                    "type": "progress",
+                    "phase": CURVE_PHASE,
+                    "current": done,
+                    "total": total,
+                    "pier": (f"Generando curvas de interacción P-M ({done} de {total} secciones)"
+                             if total else "Curvas de interacción P-M en cache")
+                }
+
+        for key, direction, _ in curve_jobs:
+            curve = curve_generation.points(key, direction)
+            if curve is not None:
+                self._session_manager.store_interaction_curve(session_id, key, direction, curve)
+
+        # Backend de procesos: curvas empaquetadas como arreglos (payload compacto)
+        curve_of = curve_generation.packed if self._backend.is_process else curve_generation.points
+        for task in dirty_tasks:
+            task['interaction_curve'] = curve_of(task['key'], 'primary')
+
+        curve_errors = [error.to_dict() for error in curve_generation.errors]
+        for error in curve_generation.errors[:20]:
+            claude_logger.log_analysis_warning(
+                f"Curva P-M {error.direction} de {error.key}: {error.error}"
+            )
+        if len(curve_errors) > 20:
+            claude_logger.log_analysis_warning(f"... y {len(curve_errors) - 20} curvas P-M mas con error")
+
+        # =====================================================================
+        # ANÁLISIS PARALELO - Solo elementos modificados
+        # =====================================================================
+        last_progress = completed
+        task_groups = {task['key']: RESULT_GROUPS[task['type']] for task in dirty_tasks}
+        pending_rows = []
+
+        # Recoger resultados a medida que terminan (por tarea o por chunk)
+        for batch in self._backend.run(
+            dirty_tasks,
+            task_fn=self._run_analysis_task,
+            chunk_fn=_analyze_task_chunk,
+            initializer=init_worker_process
+        ):
+            for result in batch:
                 completed += 1
 
-                # Clasificar resultado
-                if result['type'] == 'pier':
-                    pier_results.append(result['result'])
-                elif result['type'] == 'column':
-                    column_results.append(result['result'])
-                elif result['type'] == 'beam':
-                    beam_results.append(result['result'])
-                elif result['type'] == 'drop_beam':
-                    drop_beam_results.append(result['result'])
-
-                # Guardar en cache
+                # Guardar en cache junto con la huella de sus entradas
                 self._session_manager.store_analysis_result(
-                    session_id, result['key'], result['result']
+                    session_id, result['key'], result['result'],
+                    fingerprint=fingerprints[result['key']]
+                )
+                pending_rows.append(
+                    (task_groups[result['key']], ResultFormatter.summary_row(result['result']))
                 )
 
-                # Emitir progreso cada PROGRESS_INTERVAL elementos
-                if completed - last_progress >= PROGRESS_INTERVAL or completed == total_elements:
-                    last_progress = completed
-                    yield {
-                        "type": "progress",
-                        "current": completed,
-                        "total": total_elements,
-                        "pier": f"Procesando {completed} de {total_elements}"
-                    }
+            # Filas resumen a medida que terminan los workers
+            if len(pending_rows) >= PARTIAL_CHUNK_SIZE or completed == total_elements:
+                yield self._partial_event(pending_rows)
+                pending_rows = []
+
+            # Emitir progreso cada PROGRESS_INTERVAL elementos
+            if completed - last_progress >= PROGRESS_INTERVAL or completed == total_elements:
+                last_progress = completed
+                yield {
+                    "type": "progress",
+                    "phase": ELEMENT_PHASE,
+                    "current": completed,
+                    "total": total_elements,
+                    "pier": f"Procesando {completed} de {total_elements}"
+                }
+
+        if pending_rows:
+            yield self._partial_event(pending_rows)
+
+        # Los resultados cacheados hacen crecer la sesión: re-estimar memoria
+        self._session_manager.update_session_size(session_id)
+
+        # Fin de fase: volcar el log de estado sin esperar el intervalo
+        claude_logger.flush(wait=False)
+
+        # Resultados por tipo (nuevos y reutilizados, en orden de elementos)
+        results_by_type = {'pier': [], 'column': [], 'beam': [], 'drop_beam': []}
+        order = {group: [] for group in RESULT_GROUPS.values()}
+        for task in all_tasks:
+            result = self._session_manager.get_analysis_result(session_id, task['key'])
+            if result is not None:
+                results_by_type[task['type']].append(result)
+                order[RESULT_GROUPS[task['type']]].append(task['key'])
+
+        pier_results = results_by_type['pier']
+        column_results = results_by_type['column']
+        beam_results = results_by_type['beam']
+        drop_beam_results = results_by_type['drop_beam']
 
         # Calcular estadísticas
         statistics = self._calculate_statistics(
             pier_results, column_results, beam_results, drop_beam_results
         )
 
-        # Unificar resultados
-        all_results = pier_results + column_results
+        # Diagramas de los elementos críticos: se dibujan en segundo plano
+        # mientras el usuario revisa la tabla
+        plot_prefetch = self._prefetch_section_diagrams(session_id, pier_results, column_results)
 
-        # Enviar resultado completo
+        # Cierre: las filas ya llegaron en eventos 'partial'; aquí solo el
+        # orden final por grupo (el detalle por combinación se pide con
+        # get_element_result)
         yield {
             "type": "complete",
             "result": {
                 'success': True,
                 'statistics': statistics,
-                'results': all_results,
-                'beam_results': beam_results,
-                'drop_beam_results': drop_beam_results,
+                'order': order,
                 'summary_plot': None
-            }
+            },
+            # Elementos re-verificados vs reutilizados del cache
+            "incremental": {
+                "reanalyzed": len(dirty_tasks),
+                "reused": total_elements - len(dirty_tasks)
+            },
+            # Curvas P-M que no se pudieron generar (por elemento y dirección)
+            "curve_errors": curve_errors,
+            # Contadores del cache de curvas P-M (diagnóstico)
+            "curve_cache": self._flexo_service.curve_cache.stats(),
+            # Diagramas de sección encolados para pre-generación
+            "plot_prefetch": plot_prefetch
         }
 
+    def _prefetch_section_diagrams(
+        self,
+        session_id: str,
+        pier_results: List[Dict[str, Any]],
+        column_results: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Encola la pre-generación de los diagramas de sección de los
+        elementos verticales con mayor dcr_max.
+
+        Returns:
+            Cantidad de diagramas encolados (los ya cacheados no cuentan)
+        """
+        top_n = int(os.environ.get('INGEO_PLOT_PREFETCH', DEFAULT_PLOT_PREFETCH))
+        if top_n <= 0:
+            return 0
+
+        candidates = [(r, False) for r in pier_results] + [(r, True) for r in column_results]
+        candidates.sort(key=lambda c: c[0].get('dcr_max') or 0, reverse=True)
+        jobs = []
+        for result, is_column in candidates[:top_n]:
+            if is_column:
+                element = self._session_manager.get_column(session_id, result['key'])
+            else:
+                element = self._session_manager.get_pier(session_id, result['key'])
+            if element is not None:
+                jobs.append(self._plot_renderer.section_job(element, column=is_column))
+        return self._plot_renderer.prefetch(jobs)
+
+    @staticmethod
+    def _partial_event(rows: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Evento 'partial' con filas resumen [(grupo, fila)] agrupadas."""
+        event = {'type': 'partial', 'results': [], 'beam_results': [], 'drop_beam_results': []}
+        for group, row in rows:
+            event[group].append(row)
+        return event
+
+    def get_element_result(self, session_id: str, element_key: str) -> Dict[str, Any]:
+        """
+        Resultado completo de un elemento (incluye combo_results).
+
+        Es el detalle que los eventos 'partial' omiten; se lee del cache de
+        análisis de la sesión sin recalcular (las filas por combinación se
+        arman desde la tabla compacta y quedan memorizadas).
+        """
+        error = self._validate_session(session_id)
+        if error:
+            return error
+        result = self._session_manager.get_analysis_result(session_id, element_key)
+        if result is None:
+            return {'success': False, 'error': f'Sin resultado de análisis para {element_key}'}
+        return {'success': True, 'result': with_combo_results(result)}
+
     # =========================================================================
     # API Pública - Análisis por Combinación
     # =========================================================================
@@ -773,7 +991,7 @@ class StructuralAnalysisService:
             'pier_key': pier_key,
             'combinations': combinations_with_fs,
             'unique_angles': pier_forces.get_unique_angles(),
-            'total_combinations': len(pier_forces.combinations),
+            'total_combinations': pier_forces.n_combinations,
             'capacity_check': capacity_check
         }
 
@@ -787,7 +1005,13 @@ class StructuralAnalysisService:
         """
         Analiza un pier para una combinación específica.
 
-        Usa ElementOrchestrator.verify_combination() para la verificación.
+        La flexión se verifica contra la superficie biaxial P-M2-M3 del pier
+        (generada una vez por sección); el cortante y el estado general con
+        ElementOrchestrator.verify_combination().
+
+        El SF resultante es biaxial (sf_method='biaxial') y puede diferir del
+        de la tabla de combinaciones, que usa la curva P-M primaria con el
+        momento resultante; el gráfico lo rotula como biaxial.
         """
         # Validar pier
         error = self._validate_pier(session_id, pier_key)
@@ -797,92 +1021,26 @@ class StructuralAnalysisService:
         pier = self._session_manager.get_pier(session_id, pier_key)
         pier_forces = self._session_manager.get_pier_forces(session_id, pier_key)
 
-        if not pier_forces or combination_index >= len(pier_forces.combinations):
+        if not pier_forces or combination_index >= pier_forces.n_combinations:
             return {'success': False, 'error': 'Invalid combination index'}
 
         # Obtener la combinación
-        combo = pier_forces.combinations[combination_index]
+        combo = pier_forces.get_combination(combination_index)
         angle_deg = combo.moment_angle_deg
 
-        # Generar curvas de interacción para M3 (primary) y M2 (secondary)
-        _, points_M3, _ = self._generate_interaction_data(pier, direction='primary')
-        _, points_M2, _ = self._generate_interaction_data(pier, direction='secondary')
-
-        # Interpolar la curva al ángulo específico de la combinación
-        # Fórmula: Mn(θ) = Mn3 * cos(θ) + Mn2 * sin(θ)
-        angle_rad = math.radians(abs(angle_deg))
-        cos_angle = math.cos(angle_rad)
-        sin_angle = math.sin(angle_rad)
-
-        # Crear funciones de interpolación para obtener Mn dado Pn
-        # Ordenar por phi_Pn para interpolar correctamente
-        points_M3_sorted = sorted(points_M3, key=lambda p: p.phi_Pn, reverse=True)
-        points_M2_sorted = sorted(points_M2, key=lambda p: p.phi_Pn, reverse=True)
-
-        def interpolate_Mn_at_Pn(points: list, target_Pn: float) -> tuple:
-            """Interpola Mn, phi, c, epsilon_t para un Pn dado."""
-            # Buscar el segmento donde cae target_Pn
-            for i in range(len(points) - 1):
-                p1, p2 = points[i], points[i + 1]
-                if p1.phi_Pn >= target_Pn >= p2.phi_Pn:
-                    # Interpolación lineal
-                    if abs(p1.phi_Pn - p2.phi_Pn) < 0.001:
-                        ratio = 0.5
-                    else:
-                        ratio = (p1.phi_Pn - target_Pn) / (p1.phi_Pn - p2.phi_Pn)
-                    Mn = p1.phi_Mn + ratio * (p2.phi_Mn - p1.phi_Mn)
-                    phi = p1.phi + ratio * (p2.phi - p1.phi)
-                    c = p1.c + ratio * (p2.c - p1.c) if p1.c != float('inf') and p2.c != float('inf') else p1.c
-                    eps = p1.epsilon_t + ratio * (p2.epsilon_t - p1.epsilon_t) if p1.epsilon_t != float('inf') and p2.epsilon_t != float('inf') else p1.epsilon_t
-                    return Mn, phi, c, eps
-            # Si está fuera del rango, usar el extremo más cercano
-            if target_Pn > points[0].phi_Pn:
-                return points[0].phi_Mn, points[0].phi, points[0].c, points[0].epsilon_t
-            return points[-1].phi_Mn, points[-1].phi, points[-1].c, points[-1].epsilon_t
-
-        # Usar los valores de phi_Pn de la curva M3 como referencia
-        interpolated_points = []
-        for p3 in points_M3_sorted:
-            target_Pn = p3.phi_Pn
-
-            # Obtener Mn de M3 (ya lo tenemos)
-            Mn3 = p3.phi_Mn
-            phi3 = p3.phi
-
-            # Interpolar Mn de M2 al mismo Pn
-            Mn2, phi2, c2, eps2 = interpolate_Mn_at_Pn(points_M2_sorted, target_Pn)
-
-            # Interpolar según ángulo
-            phi_Mn_interp = Mn3 * cos_angle + Mn2 * sin_angle
-            phi_interp = min(phi3, phi2)
-
-            # Calcular Mn nominal (sin phi)
-            Mn_interp = phi_Mn_interp / phi_interp if phi_interp > 0 else 0
-
-            # c y epsilon_t del punto M3 (aproximación razonable)
-            c_interp = p3.c
-            epsilon_t_interp = p3.epsilon_t
-
-            interpolated_points.append(InteractionPoint(
-                Pn=p3.Pn,
-                Mn=Mn_interp,
-                phi=phi_interp,
-                phi_Pn=target_Pn,
-                phi_Mn=phi_Mn_interp,
-                c=c_interp,
-                epsilon_t=epsilon_t_interp
-            ))
-
-        # Usar la curva interpolada para el ángulo de esta combinación
-        interaction_points = interpolated_points
-        design_curve = self._interaction_service.get_design_curve(interaction_points)
-
-        # Usar orquestador para verificar la combinación
+        # Superficie biaxial P-M2-M3 de la sección (cacheada por sección):
+        # SF de la demanda (P, M2, M3) y curva P-M en el plano de su momento
+        surface = self._flexo_service.biaxial_surface(pier)
+        sf = surface.safety_factor(combo.P_compression, combo.M2, combo.M3)
+        interaction_points = surface.curve_at(combo.M2, combo.M3)
+
+        # Usar orquestador para verificar la combinación (cortante y estado)
         result = self._orchestrator.verify_combination(
             element=pier,
             combination=combo,
             index=combination_index,
             interaction_points=interaction_points,
+            flexure_sf=sf,
         )
         flexure_sf = result.flexure_sf
         flexure_status = result.flexure_status
@@ -895,13 +1053,14 @@ class StructuralAnalysisService:
             # Formato: (Pu, Mu, combo_name)
             combo_label = f"{combo.name} ({combo.location})"
             combo_point = [(result.P, combo.moment_resultant, combo_label)]
-            pm_plot = self._plot_generator.generate_pm_diagram(
-                capacity_curve=design_curve,
+            pm_plot = self._plot_renderer.pm_diagram(
+                capacity_curve=interaction_points,
                 demand_points=combo_point,
                 pier_label=f"{pier.story} - {pier.label}",
                 safety_factor=flexure_sf,
                 moment_axis='combined',
-                angle_deg=angle_deg
+                angle_deg=angle_deg,
+                sf_label=BIAXIAL_SF_LABEL
             )
 
         return {
@@ -919,6 +1078,7 @@ class StructuralAnalysisService:
                 'angle_deg': angle_deg
             },
             'safety_factor': round(flexure_sf, 3) if flexure_sf < 100 else '>100',
+            'sf_method': 'biaxial',
             'status': flexure_status,
             'pm_plot': pm_plot
         }
@@ -1101,9 +1261,9 @@ class StructuralAnalysisService:
             hn_ft=hn_ft
         )
 
-        return ResultFormatter.format_any_element(
+        return with_combo_results(ResultFormatter.format_any_element(
             pier, result, pier_key, continuity_info
-        )
+        ))
 
     def get_session_data(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Obtiene los datos de una sesion."""
@@ -515,7 +515,7 @@ class FrontendLogger {
                 break;
 
             case 'analysis_progress':
-                message = `[${now}] ANALIZANDO: ${data.current}/${data.total} - ${data.element || ''}`;
+                message = `[${now}] ${data.phase === 'curves' ? 'CURVAS P-M' : 'ANALIZANDO'}: ${data.current}/${data.total} - ${data.element || ''}`;
                 break;
 
             case 'complete':
@@ -11,9 +11,9 @@ class StructuralAPI {
     /**
      * Procesa un stream SSE de forma robusta.
      * @param {Response} response - Response del fetch
-     * @param {Object} handlers - {onProgress, onComplete, onError}
+     * @param {Object} handlers - {onProgress, onPartial, onComplete, onError}
      */
-    _processSSEStream(response, { onProgress, onComplete, onError }) {
+    _processSSEStream(response, { onProgress, onPartial, onComplete, onError }) {
         if (!response.ok) {
             onError(new Error(`HTTP ${response.status}`));
             return;
@@ -44,6 +44,8 @@ class StructuralAPI {
 
                             if (event.type === 'progress') {
                                 onProgress?.(event);
+                            } else if (event.type === 'partial') {
+                                onPartial?.(event);
                             } else if (event.type === 'complete') {
                                 reader.cancel();
                                 onComplete(event.result);
@@ -160,10 +162,26 @@ class StructuralAPI {
             body: JSON.stringify(params)
         });
 
+        // Filas resumen recibidas en eventos 'partial', por grupo y clave
+        const rows = { results: {}, beam_results: {}, drop_beam_results: {} };
+
         return new Promise((resolve, reject) => {
             this._processSSEStream(response, {
-                onProgress: (e) => onProgress?.(e.current, e.total, e.pier),
-                onComplete: resolve,
+                // phase: 'curves' (curvas P-M) o 'elements' (verificación)
+                onProgress: (e) => onProgress?.(e.current, e.total, e.pier, e.phase),
+                onPartial: (e) => {
+                    for (const group of Object.keys(rows)) {
+                        for (const row of e[group] || []) rows[group][row.key] = row;
+                    }
+                },
+                onComplete: (result) => {
+                    // Armar las listas en el orden final de elementos
+                    for (const [group, keys] of Object.entries(result.order || {})) {
+                        result[group] = keys.map((key) => rows[group][key]).filter(Boolean);
+                    }
+                    delete result.order;
+                    resolve(result);
+                },
                 onError: reject
             });
         });
@@ -271,6 +289,8 @@ class StructuralAPI {
      * @param {boolean} config.include_pm_diagrams - Incluir diagramas P-M
      * @param {boolean} config.include_sections - Incluir secciones
      * @param {boolean} config.include_full_table - Incluir tabla completa
+     * @param {Object} config.materials_config - Materiales del análisis de la UI
+     * @param {string} config.seismic_category - Categoría sísmica del análisis de la UI
      * @returns {Promise<Blob>} PDF como blob
      */
     async generateReport(config) {
@@ -288,6 +308,36 @@ class StructuralAPI {
         return response.blob();
     }
 
+    /**
+     * Genera un informe PDF con progreso en tiempo real (SSE) y lo descarga.
+     * @param {Object} config - Configuración del informe (ver generateReport)
+     * @param {Function} onProgress - Callback (current, total, label, phase);
+     *     phase: 'curves', 'elements', 'report_plots' o 'report_pages'
+     * @returns {Promise<Blob>} PDF como blob
+     */
+    async generateReportWithProgress(config, onProgress) {
+        const response = await fetch(`${this.baseUrl}/generate-report-stream`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(config)
+        });
+
+        const result = await new Promise((resolve, reject) => {
+            this._processSSEStream(response, {
+                onProgress: (e) => onProgress?.(e.current, e.total, e.element || e.pier, e.phase),
+                onComplete: resolve,
+                onError: reject
+            });
+        });
+
+        const download = await fetch(`${this.baseUrl}/report/${result.report_id}`);
+        if (!download.ok) {
+            const errorData = await download.json().catch(() => ({}));
+            throw new Error(errorData.error || `HTTP ${download.status}`);
+        }
+        return download.blob();
+    }
+
     // =========================================================================
     // Vigas de Acople
     // =========================================================================
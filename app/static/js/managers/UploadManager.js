@@ -432,14 +432,16 @@ class UploadManager {
 
     /**
      * Actualiza el progreso en el modal.
+     * @param {string} [phase] - 'curves' (curvas P-M) o 'elements'
      */
-    updateProgress(current, total, element) {
+    updateProgress(current, total, element, phase) {
         const progressText = document.getElementById('progress-text');
         const progressBar = document.getElementById('progress-bar');
         const progressPier = document.getElementById('progress-pier');
 
         if (progressText) {
-            progressText.textContent = total > 0 ? `Procesando ${current} de ${total}` : element;
+            const action = phase === 'curves' ? 'Curvas P-M' : 'Procesando';
+            progressText.textContent = total > 0 ? `${action} ${current} de ${total}` : element;
         }
         if (progressBar && total > 0) {
             progressBar.style.width = `${(current / total) * 100}%`;
@@ -516,9 +518,9 @@ class UploadManager {
 
             const result = await structuralAPI.analyzeWithProgress(
                 params,
-                (current, total, pier) => {
-                    this.updateProgress(current, total, pier);
-                    this._logImport('analysis_progress', { current, total, element: pier });
+                (current, total, pier, phase) => {
+                    this.updateProgress(current, total, pier, phase);
+                    this._logImport('analysis_progress', { current, total, element: pier, phase });
                 }
             );
 
@@ -29,7 +29,8 @@ class ReportModal {
             cancelBtn: document.getElementById('report-cancel-btn'),
             generateBtn: document.getElementById('report-generate-btn'),
             btnText: document.querySelector('#report-generate-btn .btn-text'),
-            btnLoading: document.querySelector('#report-generate-btn .btn-loading')
+            btnLoading: document.querySelector('#report-generate-btn .btn-loading'),
+            btnProgress: document.querySelector('#report-generate-btn .btn-progress')
         };
     }
 
@@ -128,6 +129,9 @@ class ReportModal {
         if (this.elements.btnLoading) {
             this.elements.btnLoading.style.display = loading ? 'inline' : 'none';
         }
+        if (this.elements.btnProgress) {
+            this.elements.btnProgress.textContent = 'Generando...';
+        }
         if (this.elements.generateBtn) {
             this.elements.generateBtn.disabled = loading;
         }
@@ -146,10 +150,26 @@ class ReportModal {
             include_proposals: this.elements.includeProposals?.checked ?? true,
             include_pm_diagrams: this.elements.includePM?.checked ?? true,
             include_sections: this.elements.includeSections?.checked ?? true,
-            include_full_table: this.elements.includeFullTable?.checked ?? true
+            include_full_table: this.elements.includeFullTable?.checked ?? true,
+            // Mismas opciones que el análisis de la UI (reutiliza su cache)
+            materials_config: this.page.materialsManager.getConfig(),
+            seismic_category: this.page.getSeismicCategory()
         };
     }
 
+    setProgress(current, total, phase) {
+        const labels = {
+            curves: 'Curvas P-M',
+            elements: 'Análisis',
+            report_plots: 'Gráficos',
+            report_pages: 'Páginas'
+        };
+        if (this.elements.btnProgress) {
+            this.elements.btnProgress.textContent =
+                `${labels[phase] || 'Generando'} ${current}/${total}...`;
+        }
+    }
+
     async generate() {
         if (!this.validateInputs()) {
             return;
@@ -160,7 +180,10 @@ class ReportModal {
 
         try {
             const config = this.getConfig();
-            const blob = await structuralAPI.generateReport(config);
+            const blob = await structuralAPI.generateReportWithProgress(
+                config,
+                (current, total, label, phase) => this.setProgress(current, total, phase)
+            );
 
             // Descargar el archivo
             const url = window.URL.createObjectURL(blob);
@@ -401,10 +401,15 @@ class WallsModule {
 
         const flexureBody = document.getElementById('det-flexure-body');
         if (flexure) {
+            // D/C de la curva primaria (tabla) y, rotulado aparte, el biaxial del diagrama P-M
+            const biaxialDcr = flexure.dcr_biaxial !== undefined
+                ? `<div class="${getDcrClass(flexure.dcr_biaxial)}" title="${flexure.sf_biaxial_label}">`
+                  + `biaxial: ${flexure.dcr_biaxial}</div>`
+                : '';
             flexureBody.innerHTML = `
                 <tr>
                     <td>${flexure.location}</td>
-                    <td class="${getDcrClass(flexure.dcr)}">${flexure.dcr}</td>
+                    <td class="${getDcrClass(flexure.dcr)}" title="D/C curva P-M">${flexure.dcr}${biaxialDcr}</td>
                     <td class="combo-cell">${combo_name}</td>
                     <td>${flexure.Pu_tonf}</td>
                     <td>${flexure.Mu2_tonf_m}</td>
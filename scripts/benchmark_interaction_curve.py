@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark del motor NumPy de curvas P-M contra la implementación escalar previa.
+
+Uso:
+    python scripts/benchmark_interaction_curve.py [--sections N] [--layers N] [--repeat N]
+
+Genera N secciones de muro aleatorias (reproducibles), calcula la curva con
+InteractionDiagramService.generate_interaction_curve() y con la versión
+escalar de referencia (bucle c × capas en Python), verifica que ambas
+coincidan dentro de tolerancia y reporta tiempos.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.domain.flexure.interaction_diagram import (
+    InteractionDiagramService,
+    InteractionPoint,
+    CURVE_COLUMNS,
+    C_MIN_MM,
+)
+from app.domain.calculations.steel_layer_calculator import SteelLayer
+from app.domain.constants.materials import calculate_beta1, EPSILON_CU, ES_MPA
+from app.domain.constants.phi_chapter21 import (
+    PHI_COMPRESSION,
+    PHI_TENSION,
+    calculate_phi_flexure,
+)
+from app.domain.constants.units import N_TO_TONF, NMM_TO_TONFM
+
+
+def legacy_interaction_curve(width, thickness, fc, fy, steel_layers, n_points=50):
+    """Implementación escalar de referencia (un punto y una capa a la vez)."""
+    b, h = thickness, width
+    As_total = sum(layer.area for layer in steel_layers)
+    d = max(layer.position for layer in steel_layers)
+    beta1 = calculate_beta1(fc)
+    epsilon_y = fy / ES_MPA
+
+    P0_max = 0.80 * (0.85 * fc * (b * h - As_total) + fy * As_total)
+    points = [InteractionPoint(P0_max / N_TO_TONF, 0, PHI_COMPRESSION,
+                               PHI_COMPRESSION * P0_max / N_TO_TONF, 0, float('inf'), 0)]
+
+    c_balanced = d * EPSILON_CU / (EPSILON_CU + epsilon_y)
+    n1, n2, n3 = n_points // 4, n_points // 3, n_points // 3
+    c_values = [d * (10 - 9 * i / n1) for i in range(n1)]
+    c_values += [d - (d - c_balanced) * i / n2 for i in range(n2 + 1)]
+    c_values += [c_balanced - (c_balanced - 0.05 * d) * i / n3 for i in range(n3 + 1)]
+
+    for c in sorted(set(c_values), reverse=True):
+        if c <= C_MIN_MM:
+            continue
+        a = min(beta1 * c, h)
+        Cc = 0.85 * fc * a * b
+        Mc = Cc * (h / 2 - a / 2)
+        Pn_s = Mn_s = eps_max = 0.0
+        for layer in steel_layers:
+            eps = EPSILON_CU * (layer.position - c) / c
+            fs = min(abs(eps) * ES_MPA, fy)
+            if eps < 0:
+                fs = -fs
+            if layer.position <= a and fs < 0:
+                F = layer.area * (fs + 0.85 * fc)
+            else:
+                F = layer.area * fs
+            Pn_s -= F
+            Mn_s += F * (layer.position - h / 2)
+            eps_max = max(eps_max, eps)
+        Pn = min(Cc + Pn_s, P0_max)
+        Mn = abs(Mc + Mn_s)
+        phi = calculate_phi_flexure(eps_max)
+        points.append(InteractionPoint(Pn / N_TO_TONF, Mn / NMM_TO_TONFM, phi,
+                                       phi * Pn / N_TO_TONF, phi * Mn / NMM_TO_TONFM,
+                                       c, eps_max))
+
+    Pt = -As_total * fy
+    points.append(InteractionPoint(Pt / N_TO_TONF, 0, PHI_TENSION,
+                                   PHI_TENSION * Pt / N_TO_TONF, 0, 0, float('inf')))
+    points.sort(key=lambda p: p.phi_Pn, reverse=True)
+    return points
+
+
+def make_sections(n_sections, n_layers, seed=0):
+    """Genera secciones de muro reproducibles (h, b, fc, fy, capas)."""
+    rng = random.Random(seed)
+    sections = []
+    for _ in range(n_sections):
+        h = rng.uniform(600, 8000)
+        b = rng.choice([150, 200, 250, 300])
+        fc = rng.choice([25, 30, 35, 40])
+        fy = 420
+        spacing = (h - 80) / (n_layers - 1)
+        layers = [SteelLayer(position=40 + i * spacing, area=rng.uniform(100, 800))
+                  for i in range(n_layers)]
+        sections.append((h, b, fc, fy, layers))
+    return sections
+
+
+def max_relative_diff(reference, candidate):
+    """Máxima diferencia relativa entre dos curvas, campo a campo."""
+    if len(reference) != len(candidate):
+        return math.inf
+    worst = 0.0
+    for p, q in zip(reference, candidate):
+        for name in CURVE_COLUMNS:
+            x, y = getattr(p, name), getattr(q, name)
+            if math.isinf(x) or math.isinf(y):
+                if x != y:
+                    return math.inf
+                continue
+            worst = max(worst, abs(x - y) / max(1.0, abs(x)))
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de curvas P-M")
+    parser.add_argument("--sections", type=int, default=500, help="Número de secciones")
+    parser.add_argument("--layers", type=int, default=20, help="Capas de acero por sección")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones (se usa la mejor)")
+    args = parser.parse_args()
+
+    sections = make_sections(args.sections, args.layers)
+    service = InteractionDiagramService()
+
+    def run_legacy():
+        return [legacy_interaction_curve(h, b, fc, fy, layers) for h, b, fc, fy, layers in sections]
+
+    def run_numpy():
+        return [service.generate_interaction_curve(h, b, fc, fy, 0, steel_layers=layers)
+                for h, b, fc, fy, layers in sections]
+
+    def best_time(fn):
+        best, result = math.inf, None
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - t0)
+        return best, result
+
+    t_legacy, legacy = best_time(run_legacy)
+    t_numpy, vectorized = best_time(run_numpy)
+
+    worst = max(max_relative_diff(a, b) for a, b in zip(legacy, vectorized))
+
+    print(f"Secciones: {args.sections}  Capas: {args.layers}  Puntos/curva: {len(vectorized[0])}")
+    print(f"Escalar (referencia): {t_legacy * 1000:9.1f} ms")
+    print(f"NumPy:                {t_numpy * 1000:9.1f} ms")
+    print(f"Speedup:              {t_legacy / t_numpy:9.2f}x")
+    print(f"Máx. dif. relativa:   {worst:9.2e}")
+    return 0 if worst < 1e-9 else 1
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,55 @@
+# tests/conftest.py
+"""
+Constructores compartidos de datos de prueba.
+
+Se importan explícitamente (from tests.conftest import make_pier, ...):
+- make_mesh: malla típica 2 cortinas φ10@200 / φ8@200
+- make_pier: muro 2000x200, h=2700, f'c=25, fy=420 con make_mesh()
+- make_pier_forces: fuerzas de un pier (combinaciones C1..Cn)
+- make_session: ParsedData con n piers de un piso y sus fuerzas
+"""
+from app.domain.entities import (
+    ParsedData, VerticalElement, VerticalElementSource, MeshReinforcement,
+    ElementForces, ElementForceType, LoadCombination,
+)
+
+
+def make_mesh(**overrides) -> MeshReinforcement:
+    """Malla de 2 cortinas φ10@200 vertical y φ8@200 horizontal."""
+    values = dict(n_meshes=2, diameter_v=10, spacing_v=200, diameter_h=8, spacing_h=200)
+    values.update(overrides)
+    return MeshReinforcement(**values)
+
+
+def make_pier(label: str = 'M1', story: str = 'Piso 1', length: float = 2000,
+              **overrides) -> VerticalElement:
+    """Pier rectangular; overrides reemplaza cualquier campo (ej: thickness, mesh_reinforcement)."""
+    values = dict(
+        label=label, story=story, source=VerticalElementSource.PIER,
+        length=length, thickness=200, height=2700, fc=25, fy=420,
+        mesh_reinforcement=make_mesh(),
+    )
+    values.update(overrides)
+    return VerticalElement(**values)
+
+
+def make_pier_forces(label: str = 'M1', story: str = 'Piso 1', n: int = 3) -> ElementForces:
+    """Fuerzas de un pier: combinación Cj con P=-50j, V2=10j, M3=20j (j=1..n)."""
+    forces = ElementForces(label=label, story=story, element_type=ElementForceType.PIER)
+    forces.combinations = [
+        LoadCombination(name=f'C{j}', location='Top', step_type='',
+                        P=-50.0 * j, V2=10.0 * j, V3=1.0, T=0.0, M2=1.0, M3=20.0 * j)
+        for j in range(1, n + 1)
+    ]
+    return forces
+
+
+def make_session(n_piers: int = 3) -> ParsedData:
+    """Sesión con piers 'Piso 1_M{i}' (largo 2000 + 100i) y sus fuerzas."""
+    parsed = ParsedData()
+    for i in range(n_piers):
+        key = f'Piso 1_M{i}'
+        parsed.vertical_elements[key] = make_pier(f'M{i}', length=2000 + 100 * i)
+        parsed.vertical_forces[key] = make_pier_forces(f'M{i}')
+    parsed.stories = ['Piso 1']
+    return parsed
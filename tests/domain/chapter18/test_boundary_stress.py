@@ -0,0 +1,74 @@
+# tests/domain/chapter18/test_boundary_stress.py
+"""
+Tests para el cálculo de esfuerzos en bordes (§18.10.6.3) y el barrido
+vectorizado sobre todas las combinaciones.
+"""
+import numpy as np
+import pytest
+
+from app.domain.chapter18.boundary_elements import (
+    calculate_boundary_stress, edge_stresses, scan_boundary_stress,
+)
+from app.domain.chapter18.walls import SeismicWallService
+from app.domain.constants.units import TONF_TO_N, TONFM_TO_NMM
+
+
+def _loop_scan(width, thickness, fc, P_N, M_Nmm):
+    """Recorrido combinación a combinación (referencia)."""
+    best = {'left': (0.0, None), 'right': (0.0, None)}
+    for i, (P, M) in enumerate(zip(P_N, M_Nmm)):
+        stress = calculate_boundary_stress(width, thickness, fc, P, M)
+        if stress.sigma_left > best['left'][0]:
+            best['left'] = (stress.sigma_left, i)
+        if stress.sigma_right > best['right'][0]:
+            best['right'] = (stress.sigma_right, i)
+    return best
+
+
+class TestEdgeStresses:
+    def test_scalar_matches_boundary_stress(self):
+        stress = calculate_boundary_stress(2000, 200, 25, P_N=1e6, M_Nmm=-3e8)
+        assert edge_stresses(2000, 200, 1e6, -3e8) == (stress.sigma_left, stress.sigma_right)
+        assert stress.sigma_left == pytest.approx(2.5 + 2.25)
+
+    def test_zero_section_has_no_stress(self):
+        assert edge_stresses(0, 200, 1e6, 1e8) == (0.0, 0.0)
+
+
+class TestScanBoundaryStress:
+    def test_matches_combination_loop(self):
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            n = int(rng.integers(1, 40))
+            P_N = rng.normal(0, 1e6, n)
+            M_Nmm = rng.normal(0, 3e8, n)
+
+            scan = scan_boundary_stress(2000, 200, 25, P_N, M_Nmm)
+            expected = _loop_scan(2000, 200, 25, P_N, M_Nmm)
+
+            assert (scan.sigma_left, scan.index_left) == pytest.approx(expected['left'])
+            assert (scan.sigma_right, scan.index_right) == pytest.approx(expected['right'])
+
+    def test_first_combination_wins_ties(self):
+        scan = scan_boundary_stress(2000, 200, 25, [1e6, 2e6, 2e6], [0.0, 0.0, 0.0])
+        assert scan.index_left == 1 and scan.index_right == 1
+
+    def test_no_compression_and_empty(self):
+        for P_N in ([-1e6, np.nan], []):
+            scan = scan_boundary_stress(2000, 200, 25, P_N, [0.0] * len(P_N))
+            assert (scan.sigma_left, scan.index_left) == (0.0, None)
+            assert (scan.sigma_right, scan.index_right) == (0.0, None)
+            assert not scan.required_left
+
+    def test_required_by_limit(self):
+        scan = scan_boundary_stress(2000, 200, 25, [5.0 * 2000 * 200], [0.0])
+        assert scan.sigma_limit == 5.0
+        assert scan.required_left and scan.required_right
+
+
+class TestWallSigmaMax:
+    def test_uses_compression_edge(self):
+        sigma = SeismicWallService()._calculate_sigma_max(2000, 200, Pu=-100, Mu=-50)
+        expected, _ = edge_stresses(2000, 200, 100 * TONF_TO_N, 50 * TONFM_TO_NMM)
+        assert sigma == pytest.approx(expected)
+        assert SeismicWallService()._calculate_sigma_max(0, 200, Pu=100, Mu=50) == 0
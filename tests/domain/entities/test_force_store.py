@@ -0,0 +1,151 @@
+# tests/domain/entities/test_force_store.py
+"""
+Tests para el almacén columnar de combinaciones y las vistas ElementForces.
+"""
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.domain.entities import ElementForces, ElementForceType, ForceStore, LoadCombination
+from app.domain.entities.element_forces import COMBO_COLUMNS
+
+
+@pytest.fixture
+def table():
+    """Tabla de fuerzas de dos piers con filas intercaladas."""
+    return pd.DataFrame([
+        ['S1_P2', 'DL', 'Top', '', -50.0, 1.0, 0.5, 0.0, 2.0, 8.0],
+        ['S1_P1', 'DL', 'Top', '', -10.0, 2.0, 0.0, 0.0, 3.0, 4.0],
+        ['S1_P1', 'EQ', 'Bottom', 'Max', 5.0, -9.0, 1.0, 0.1, -6.0, 12.0],
+        ['S1_P2', 'EQ', 'Bottom', 'Min', 20.0, -3.0, 0.0, 0.0, 1.0, -30.0],
+        ['S1_P1', 'EQ', 'Top', 'Min', -20.0, 4.0, 0.0, 0.0, 1.0, -2.0],
+    ], columns=['key', *COMBO_COLUMNS])
+
+
+def _views(table):
+    store, ranges = ForceStore.from_frame(table, key_column='key')
+    views = {}
+    for key, (start, stop) in ranges.items():
+        forces = ElementForces(label=key, story='S1', element_type=ElementForceType.PIER)
+        forces.bind(store, start, stop)
+        views[key] = forces
+    return store, views
+
+
+def _per_element(table, key):
+    forces = ElementForces(label=key, story='S1', element_type=ElementForceType.PIER)
+    forces.set_combinations_from_df(table[table['key'] == key])
+    return forces
+
+
+class TestForceStore:
+    def test_ranges_group_rows_in_original_order(self, table):
+        store, ranges = ForceStore.from_frame(table, key_column='key')
+        assert len(store) == 5
+        start, stop = ranges['S1_P1']
+        assert store.column('P', start, stop).tolist() == [-10.0, 5.0, -20.0]
+        assert store.labels('location', start, stop).tolist() == ['Top', 'Bottom', 'Top']
+
+    def test_columns_are_read_only_views(self, table):
+        store, views = _views(table)
+        P = views['S1_P2'].values('P')
+        assert np.shares_memory(P, store.column('P'))
+        with pytest.raises(ValueError):
+            P[0] = 0.0
+
+    def test_subset_is_compact(self, table):
+        store, ranges = ForceStore.from_frame(table, key_column='key')
+        sub = store.subset(*ranges['S1_P2'])
+        assert len(sub) == 2
+        assert sub.labels('step_type').tolist() == ['', 'Min']
+
+    def test_missing_labels_become_empty(self):
+        df = pd.DataFrame([[None, np.nan, 'Max', 1, 2, 3, 4, 5, 6]], columns=COMBO_COLUMNS)
+        store, _ = ForceStore.from_frame(df)
+        assert store.labels('name').tolist() == ['']
+        assert store.labels('location').tolist() == ['']
+
+
+class TestElementForcesView:
+    def test_combinations_match_per_element_storage(self, table):
+        _, views = _views(table)
+        for key, view in views.items():
+            assert view.combinations == _per_element(table, key).combinations
+
+    @pytest.mark.parametrize('method', [
+        'get_envelope', 'get_max_shear', 'get_max_moment', 'get_critical_pm_points',
+        'get_combinations_with_angles', 'get_critical_combination',
+        'get_critical_shear_combo', 'get_critical_moment_combo', 'get_critical_flexure_combo',
+    ])
+    def test_methods_match_per_element_storage(self, table, method):
+        _, views = _views(table)
+        for key, view in views.items():
+            assert getattr(view, method)() == getattr(_per_element(table, key), method)()
+
+    def test_iter_combinations_does_not_cache(self, table):
+        _, views = _views(table)
+        combos = list(views['S1_P1'].iter_combinations())
+        assert [c.name for c in combos] == ['DL', 'EQ', 'EQ']
+        assert views['S1_P1']._combinations_list is None
+
+    def test_get_combination(self, table):
+        _, views = _views(table)
+        combo = views['S1_P1'].get_combination(1)
+        assert combo == LoadCombination('EQ', 'Bottom', 'Max', 5.0, -9.0, 1.0, 0.1, -6.0, 12.0)
+
+    def test_bulk_views_split_story_and_label(self, table):
+        table = pd.concat([table, table.iloc[[0]].assign(key='SINPISO')], ignore_index=True)
+        store, ranges = ForceStore.from_frame(table, key_column='key')
+        views = ElementForces.views(store, ranges, ElementForceType.PIER)
+
+        assert list(ranges) == ['S1_P1', 'S1_P2', 'SINPISO']
+        assert list(views) == ['S1_P1', 'S1_P2']
+        assert (views['S1_P2'].story, views['S1_P2'].label) == ('S1', 'P2')
+        assert views['S1_P1'].store_range == (store, 0, 3)
+
+    def test_pickle_sends_only_own_rows(self, table):
+        _, views = _views(table)
+        restored = pickle.loads(pickle.dumps(views['S1_P2']))
+        assert len(restored._store) == 2
+        assert restored.combinations == views['S1_P2'].combinations
+
+    def test_setter_roundtrip(self):
+        combo = LoadCombination('C1', 'Top', '', -10.0, 1.0, 2.0, 0.0, 3.0, 4.0)
+        forces = ElementForces(label='P1', story='S1', element_type=ElementForceType.PIER)
+        forces.combinations = [combo]
+        assert forces.n_combinations == 1
+        assert forces.combinations_df['M3'].tolist() == [4.0]
+
+    def test_empty(self):
+        forces = ElementForces(label='P1', story='S1', element_type=ElementForceType.PIER)
+        assert forces.n_combinations == 0
+        assert forces.combinations == []
+        assert forces.get_envelope() == {}
+        assert forces.get_critical_combination() is None
+
+
+class TestConcatAndLazy:
+    def test_concat_ranges_in_order(self, table):
+        store, ranges = ForceStore.from_frame(table, key_column='key')
+        merged, new_ranges = ForceStore.concat({
+            'B': (store, *ranges['S1_P2']), 'A': (store, *ranges['S1_P1']),
+        })
+        assert new_ranges == {'B': (0, 2), 'A': (2, 5)}
+        assert merged.column('P').tolist() == [-50.0, 20.0, -10.0, 5.0, -20.0]
+        assert merged.labels('name', 2, 5).tolist() == ['DL', 'EQ', 'EQ']
+
+    def test_lazy_loads_on_first_access(self, table):
+        store, _ = ForceStore.from_frame(table)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return store.arrays()
+
+        lazy = ForceStore.lazy(len(store), loader)
+        assert len(lazy) == 5 and not lazy.is_loaded
+        assert lazy.column('M3').tolist() == store.column('M3').tolist()
+        assert lazy.labels('step_type').tolist() == store.labels('step_type').tolist()
+        assert lazy.is_loaded and calls == [1]
@@ -0,0 +1,122 @@
+# tests/domain/flexure/test_biaxial_surface.py
+"""
+Tests para la superficie de interacción biaxial P-M2-M3.
+
+Los meridianos en M2 = 0 y M3 = 0 deben reproducir las curvas uniaxiales
+primaria y secundaria, y los factores de seguridad por rayo deben coincidir
+con FlexureChecker en esos planos.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from app.domain.entities import VerticalElement, VerticalElementSource
+from app.domain.entities.composite_section import CompositeSection, WallSegment
+from app.domain.flexure import (
+    BiaxialSection, BiaxialSurface, FlexureChecker, generate_biaxial_surface,
+)
+from app.services.analysis.flexocompression_service import FlexocompressionService
+from tests.conftest import make_pier
+
+
+@pytest.fixture(scope='module')
+def pier():
+    return make_pier(length=3000)
+
+
+@pytest.fixture(scope='module')
+def surface(pier):
+    return generate_biaxial_surface(BiaxialSection.from_element(pier))
+
+
+@pytest.fixture(scope='module')
+def uniaxial(pier):
+    service = FlexocompressionService()
+    return {
+        direction: service.generate_interaction_curve(pier, direction=direction, use_cache=False)[0]
+        for direction in ('primary', 'secondary')
+    }
+
+
+class TestSection:
+    def test_rectangle_properties(self, pier):
+        section = BiaxialSection.from_element(pier)
+        assert section.Ag == pytest.approx(3000 * 200)
+        assert section.As_total == pytest.approx(pier.As_flexure_total, rel=1e-6)
+        assert section.centroid == pytest.approx((1500, 100))
+
+    def test_composite_area_matches_segments(self):
+        composite = CompositeSection(segments=[
+            WallSegment(x1=0, y1=0, x2=1200, y2=0, thickness=200),
+            WallSegment(x1=1200, y1=0, x2=1200, y2=800, thickness=200),
+        ])
+        section = BiaxialSection(
+            [segment.get_corners() for segment in composite.segments],
+            [(100, 0, 500), (1200, 700, 500)], fc=25, fy=420,
+        )
+        assert section.Ag == pytest.approx(composite.Ag)
+
+        surface = generate_biaxial_surface(section)
+        P0_max = 0.80 * (0.85 * 25 * (composite.Ag - 1000) + 420 * 1000) / 9806.65
+        assert surface.meridians[:, 0, 0] == pytest.approx(P0_max, rel=1e-9)
+
+
+    def test_composite_is_rotated_to_local_axes(self, pier):
+        pier = VerticalElement(
+            label='PL', story='Piso 1', source=VerticalElementSource.PIER,
+            length=1500, thickness=200, height=2700, fc=25, fy=420, axis_angle=90.0,
+            composite_section=CompositeSection(segments=[
+                WallSegment(x1=0, y1=0, x2=0, y2=1500, thickness=200),
+                WallSegment(x1=0, y1=1500, x2=600, y2=1500, thickness=200),
+            ]),
+            mesh_reinforcement=pier.mesh_reinforcement,
+        )
+        section = BiaxialSection.from_element(pier)
+        width, height = np.ptp(section.vertices, axis=0)
+        assert width == pytest.approx(1600) and height == pytest.approx(700)
+        assert np.ptp(section.bars[:, 0]) > np.ptp(section.bars[:, 1])
+
+
+class TestUniaxialPlanes:
+    @pytest.mark.parametrize('direction, M2, M3', [('primary', 0.0, 1.0), ('secondary', 1.0, 0.0)])
+    def test_meridian_matches_uniaxial_curve(self, surface, uniaxial, direction, M2, M3):
+        curve = surface.curve_at(M2, M3)
+        expected = uniaxial[direction]
+        loads = np.linspace(-100, 900, 21)
+        np.testing.assert_allclose(curve.phi_Mn_at(loads), expected.phi_Mn_at(loads),
+                                   rtol=1e-9, atol=1e-9)
+
+    @pytest.mark.parametrize('direction, scale', [('primary', 1.0), ('secondary', 0.1)])
+    def test_safety_factors_match_checker(self, surface, uniaxial, direction, scale):
+        Pu = np.array([100.0, 300.0, -50.0, 500.0])
+        Mu = np.array([200.0, 400.0, 50.0, 100.0]) * scale
+        expected, _ = FlexureChecker.calculate_safety_factors(uniaxial[direction], Pu, Mu)
+        if direction == 'primary':
+            result = surface.safety_factors(Pu, np.zeros_like(Mu), Mu)
+        else:
+            result = surface.safety_factors(Pu, Mu, np.zeros_like(Mu))
+        np.testing.assert_allclose(result, expected, rtol=1e-3)
+
+
+class TestBiaxial:
+    def test_symmetric_in_moment_sign(self, surface):
+        for M2, M3 in [(5.0, 100.0), (10.0, 50.0)]:
+            sf = surface.safety_factor(200.0, M2, M3)
+            assert surface.safety_factor(200.0, -M2, M3) == pytest.approx(sf, rel=1e-6)
+            assert surface.safety_factor(200.0, M2, -M3) == pytest.approx(sf, rel=1e-6)
+
+    def test_weak_axis_component_reduces_capacity(self, surface):
+        """La componente M2 de una pared delgada controla aunque sea menor que M3."""
+        strong = surface.safety_factor(200.0, 0.0, 100.0)
+        weak = surface.safety_factor(200.0, 10.0, 0.0)
+        combined = surface.safety_factor(200.0, 10.0, 100.0)
+        assert combined < min(strong, weak)
+
+    def test_zero_demand_is_infinite(self, surface):
+        assert math.isinf(surface.safety_factor(0.0, 0.0, 0.0))
+        assert isinstance(surface, BiaxialSurface) and surface.nbytes > 0
+
+    def test_arrays_are_read_only(self, surface):
+        with pytest.raises(ValueError):
+            surface.meridians[0, 0, 0] = 0.0
@@ -0,0 +1,162 @@
+# tests/domain/flexure/test_checker.py
+"""
+Tests para el kernel vectorizado de FlexureChecker.
+
+Verifica que calculate_safety_factors() y get_phi_Mn_at_P_batch()
+reproducen la versión escalar (un punto de demanda a la vez),
+incluyendo los casos borde: demanda nula, rayos sin intersección
+y Pu fuera del rango de la curva.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from app.domain.flexure import FlexureChecker, InteractionDiagramService
+from app.domain.flexure.interaction_diagram import InteractionPoint
+from app.domain.calculations.steel_layer_calculator import SteelLayer
+from app.domain.constants.tolerances import (
+    ZERO_TOLERANCE,
+    PARALLEL_TOLERANCE,
+    SEGMENT_PARAM_TOLERANCE,
+    INSIDE_SF_THRESHOLD,
+)
+
+
+def scalar_safety_factor(curve, Pu, Mu):
+    """Ray-casting escalar de referencia (un segmento a la vez)."""
+    Mu = abs(Mu)
+    d_demand = math.sqrt(Pu**2 + Mu**2)
+    if d_demand < ZERO_TOLERANCE:
+        return float('inf'), True
+    dir_M, dir_P = Mu / d_demand, Pu / d_demand
+
+    best_t = None
+    for (M1, P1), (M2, P2) in zip(curve[:-1], curve[1:]):
+        dM, dP = M2 - M1, P2 - P1
+        det = dir_M * (-dP) - dir_P * (-dM)
+        if abs(det) < PARALLEL_TOLERANCE:
+            continue
+        t = (M1 * (-dP) - P1 * (-dM)) / det
+        s = (dir_M * P1 - dir_P * M1) / det
+        if t > 0 and -SEGMENT_PARAM_TOLERANCE <= s <= 1 + SEGMENT_PARAM_TOLERANCE:
+            best_t = t if best_t is None else min(best_t, t)
+
+    if best_t is not None:
+        sf = best_t / d_demand
+        return sf, sf >= INSIDE_SF_THRESHOLD
+
+    is_inside = FlexureChecker._point_in_polygon(Mu, Pu, curve)
+    min_dist, closest = float('inf'), 0.0
+    for M_cap, P_cap in curve:
+        proj = M_cap * dir_M + P_cap * dir_P
+        if proj > 0:
+            dist = math.sqrt((M_cap - proj * dir_M)**2 + (P_cap - proj * dir_P)**2)
+            if dist < min_dist:
+                min_dist, closest = dist, math.sqrt(M_cap**2 + P_cap**2)
+    if closest > 0:
+        return closest / d_demand, is_inside
+    return 0.5, False
+
+
+def scalar_phi_Mn_at_P(curve, Pu):
+    """Interpolación horizontal escalar de referencia."""
+    above = [mp for mp in curve if mp[1] >= Pu]
+    below = [mp for mp in curve if mp[1] <= Pu]
+    if not above or not below:
+        return min(curve, key=lambda mp: abs(mp[1] - Pu))[0]
+    M2, P2 = min(above, key=lambda mp: mp[1])
+    M1, P1 = max(below, key=lambda mp: mp[1])
+    if abs(P2 - P1) < ZERO_TOLERANCE:
+        return M1
+    return max(0.0, M1 + (M2 - M1) * (Pu - P1) / (P2 - P1))
+
+
+@pytest.fixture
+def design_curve():
+    """Curva de diseño de un muro 2000x200 con barras de borde y malla."""
+    layers = [
+        SteelLayer(position=40, area=4 * 201),
+        SteelLayer(position=700, area=2 * 79),
+        SteelLayer(position=1300, area=2 * 79),
+        SteelLayer(position=1960, area=4 * 201),
+    ]
+    return InteractionDiagramService().generate_interaction_curve(
+        2000, 200, 30, 420, 0, steel_layers=layers
+    )
+
+
+@pytest.fixture
+def demands():
+    """Demandas aleatorias reproducibles + casos borde."""
+    rng = np.random.default_rng(0)
+    Pu = np.concatenate([rng.uniform(-300, 1200, 300), [0.0, 0.0, 5000.0, -5000.0, 100.0]])
+    Mu = np.concatenate([rng.uniform(-800, 800, 300), [0.0, 50.0, 10.0, 0.0, 5000.0]])
+    return Pu, Mu
+
+
+class TestSafetyFactorsBatch:
+    """El kernel en lote coincide con el ray-casting escalar."""
+
+    def test_matches_scalar(self, design_curve, demands):
+        Pu, Mu = demands
+        curve = [(p.phi_Mn, p.phi_Pn) for p in design_curve]
+        sf, inside = FlexureChecker.calculate_safety_factors(design_curve, Pu, Mu)
+
+        for i in range(len(Pu)):
+            sf_ref, inside_ref = scalar_safety_factor(curve, Pu[i], Mu[i])
+            assert sf[i] == pytest.approx(sf_ref, rel=1e-12)
+            assert inside[i] == inside_ref
+
+    def test_accepts_compact_array(self, design_curve, demands):
+        Pu, Mu = demands
+        compact = np.array([[getattr(p, f) for f in InteractionPoint.__dataclass_fields__]
+                            for p in design_curve])
+        sf_points, _ = FlexureChecker.calculate_safety_factors(design_curve, Pu, Mu)
+        sf_array, _ = FlexureChecker.calculate_safety_factors(compact, Pu, Mu)
+        np.testing.assert_array_equal(sf_points, sf_array)
+
+    def test_zero_demand_is_infinite(self, design_curve):
+        sf, inside = FlexureChecker.calculate_safety_factors(design_curve, [0.0], [0.0])
+        assert math.isinf(sf[0]) and inside[0]
+
+    def test_scalar_delegates_to_batch(self, design_curve):
+        sf, inside = FlexureChecker.calculate_safety_factor(design_curve, 200.0, 150.0)
+        sf_b, inside_b = FlexureChecker.calculate_safety_factors(design_curve, [200.0], [150.0])
+        assert sf == sf_b[0] and inside == inside_b[0]
+
+
+class TestPhiMnAtPBatch:
+    def test_matches_scalar(self, design_curve):
+        curve = [(p.phi_Mn, p.phi_Pn) for p in design_curve]
+        Pu = np.concatenate([np.linspace(-600, 1500, 200), [p.phi_Pn for p in design_curve]])
+        batch = FlexureChecker.get_phi_Mn_at_P_batch(design_curve, Pu)
+        for P, M in zip(Pu, batch):
+            assert M == pytest.approx(scalar_phi_Mn_at_P(curve, P), rel=1e-12, abs=1e-12)
+
+    def test_out_of_range_uses_closest(self, design_curve):
+        P_max = max(p.phi_Pn for p in design_curve)
+        top = max(design_curve, key=lambda p: p.phi_Pn)
+        assert FlexureChecker.get_phi_Mn_at_P_batch(design_curve, [P_max + 100])[0] == top.phi_Mn
+
+
+class TestCheckFlexure:
+    def test_critical_combo_and_cache(self, design_curve, demands):
+        Pu, Mu = demands
+        demand_points = [(P, M, f'C{i} (Top)') for i, (P, M) in enumerate(zip(Pu, Mu))]
+        result = FlexureChecker.check_flexure(design_curve, demand_points)
+
+        sf, _ = FlexureChecker.calculate_safety_factors(design_curve, Pu, Mu)
+        i_crit = int(np.argmin(sf))
+        assert result.safety_factor == sf[i_crit]
+        assert result.critical_combo == f'C{i_crit} (Top)'
+        assert result.tension_combos == int(np.sum(Pu < 0))
+        assert len(result.combo_results) == len(Pu)
+        assert result.combo_results[0].combo_location == 'Top'
+        assert all(c.Mu >= 0 for c in result.combo_results)
+
+    def test_only_zero_demands_have_no_critical(self, design_curve):
+        result = FlexureChecker.check_flexure(design_curve, [(0.0, 0.0, 'C1')])
+        assert math.isinf(result.safety_factor)
+        assert result.critical_combo == ""
+        assert result.status == "OK"
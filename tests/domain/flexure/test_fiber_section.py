@@ -0,0 +1,115 @@
+# tests/domain/flexure/test_fiber_section.py
+"""
+Tests para la sección de fibras (curvas P-M de piers compuestos L, T, C).
+
+Un rectángulo discretizado en fibras debe reproducir el motor rectangular;
+las secciones compuestas deben contar una sola vez el solape de los
+segmentos y dar la envolvente inferior de ambos sentidos de momento.
+"""
+import math
+
+import numpy as np
+import pytest
+
+from app.domain.calculations.steel_layer_calculator import SteelLayer
+from app.domain.constants.materials import ES_MPA
+from app.domain.entities.composite_section import CompositeSection, WallSegment
+from app.domain.flexure import FiberSection, InteractionCurve, InteractionDiagramService
+from app.domain.flexure.fiber_section import mesh_polygons
+from app.domain.flexure.interaction_diagram import generate_c_values
+from tests.conftest import make_pier
+
+
+def _l_section():
+    return CompositeSection(segments=[
+        WallSegment(x1=0, y1=0, x2=1200, y2=0, thickness=200),
+        WallSegment(x1=1200, y1=0, x2=1200, y2=800, thickness=200),
+    ])
+
+
+def _l_pier(composite=None, axis_angle=0.0):
+    return make_pier('PL1', length=1200, axis_angle=axis_angle,
+                     composite_section=composite or _l_section())
+
+
+def _one_sided(fibers, angle):
+    service = InteractionDiagramService()
+    c = generate_c_values(fibers.max_bar_depth(angle), fibers.fy / ES_MPA, 50)
+    Pn, Mn, epsilon_t = fibers.evaluate(angle, c)
+    return InteractionCurve(service._assemble_curve(
+        c, Pn, Mn, epsilon_t, Ag=fibers.Ag, As_total=fibers.As_total,
+        fc=fibers.fc, fy=fibers.fy, is_unconfined=False
+    ))
+
+
+class TestMesh:
+    def test_overlap_counted_once(self):
+        mesh = _l_section().get_fiber_mesh()
+        # 1200×200 + 800×200 menos el solape de 100×100 en la esquina
+        assert mesh.area == pytest.approx(240000 + 160000 - 100 * 100)
+        assert not mesh.fibers.flags.writeable
+
+    def test_mesh_is_cached_per_section(self):
+        section = _l_section()
+        mesh = section.get_fiber_mesh()
+        assert section.get_fiber_mesh() is mesh
+        section.invalidate_cache()
+        assert section.get_fiber_mesh() is not mesh
+
+    def test_diagonal_segment_area(self):
+        segment = WallSegment(x1=0, y1=0, x2=1000, y2=700, thickness=250)
+        assert mesh_polygons([segment.get_corners()]).area == pytest.approx(segment.area)
+
+
+class TestCurve:
+    def test_rectangle_matches_rectangular_engine(self):
+        layers = [SteelLayer(position=40, area=804), SteelLayer(position=1000, area=158),
+                  SteelLayer(position=1960, area=804)]
+        service = InteractionDiagramService()
+        expected = service.generate_interaction_arrays(2000, 200, 30, 420, 0, steel_layers=layers)
+
+        fibers = FiberSection(
+            mesh_polygons([[(0, 0), (2000, 0), (2000, 200), (0, 200)]]),
+            [(layer.position, 100, layer.area) for layer in layers], fc=30, fy=420,
+        )
+        result = service.generate_interaction_arrays(0, 0, 30, 420, 0, fibers=fibers)
+
+        finite = np.isfinite(expected)
+        assert np.array_equal(np.isfinite(result), finite)
+        np.testing.assert_allclose(result[finite], expected[finite], rtol=1e-9, atol=1e-9)
+
+    def test_asymmetric_section_uses_weaker_sense(self):
+        fibers = FiberSection.from_element(_l_pier())
+        curve = InteractionDiagramService().generate_interaction_curve(
+            0, 0, 25, 420, 0, fibers=fibers, fiber_angle=0.0
+        )
+        loads = np.linspace(-50, 250, 13)
+        senses = [_one_sided(fibers, angle).phi_Mn_at(loads) for angle in (0.0, 180.0)]
+        weaker = np.minimum(*senses)
+
+        assert not np.allclose(senses[0], senses[1])
+        assert np.all(curve.phi_Mn_at(loads) <= weaker + 1e-9)
+        np.testing.assert_allclose(curve.phi_Mn_at(loads), weaker, rtol=1e-2)
+
+    def test_rotated_section_with_axis_angle(self):
+        theta = math.radians(30)
+        rotation = np.array([[math.cos(theta), math.sin(theta)], [-math.sin(theta), math.cos(theta)]])
+
+        def rotated(x, y):
+            return tuple(np.array([x, y]) @ rotation)
+
+        segments = []
+        for s in _l_section().segments:
+            (x1, y1), (x2, y2) = rotated(s.x1, s.y1), rotated(s.x2, s.y2)
+            segments.append(WallSegment(x1=x1, y1=y1, x2=x2, y2=y2, thickness=s.thickness))
+
+        base = FiberSection.from_element(_l_pier())
+        turned = FiberSection(CompositeSection(segments=segments).get_fiber_mesh(),
+                              [(*rotated(x, y), area) for x, y, area in base.bars], fc=25, fy=420)
+
+        service = InteractionDiagramService()
+        for angle in (0.0, 90.0):
+            expected = service.generate_interaction_curve(0, 0, 25, 420, 0, fibers=base, fiber_angle=angle)
+            result = service.generate_interaction_curve(0, 0, 25, 420, 0, fibers=turned, fiber_angle=angle + 30)
+            loads = np.linspace(-50, 250, 13)
+            np.testing.assert_allclose(result.phi_Mn_at(loads), expected.phi_Mn_at(loads), rtol=2e-3)
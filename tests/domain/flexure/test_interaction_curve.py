@@ -0,0 +1,121 @@
+# tests/domain/flexure/test_interaction_curve.py
+"""
+Tests para InteractionCurve (curva P-M respaldada por arreglo).
+
+Las consultas por búsqueda binaria deben reproducir las versiones por
+recorrido de puntos que reemplazan, incluyendo empates de φPn, segmentos
+horizontales y cargas fuera del rango de la curva.
+"""
+import math
+import pickle
+
+import numpy as np
+import pytest
+
+from app.domain.calculations.steel_layer_calculator import SteelLayer
+from app.domain.flexure import FlexureChecker, InteractionCurve, InteractionDiagramService
+from app.domain.flexure.interaction_curve import InteractionPoint, interpolate_between
+from app.domain.flexure.interaction_diagram import array_to_points
+
+
+def segment_reference(points, attr, x):
+    """Primer segmento que contiene x (recorrido de puntos ordenados)."""
+    for p1, p2 in zip(points[:-1], points[1:]):
+        P1, P2 = getattr(p1, attr), getattr(p2, attr)
+        if P1 >= x >= P2:
+            return p1, p2, (0.5 if abs(P1 - P2) < 0.001 else (P1 - x) / (P1 - P2))
+    end = points[0] if x > getattr(points[0], attr) else points[-1]
+    return end, end, 0.0
+
+
+@pytest.fixture
+def curve():
+    layers = [
+        SteelLayer(position=40, area=4 * 201),
+        SteelLayer(position=1000, area=2 * 79),
+        SteelLayer(position=1960, area=4 * 201),
+    ]
+    return InteractionDiagramService().generate_interaction_curve(
+        2000, 200, 30, 420, 0, steel_layers=layers
+    )
+
+
+@pytest.fixture
+def loads(curve):
+    rng = np.random.default_rng(1)
+    return np.concatenate([rng.uniform(-500, 1500, 200), curve.phi_Pn, [5000.0, -5000.0]])
+
+
+class TestSequence:
+    def test_behaves_like_point_list(self, curve):
+        points = array_to_points(curve.array)
+        assert isinstance(curve, InteractionCurve)
+        assert len(curve) == len(points)
+        assert curve == points and list(curve) == points
+        assert curve[0] == points[0] and curve[-1] == points[-1]
+        assert isinstance(curve[1:3], InteractionCurve) and curve[1:3] == points[1:3]
+        assert curve.design_curve() == [(p.phi_Mn, p.phi_Pn) for p in points]
+
+    def test_array_is_read_only(self, curve):
+        with pytest.raises(ValueError):
+            curve.array[0, 0] = 1.0
+        assert np.shares_memory(InteractionCurve(curve.array).array, curve.array)
+
+    def test_sorts_unordered_points_stably(self):
+        points = [InteractionPoint(0, i, 0.9, P, i, 1.0, 0.01)
+                  for i, P in enumerate([10.0, 50.0, 10.0, -20.0])]
+        curve = InteractionCurve.of(points)
+        assert curve.phi_Pn.tolist() == [50.0, 10.0, 10.0, -20.0]
+        assert curve.phi_Mn.tolist() == [1, 0, 2, 3]
+
+    def test_pickle_roundtrip(self, curve):
+        restored = pickle.loads(pickle.dumps(curve))
+        assert restored == curve
+        assert not restored.array.flags.writeable
+
+
+class TestQueries:
+    def test_phi_Mn_at_matches_point_lookup(self, curve, loads):
+        points = array_to_points(curve.array)
+        np.testing.assert_array_equal(
+            curve.phi_Mn_at(loads), FlexureChecker.get_phi_Mn_at_P_batch(points, loads)
+        )
+        assert curve.phi_Mn_at(0.0) == FlexureChecker.get_phi_Mn_at_P0(points)
+
+    def test_interpolation_with_ties(self):
+        P = np.array([10.0, 5.0, 5.0, 5.0, 0.0])
+        M = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+        result = interpolate_between(P, M, [10.0, 7.5, 5.0, 2.5, 11.0, -1.0])
+        np.testing.assert_allclose(result, [1.0, 1.5, 2.0, 3.5, 1.0, 5.0])
+
+    def test_at_phi_Pn_matches_segment_walk(self, curve, loads):
+        phi_Mn, phi, c, eps = curve.at_phi_Pn(loads)
+        for i, x in enumerate(loads):
+            p1, p2, ratio = segment_reference(curve, 'phi_Pn', x)
+            assert phi_Mn[i] == pytest.approx(p1.phi_Mn + ratio * (p2.phi_Mn - p1.phi_Mn), rel=1e-12)
+            assert phi[i] == pytest.approx(p1.phi + ratio * (p2.phi - p1.phi), rel=1e-12)
+            if math.isinf(p1.c) or math.isinf(p2.c):
+                assert c[i] == p1.c
+            else:
+                assert c[i] == pytest.approx(p1.c + ratio * (p2.c - p1.c), rel=1e-12)
+
+    def test_Mn_at_Pn_matches_segment_walk(self, curve, loads):
+        by_Pn = sorted(curve, key=lambda p: p.Pn, reverse=True)
+        for x in loads:
+            p1, p2, ratio = segment_reference(by_Pn, 'Pn', x)
+            expected = p1.Mn if ratio == 0.5 and abs(p1.Pn - p2.Pn) < 0.001 else \
+                p1.Mn + ratio * (p2.Mn - p1.Mn)
+            assert curve.Mn_at_Pn(x) == pytest.approx(expected, rel=1e-12)
+
+    def test_c_at_closest_point(self, curve):
+        def reference(Pu, Mu):
+            def distance(p):
+                dP = (p.phi_Pn - Pu) / max(abs(p.phi_Pn), 1)
+                dM = (p.phi_Mn - abs(Mu)) / max(abs(p.phi_Mn), 1)
+                return (dP ** 2 + dM ** 2) ** 0.5
+            c = min(curve, key=distance).c
+            return c if c and c < float('inf') else None
+
+        for Pu, Mu in [(0.0, 50.0), (300.0, -120.0), (-100.0, 10.0), (5000.0, 0.0)]:
+            assert curve.c_at(Pu, Mu) == reference(Pu, Mu)
+        assert InteractionCurve(np.empty((0, 7))).c_at(0.0, 0.0) is None
@@ -0,0 +1,142 @@
+# tests/domain/flexure/test_interaction_diagram.py
+"""
+Tests para el motor NumPy del diagrama de interacción P-M.
+
+Verifica:
+- Cada punto intermedio cumple equilibrio por compatibilidad de deformaciones
+  (recalculado capa por capa en Python)
+- Forma y orden del arreglo compacto
+- Puntos extremos (compresión y tracción pura)
+"""
+import math
+
+import numpy as np
+import pytest
+
+from app.domain.flexure.interaction_diagram import (
+    InteractionDiagramService,
+    InteractionPoint,
+    CURVE_COLUMNS,
+    calculate_phi_array,
+)
+from app.domain.calculations.steel_layer_calculator import SteelLayer
+from app.domain.constants.materials import calculate_beta1, EPSILON_CU, ES_MPA
+from app.domain.constants.phi_chapter21 import (
+    EPSILON_T_LIMIT, EPSILON_TY, calculate_phi_flexure, calculate_phi_flexure_array,
+)
+from app.domain.constants.units import N_TO_TONF, NMM_TO_TONFM
+
+
+def scalar_point(c, h, b, fc, fy, layers):
+    """Evalúa un punto de la curva capa por capa (referencia escalar)."""
+    a = min(calculate_beta1(fc) * c, h)
+    Cc = 0.85 * fc * a * b
+    Pn, Mn, eps_max = Cc, Cc * (h / 2 - a / 2), 0.0
+    for layer in layers:
+        eps = EPSILON_CU * (layer.position - c) / c
+        fs = math.copysign(min(abs(eps) * ES_MPA, fy), eps)
+        if layer.position <= a and fs < 0:
+            F = layer.area * (fs + 0.85 * fc)
+        else:
+            F = layer.area * fs
+        Pn -= F
+        Mn += F * (layer.position - h / 2)
+        eps_max = max(eps_max, eps)
+    return Pn, abs(Mn), eps_max
+
+
+@pytest.fixture
+def service():
+    return InteractionDiagramService()
+
+
+@pytest.fixture
+def wall_layers():
+    """Muro 2500x200 con barras de borde y malla intermedia."""
+    return [
+        SteelLayer(position=40, area=4 * 201),
+        SteelLayer(position=400, area=2 * 79),
+        SteelLayer(position=800, area=2 * 79),
+        SteelLayer(position=1250, area=2 * 79),
+        SteelLayer(position=1700, area=2 * 79),
+        SteelLayer(position=2100, area=2 * 79),
+        SteelLayer(position=2460, area=4 * 201),
+    ]
+
+
+class TestPhi:
+    """φ escalar y vectorizado salen de la misma regla (§21.2.2)."""
+
+    EPS = np.array([-0.01, 0.0, EPSILON_TY, 0.0025, EPSILON_T_LIMIT, 0.02])
+
+    @pytest.mark.parametrize('is_spiral', [False, True])
+    @pytest.mark.parametrize('is_unconfined', [False, True])
+    def test_scalar_and_array_agree(self, is_spiral, is_unconfined):
+        phi = calculate_phi_flexure_array(self.EPS, is_spiral, is_unconfined)
+        assert phi.tolist() == [
+            calculate_phi_flexure(e, is_spiral, is_unconfined) for e in self.EPS
+        ]
+
+    def test_diagram_phi_array_agrees_with_scalar(self):
+        for is_unconfined in (False, True):
+            phi = calculate_phi_array(self.EPS, is_unconfined)
+            assert phi.tolist() == [
+                calculate_phi_flexure(e, is_unconfined=is_unconfined) for e in self.EPS
+            ]
+
+    def test_transition_is_linear(self):
+        mid = (EPSILON_TY + EPSILON_T_LIMIT) / 2
+        assert calculate_phi_flexure(mid) == pytest.approx((0.65 + 0.90) / 2)
+        assert calculate_phi_flexure(mid, is_spiral=True) == pytest.approx((0.75 + 0.90) / 2)
+
+
+class TestVectorizedEngine:
+    """El motor vectorizado reproduce el cálculo capa por capa."""
+
+    def test_intermediate_points_match_scalar(self, service, wall_layers):
+        h, b, fc, fy = 2500, 200, 30, 420
+        points = service.generate_interaction_curve(h, b, fc, fy, 0, steel_layers=wall_layers)
+        P0_max = points[0].Pn * N_TO_TONF
+
+        for p in points:
+            if math.isinf(p.c) or p.c == 0:
+                continue
+            Pn, Mn, eps = scalar_point(p.c, h, b, fc, fy, wall_layers)
+            assert p.Pn == pytest.approx(min(Pn, P0_max) / N_TO_TONF, rel=1e-12)
+            assert p.Mn == pytest.approx(Mn / NMM_TO_TONFM, rel=1e-12, abs=1e-12)
+            assert p.epsilon_t == pytest.approx(eps, rel=1e-12, abs=1e-15)
+            assert p.phi == pytest.approx(calculate_phi_flexure(eps), rel=1e-12)
+
+    def test_arrays_match_points(self, service, wall_layers):
+        curve = service.generate_interaction_arrays(2500, 200, 30, 420, 0, steel_layers=wall_layers)
+        points = service.generate_interaction_curve(2500, 200, 30, 420, 0, steel_layers=wall_layers)
+
+        assert curve.shape == (len(points), len(CURVE_COLUMNS))
+        assert curve.dtype == np.float64
+        for row, p in zip(curve, points):
+            assert InteractionPoint(*row.tolist()) == p
+
+    def test_sorted_by_phi_Pn_descending(self, service, wall_layers):
+        curve = service.generate_interaction_arrays(2500, 200, 30, 420, 0, steel_layers=wall_layers)
+        phi_Pn = curve[:, CURVE_COLUMNS.index('phi_Pn')]
+        assert np.all(np.diff(phi_Pn) <= 0)
+
+    def test_extreme_points(self, service, wall_layers):
+        points = service.generate_interaction_curve(2500, 200, 30, 420, 0, steel_layers=wall_layers)
+        As = sum(layer.area for layer in wall_layers)
+
+        assert math.isinf(points[0].c)
+        assert points[0].phi == 0.65
+        assert points[-1].Pn == pytest.approx(-As * 420 / N_TO_TONF)
+        assert math.isinf(points[-1].epsilon_t)
+
+    def test_unconfined_uses_constant_phi(self, service):
+        layers = [SteelLayer(position=60, area=113)]
+        points = service.generate_interaction_curve(120, 120, 25, 420, 113,
+                                                    steel_layers=layers, is_unconfined=True)
+        assert all(p.phi == 0.60 for p in points)
+
+    def test_default_two_layer_model(self, service):
+        points = service.generate_interaction_curve(1000, 200, 25, 420, As_total=1000, cover=50)
+        assert points[-1].Pn == pytest.approx(-1000 * 420 / N_TO_TONF)
+        assert len(points) > 10
@@ -0,0 +1 @@
+# tests/domain/proposals/__init__.py
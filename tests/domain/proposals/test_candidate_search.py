@@ -0,0 +1,157 @@
+# tests/domain/proposals/test_candidate_search.py
+"""
+Tests para el motor de búsqueda de propuestas (CandidateSearch).
+
+Con verificaciones monótonas en el acero y el espesor, la búsqueda podada
+y en paralelo debe encontrar el mismo candidato que el recorrido
+secuencial en orden, verificando menos configuraciones.
+"""
+import threading
+from dataclasses import replace
+
+import pytest
+
+from app.domain.chapter18.wall_piers import WallPierService
+from app.domain.constants.phi_chapter21 import RHO_MAX
+from app.domain.entities import VerticalElement, VerticalElementSource, MeshReinforcement
+from app.domain.entities.design_proposal import FailureMode
+from app.domain.proposals import DesignGenerator
+from app.domain.proposals.strategies import CandidateSearch
+from app.domain.proposals.strategies.base import TARGET_SF
+from app.domain.proposals.strategies.combined import (
+    _candidates_for_thickness, _get_max_config_for_thickness,
+)
+from app.domain.proposals.strategies.search import steel_volume
+
+
+class CountingVerifier:
+    """Verificaciones sintéticas monótonas que cuentan sus llamadas."""
+
+    def __init__(self, flexure_demand: float, shear_demand: float):
+        self.flexure_demand = flexure_demand
+        self.shear_demand = shear_demand
+        self.flexure_calls = 0
+        self.shear_calls = 0
+        self._lock = threading.Lock()
+
+    def flexure(self, pier, forces):
+        with self._lock:
+            self.flexure_calls += 1
+        capacity = (pier.As_edge_total + 0.3 * pier.As_vertical) * pier.thickness / 200
+        return capacity / self.flexure_demand
+
+    def shear(self, pier, forces):
+        with self._lock:
+            self.shear_calls += 1
+        capacity = (pier.rho_horizontal * 1000 + 0.2 * pier.n_shear_legs) * pier.thickness / 200
+        return self.shear_demand / capacity
+
+
+def _pier():
+    return VerticalElement(
+        label='M1', story='Piso 1', source=VerticalElementSource.PIER,
+        length=2000, thickness=200, height=2700, fc=25, fy=420,
+        mesh_reinforcement=MeshReinforcement(n_meshes=2, diameter_v=8, spacing_v=250,
+                                             diameter_h=8, spacing_h=250),
+    )
+
+
+def _search(verifier, max_workers=4):
+    generator = DesignGenerator(verifier.flexure, verifier.shear, WallPierService())
+    return CandidateSearch(_pier(), None, verifier.flexure, verifier.shear,
+                           generator._apply_config_to_pier, max_workers), generator
+
+
+def _sequential(search, candidates):
+    """Referencia: primer candidato que cumple recorriendo uno a uno."""
+    for config in candidates:
+        test_pier = search._apply_config(search.pier, config)
+        if test_pier.rho_vertical > RHO_MAX:
+            continue
+        sf = search._verify_flexure(test_pier, None)
+        dcr = search._verify_shear(test_pier, None)
+        if sf >= TARGET_SF and dcr <= 1.0:
+            return config
+    return None
+
+
+class TestCandidateSearch:
+    @pytest.mark.parametrize('flexure_demand, shear_demand, thickness', [
+        (2000, 3.0, 200), (6000, 5.0, 200), (9000, 8.0, 250), (60000, 3.0, 200),
+    ])
+    @pytest.mark.parametrize('max_workers', [1, 4])
+    def test_matches_sequential_search(self, flexure_demand, shear_demand, thickness, max_workers):
+        verifier = CountingVerifier(flexure_demand, shear_demand)
+        search, generator = _search(verifier, max_workers)
+        config = generator._pier_to_config(search.pier)
+        candidates = search.sort_by_steel(_candidates_for_thickness(config, thickness, 2))
+        bound = _get_max_config_for_thickness(config, thickness, 2)
+
+        outcome = search.first_passing(candidates, bounds=[bound])
+        pruned_calls = verifier.flexure_calls
+
+        expected = _sequential(search, candidates)
+        if expected is None:
+            assert outcome.solution is None
+        else:
+            assert outcome.solution.config == expected
+            assert outcome.solution.passes
+        assert pruned_calls < verifier.flexure_calls - pruned_calls
+
+    def test_shear_depends_on_vertical_steel(self):
+        # Verificación de corte que exige acero vertical (como ρv >= ρh en
+        # muros bajos, §18.10.4.3): más borde puede cumplir con la misma malla
+        class VerticalSteelVerifier(CountingVerifier):
+            def shear(self, pier, forces):
+                dcr = super().shear(pier, forces)
+                return dcr if pier.rho_vertical >= 2 * pier.rho_horizontal else max(dcr, 1.5)
+
+        verifier = VerticalSteelVerifier(500, 2.0)
+        search, generator = _search(verifier)
+        config = generator._pier_to_config(search.pier)
+        candidates = search.sort_by_steel(_candidates_for_thickness(config, 200, 2))
+
+        outcome = search.first_passing(candidates)
+
+        assert outcome.solution is not None
+        assert outcome.solution.config == _sequential(search, candidates)
+
+    def test_candidates_sorted_by_steel(self):
+        search, generator = _search(CountingVerifier(1, 1))
+        config = generator._pier_to_config(search.pier)
+        candidates = search.sort_by_steel(_candidates_for_thickness(config, 200, 3))
+        volumes = [steel_volume(c, 2000, 200) for c in candidates]
+        assert volumes == sorted(volumes)
+
+    def test_verifications_are_memoized(self):
+        verifier = CountingVerifier(2000, 0.5)
+        search, generator = _search(verifier)
+        config = generator._pier_to_config(search.pier)
+
+        first = search.evaluate(config)
+        assert search.evaluate(replace(config)) is first
+        assert (verifier.flexure_calls, verifier.shear_calls) == (1, 1)
+
+    def test_flexure_skipped_when_shear_fails(self):
+        verifier = CountingVerifier(2000, 100.0)
+        search, generator = _search(verifier)
+        config = generator._pier_to_config(search.pier)
+
+        result = search.evaluate_many([config])[0][0]
+        assert result.sf is None and result.dcr > 1.0 and not result.passes
+        assert verifier.flexure_calls == 0
+        assert search.evaluate(config).verified
+
+
+class TestDesignGenerator:
+    def test_combined_proposal_resolves(self):
+        verifier = CountingVerifier(6000, 5.0)
+        generator = DesignGenerator(verifier.flexure, verifier.shear, WallPierService(), max_workers=2)
+        pier = _pier()
+        sf, dcr = verifier.flexure(pier, None), verifier.shear(pier, None)
+
+        proposal = generator.generate_proposal(pier, None, sf, dcr)
+
+        assert proposal.failure_mode == FailureMode.COMBINED
+        assert proposal.success
+        assert proposal.proposed_sf_flexure >= TARGET_SF and proposal.proposed_dcr_shear <= 1.0
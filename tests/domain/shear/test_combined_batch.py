@@ -0,0 +1,115 @@
+# tests/domain/shear/test_combined_batch.py
+"""
+Tests para la verificación de corte combinado vectorizada.
+
+Cada combinación del lote debe coincidir exactamente con verify_combined_shear().
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.domain.chapter18.common import SeismicCategory
+from app.domain.entities import ElementForces, ElementForceType
+from app.domain.shear.verification import ShearVerificationService
+from app.services.analysis.shear_service import ShearService
+from tests.conftest import make_pier
+
+# (lw, tw, hw, fc, fy, rho_h): muros esbelto/rechoncho, columna, f'c > límite
+SECTIONS = [
+    (3000, 200, 2700, 25, 420, 0.0025),
+    (4000, 250, 3000, 30, 500, 0.0030),
+    (600, 400, 3000, 30, 420, 0.0050),
+    (2000, 200, 2700, 90, 420, 0.0025),
+]
+
+
+def _demands(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    Nu = rng.normal(0, 300, n)
+    Nu[:3] = [0.0, -0.0, -5000.0]  # sin carga, cero negativo, tracción extrema
+    return rng.normal(0, 60, n), rng.normal(0, 8, n), Nu
+
+
+class TestVerifyCombinedShearBatch:
+    @pytest.mark.parametrize('section', SECTIONS)
+    @pytest.mark.parametrize('category', [SeismicCategory.SPECIAL, SeismicCategory.ORDINARY])
+    def test_matches_scalar(self, section, category):
+        service = ShearVerificationService()
+        lw, tw, hw, fc, fy, rho_h = section
+        Vu2, Vu3, Nu = _demands()
+
+        batch = service.verify_combined_shear_batch(
+            lw, tw, hw, fc, fy, rho_h, Vu2, Vu3, Nu,
+            lambda_factor=0.85, seismic_category=category
+        )
+
+        for i in range(len(Nu)):
+            ref = service.verify_combined_shear(
+                lw, tw, hw, fc, fy, rho_h, abs(Vu2[i]), abs(Vu3[i]), Nu=Nu[i],
+                lambda_factor=0.85, seismic_category=category
+            )
+            assert batch.Vc_2[i] == ref.result_V2.Vc
+            assert batch.Vs_2[i] == ref.result_V2.Vs
+            assert batch.phi_Vn_2[i] == ref.result_V2.phi_Vn
+            assert batch.phi_Vn_3[i] == ref.result_V3.phi_Vn
+            assert batch.dcr_2[i] == ref.dcr_2
+            assert batch.dcr_3[i] == ref.dcr_3
+            assert batch.dcr_combined[i] == ref.dcr_combined
+        assert batch.phi_v == ref.phi_v
+
+    def test_critical_index_is_first_maximum(self):
+        service = ShearVerificationService()
+        batch = service.verify_combined_shear_batch(
+            3000, 200, 2700, 25, 420, 0.0025,
+            Vu2=[10.0, 40.0, 40.0, 5.0], Vu3=[0.0] * 4, Nu=[0.0] * 4
+        )
+        assert batch.critical_index == 1
+
+    def test_no_demand_has_no_critical(self):
+        service = ShearVerificationService()
+        batch = service.verify_combined_shear_batch(
+            3000, 200, 2700, 25, 420, 0.0025, Vu2=[0.0, 0.0], Vu3=[0.0, 0.0], Nu=[10.0, -10.0]
+        )
+        assert batch.critical_index is None
+
+
+class TestCheckShearBatched:
+    @pytest.fixture
+    def pier_and_forces(self):
+        pier = make_pier(story='S1', length=3000)
+        Vu2, Vu3, Nu = _demands(n=50, seed=1)
+        df = pd.DataFrame({
+            'name': [f'C{i}' for i in range(50)], 'location': 'Top', 'step_type': '',
+            'P': -Nu, 'V2': Vu2, 'V3': Vu3, 'T': 0.0, 'M2': 0.0, 'M3': 0.0,
+        })
+        forces = ElementForces(label='M1', story='S1', element_type=ElementForceType.PIER)
+        forces.set_combinations_from_df(df)
+        return pier, forces
+
+    def test_rows_match_scalar_verification(self, pier_and_forces):
+        pier, forces = pier_and_forces
+        result = ShearService().check_shear(pier, forces)
+        verification = ShearVerificationService()
+
+        rows = result['combo_results']
+        assert len(rows) == forces.n_combinations
+        for row, combo in zip(rows, forces.iter_combinations()):
+            ref = verification.verify_combined_shear(
+                pier.length, pier.thickness, pier.height, pier.fc, pier.fy,
+                pier.rho_horizontal, abs(combo.V2), abs(combo.V3), Nu=-combo.P,
+            )
+            assert row['combo_name'] == f"{combo.name} (Top)"
+            assert row['phi_Vn_2'] == round(ref.result_V2.phi_Vn, 2)
+            assert row['dcr_combined'] == round(ref.dcr_combined, 3)
+
+        worst = max(rows, key=lambda r: r['dcr_combined'])
+        assert result['dcr_combined'] == worst['dcr_combined']
+
+    def test_without_combo_results(self, pier_and_forces):
+        pier, forces = pier_and_forces
+        full = ShearService().check_shear(pier, forces)
+        summary = ShearService().check_shear(pier, forces, include_combo_results=False)
+
+        assert 'combo_results' not in summary
+        full.pop('combo_results')
+        assert summary == full
@@ -0,0 +1,112 @@
+# tests/services/analysis/test_analysis_backend.py
+"""
+Tests para los backends de ejecución del análisis paralelo.
+"""
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.analysis.analysis_backend import (
+    AnalysisBackend,
+    BACKEND_PROCESS,
+    BACKEND_THREAD,
+    DEFAULT_MAX_WORKERS,
+    MAX_CHUNK_SIZE,
+    chunk_tasks,
+    resolve_backend,
+    resolve_workers,
+)
+from app.domain.entities import ElementForces
+from app.domain.entities.element_forces import ElementForceType, COMBO_COLUMNS
+from app.domain.flexure import InteractionDiagramService
+from app.domain.flexure.interaction_diagram import points_to_array, array_to_points
+
+
+def _double(task):
+    return {'key': task['key'], 'value': task['value'] * 2}
+
+
+def _double_chunk(tasks):
+    return [_double(t) for t in tasks]
+
+
+class TestResolveBackend:
+    def test_default_is_thread(self, monkeypatch):
+        monkeypatch.delenv('INGEO_ANALYSIS_BACKEND', raising=False)
+        assert resolve_backend() == BACKEND_THREAD
+
+    def test_env_var(self, monkeypatch):
+        monkeypatch.setenv('INGEO_ANALYSIS_BACKEND', 'Process')
+        assert resolve_backend() == BACKEND_PROCESS
+
+    def test_explicit_overrides_env(self, monkeypatch):
+        monkeypatch.setenv('INGEO_ANALYSIS_BACKEND', 'process')
+        assert resolve_backend('thread') == BACKEND_THREAD
+
+    def test_unknown_falls_back_to_thread(self):
+        assert resolve_backend('gpu') == BACKEND_THREAD
+
+
+class TestResolveWorkers:
+    def test_default_is_capped_by_cpus(self, monkeypatch):
+        monkeypatch.delenv('INGEO_PARSE_WORKERS', raising=False)
+        monkeypatch.setattr('os.cpu_count', lambda: 2)
+        assert resolve_workers(env_var='INGEO_PARSE_WORKERS') == min(DEFAULT_MAX_WORKERS, 2)
+
+    def test_env_var(self, monkeypatch):
+        monkeypatch.setenv('INGEO_PARSE_WORKERS', '7')
+        assert resolve_workers(env_var='INGEO_PARSE_WORKERS') == 7
+
+    def test_explicit_overrides_env_and_is_at_least_one(self, monkeypatch):
+        monkeypatch.setenv('INGEO_PARSE_WORKERS', '7')
+        assert resolve_workers(3, 'INGEO_PARSE_WORKERS') == 3
+        assert resolve_workers(0) == 1
+
+    def test_explicit_default_is_not_capped(self, monkeypatch):
+        monkeypatch.delenv('INGEO_PARSE_WORKERS', raising=False)
+        monkeypatch.setattr('os.cpu_count', lambda: 1)
+        assert resolve_workers(env_var='INGEO_PARSE_WORKERS', default=4) == 4
+
+
+class TestChunkTasks:
+    def test_preserves_all_tasks_in_order(self):
+        tasks = list(range(1000))
+        chunks = chunk_tasks(tasks, n_workers=4)
+        assert [t for chunk in chunks for t in chunk] == tasks
+        assert max(len(c) for c in chunks) <= MAX_CHUNK_SIZE
+
+    def test_empty(self):
+        assert chunk_tasks([], n_workers=4) == []
+
+
+class TestBackendRun:
+    @pytest.mark.parametrize('name', [BACKEND_THREAD, BACKEND_PROCESS])
+    def test_returns_every_result(self, name):
+        backend = AnalysisBackend(name, max_workers=2)
+        tasks = [{'key': i, 'value': i} for i in range(50)]
+        try:
+            results = [r for batch in backend.run(tasks, _double, _double_chunk) for r in batch]
+        finally:
+            backend.shutdown()
+        assert sorted(r['value'] for r in results) == [2 * i for i in range(50)]
+
+
+class TestCompactPayloads:
+    def test_curve_roundtrip(self):
+        points = InteractionDiagramService().generate_interaction_curve(2000, 200, 30, 420, 2000)
+        curve = points_to_array(points)
+        assert curve.shape == (len(points), 7)
+        assert array_to_points(pickle.loads(pickle.dumps(curve))) == points
+
+    def test_element_forces_pickle_drops_object_cache(self):
+        df = pd.DataFrame([['C1', 'Top', '', -10.0, 1.0, 2.0, 0.0, 3.0, 4.0]], columns=COMBO_COLUMNS)
+        forces = ElementForces(label='P1', story='S1', element_type=ElementForceType.PIER)
+        forces.set_combinations_from_df(df)
+        assert len(forces.combinations) == 1  # poblar cache de objetos
+
+        restored = pickle.loads(pickle.dumps(forces))
+        assert restored._combinations_list is None
+        assert restored.combinations[0].M3 == 4.0
+        assert np.array_equal(restored.combinations_df['P'].values, df['P'].values)
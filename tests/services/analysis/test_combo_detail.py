@@ -0,0 +1,128 @@
+# tests/services/analysis/test_combo_detail.py
+"""
+Tests para el detalle por combinación bajo demanda.
+
+Las filas armadas desde la tabla compacta deben coincidir exactamente con
+las que FlexocompressionService y ShearService arman en forma directa,
+también después de un desalojo a disco (tabla guardada como JSON).
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.domain.entities import ElementForces, ElementForceType
+from app.domain.flexure import FlexureChecker
+from app.services.analysis import FlexocompressionService, ShearService
+from app.services.analysis.combo_detail import (
+    combo_results, flexure_combo_rows, shear_combo_rows, with_combo_results,
+)
+from app.services.parsing.session_store import _json_default
+from tests.conftest import make_pier
+
+
+@pytest.fixture
+def pier_and_forces():
+    pier = make_pier(story='S1', length=3000)
+    rng = np.random.default_rng(3)
+    n = 40
+    P = rng.normal(-100, 150, n)
+    P[0] = 0.0  # sin carga axial
+    df = pd.DataFrame({
+        'name': [f'C{i % 7}' for i in range(n)],
+        'location': np.where(np.arange(n) % 2, 'Top', 'Bottom'),
+        'step_type': '',
+        'P': P, 'V2': rng.normal(0, 40, n), 'V3': rng.normal(0, 5, n),
+        'T': 0.0, 'M2': rng.normal(0, 10, n), 'M3': rng.normal(0, 300, n),
+    })
+    df.loc[1, ['P', 'V2', 'V3', 'M2', 'M3']] = 0.0  # sin demanda
+    forces = ElementForces(label='M1', story='S1', element_type=ElementForceType.PIER)
+    forces.set_combinations_from_df(df)
+    return pier, forces
+
+
+def _json_roundtrip(table):
+    return json.loads(json.dumps(table, default=_json_default))
+
+
+class TestFlexureRows:
+    def test_lazy_rows_match_eager(self, pier_and_forces):
+        pier, forces = pier_and_forces
+        service = FlexocompressionService()
+        eager = service.check_flexure(pier, forces)
+        lazy = service.check_flexure(pier, forces, include_combo_results=False,
+                                     include_combo_table=True)
+
+        assert flexure_combo_rows(lazy['combo_table']) == eager['combo_results']
+        assert flexure_combo_rows(_json_roundtrip(lazy['combo_table'])) == eager['combo_results']
+
+    def test_rows_match_checker_combo_results(self, pier_and_forces):
+        pier, forces = pier_and_forces
+        service = FlexocompressionService()
+        curve, _ = service.generate_interaction_curve(pier)
+        reference = FlexureChecker.check_flexure(curve, forces.get_critical_pm_points())
+        lazy = service.check_flexure(pier, forces, interaction_points=curve,
+                                     include_combo_results=False, include_combo_table=True)
+
+        rows = flexure_combo_rows(lazy['combo_table'])
+        assert len(rows) == len(reference.combo_results)
+        for row, ref in zip(rows, reference.combo_results):
+            assert row['name'] == ref.combo_name
+            assert row['location'] == ref.combo_location
+            assert row['Pu'] == round(ref.Pu, 2)
+            assert row['Mu'] == round(ref.Mu, 2)
+            assert row['phi_Mn_at_Pu'] == round(ref.phi_Mn_at_Pu, 2)
+            assert row['is_tension'] == ref.is_tension
+        assert lazy['critical_combo'] == reference.critical_combo
+
+    def test_lean_result_has_same_governing_values(self, pier_and_forces):
+        pier, forces = pier_and_forces
+        service = FlexocompressionService()
+        eager = service.check_flexure(pier, forces)
+        lean = service.check_flexure(pier, forces, include_combo_results=False)
+
+        for key in ('combo_results', 'design_curve', 'demand_points'):
+            eager.pop(key)
+        assert lean == eager
+
+
+class TestShearRows:
+    def test_lazy_rows_match_eager(self, pier_and_forces):
+        pier, forces = pier_and_forces
+        service = ShearService()
+        eager = service.check_shear(pier, forces)
+        lazy = service.check_shear(pier, forces, include_combo_results=False,
+                                   include_combo_table=True)
+
+        assert shear_combo_rows(lazy['combo_table']) == eager['combo_results']
+        assert shear_combo_rows(_json_roundtrip(lazy['combo_table'])) == eager['combo_results']
+
+
+class TestMaterialization:
+    @pytest.fixture
+    def cached(self, pier_and_forces):
+        pier, forces = pier_and_forces
+        options = dict(include_combo_results=False, include_combo_table=True)
+        return {
+            'key': 'S1_M1',
+            'flexure': FlexocompressionService().check_flexure(pier, forces, **options),
+            'shear': ShearService().check_shear(pier, forces, **options),
+        }
+
+    def test_rows_are_memoized(self, cached):
+        rows = combo_results(cached, 'flexure')
+        assert len(rows) == 40
+        assert combo_results(cached, 'flexure') is rows
+        assert 'combo_results' not in cached['shear']
+
+    def test_with_combo_results_is_json_ready(self, cached):
+        detail = with_combo_results(cached)
+        json.dumps(detail)
+        assert 'combo_table' not in detail['flexure']
+        assert 'combo_table' in cached['flexure']
+        assert detail['shear']['combo_results'] is cached['shear']['combo_results']
+
+    def test_section_without_detail(self):
+        assert combo_results({'flexure': {'dcr': 0.5}}, 'flexure') == []
+        assert combo_results({}, 'shear') == []
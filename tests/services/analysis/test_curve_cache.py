@@ -0,0 +1,154 @@
+# tests/services/analysis/test_curve_cache.py
+"""
+Tests para el cache de curvas P-M direccionado por contenido.
+"""
+import numpy as np
+import pytest
+
+from app.domain.entities.composite_section import CompositeSection, WallSegment
+from app.domain.flexure import InteractionCurve, InteractionDiagramService, SteelLayer
+from app.services.analysis.curve_cache import InteractionCurveCache, section_fingerprint
+from app.services.analysis.flexocompression_service import FlexocompressionService
+from tests.conftest import make_mesh, make_pier
+
+
+def _section(width=2000, **overrides):
+    section = dict(
+        width=width, thickness=200, fc=30, fy=420, As_total=2 * 804, cover=40,
+        steel_layers=[SteelLayer(position=40, area=804), SteelLayer(position=width - 40, area=804)],
+    )
+    section.update(overrides)
+    return section
+
+
+def _pier(story):
+    """Mismo muro en distintos pisos (sección repetida)."""
+    return make_pier("M1-A", story, mesh_reinforcement=make_mesh(n_edge_bars=4, diameter_edge=16))
+
+
+def _l_pier(story, thickness=200):
+    """Pier L (sección compuesta) en un piso."""
+    pier = _pier(story)
+    pier.composite_section = CompositeSection(segments=[
+        WallSegment(x1=0, y1=0, x2=2000, y2=0, thickness=thickness),
+        WallSegment(x1=2000, y1=0, x2=2000, y2=800, thickness=thickness),
+    ])
+    return pier
+
+
+def _curve(width=2000):
+    return InteractionDiagramService().generate_interaction_curve(**_section(width))
+
+
+class TestSectionFingerprint:
+    def test_same_inputs_same_key(self):
+        assert section_fingerprint(**_section()) == section_fingerprint(**_section())
+
+    @pytest.mark.parametrize('override', [
+        {'fc': 35},
+        {'cover': 50},
+        {'steel_layers': [SteelLayer(position=40, area=804), SteelLayer(position=1950, area=804)]},
+        {'steel_layers': None},
+        {'is_unconfined': True},
+    ])
+    def test_any_input_changes_key(self, override):
+        assert section_fingerprint(**_section()) != section_fingerprint(**_section(**override))
+
+
+class TestInteractionCurveCache:
+    def test_hit_returns_equal_curve(self):
+        cache = InteractionCurveCache(max_entries=10)
+        points = _curve()
+        cache.put('a', points)
+
+        assert cache.get('a') == points
+        assert cache.get('b') is None
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+
+    def test_hits_share_the_cached_array(self):
+        cache = InteractionCurveCache(max_entries=10)
+        cache.put('a', _curve())
+        first, second = cache.get('a'), cache.get('a')
+
+        assert isinstance(first, InteractionCurve)
+        assert np.shares_memory(first.array, second.array)
+        assert not first.array.flags.writeable
+
+    def test_lru_eviction_by_entries(self):
+        cache = InteractionCurveCache(max_entries=2)
+        cache.put('a', _curve(1000))
+        cache.put('b', _curve(1500))
+        cache.get('a')                 # 'b' pasa a ser el menos usado
+        cache.put('c', _curve(2000))
+
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('c') is not None
+        assert cache.stats()['evictions'] == 1
+
+    def test_memory_cap(self):
+        points = _curve()
+        one_curve = len(points) * 7 * 8
+        cache = InteractionCurveCache(max_entries=100, max_bytes=2 * one_curve)
+        for i in range(5):
+            cache.put(str(i), points)
+
+        assert len(cache) == 2
+        assert cache.stats()['bytes'] <= 2 * one_curve
+
+    def test_get_or_create_calls_factory_once(self):
+        cache = InteractionCurveCache(max_entries=10)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return _curve()
+
+        first = cache.get_or_create('k', factory)
+        second = cache.get_or_create('k', factory)
+        assert first == second
+        assert len(calls) == 1
+
+
+class TestFlexocompressionServiceCache:
+    def test_repeated_section_is_shared(self):
+        cache = InteractionCurveCache(max_entries=100)
+        service = FlexocompressionService(curve_cache=cache)
+
+        curve_lower, _ = service.generate_interaction_curve(_pier('Piso 1'), direction='primary')
+        curve_upper, _ = service.generate_interaction_curve(_pier('Piso 2'), direction='primary')
+
+        assert curve_lower == curve_upper
+        assert cache.stats()['misses'] == 1
+        assert cache.stats()['hits'] == 1
+
+    def test_use_cache_false_bypasses(self):
+        cache = InteractionCurveCache(max_entries=100)
+        service = FlexocompressionService(curve_cache=cache)
+        service.generate_interaction_curve(_pier('Piso 1'), use_cache=False)
+        assert cache.stats()['entries'] == 0
+
+    def test_biaxial_surface_is_shared(self):
+        cache = InteractionCurveCache(max_entries=100)
+        service = FlexocompressionService(curve_cache=cache)
+
+        lower = service.biaxial_surface(_pier('Piso 1'))
+        upper = service.biaxial_surface(_pier('Piso 2'))
+
+        assert upper is lower
+        assert cache.stats()['misses'] == 1 and cache.stats()['hits'] == 1
+        assert cache.stats()['bytes'] >= lower.nbytes
+
+    def test_composite_sections_are_keyed_by_fibers(self):
+        service = FlexocompressionService(curve_cache=InteractionCurveCache())
+        rectangle = service.interaction_section(_pier('Piso 1'))
+        lower = service.interaction_section(_l_pier('Piso 1'))
+        upper = service.interaction_section(_l_pier('Piso 2'))
+
+        assert 'fibers' in lower and 'steel_layers' not in lower
+        assert section_fingerprint(**lower) == section_fingerprint(**upper)
+        assert section_fingerprint(**lower) != section_fingerprint(**rectangle)
+        thicker = service.interaction_section(_l_pier('Piso 1', thickness=250))
+        secondary = service.interaction_section(_l_pier('Piso 1'), 'secondary')
+        assert section_fingerprint(**lower) != section_fingerprint(**thicker)
+        assert section_fingerprint(**lower) != section_fingerprint(**secondary)
@@ -0,0 +1,122 @@
+# tests/services/analysis/test_curve_generation.py
+"""
+Tests para la pre-generación paralela de curvas P-M.
+"""
+import numpy as np
+import pytest
+
+from app.domain.entities.composite_section import CompositeSection, WallSegment
+from app.domain.flexure.interaction_diagram import points_to_array
+from app.services.analysis.analysis_backend import AnalysisBackend, BACKEND_PROCESS, BACKEND_THREAD
+from app.services.analysis.curve_cache import InteractionCurveCache
+from app.services.analysis.curve_generation import CurveBuffer, CurveError, CurveGeneration
+from app.services.analysis.flexocompression_service import FlexocompressionService
+from tests.conftest import make_pier
+
+
+def _pier(story, length=2000):
+    return make_pier(story=story, length=length)
+
+
+def _l_pier(story):
+    pier = _pier(story, length=1200)
+    pier.composite_section = CompositeSection(segments=[
+        WallSegment(x1=0, y1=0, x2=1200, y2=0, thickness=200),
+        WallSegment(x1=1200, y1=0, x2=1200, y2=800, thickness=200),
+    ])
+    return pier
+
+
+def _jobs():
+    """Tres pisos: los dos primeros con la misma sección."""
+    piers = {'S1_M1': _pier('S1'), 'S2_M1': _pier('S2'), 'S3_M1': _pier('S3', length=3000)}
+    return [(key, d, pier) for key, pier in piers.items() for d in ('primary', 'secondary')]
+
+
+def _run(backend_name, jobs, cache=None, section_fn=FlexocompressionService.interaction_section):
+    backend = AnalysisBackend(backend_name, max_workers=2)
+    generation = CurveGeneration(backend, cache if cache is not None else InteractionCurveCache())
+    try:
+        progress = list(generation.run(jobs, section_fn))
+    finally:
+        backend.shutdown()
+    return generation, progress
+
+
+class TestCurveBuffer:
+    @pytest.mark.parametrize('shared', [False, True])
+    def test_write_read(self, shared):
+        buffer = CurveBuffer(3, 5, shared=shared)
+        try:
+            curve = np.arange(21, dtype=float).reshape(3, 7)
+            buffer.write(1, curve)
+            assert buffer.read(0) is None
+            assert np.array_equal(buffer.read(1), curve)
+            with pytest.raises(ValueError):
+                buffer.write(2, np.zeros((6, 7)))
+        finally:
+            buffer.close(unlink=True)
+
+    def test_attach_sees_writes(self):
+        buffer = CurveBuffer(2, 4, shared=True)
+        try:
+            worker = CurveBuffer.attach(buffer.spec)
+            worker.write(0, np.ones((2, 7)))
+            worker.close()
+            assert np.array_equal(buffer.read(0), np.ones((2, 7)))
+        finally:
+            buffer.close(unlink=True)
+
+
+class TestCurveGeneration:
+    @pytest.mark.parametrize('name', [BACKEND_THREAD, BACKEND_PROCESS])
+    def test_matches_service_curves(self, name):
+        jobs = _jobs()
+        generation, progress = _run(name, jobs)
+
+        # 2 secciones únicas por dirección (S1 y S2 comparten)
+        assert progress[0] == (0, 4) and progress[-1] == (4, 4)
+        assert generation.errors == []
+        service = FlexocompressionService(curve_cache=InteractionCurveCache())
+        for key, direction, pier in jobs:
+            expected, _ = service.generate_interaction_curve(pier, direction=direction, use_cache=False)
+            assert generation.points(key, direction) == expected
+            assert np.array_equal(generation.packed(key, direction), points_to_array(expected))
+        assert generation.points('S1_M1') is generation.points('S2_M1')
+
+    def test_cached_sections_are_not_generated(self):
+        cache = InteractionCurveCache()
+        _run(BACKEND_THREAD, _jobs(), cache=cache)
+        generation, progress = _run(BACKEND_THREAD, _jobs(), cache=cache)
+        assert progress == [(0, 0)]
+        assert generation.points('S3_M1', 'secondary') is not None
+
+    @pytest.mark.parametrize('name', [BACKEND_THREAD, BACKEND_PROCESS])
+    def test_failures_are_reported_per_element(self, name):
+        bad = _pier('S4', length=2500)
+
+        def section_fn(element, direction):
+            section = FlexocompressionService.interaction_section(element, direction)
+            if element is bad:
+                section['n_points'] = 200  # curva más larga que el buffer: falla en el worker
+            return section
+
+        jobs = _jobs() + [('S4_M1', 'primary', bad), ('S5_M1', 'primary', None)]
+        generation, _ = _run(name, jobs, section_fn=section_fn)
+
+        failed = {(e.key, e.direction) for e in generation.errors}
+        assert failed == {('S4_M1', 'primary'), ('S5_M1', 'primary')}
+        assert all(isinstance(e, CurveError) and e.error for e in generation.errors)
+        assert generation.points('S4_M1') is None and generation.packed('S5_M1') is None
+        assert generation.points('S1_M1') is not None
+
+    @pytest.mark.parametrize('name', [BACKEND_THREAD, BACKEND_PROCESS])
+    def test_composite_sections_use_fibers(self, name):
+        jobs = [(f'S{i}_PL1', d, _l_pier(f'S{i}')) for i in (1, 2) for d in ('primary', 'secondary')]
+        generation, progress = _run(name, jobs)
+
+        assert progress[-1] == (2, 2) and generation.errors == []
+        service = FlexocompressionService(curve_cache=InteractionCurveCache())
+        for key, direction, pier in jobs:
+            expected, _ = service.generate_interaction_curve(pier, direction=direction, use_cache=False)
+            assert generation.points(key, direction) == expected
@@ -0,0 +1,143 @@
+# tests/services/analysis/test_input_fingerprint.py
+"""
+Tests para la huella de entradas del análisis incremental.
+"""
+import numpy as np
+import pytest
+
+from app.domain.chapter18 import SeismicCategory
+from app.domain.entities import ElementForces, ElementForceType, LoadCombination, ParsedData
+from app.services.analysis import input_fingerprint
+from app.services.analysis.input_fingerprint import code_version, task_fingerprint
+from app.services.parsing.session_manager import SessionManager
+from tests.conftest import make_pier
+
+
+def _task(P=-10.0, **overrides):
+    pier = make_pier()
+    forces = ElementForces(label='M1', story='Piso 1', element_type=ElementForceType.PIER)
+    forces.combinations = [LoadCombination(name='C1', location='Top', step_type='',
+                                           P=P, V2=1.0, V3=2.0, T=0.0, M2=3.0, M3=4.0)]
+    task = {
+        'type': 'pier',
+        'key': 'Piso 1_M1',
+        'element': pier,
+        'forces': forces,
+        'materials_config': {'H25': {'fc': 25, 'type': 'normal', 'lambda': 1.0}},
+        'continuity_info': None,
+        'hn_ft': 60.0,
+        'seismic_category': SeismicCategory.SPECIAL,
+        'coupling_config': None,
+        'label': 'Pier: Piso 1 - M1',
+    }
+    task.update(overrides)
+    return task
+
+
+class TestTaskFingerprint:
+    def test_identical_tasks_same_fingerprint(self):
+        assert task_fingerprint(_task()) == task_fingerprint(_task())
+
+    def test_ignores_curve_and_label(self):
+        task = _task(interaction_curve=[1, 2, 3], label='otro')
+        assert task_fingerprint(task) == task_fingerprint(_task())
+
+    def test_reinforcement_change(self):
+        task = _task()
+        task['element'].update_reinforcement(spacing_v=150)
+        assert task_fingerprint(task) != task_fingerprint(_task())
+
+    def test_geometry_change(self):
+        task = _task()
+        task['element'].thickness = 250
+        assert task_fingerprint(task) != task_fingerprint(_task())
+
+    def test_forces_change(self):
+        assert task_fingerprint(_task(P=-10.5)) != task_fingerprint(_task())
+
+    def test_numpy_scalars_match_python_floats(self):
+        """Un proyecto reabierto trae floats donde el parser dejó np.float64."""
+        task, expected = _task(), _task()
+        task['element'].height = np.float64(2700.0)
+        expected['element'].height = 2700.0
+        assert task_fingerprint(task) == task_fingerprint(expected)
+
+    @pytest.mark.parametrize('override', [
+        {'materials_config': {'H25': {'fc': 25, 'type': 'lightweight', 'lambda': 0.75}}},
+        {'seismic_category': SeismicCategory.INTERMEDIATE},
+        {'hn_ft': 80.0},
+        {'coupling_config': {'beam_left': 'VI20/50'}},
+    ])
+    def test_context_change(self, override):
+        assert task_fingerprint(_task(**override)) != task_fingerprint(_task())
+
+
+class TestCodeVersion:
+    @pytest.fixture(autouse=True)
+    def fresh_version(self):
+        code_version.cache_clear()
+        yield
+        code_version.cache_clear()
+
+    def test_release_changes_version(self, monkeypatch):
+        base = code_version()
+        code_version.cache_clear()
+        monkeypatch.setenv('INGEO_RELEASE', '2.0')
+        assert code_version() != base
+
+    def test_compiled_only_deploy_hashes_bytecode(self, tmp_path, monkeypatch):
+        module = tmp_path / 'domain' / 'calc.pyc'
+        module.parent.mkdir()
+        module.write_bytes(b'v1')
+        (tmp_path / 'services').mkdir()
+        monkeypatch.setattr(input_fingerprint, '_APP_DIR', tmp_path)
+        first = code_version()
+
+        code_version.cache_clear()
+        module.write_bytes(b'v2')
+        assert code_version() != first
+
+    def test_frozen_deploy_falls_back_to_release(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(input_fingerprint, '_APP_DIR', tmp_path)
+        monkeypatch.setenv('INGEO_RELEASE', '1.0')
+        first = code_version()
+
+        code_version.cache_clear()
+        monkeypatch.setenv('INGEO_RELEASE', '1.1')
+        assert code_version() != first
+
+
+class TestSessionManagerFingerprints:
+    @pytest.fixture
+    def manager(self):
+        manager = SessionManager()
+        manager.register_session('s1', ParsedData())
+        return manager
+
+    def test_result_valid_only_for_same_fingerprint(self, manager):
+        manager.store_analysis_result('s1', 'A', {'sf': 1.2}, fingerprint='abc')
+        assert manager.get_valid_analysis_result('s1', 'A', 'abc') == {'sf': 1.2}
+        assert manager.get_valid_analysis_result('s1', 'A', 'xyz') is None
+
+    def test_store_without_fingerprint_is_never_valid(self, manager):
+        manager.store_analysis_result('s1', 'A', {'sf': 1.2}, fingerprint='abc')
+        manager.store_analysis_result('s1', 'A', {'sf': 0.8})
+        assert manager.get_valid_analysis_result('s1', 'A', 'abc') is None
+
+    def test_retain_drops_removed_elements(self, manager):
+        manager.store_analysis_result('s1', 'A', {'sf': 1.2}, fingerprint='a')
+        manager.store_analysis_result('s1', 'B', {'sf': 0.8}, fingerprint='b')
+        manager.store_interaction_curve('s1', 'B', 'primary', [])
+
+        manager.retain_analysis_results('s1', ['A'])
+
+        parsed_data = manager.get_session('s1')
+        assert set(parsed_data.analysis_cache) == {'A'}
+        assert set(parsed_data.analysis_fingerprints) == {'A'}
+        assert 'B' not in parsed_data.interaction_curves
+
+    def test_invalidate_element(self, manager):
+        manager.store_analysis_result('s1', 'A', {'sf': 1.2}, fingerprint='a')
+        manager.invalidate_element('s1', 'A')
+        assert manager.get_analysis_result('s1', 'A') is None
+        assert manager.get_valid_analysis_result('s1', 'A', 'a') is None
@@ -0,0 +1 @@
+# tests/services/logging/__init__.py
@@ -0,0 +1,57 @@
+# tests/services/logging/test_claude_state_logger.py
+"""
+Tests para el log de estado asíncrono: eventos en lote, escrituras acotadas
+y apagado.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.logging import claude_logger
+
+
+@pytest.fixture
+def logger(tmp_path, monkeypatch):
+    claude_logger.flush()
+    monkeypatch.setattr(claude_logger, 'enabled', True)
+    monkeypatch.setattr(claude_logger, 'log_path', tmp_path / 'state.log')
+    monkeypatch.setattr(claude_logger, 'flush_interval', 60.0)
+    writes = []
+    original = claude_logger._write
+    monkeypatch.setattr(claude_logger, '_write', lambda: (writes.append(1), original()))
+    claude_logger.set_session('s1')
+    assert claude_logger.flush()
+    writes.clear()
+    yield claude_logger, writes
+    claude_logger.flush()
+
+
+class TestClaudeStateLogger:
+    def test_concurrent_results_are_batched(self, logger):
+        log, writes = logger
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: log.log_element_result(f'M{i}', 'Piso 1', dcr=0.5), range(500)))
+
+        assert log.flush()
+        content = log.log_path.read_text(encoding='utf-8')
+        assert 'Elements Analyzed: 500' in content
+        assert 'Session: s1' in content
+        assert len(writes) <= 2  # Intervalo largo: solo el flush (y quizás uno urgente)
+
+    def test_phase_boundary_writes_without_flush(self, logger):
+        log, writes = logger
+        log.log_table_found('pier_forces', 10)
+        log.set_session('s2')
+
+        deadline = time.monotonic() + 5.0
+        while not writes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert 'Session: s2' in log.log_path.read_text(encoding='utf-8')
+
+    def test_disabled_drops_events(self, logger, monkeypatch):
+        log, writes = logger
+        monkeypatch.setattr(log, 'enabled', False)
+        log.log_element_result('M1', 'Piso 1', dcr=0.5)
+        assert log.flush()
+        assert writes == []
@@ -0,0 +1 @@
+# tests/services/parsing/__init__.py
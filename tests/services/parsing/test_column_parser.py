@@ -0,0 +1,49 @@
+# tests/services/parsing/test_column_parser.py
+"""
+Tests para el parser de columnas (Element Forces - Columns).
+"""
+import pandas as pd
+import pytest
+
+from app.services.parsing.column_parser import ColumnParser
+
+SECTIONS = pd.DataFrame({
+    'Name': [None, 'C40x40'], 'Material': [None, '4000Psi'],
+    'Design Type': [None, 'Column'], 'Depth': ['m', 0.4], 'Width': ['m', 0.4],
+})
+
+ASSIGNS = pd.DataFrame({
+    'Story': ['Piso 1', 'Piso 2', 'Piso 1'], 'Label': ['C1', 'C1', 'C2'],
+    'Section Property': ['C40x40'] * 3,
+})
+
+
+def _forces(location=None):
+    rows = []
+    for story, column, top in (('Piso 1', 'C1', 3.0), ('Piso 2', 'C1', 2.7), ('Piso 1', 'C2', 3.0)):
+        for case in ('DL', 'EQ'):
+            for station in (0.0, top / 2, top):
+                rows.append([story, column, case, 'Max', station, location, -10.0, 1.0, 0.5, 0.0, 2.0, 8.0])
+    return pd.DataFrame(rows, columns=['Story', 'Column', 'Output Case', 'Step Type', 'Station',
+                                       'Location', 'P', 'V2', 'V3', 'T', 'M2', 'M3'])
+
+
+class TestColumnForces:
+    def test_location_from_station_when_blank(self):
+        columns, forces, stories = ColumnParser().parse_columns(SECTIONS, ASSIGNS, _forces(), {})
+
+        assert stories == ['Piso 1', 'Piso 2']
+        assert list(forces) == ['Piso 1_C1', 'Piso 1_C2', 'Piso 2_C1']
+        assert forces['Piso 2_C1'].labels('location').tolist() == ['Bottom', 'Middle', 'Top'] * 2
+        assert columns['Piso 2_C1'].height == pytest.approx(2700)
+        assert forces['Piso 2_C1'].height == pytest.approx(2700)
+
+    def test_explicit_location_is_kept(self):
+        _, forces, _ = ColumnParser().parse_columns(SECTIONS, ASSIGNS, _forces('Top'), {})
+        assert set(forces['Piso 1_C2'].labels('location')) == {'Top'}
+
+    def test_column_without_section_is_skipped(self):
+        sections = SECTIONS.assign(Name=[None, 'OTRA'])
+        columns, forces, _ = ColumnParser().parse_columns(sections, ASSIGNS, _forces(), {})
+        assert columns == {}
+        assert len(forces) == 3
@@ -0,0 +1,149 @@
+# tests/services/parsing/test_parse_pipeline.py
+"""
+Tests para el pipeline de parseo por etapas (ParsePipeline) y su uso en
+EtabsExcelParser.parse_from_tables().
+"""
+import threading
+from functools import partial
+from io import BytesIO
+
+import pytest
+from openpyxl import Workbook
+
+from app.services.parsing import EtabsExcelParser
+from app.services.parsing.parse_pipeline import ParsePipeline
+from app.services.parsing.table_extractor import extract_tables_fast
+
+
+def _add(offset, *values):
+    return offset + sum(values)
+
+
+class TestParsePipeline:
+    def test_dependencies_receive_results_in_declared_order(self):
+        pipeline = ParsePipeline(backend='thread')
+        pipeline.add('a', partial(_add, 1))
+        pipeline.add('b', partial(_add, 10), depends_on=('a',))
+        pipeline.add('c', lambda b, a: (b, a), depends_on=('b', 'a'))
+
+        results = pipeline.run()
+
+        assert results == {'a': 1, 'b': 11, 'c': (11, 1)}
+        assert [t.name for t in pipeline.timings][-1] == 'c'
+
+    def test_independent_stages_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        pipeline = ParsePipeline(backend='thread')
+        pipeline.add('left', barrier.wait)
+        pipeline.add('right', barrier.wait)
+
+        assert set(pipeline.run()) == {'left', 'right'}
+
+    def test_on_stage_reports_every_stage(self):
+        events = []
+        pipeline = ParsePipeline(backend='thread')
+        pipeline.add('a', partial(_add, 1))
+        pipeline.add('b', partial(_add, 2), depends_on=('a',))
+
+        pipeline.run(on_stage=lambda timing, done, total: events.append((timing.name, done, total)))
+
+        assert events == [('a', 1, 2), ('b', 2, 2)]
+        timing = pipeline.timings[1].to_dict()
+        assert timing['backend'] == 'thread' and timing['started'] >= 0
+
+    def test_isolated_stages_run_in_processes(self):
+        pipeline = ParsePipeline(backend='process', max_workers=2)
+        pipeline.add('light', partial(_add, 1))
+        pipeline.add('heavy', partial(_add, 5), depends_on=('light',), isolated=True)
+
+        assert pipeline.run() == {'light': 1, 'heavy': 6}
+        assert {t.name: t.backend for t in pipeline.timings} == {'light': 'thread', 'heavy': 'process'}
+
+    def test_invalid_graph(self):
+        pipeline = ParsePipeline(backend='thread')
+        pipeline.add('a', partial(_add, 1), depends_on=('missing',))
+        with pytest.raises(ValueError, match='inexistentes'):
+            pipeline.run()
+
+        pipeline = ParsePipeline(backend='thread')
+        pipeline.add('a', partial(_add, 1), depends_on=('b',))
+        pipeline.add('b', partial(_add, 1), depends_on=('a',))
+        with pytest.raises(ValueError, match='circulares'):
+            pipeline.run()
+
+        with pytest.raises(ValueError, match='duplicada'):
+            pipeline.add('a', partial(_add, 1))
+
+    def test_stage_error_propagates(self):
+        def fail():
+            raise RuntimeError('tabla corrupta')
+
+        pipeline = ParsePipeline(backend='thread')
+        pipeline.add('bad', fail)
+        pipeline.add('after', partial(_add, 1), depends_on=('bad',))
+        with pytest.raises(RuntimeError, match='tabla corrupta'):
+            pipeline.run()
+
+
+PIER_PROPS = [
+    ['TABLE:  Pier Section Properties'],
+    ['Story', 'Pier', 'AxisAngle', 'Width Bottom', 'Thickness Bottom', 'Width Top',
+     'Thickness Top', 'Material', 'CG Bottom Z', 'CG Top Z'],
+    [None, None, 'deg', 'm', 'm', 'm', 'm', None, 'm', 'm'],
+    ['Piso 2', 'M1', 0, 2.0, 0.2, 2.0, 0.2, '4000Psi', 3.0, 6.0],
+    ['Piso 1', 'M1', 0, 2.0, 0.2, 2.0, 0.2, '4000Psi', 0.0, 3.0],
+]
+
+
+PIER_FORCES = [
+    ['TABLE:  Pier Forces'],
+    ['Story', 'Pier', 'Output Case', 'Location', 'P', 'V2', 'V3', 'T', 'M2', 'M3'],
+    [None, None, None, None, 'tonf', 'tonf', 'tonf', 'tonf-m', 'tonf-m', 'tonf-m'],
+    ['Piso 2', 'M1', 'DL', 'Top', -30, 5, 0, 0, 0.2, 1.0],
+    ['Piso 2', 'M1', 'DL', 'Bottom', -35, 5, 0, 0, 0.3, 2.0],
+    ['Piso 1', 'M1', 'DL', 'Top', -50, 8, 0, 0, 0.4, 1.5],
+    ['Piso 1', 'M1', 'EQ', 'Bottom', 12.25, 9, 1, 0, 0.5, 4.0],
+]
+
+
+def _tables():
+    wb = Workbook()
+    ws = wb.active
+    for row in PIER_PROPS + [[]] + PIER_FORCES:
+        ws.append(row)
+    buffer = BytesIO()
+    wb.save(buffer)
+    return extract_tables_fast(buffer.getvalue())
+
+
+class TestParseFromTables:
+    def test_stages_and_continuity(self):
+        events = []
+        data = EtabsExcelParser().parse_from_tables(
+            _tables(), on_stage=lambda timing, done, total: events.append((timing.name, total))
+        )
+
+        assert {name for name, _ in events} == {
+            'materials', 'piers', 'pier_forces', 'composite', 'columns', 'beams',
+            'drop_beams', 'stories', 'continuity',
+        }
+        assert events[-1] == ('continuity', 9)
+        assert data.stories == ['Piso 2', 'Piso 1']
+        assert set(data.vertical_elements) == {'Piso 1_M1', 'Piso 2_M1'}
+        assert data.continuity_info['Piso 1_M1'].n_stories == 2
+        assert data.building_info.n_stories == 2
+
+    def test_process_backend_shares_one_force_store(self):
+        by_backend = {
+            backend: EtabsExcelParser().parse_from_tables(_tables(), backend=backend)
+            for backend in ('thread', 'process')
+        }
+        forces = by_backend['process'].vertical_forces
+
+        assert set(forces) == {'Piso 1_M1', 'Piso 2_M1'}
+        stores = {id(f.store_range[0]) for f in forces.values()}
+        assert len(stores) == 1
+        for key, force in forces.items():
+            expected = by_backend['thread'].vertical_forces[key]
+            assert force.values('P').tolist() == expected.values('P').tolist()
+            assert force.labels('location').tolist() == expected.labels('location').tolist()
@@ -0,0 +1,46 @@
+# tests/services/parsing/test_section_index.py
+"""
+Tests para el índice de nombres de sección de vigas.
+
+Debe dar el mismo resultado que el recorrido lineal original: primera
+sección (en orden de definición) con `label in nombre or nombre in label`.
+"""
+import random
+
+import pytest
+
+from app.services.parsing.section_index import SectionNameIndex
+
+
+def _linear(names, label):
+    for name in names:
+        if label in name or name in label:
+            return name
+    return None
+
+
+class TestSectionNameIndex:
+    @pytest.mark.parametrize('label, expected', [
+        ('B1', 'V20x50-B1'),     # label contenido en la sección
+        ('VI30x60', 'VI30x60'),  # nombre exacto
+        ('B1-VI30x60', 'VI30x60'),  # contiene a dos secciones: gana la definida primero
+        ('XYZ', None),
+    ])
+    def test_matches_linear_scan(self, label, expected):
+        names = ['V20x50-B1', 'VI30x60', 'B1']
+        assert SectionNameIndex(names).find(label) == expected == _linear(names, label)
+
+    def test_random_names_match_linear_scan(self):
+        rng = random.Random(7)
+        alphabet = 'BV12-x'
+        names = list(dict.fromkeys(
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 7))) for _ in range(60)
+        ))
+        index = SectionNameIndex(names)
+        for _ in range(500):
+            label = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+            assert index.find(label) == _linear(names, label)
+
+    def test_empty(self):
+        assert SectionNameIndex([]).find('B1') is None
+        assert SectionNameIndex(['', 'B1']).find('X') == ''
@@ -0,0 +1,218 @@
+# tests/services/parsing/test_session_store.py
+"""
+Tests para SessionStore: contabilidad de memoria, desalojo LRU/TTL y
+recarga transparente desde disco.
+"""
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from app.domain.entities import ParsedData, ElementForces
+from app.domain.entities.element_forces import ElementForceType
+from app.domain.entities.load_combination import LoadCombination
+from app.services.parsing import session_store
+from app.services.parsing.session_manager import SessionManager
+from app.services.parsing.session_store import SessionStore, estimate_session_size
+from app.services.structural_analysis import StructuralAnalysisService
+from tests.conftest import make_pier
+
+
+def _session(n_rows=1000):
+    """Sesión con tablas crudas, un pier, sus fuerzas y un resultado cacheado."""
+    parsed = ParsedData()
+    table = pd.DataFrame({'Story': ['Piso 1'] * n_rows, 'P': range(n_rows)})
+    parsed.raw_tables['pier_forces'] = table
+    parsed.accumulated_tables['pier_forces'] = [table]
+    parsed.vertical_elements['Piso 1_M1'] = make_pier()
+    forces = ElementForces(label='M1', story='Piso 1', element_type=ElementForceType.PIER)
+    forces.combinations = [LoadCombination(name='C1', location='Top', step_type='',
+                                           P=-10.0, V2=1.0, V3=2.0, T=0.0, M2=3.0, M3=4.0)]
+    parsed.vertical_forces['Piso 1_M1'] = forces
+    parsed.analysis_cache['Piso 1_M1'] = {'key': 'Piso 1_M1', 'sf': float('inf'), 'dcr': 0.5}
+    return parsed
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    def factory(**kwargs):
+        kwargs.setdefault('memory_budget', 10**12)
+        kwargs.setdefault('ttl_seconds', 0)
+        return SessionStore(spill_dir=tmp_path, **kwargs)
+    return factory
+
+
+class TestMemoryAccounting:
+    def test_size_grows_with_tables(self):
+        assert estimate_session_size(_session(10_000)) > estimate_session_size(_session(10))
+
+    def test_refresh_tracks_growth(self, make_store):
+        store = make_store()
+        store['a'] = ParsedData()
+        before = store.memory_usage
+        store.get('a').raw_tables['big'] = pd.DataFrame({'x': range(100_000)})
+        store.refresh('a')
+        assert store.memory_usage > before + 100_000 * 8
+
+
+class TestEviction:
+    def test_lru_spills_to_disk_over_budget(self, make_store):
+        one = estimate_session_size(_session())
+        store = make_store(memory_budget=int(2.5 * one))
+        for sid in ('a', 'b', 'c'):
+            store[sid] = _session()
+        store.get('a')                 # 'b' pasa a ser el menos usado
+        store['d'] = _session()
+
+        stats = store.stats()
+        assert stats['in_memory'] == 2
+        assert stats['spilled'] == 2
+        assert stats['memory_bytes'] <= store.memory_budget
+        assert 'b' in store and len(store) == 4
+
+    def test_ttl_spills_idle_sessions(self, make_store):
+        store = make_store(ttl_seconds=0.05)
+        store['idle'] = _session()
+        time.sleep(0.1)
+        store['active'] = _session()
+        assert store.stats()['spilled'] == 1
+
+    def test_reload_is_transparent(self, make_store):
+        store = make_store()
+        original = _session()
+        store['a'] = original
+        store._spill('a')
+        assert store.stats()['in_memory'] == 0
+
+        reloaded = store['a']
+        assert store.reloads == 1
+        assert list(reloaded.vertical_elements) == ['Piso 1_M1']
+        assert reloaded.vertical_forces['Piso 1_M1'].combinations[0].M3 == 4.0
+        assert reloaded.analysis_cache == original.analysis_cache
+        pd.testing.assert_frame_equal(reloaded.raw_tables['pier_forces'],
+                                      original.raw_tables['pier_forces'])
+        assert len(reloaded.accumulated_tables['pier_forces']) == 1
+
+    def test_reload_keeps_table_units(self, make_store):
+        store = make_store()
+        parsed = _session()
+        parsed.raw_tables['pier_forces'].attrs['units'] = {'p': 'tonf'}
+        store['a'] = parsed
+        store._spill('a')
+        assert store['a'].raw_tables['pier_forces'].attrs == {'units': {'p': 'tonf'}}
+
+    def test_pop_removes_spilled_copy(self, make_store, tmp_path):
+        store = make_store()
+        store['a'] = _session()
+        store._spill('a')
+        assert store.pop('a')
+        assert 'a' not in store
+        assert not list(tmp_path.iterdir())
+
+
+class TestSessionManagerIntegration:
+    def test_spilled_session_still_served(self, make_store):
+        manager = SessionManager(make_store())
+        manager.register_session('s1', _session())
+        manager._cache._spill('s1')
+
+        assert manager.has_session('s1')
+        assert manager.get_pier('s1', 'Piso 1_M1').label == 'M1'
+        assert manager.get_analysis_result('s1', 'Piso 1_M1')['dcr'] == 0.5
+        assert manager.clear_session('s1')
+        assert not manager.has_session('s1')
+
+    def test_spilled_analysis_keeps_curves(self, make_store):
+        manager = SessionManager(make_store())
+        service = StructuralAnalysisService(session_manager=manager, analysis_backend='thread')
+        manager.register_session('s1', _session())
+
+        list(service.analyze_with_progress('s1', generate_plots=False))
+        manager._cache._spill('s1')
+        assert manager.get_store_stats()['spilled'] == 1
+
+        events = list(service.analyze_with_progress('s1', generate_plots=False))
+        assert events[-1]['incremental'] == {'reanalyzed': 0, 'reused': 1}
+        curve = manager.get_interaction_curve('s1', 'Piso 1_M1', 'primary')
+        assert curve is not None and len(curve) > 0
+        combo_table = manager.get_analysis_result('s1', 'Piso 1_M1')['flexure']['combo_table']
+        assert combo_table['Pu'].shape == (1,)
+
+    def test_process_session_survives_memory_pressure(self, make_store, monkeypatch):
+        store = make_store(memory_budget=estimate_session_size(_session()) + 1)
+        manager = SessionManager(store)
+        uploaded = ParsedData()
+        uploaded.accumulated_tables = _session().accumulated_tables
+        manager.register_session('A', uploaded)
+
+        def parse_while_other_upload(tables, hn_ft=None, on_stage=None):
+            # Otra petición registra una sesión mientras 'A' se procesa
+            manager.register_session('B', _session())
+            return _session()
+
+        monkeypatch.setattr(manager._excel_parser, 'parse_from_tables', parse_while_other_upload)
+        assert manager.process_session('A')['success']
+
+        assert store.stats()['spills'] >= 1
+        assert list(manager.get_session('A').vertical_elements) == ['Piso 1_M1']
+        assert manager.get_session('A').raw_tables
+
+
+class TestSpillConcurrency:
+    def test_pinned_session_is_not_spilled(self, make_store):
+        one = estimate_session_size(_session())
+        store = make_store(memory_budget=int(1.5 * one))
+        store['a'] = _session()
+        with store.pinned('a'):
+            store['b'] = _session()
+            store._spill('a')
+            assert store.stats()['spilled'] == 0
+        store['c'] = _session()
+        assert store.stats()['spilled'] == 2
+
+    def test_slow_spill_does_not_block_other_sessions(self, make_store, monkeypatch):
+        writing, release = threading.Event(), threading.Event()
+        original = session_store.spill_payload
+
+        def slow_payload(parsed_data):
+            writing.set()
+            release.wait(timeout=5)
+            return original(parsed_data)
+
+        monkeypatch.setattr(session_store, 'spill_payload', slow_payload)
+        store = make_store()
+        store['a'] = _session()
+        store['b'] = _session()
+        spiller = threading.Thread(target=store._spill, args=('a',))
+        spiller.start()
+        assert writing.wait(timeout=5)
+
+        assert store.get('b') is not None      # sin esperar la escritura de 'a'
+        reclaimed = store.get('a')             # se recupera sin pasar por disco
+        release.set()
+        spiller.join(timeout=5)
+
+        assert store.get('a') is reclaimed
+        assert store.stats()['spilled'] == 0 and store.spills == 0
+
+    def test_size_is_measured_without_the_store_lock(self, make_store, monkeypatch):
+        store = make_store()
+        original = session_store.estimate_session_size
+        lock_free = []
+
+        def probing_estimate(parsed_data):
+            # Otro thread (otra petición) debe poder tomar el lock mientras tanto
+            probe = threading.Thread(target=lambda: lock_free.append(
+                store._lock.acquire(timeout=1) and (store._lock.release() or True)))
+            probe.start()
+            probe.join()
+            return original(parsed_data)
+
+        monkeypatch.setattr(session_store, 'estimate_session_size', probing_estimate)
+        store['a'] = _session()
+        store.refresh('a')
+        store._spill('a')
+        store.get('a')
+
+        assert lock_free == [True, True, True]
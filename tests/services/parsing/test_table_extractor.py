@@ -0,0 +1,114 @@
+# tests/services/parsing/test_table_extractor.py
+"""
+Tests para la extracción en streaming de tablas ETABS desde Excel.
+"""
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from app.services.parsing.table_extractor import (
+    concat_tables, extract_tables_fast, extract_units_from_df, normalize_columns,
+    with_units_row,
+)
+
+
+def _workbook(*sheets):
+    """Excel en memoria: cada hoja es una lista de filas."""
+    wb = Workbook()
+    wb.remove(wb.active)
+    for name, rows in sheets:
+        ws = wb.create_sheet(name)
+        for row in rows:
+            ws.append(row)
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+PIER_FORCES = [
+    ['TABLE:  Pier Forces'],
+    ['Story', 'Pier', 'Output Case', 'Location', 'P', 'M3'],
+    [None, None, None, None, 'tonf', 'tonf-m'],
+    ['Piso 1', 'M1', 'DL', 'Top', -50, 1.5],
+    [None, None, None, None, None, None],
+    ['Piso 1', 'M1', 'EQ', 'Bottom', 12.25, None],
+]
+
+UNKNOWN = [
+    ['TABLE:  Program Control'],
+    ['ProgramName', 'Version'],
+    [None, None],
+    ['ETABS', '21.0'],
+]
+
+ASSIGNS = [
+    ['TABLE:  Frame Assignments - Section Properties'],
+    ['Story', 'Label', 'UniqueName', 'Section Property'],
+    [None, None, None, None],
+    ['Piso 1', 'C1', 12, 'C40x40'],
+    ['Piso 1', 'C2', 13, 'C40x40'],
+]
+
+
+class TestExtractTablesFast:
+    def test_units_row_first_and_typed_numeric_columns(self):
+        stats = {}
+        tables = extract_tables_fast(_workbook(('Forces', PIER_FORCES)), stats)
+
+        df = tables['pier_forces']
+        assert len(df) == 3  # unidades + 2 filas (la vacía se descarta)
+        assert df['P'].dtype == np.float64
+        assert np.isnan(df['P'].iloc[0])
+        assert df['P'].iloc[1:].tolist() == [-50.0, 12.25]
+        assert np.isnan(df['M3'].iloc[2])
+        assert df['Story'].iloc[1:].tolist() == ['Piso 1', 'Piso 1']
+        assert stats['pier_forces']['rows'] == 3
+        assert stats['pier_forces']['estimated_bytes'] > 0
+
+    def test_units_from_attrs(self):
+        tables = extract_tables_fast(_workbook(('Forces', PIER_FORCES)))
+        df = normalize_columns(tables['pier_forces'])
+        assert df.attrs['units'] == {'p': 'tonf', 'm3': 'tonf-m'}
+        assert extract_units_from_df(df)['p'] == 1.0
+
+    def test_unknown_tables_are_skipped(self):
+        content = _workbook(('Sheet', UNKNOWN + PIER_FORCES))
+        tables = extract_tables_fast(content)
+        assert set(tables) == {'pier_forces'}
+        assert len(tables['pier_forces']) == 3
+
+    def test_empty_units_row_is_dropped(self):
+        tables = extract_tables_fast(_workbook(('Assigns', ASSIGNS)))
+        df = tables['frame_assigns']
+        assert df['Label'].tolist() == ['C1', 'C2']
+        assert df['UniqueName'].tolist() == [12, 13]
+        assert df.attrs['units'] == {}
+
+    def test_text_in_numeric_column_keeps_values(self):
+        rows = PIER_FORCES[:4] + [['Piso 2', 'M1', 'DL', 'Top', 'N/A', 2.0]]
+        df = extract_tables_fast(_workbook(('Forces', rows)))['pier_forces']
+        assert df['P'].dtype == object
+        assert df['P'].tolist() == ['tonf', -50, 'N/A']
+        assert df['M3'].dtype == np.float64
+
+
+class TestUnitsHelpers:
+    @pytest.fixture
+    def table(self):
+        return extract_tables_fast(_workbook(('Forces', PIER_FORCES)))['pier_forces']
+
+    def test_concat_keeps_first_units(self, table):
+        other = table.copy()
+        other.attrs = {'units': {'p': 'kN', 'm3': 'kN-m'}}
+        merged = concat_tables([table, other])
+        assert len(merged) == 6
+        assert merged.attrs['units']['p'] == 'tonf'
+
+    def test_with_units_row(self, table):
+        shown = with_units_row(table)
+        assert shown.iloc[0].tolist()[4:] == ['tonf', 'tonf-m']
+        assert np.isnan(table['P'].iloc[0])
+        pd.testing.assert_frame_equal(shown.iloc[1:].astype(table.dtypes), table.iloc[1:])
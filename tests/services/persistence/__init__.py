@@ -0,0 +1 @@
+# tests/services/persistence/__init__.py
@@ -0,0 +1,134 @@
+# tests/services/persistence/test_analysis_store.py
+"""
+Tests para la caché de análisis persistente (analysis.npz).
+
+Al reabrir un proyecto los resultados y curvas P-M guardados deben
+restaurarse tal cual, y el análisis incremental solo debe re-verificar
+los elementos cuyas entradas cambiaron.
+"""
+import numpy as np
+import pytest
+
+from app.domain.entities import ParsedData, ElementForces, ElementForceType, LoadCombination
+from app.domain.entities.composite_section import CompositeSection, WallSegment
+from app.domain.flexure import InteractionDiagramService
+from app.services.analysis.input_fingerprint import task_fingerprint
+from app.services.persistence import ProjectManager
+from app.services.persistence import analysis_store
+from app.services.persistence.analysis_store import dump_analysis_cache, load_analysis_cache
+from app.services.persistence.project_format import dump_parsed_data, load_parsed_data
+from tests.conftest import make_pier
+
+
+def _pier(label, composite=None):
+    return make_pier(label, height=np.float64(2700.0), composite_section=composite)
+
+
+def _task(parsed, key):
+    return {'type': 'pier', 'key': key, 'element': parsed.vertical_elements[key],
+            'forces': parsed.vertical_forces[key], 'seismic_category': None}
+
+
+@pytest.fixture
+def parsed():
+    data = ParsedData()
+    composite = CompositeSection(segments=[
+        WallSegment(x1=0, y1=0, x2=1200, y2=0, thickness=200, wall_id=1),
+        WallSegment(x1=1200, y1=0, x2=1200, y2=800, thickness=200, wall_id=2),
+    ])
+    curve = InteractionDiagramService().generate_interaction_curve(2000, 200, 25, 420, 1000)
+    for label, section in (('M1', None), ('PL1', composite)):
+        key = f'Piso 1_{label}'
+        data.vertical_elements[key] = _pier(label, section)
+        forces = ElementForces(label=label, story='Piso 1', element_type=ElementForceType.PIER)
+        forces.combinations = [LoadCombination(name='C1', location='Top', step_type='',
+                                               P=-10.0, V2=1.0, V3=2.0, T=0.0, M2=3.0, M3=4.0)]
+        data.vertical_forces[key] = forces
+        data.analysis_cache[key] = {
+            'key': key,
+            'flexure': {'sf': np.float64(1.5), 'combo_table': {
+                'name': np.array(['C1'], dtype=object),
+                'Pu': np.array([10.0]),
+                'sf': np.array([np.inf]),
+            }},
+            'warnings': ['a', 'b'],
+            'pm_plot': None,
+        }
+        data.analysis_fingerprints[key] = task_fingerprint(_task(data, key))
+        data.interaction_curves[key] = {'primary': curve}
+    data.stories = ['Piso 1']
+    return data
+
+
+class TestAnalysisStore:
+    def test_roundtrip(self, parsed):
+        restored = ParsedData(vertical_elements=parsed.vertical_elements)
+        assert load_analysis_cache(dump_analysis_cache(parsed), restored) == 2
+
+        result = restored.analysis_cache['Piso 1_M1']
+        table = result['flexure']['combo_table']
+        assert result['flexure']['sf'] == 1.5 and result['warnings'] == ['a', 'b']
+        assert table['name'].dtype == object and table['name'].tolist() == ['C1']
+        np.testing.assert_array_equal(table['sf'], [np.inf])
+        assert restored.analysis_fingerprints == parsed.analysis_fingerprints
+        assert restored.interaction_curves['Piso 1_M1']['primary'] == \
+            parsed.interaction_curves['Piso 1_M1']['primary']
+
+    def test_other_code_version_is_discarded(self, parsed, monkeypatch):
+        content = dump_analysis_cache(parsed)
+        monkeypatch.setattr(analysis_store, 'code_version', lambda: 'otra')
+        restored = ParsedData(vertical_elements=parsed.vertical_elements)
+        assert load_analysis_cache(content, restored) == 0
+        assert not restored.analysis_cache and not restored.interaction_curves
+
+    def test_skips_results_without_fingerprint_or_element(self, parsed):
+        parsed.analysis_fingerprints.pop('Piso 1_M1')
+        restored = ParsedData()
+        restored.vertical_elements['Piso 1_M1'] = parsed.vertical_elements['Piso 1_M1']
+        assert load_analysis_cache(dump_analysis_cache(parsed), restored) == 0
+
+    def test_reopened_project_keeps_fingerprints(self, parsed):
+        """Elementos reabiertos (incluida la sección compuesta) dan la misma huella."""
+        reopened = load_parsed_data(dump_parsed_data(parsed))
+        assert reopened.vertical_elements['Piso 1_PL1'].composite_section.segments == \
+            parsed.vertical_elements['Piso 1_PL1'].composite_section.segments
+        for key, fingerprint in parsed.analysis_fingerprints.items():
+            assert task_fingerprint(_task(reopened, key)) == fingerprint
+
+
+class TestProjectManager:
+    def test_save_and_load_restore_results(self, parsed, tmp_path):
+        manager = ProjectManager(base_dir=tmp_path)
+        project_id = manager.create_project('P', b'xlsx', 'a.xlsx')['project_id']
+        manager.save_parsed_data(project_id, parsed)
+        assert manager.save_analysis_cache(project_id, parsed)['success']
+
+        result = manager.load_project(project_id)
+
+        assert result['cached_results'] == 2
+        assert set(result['parsed_data'].analysis_cache) == set(parsed.analysis_cache)
+
+    def test_corrupt_cache_is_ignored(self, parsed, tmp_path):
+        manager = ProjectManager(base_dir=tmp_path)
+        project_id = manager.create_project('P', b'xlsx', 'a.xlsx')['project_id']
+        manager.save_parsed_data(project_id, parsed)
+        (tmp_path / project_id / 'analysis.npz').write_bytes(b'no es un npz')
+
+        result = manager.load_project(project_id)
+
+        assert result['success'] and result['cached_results'] == 0
+        assert not result['parsed_data'].analysis_cache
+
+    def test_truncated_cache_is_ignored(self, parsed, tmp_path):
+        manager = ProjectManager(base_dir=tmp_path)
+        project_id = manager.create_project('P', b'xlsx', 'a.xlsx')['project_id']
+        manager.save_parsed_data(project_id, parsed)
+        manager.save_analysis_cache(project_id, parsed)
+        cache_path = tmp_path / project_id / 'analysis.npz'
+        content = cache_path.read_bytes()
+        cache_path.write_bytes(content[:len(content) // 2])
+
+        result = manager.load_project(project_id)
+
+        assert result['success'] and result['cached_results'] == 0
+        assert not result['parsed_data'].interaction_curves
@@ -0,0 +1,87 @@
+# tests/services/persistence/test_project_format.py
+"""
+Tests para el formato binario de proyecto y la migración desde JSON.
+"""
+import json
+
+import pytest
+
+from app.domain.entities import ParsedData, ElementForces, ElementForceType, LoadCombination
+from app.services.persistence import ProjectManager
+from app.services.persistence.parsed_data_serializer import serialize_parsed_data
+from app.services.persistence.project_format import (
+    PROJECT_FORMAT_VERSION, dump_parsed_data, load_parsed_data,
+)
+from tests.conftest import make_pier
+
+
+def _forces(label, n):
+    forces = ElementForces(label=label, story='Piso 1', element_type=ElementForceType.PIER)
+    forces.combinations = [
+        LoadCombination(name=f'C{i}', location='Top' if i % 2 else 'Bottom',
+                        step_type='Max' if i == 1 else '',
+                        P=-10.0 * i, V2=1.5, V3=0.25 * i, T=0.0, M2=3.0, M3=-4.0 * i)
+        for i in range(n)
+    ]
+    return forces
+
+
+@pytest.fixture
+def parsed():
+    data = ParsedData()
+    for label, n in (('M1', 3), ('M2', 0), ('M3', 5)):
+        key = f'Piso 1_{label}'
+        data.vertical_elements[key] = make_pier(label)
+        data.vertical_forces[key] = _forces(label, n)
+    data.stories = ['Piso 1']
+    return data
+
+
+class TestBinaryFormat:
+    def test_roundtrip_matches_json(self, parsed):
+        restored = load_parsed_data(dump_parsed_data(parsed))
+        assert serialize_parsed_data(restored) == serialize_parsed_data(parsed)
+
+    def test_forces_load_lazily(self, parsed):
+        restored = load_parsed_data(dump_parsed_data(parsed))
+        forces = restored.vertical_forces['Piso 1_M3']
+        store = forces.store_range[0]
+        assert not store.is_loaded
+        assert forces.n_combinations == 5
+        assert forces.get_combination(4).M3 == -16.0
+        assert store.is_loaded
+
+    def test_newer_version_is_rejected(self, parsed, monkeypatch):
+        from app.services.persistence import project_format
+        monkeypatch.setattr(project_format, 'PROJECT_FORMAT_VERSION', PROJECT_FORMAT_VERSION + 1)
+        content = dump_parsed_data(parsed)
+        monkeypatch.undo()
+        with pytest.raises(ValueError):
+            load_parsed_data(content)
+
+
+class TestProjectManager:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        return ProjectManager(base_dir=tmp_path)
+
+    def test_save_and_load(self, manager, parsed):
+        project_id = manager.create_project('P', b'xlsx', 'a.xlsx')['project_id']
+        assert manager.save_parsed_data(project_id, parsed)['success']
+
+        result = manager.load_project(project_id)
+        assert result['success']
+        assert result['parsed_data'].vertical_forces['Piso 1_M1'].combinations == \
+            parsed.vertical_forces['Piso 1_M1'].combinations
+
+    def test_json_project_is_migrated(self, manager, parsed, tmp_path):
+        project_id = manager.create_project('P', b'xlsx', 'a.xlsx')['project_id']
+        legacy = tmp_path / project_id / 'parsed_data.json'
+        legacy.write_text(json.dumps(serialize_parsed_data(parsed)), encoding='utf-8')
+
+        result = manager.load_project(project_id)
+
+        assert result['success']
+        assert not legacy.exists()
+        assert (tmp_path / project_id / 'parsed_data.npz').exists()
+        assert serialize_parsed_data(result['parsed_data']) == serialize_parsed_data(parsed)
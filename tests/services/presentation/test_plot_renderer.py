@@ -0,0 +1,188 @@
+# tests/services/presentation/test_plot_renderer.py
+"""
+Tests para el renderizado de gráficos con cache (PlotRenderer) y el uso
+concurrente de PlotGenerator.
+"""
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+from app.domain.entities.composite_section import CompositeSection, WallSegment
+from app.services.presentation.plot_generator import PlotGenerator
+from app.services.presentation.plot_renderer import PlotImageCache, PlotRenderer
+from tests.conftest import make_pier
+
+
+def _pier(story='S1', length=2000):
+    return make_pier(story=story, length=length)
+
+
+def _l_pier():
+    pier = _pier(length=1200)
+    pier.composite_section = CompositeSection(segments=[
+        WallSegment(x1=0, y1=0, x2=1200, y2=0, thickness=200),
+        WallSegment(x1=1200, y1=0, x2=1200, y2=800, thickness=200),
+    ])
+    return pier
+
+
+CURVE = [(0.0, 300.0), (40.0, 150.0), (55.0, 60.0), (30.0, -20.0), (0.0, -60.0),
+         (-30.0, -20.0), (-55.0, 60.0), (-40.0, 150.0)]
+
+
+class CountingGenerator(PlotGenerator):
+    """PlotGenerator que no dibuja: cuenta llamadas y puede bloquearse."""
+
+    def __init__(self, gate=None):
+        super().__init__(dpi=72)
+        self.calls = []
+        self.gate = gate
+        self._lock = threading.Lock()
+
+    def _record(self, name, element):
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        with self._lock:
+            self.calls.append(name)
+        return f'{name}:{element.story}:{element.mesh_reinforcement.spacing_v}'
+
+    def generate_section_diagram(self, pier, figsize=(10, 8)):
+        return self._record('section', pier)
+
+    def generate_column_section_diagram(self, column, figsize=(8, 8)):
+        return self._record('column', column)
+
+    def generate_pm_diagram(self, capacity_curve, demand_points, pier_label, safety_factor, **options):
+        with self._lock:
+            self.calls.append('pm')
+        return f'pm:{pier_label}:{safety_factor}'
+
+
+def _renderer(generator, **kwargs):
+    return PlotRenderer(generator, backend='thread', max_workers=2, cache=PlotImageCache(), **kwargs)
+
+
+class TestPlotRenderer:
+    def test_cache_hit_skips_rendering(self):
+        generator = CountingGenerator()
+        renderer = _renderer(generator)
+        pier = _pier()
+
+        first = renderer.section_diagram(pier)
+        assert renderer.section_diagram(replace(pier)) == first
+        assert renderer.section_diagram(pier, column=True) == 'column:S1:200'
+        assert generator.calls == ['section', 'column']
+        assert renderer.stats()['hits'] == 1
+
+    def test_key_follows_element_and_demand(self):
+        generator = CountingGenerator()
+        renderer = _renderer(generator)
+        pier = _pier()
+        proposed = replace(pier, mesh_reinforcement=replace(pier.mesh_reinforcement, spacing_v=150))
+
+        assert renderer.section_diagram(proposed) == 'section:S1:150'
+        assert renderer.section_diagram(pier) == 'section:S1:200'
+
+        renderer.pm_diagram(CURVE, [(10.0, 5.0, 'C1')], 'S1 - M1', 1.2)
+        renderer.pm_diagram(CURVE, [(10.0, 5.0, 'C1')], 'S1 - M1', 1.2)
+        renderer.pm_diagram(CURVE, [(10.0, 6.0, 'C1')], 'S1 - M1', 1.2)
+        renderer.pm_diagram(CURVE[:-1], [(10.0, 5.0, 'C1')], 'S1 - M1', 1.2)
+        assert generator.calls.count('pm') == 3
+
+    def test_concurrent_requests_share_render(self):
+        gate = threading.Event()
+        generator = CountingGenerator(gate)
+        renderer = _renderer(generator)
+        pier = _pier()
+
+        assert renderer.prefetch([renderer.section_job(pier)]) == 1
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(renderer.section_diagram, pier) for _ in range(3)]
+            gate.set()
+            images = {f.result() for f in futures}
+
+        assert images == {'section:S1:200'}
+        assert generator.calls == ['section']
+        assert renderer.prefetch([renderer.section_job(pier)]) == 0
+        assert renderer.stats()['in_flight'] == 0
+
+    def test_render_error_is_not_cached(self):
+        class FailingGenerator(CountingGenerator):
+            def generate_section_diagram(self, pier, figsize=(10, 8)):
+                self.calls.append('section')
+                raise RuntimeError('sin sección')
+
+        generator = FailingGenerator()
+        renderer = _renderer(generator)
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match='sin sección'):
+                renderer.section_diagram(_pier())
+        assert generator.calls == ['section', 'section']
+
+    def test_render_many_yields_every_job_once_rendered(self):
+        generator = CountingGenerator()
+        renderer = _renderer(generator)
+        cached = _pier()
+        renderer.section_diagram(cached)
+        other = _pier(story='S2')
+        jobs = [renderer.section_job(cached), renderer.section_job(other),
+                renderer.section_job(other), renderer.pm_job(CURVE, [], 'S1 - M1', 1.0)]
+
+        done = list(renderer.render_many(jobs))
+
+        assert done[0] == (jobs[0], 'section:S1:200')
+        assert sorted(image for _, image in done) == [
+            'pm:S1 - M1:1.0', 'section:S1:200', 'section:S2:200', 'section:S2:200'
+        ]
+        assert generator.calls.count('section') == 2
+
+    def test_process_backend_renders_real_images(self):
+        renderer = PlotRenderer(PlotGenerator(dpi=40), backend='process', max_workers=1,
+                                cache=PlotImageCache())
+        try:
+            section = renderer.section_diagram(_l_pier())
+            pm = renderer.pm_diagram(CURVE, [(10.0, 5.0, 'C1')], 'S1 - M1', 1.2)
+        finally:
+            renderer.shutdown()
+        assert base64.b64decode(section).startswith(b'\x89PNG')
+        assert base64.b64decode(pm).startswith(b'\x89PNG')
+
+
+class TestPlotImageCache:
+    def test_lru_eviction_by_entries_and_bytes(self):
+        cache = PlotImageCache(max_entries=2, max_bytes=10)
+        cache.put(('a',), 'xxxx')
+        cache.put(('b',), 'xxxx')
+        cache.get(('a',))
+        cache.put(('c',), 'xxxx')
+        assert ('b',) not in cache and ('a',) in cache
+
+        cache.put(('d',), 'xxxxxxxx')
+        assert len(cache) == 1 and cache.stats()['bytes'] == 8
+
+        cache.put(('e',), 'x' * 11)
+        assert ('e',) not in cache
+
+
+class TestPlotGenerator:
+    def test_threads_render_same_images_as_sequential(self):
+        generator = PlotGenerator(dpi=40)
+        piers = [_pier(length=1500 + 100 * i) for i in range(4)]
+        expected = [generator.generate_section_diagram(p) for p in piers]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            images = list(pool.map(generator.generate_section_diagram, piers))
+
+        assert images == expected
+
+    def test_svg_format(self):
+        image = PlotGenerator(image_format='svg').generate_pm_diagram(
+            CURVE, [(10.0, 5.0, 'C1')], 'S1 - M1', 1.2
+        )
+        assert b'<svg' in base64.b64decode(image)
+
+        with pytest.raises(ValueError, match='Formato'):
+            PlotGenerator(image_format='jpg')
@@ -617,3 +617,24 @@ class TestEdgeCases:
         )
 
         assert formatted['pm_plot'] == 'base64_encoded_image'
+
+
+class TestSummaryRow:
+    def test_drops_per_combo_detail_without_mutating(self):
+        result = {
+            'key': 'S1_P1',
+            'flexure': {'dcr': 0.8, 'combo_results': [{'dcr': 0.8}] * 3},
+            'shear': {'dcr': 0.5, 'combo_results': [{'dcr': 0.5}]},
+            'pm_plot': {'phi_Mn_values': [1, 2]},
+            'design_curve': [(0, 1)],
+        }
+        row = ResultFormatter.summary_row(result)
+
+        assert row == {
+            'key': 'S1_P1',
+            'flexure': {'dcr': 0.8},
+            'shear': {'dcr': 0.5},
+            'pm_plot': {'phi_Mn_values': [1, 2]},
+        }
+        assert len(result['flexure']['combo_results']) == 3
+        assert row['pm_plot'] is result['pm_plot']
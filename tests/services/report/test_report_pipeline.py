@@ -0,0 +1,170 @@
+# tests/services/report/test_report_pipeline.py
+"""
+Tests para el pipeline del informe PDF (ReportPipeline) y los informes
+pendientes de descarga (ReportSpool).
+"""
+import io
+import time
+
+import pytest
+
+from app.services.presentation.plot_generator import PlotGenerator
+from app.services.presentation.plot_renderer import PlotImageCache, PlotRenderer
+from app.services.report import PDFReportGenerator, ReportConfig, ReportPipeline
+from app.services.report import report_pipeline
+from app.services.report.report_pipeline import (
+    REPORT_PAGES_PHASE, REPORT_PLOTS_PHASE, ReportSpool, SpooledReport,
+)
+from app.services.structural_analysis import StructuralAnalysisService
+from tests.conftest import make_session
+
+# PNG 1x1 para los diagramas
+PIXEL_PNG = (
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAE'
+    'hQGAhKmMIQAAAABJRU5ErkJggg=='
+)
+
+
+class PixelGenerator(PlotGenerator):
+    """PlotGenerator que no dibuja: retorna un pixel y registra las llamadas."""
+
+    def __init__(self):
+        super().__init__(dpi=72)
+        self.calls = []
+
+    def generate_section_diagram(self, pier, figsize=(10, 8)):
+        self.calls.append(('section', pier.label))
+        return PIXEL_PNG
+
+    def generate_pm_diagram(self, capacity_curve, demand_points, pier_label, safety_factor, **options):
+        self.calls.append(('pm', pier_label, len(demand_points)))
+        return PIXEL_PNG
+
+
+@pytest.fixture
+def generator():
+    return PixelGenerator()
+
+
+@pytest.fixture
+def pipeline(generator, monkeypatch):
+    # Sin pre-generación al terminar el análisis: cada render lo pide el informe
+    monkeypatch.setenv('INGEO_PLOT_PREFETCH', '0')
+    renderer = PlotRenderer(generator, backend='thread', max_workers=2, cache=PlotImageCache())
+    service = StructuralAnalysisService(analysis_backend='thread', plot_renderer=renderer)
+    service._session_manager.register_session('s1', make_session())
+    return ReportPipeline(service, service._session_manager, renderer, spool=ReportSpool())
+
+
+def _report(pipeline, events):
+    report = pipeline._spool.take(events[-1]['result']['report_id'])
+    return b''.join(report.iter_chunks())
+
+
+class TestReportPipeline:
+    def test_events_and_spooled_pdf(self, pipeline, generator):
+        config = ReportConfig(project_name='Obra Uno', top_by_load=1, top_by_cuantia=1,
+                              include_failing=False)
+
+        events = list(pipeline.run('s1', config))
+        complete = events[-1]
+        phases = [e['phase'] for e in events if e['type'] == 'progress']
+
+        assert complete['type'] == 'complete'
+        assert complete['result']['filename'] == 'Informe_Obra_Uno.pdf'
+        assert REPORT_PLOTS_PHASE in phases and REPORT_PAGES_PHASE in phases
+        assert phases.index(REPORT_PLOTS_PHASE) < phases.index(REPORT_PAGES_PHASE)
+
+        # Dos piers críticos: P-M (con las 3 combinaciones) + sección de cada uno
+        assert complete['result']['plots'] == 4
+        assert sorted(call[0] for call in generator.calls) == ['pm', 'pm', 'section', 'section']
+        assert all(call[2] == 3 for call in generator.calls if call[0] == 'pm')
+
+        pdf = _report(pipeline, events)
+        assert pdf.startswith(b'%PDF') and len(pdf) == complete['result']['bytes']
+        assert pipeline._spool.take(complete['result']['report_id']) is None
+
+    def test_second_report_reuses_rendered_plots(self, pipeline, generator):
+        config = ReportConfig(top_by_load=1, top_by_cuantia=0, include_failing=False)
+
+        list(pipeline.run('s1', config))
+        events = list(pipeline.run('s1', config))
+
+        assert events[-1]['result']['plots'] == 2
+        assert len(generator.calls) == 2
+
+    def test_without_diagrams_renders_nothing(self, pipeline, generator):
+        config = ReportConfig(include_pm_diagrams=False, include_sections=False)
+
+        events = list(pipeline.run('s1', config))
+
+        assert events[-1]['result']['plots'] == 0
+        assert generator.calls == []
+        assert _report(pipeline, events).startswith(b'%PDF')
+
+    def test_reuses_ui_analysis_with_same_options(self, pipeline):
+        service = pipeline._analysis
+        list(service.analyze_with_progress('s1', seismic_category='ORDINARY', generate_plots=False))
+        before = pipeline._session_manager.get_analysis_result('s1', 'Piso 1_M0')
+
+        events = list(pipeline.run('s1', ReportConfig(), seismic_category='ORDINARY'))
+
+        assert events[-1]['type'] == 'complete'
+        assert pipeline._session_manager.get_analysis_result('s1', 'Piso 1_M0') is before
+
+    def test_missing_session_curve_is_regenerated(self, pipeline, generator):
+        list(pipeline._analysis.analyze_with_progress('s1', generate_plots=False))
+        pipeline._session_manager.clear_interaction_curves('s1')
+        config = ReportConfig(top_by_load=1, top_by_cuantia=0, include_failing=False,
+                              include_sections=False)
+
+        events = list(pipeline.run('s1', config))
+
+        assert events[-1]['result']['plots'] == 1
+        assert events[-1]['result']['plot_errors'] == []
+        stored = [key for key in ('Piso 1_M0', 'Piso 1_M1', 'Piso 1_M2')
+                  if pipeline._session_manager.get_interaction_curve('s1', key, 'primary')]
+        assert len(stored) == 1
+
+    def test_disconnect_closes_unfinished_pdf(self, pipeline, monkeypatch):
+        files = []
+
+        class TrackedFile(report_pipeline.SpooledTemporaryFile):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                files.append(self)
+
+        monkeypatch.setattr(report_pipeline, 'SpooledTemporaryFile', TrackedFile)
+        monkeypatch.setattr(PDFReportGenerator, 'PROGRESS_EVERY', 1)
+        run = pipeline.run('s1', ReportConfig(include_pm_diagrams=False, include_sections=False))
+        for event in run:
+            if event.get('phase') == REPORT_PAGES_PHASE:
+                break
+        run.close()
+
+        deadline = time.monotonic() + 5
+        while not files[0].closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert files[0].closed
+        assert len(pipeline._spool) == 0
+
+    def test_unknown_session_is_error(self, pipeline):
+        events = list(pipeline.run('otra', ReportConfig()))
+        assert events[-1]['type'] == 'error'
+
+
+class TestReportSpool:
+    def test_take_once_and_expire(self):
+        spool = ReportSpool(ttl_seconds=60, max_reports=2)
+        ids = [spool.put(SpooledReport(io.BytesIO(b'%PDF'), f'{i}.pdf', 4, 1)) for i in range(3)]
+
+        # Supera max_reports: se descarta el más antiguo
+        assert len(spool) == 2
+        assert spool.take(ids[0]) is None
+        assert b''.join(spool.take(ids[1]).iter_chunks()) == b'%PDF'
+        assert spool.take(ids[1]) is None
+
+        stale = SpooledReport(io.BytesIO(b'%PDF'), 'old.pdf', 4, 1, created=time.monotonic() - 120)
+        report_id = spool.put(stale)
+        assert spool.take(report_id) is None
+        assert stale.file.closed
@@ -0,0 +1,136 @@
+# tests/services/test_structural_analysis.py
+"""
+Tests para el streaming de resultados de analyze_with_progress y el
+detalle por combinación bajo demanda.
+"""
+import json
+
+import pytest
+
+from app.services.presentation.result_formatter import ResultFormatter
+from app.services.structural_analysis import BIAXIAL_SF_LABEL, StructuralAnalysisService
+from tests.conftest import make_session
+
+
+@pytest.fixture
+def service():
+    service = StructuralAnalysisService(analysis_backend='thread')
+    service._session_manager.register_session('s1', make_session())
+    return service
+
+
+def _rows(events):
+    rows = {}
+    for event in events:
+        if event['type'] == 'partial':
+            for row in event['results']:
+                rows[row['key']] = row
+    return rows
+
+
+class TestAnalyzeStreaming:
+    def test_partial_rows_then_compact_complete(self, service):
+        events = list(service.analyze_with_progress('s1'))
+        complete = events[-1]
+
+        assert complete['type'] == 'complete'
+        assert 'results' not in complete['result']
+        order = complete['result']['order']['results']
+        assert order == ['Piso 1_M0', 'Piso 1_M1', 'Piso 1_M2']
+
+        rows = _rows(events)
+        assert set(rows) == set(order)
+        for key in order:
+            full = service.get_element_result('s1', key)['result']
+            assert rows[key] == ResultFormatter.summary_row(full)
+            assert 'combo_results' not in rows[key]['flexure']
+            assert 'combo_results' in full['flexure']
+
+    def test_reused_results_are_streamed(self, service):
+        list(service.analyze_with_progress('s1'))
+        events = list(service.analyze_with_progress('s1'))
+        assert events[-1]['incremental'] == {'reanalyzed': 0, 'reused': 3}
+        assert len(_rows(events)) == 3
+
+    def test_analyze_returns_summary_rows_in_order(self, service):
+        result = service.analyze('s1')
+        assert [r['key'] for r in result['results']] == ['Piso 1_M0', 'Piso 1_M1', 'Piso 1_M2']
+        assert 'combo_results' not in result['results'][0]['flexure']
+        assert 'order' not in result
+        json.dumps(result)
+
+    def test_curve_phase_precedes_element_progress(self, service):
+        events = list(service.analyze_with_progress('s1'))
+        phases = [e['phase'] for e in events if e['type'] == 'progress']
+        assert phases[0] == 'curves'
+        assert 'curves' not in phases[phases.index('elements'):]
+        curves = [e for e in events if e.get('phase') == 'curves']
+        assert curves[-1]['current'] == curves[-1]['total']
+        assert events[-1]['curve_errors'] == []
+
+    def test_element_result_unknown_key(self, service):
+        assert service.get_element_result('s1', 'nope')['success'] is False
+
+
+class TestLazyComboDetail:
+    def test_analysis_caches_only_compact_table(self, service):
+        list(service.analyze_with_progress('s1'))
+        cached = service._session_manager.get_analysis_result('s1', 'Piso 1_M0')
+        for section in ('flexure', 'shear'):
+            assert 'combo_results' not in cached[section]
+            assert len(cached[section]['combo_table']['name']) == 3
+
+    def test_element_result_materializes_and_memoizes(self, service):
+        list(service.analyze_with_progress('s1'))
+        detail = service.get_element_result('s1', 'Piso 1_M0')['result']
+        json.dumps(detail)
+
+        rows = detail['flexure']['combo_results']
+        assert [r['name'] for r in rows] == ['C1 (Top)', 'C2 (Top)', 'C3 (Top)']
+        assert 'combo_table' not in detail['flexure']
+        assert len(detail['shear']['combo_results']) == 3
+
+        cached = service._session_manager.get_analysis_result('s1', 'Piso 1_M0')
+        assert cached['flexure']['combo_results'] is rows
+
+    def test_combination_details_read_materialized_rows(self, service):
+        list(service.analyze_with_progress('s1'))
+        details = service.get_combination_details('s1', 'Piso 1_M1', 2)
+        full = service.get_element_result('s1', 'Piso 1_M1')['result']
+
+        assert details['success']
+        assert details['flexure']['dcr'] == full['flexure']['combo_results'][2]['dcr']
+        assert details['shear']['dcr_combined'] == full['shear']['combo_results'][2]['dcr_combined']
+
+    def test_combination_details_label_the_biaxial_sf_of_the_diagram(self, service):
+        list(service.analyze_with_progress('s1'))
+        details = service.get_combination_details('s1', 'Piso 1_M1', 1)
+        single = service.analyze_single_combination('s1', 'Piso 1_M1', 1, generate_plot=False)
+
+        flexure = details['flexure']
+        assert flexure['sf_biaxial_label'] == BIAXIAL_SF_LABEL
+        assert flexure['sf_biaxial'] == pytest.approx(single['safety_factor'], abs=0.01)
+        assert flexure['dcr_biaxial'] == pytest.approx(1 / single['safety_factor'], rel=1e-2)
+
+
+class TestSingleCombination:
+    def test_uses_biaxial_surface(self, service):
+        result = service.analyze_single_combination('s1', 'Piso 1_M1', 1, generate_plot=False)
+        assert result['success']
+
+        pier = service._session_manager.get_pier('s1', 'Piso 1_M1')
+        combo = service._session_manager.get_pier_forces('s1', 'Piso 1_M1').combinations[1]
+        surface = service._flexo_service.biaxial_surface(pier)
+        expected = surface.safety_factor(combo.P_compression, combo.M2, combo.M3)
+        assert result['safety_factor'] == pytest.approx(expected, rel=1e-2)
+        assert result['sf_method'] == 'biaxial'
+
+    def test_plot_labels_biaxial_sf(self, service, monkeypatch):
+        calls = []
+        monkeypatch.setattr(service._plot_renderer, 'pm_diagram',
+                            lambda *args, **kwargs: calls.append(kwargs) or 'png')
+
+        result = service.analyze_single_combination('s1', 'Piso 1_M1', 1)
+
+        assert result['pm_plot'] == 'png'
+        assert calls[0]['sf_label'] == BIAXIAL_SF_LABEL
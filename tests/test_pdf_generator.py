@@ -2,6 +2,8 @@
 """
 Tests para el generador de informes PDF.
 """
+import io
+
 import pytest
 from datetime import datetime
 
@@ -399,3 +401,52 @@ class TestPDFReportGeneratorHelpers:
         """Construye tabla completa."""
         elements = generator._build_full_results_table(sample_results)
         assert len(elements) > 0
+
+
+# PNG 1x1 para los diagramas
+PIXEL_PNG = (
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAE'
+    'hQGAhKmMIQAAAABJRU5ErkJggg=='
+)
+
+
+class TestReportStory:
+    """Tests para build_story / write_report (informe por partes)."""
+
+    def test_critical_keys_order_without_duplicates(self, sample_results):
+        config = ReportConfig(top_by_load=1, top_by_cuantia=1, include_failing=True)
+        keys = PDFReportGenerator.critical_keys(sample_results, config)
+        # Carga: P2-B1; cuantia: P1-A2; fallan: P1-A2 (repetido)
+        assert keys == ['Cielo P2_P2-B1', 'Cielo P1_P1-A2']
+
+        config = ReportConfig(top_by_load=0, top_by_cuantia=0, include_failing=False)
+        assert PDFReportGenerator.critical_keys(sample_results, config) == []
+
+    def test_write_report_reports_progress(self, generator, sample_results, sample_config):
+        story = generator.build_story(sample_results, sample_config)
+        total = len(story)  # ReportLab consume la lista
+        events = []
+        output = io.BytesIO()
+
+        pages = generator.write_report(story, output, on_progress=lambda *e: events.append(e))
+
+        assert output.getvalue().startswith(b'%PDF')
+        assert pages >= 1
+        assert events[-1] == (total, total, pages)
+        assert [drawn for drawn, _, _ in events] == sorted(drawn for drawn, _, _ in events)
+
+    def test_build_story_uses_given_diagrams(self, generator, sample_results, sample_config):
+        sample_config.include_pm_diagrams = True
+        sample_config.include_sections = True
+        base = len(generator.build_story(sample_results, sample_config))
+
+        story = generator.build_story(
+            sample_results, sample_config,
+            pm_plots={'Cielo P1_P1-A2': PIXEL_PNG},
+            section_diagrams={'Cielo P1_P1-A2': PIXEL_PNG, 'Cielo P2_P2-B1': 'no-base64!'}
+        )
+
+        assert len(story) > base
+        output = io.BytesIO()
+        generator.write_report(story, output)
+        assert output.getvalue().startswith(b'%PDF')